@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+################################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for FileHandleCache (hw_management_lib) and its use by TC 2.5
+# hw_management_file_op: attribute files are kept open and re-read with
+# pread(), descriptors are re-opened when file is replaced or removed and
+# number of open descriptors is limited by LRU eviction.
+################################################################################
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+TESTS_DIR = Path(__file__).parent
+PROJECT_ROOT = TESTS_DIR.parent.parent
+HW_MGMT_BIN = PROJECT_ROOT / "usr" / "usr" / "bin"
+if str(HW_MGMT_BIN) not in sys.path:
+    sys.path.insert(0, str(HW_MGMT_BIN))
+
+from hw_management_lib import FileHandleCache  # noqa: E402
+import hw_management_thermal_control_2_5 as tc25  # noqa: E402
+
+pytestmark = pytest.mark.offline
+
+
+def _write(path, data):
+    with open(path, "w") as f:
+        f.write(data)
+
+
+def _replace(path, data):
+    tmp_path = "{}.tmp".format(path)
+    _write(tmp_path, data)
+    os.replace(tmp_path, path)
+
+
+def test_read_reuses_descriptor(tmp_path):
+    attr = tmp_path / "temp1_input"
+    _write(attr, "45000\n")
+    cache = FileHandleCache(max_size=4)
+
+    assert cache.read(str(attr)) == "45000\n"
+    # same inode rewritten in place - new value visible via pread
+    _write(attr, "46000\n")
+    with patch("os.open", side_effect=AssertionError("unexpected open")):
+        assert cache.read(str(attr)) == "46000\n"
+    assert cache.get_stat() == {"hit": 1, "miss": 1, "reopen": 0, "evict": 0, "open": 1}
+    cache.close()
+
+
+def test_read_missing_file_returns_none(tmp_path):
+    cache = FileHandleCache()
+    assert cache.read(str(tmp_path / "absent")) is None
+    # directory is not an attribute file
+    assert cache.read(str(tmp_path)) is None
+    assert cache.get_stat()["open"] == 0
+
+
+def test_replaced_file_reopened_after_revalidate(tmp_path):
+    attr = tmp_path / "module1_temp_input"
+    _write(attr, "40000")
+    cache = FileHandleCache(revalidate_ms=0)
+    assert cache.read(str(attr)) == "40000"
+
+    # atomic write creates new inode - old descriptor must not be used
+    _replace(attr, "41000")
+    assert cache.read(str(attr)) == "41000"
+    assert cache.get_stat()["reopen"] == 1
+
+    os.remove(attr)
+    assert cache.read(str(attr)) is None
+    assert not cache.is_file(str(attr))
+    assert cache.get_stat()["open"] == 0
+
+
+def test_removed_device_errno_triggers_reopen(tmp_path):
+    attr = tmp_path / "fan1_speed_get"
+    _write(attr, "9000")
+    cache = FileHandleCache()
+    cache.read(str(attr))
+
+    real_pread = os.pread
+    calls = []
+
+    def _pread(fd, size, offset):
+        calls.append(fd)
+        if len(calls) == 1:
+            raise OSError(19, "No such device")
+        return real_pread(fd, size, offset)
+
+    with patch("os.pread", side_effect=_pread):
+        assert cache.read(str(attr)) == "9000"
+    assert cache.get_stat()["reopen"] == 1
+    cache.close()
+
+
+def test_lru_eviction_limits_open_descriptors(tmp_path):
+    cache = FileHandleCache(max_size=2)
+    paths = []
+    for idx in range(3):
+        path = tmp_path / "attr{}".format(idx)
+        _write(path, str(idx))
+        paths.append(str(path))
+
+    cache.read(paths[0])
+    cache.read(paths[1])
+    cache.read(paths[0])
+    cache.read(paths[2])
+    stat = cache.get_stat()
+    assert stat["open"] == 2
+    assert stat["evict"] == 1
+    # attr1 was least recently used
+    assert list(cache._handles) == [paths[0], paths[2]]
+    cache.close()
+    assert cache.get_stat()["open"] == 0
+
+
+def test_read_large_file(tmp_path):
+    attr = tmp_path / "config"
+    data = "x" * (FileHandleCache.READ_SIZE * 2 + 17)
+    _write(attr, data)
+    cache = FileHandleCache()
+    assert cache.read(str(attr)) == data
+    assert cache.read(str(attr)) == data
+    cache.close()
+
+
+def test_file_op_uses_cache(tmp_path, monkeypatch):
+    (tmp_path / "thermal").mkdir()
+    _write(tmp_path / "thermal" / "asic", "52000\n")
+    cache = FileHandleCache()
+    monkeypatch.setattr(tc25, "gfile_handle_cache", cache)
+    file_op = tc25.hw_management_file_op({tc25.CONST.HW_MGMT_ROOT: str(tmp_path)})
+
+    assert file_op.check_file("thermal/asic")
+    assert file_op.thermal_read_file_int("asic", scale=1000) == 52
+    # check_file + read served by cached descriptor
+    with patch("os.path.isfile", side_effect=AssertionError("unexpected stat")):
+        assert file_op.check_file("thermal/asic")
+        assert file_op.thermal_read_file("asic") == "52000"
+        assert file_op.get_file_val("thermal/asic", scale=1000) == 52
+    assert file_op.read_file("thermal/absent") is None
+    assert file_op.get_file_val("thermal/absent", def_val=7) == 7
+
+    file_op.rm_file("thermal/asic")
+    assert not file_op.check_file("thermal/asic")
+    assert cache.get_stat()["open"] == 0
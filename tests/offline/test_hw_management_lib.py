@@ -7,7 +7,8 @@
 # Tests all functions with simple, medium, and complex scenarios
 ########################################################################
 
-from hw_management_lib import HW_Mgmt_Logger, current_milli_time
+from hw_management_lib import HW_Mgmt_Logger, current_milli_time, JobScheduler
+import hw_management_lib
 import sys
 import os
 import pytest
@@ -667,7 +668,7 @@ class TestHashGarbageCollect:
 
     def test_medium_small_hash(self, basic_logger):
         """Medium: Garbage collect on small hash"""
-        from hw_management_lib import _MsgState
+        _MsgState = hw_management_lib._MsgState
 
         # Add a few entries
         now = current_milli_time()
@@ -686,7 +687,7 @@ class TestHashGarbageCollect:
 
     def test_complex_exceed_max_size(self, basic_logger):
         """Complex: Hash exceeds MAX_MSG_HASH_SIZE (100)"""
-        from hw_management_lib import _MsgState
+        _MsgState = hw_management_lib._MsgState
 
         # Add more than MAX_MSG_HASH_SIZE entries
         now = current_milli_time()
@@ -700,12 +701,14 @@ class TestHashGarbageCollect:
             )
 
         basic_logger._msg_hash_garbage_collect(basic_logger.log_hash)
-        # Should clear the entire hash
-        assert len(basic_logger.log_hash) == 0
+        # Least recently seen entries evicted down to max size
+        assert len(basic_logger.log_hash) == basic_logger.MAX_MSG_HASH_SIZE
+        assert hash("id_49") not in basic_logger.log_hash
+        assert hash("id_50") in basic_logger.log_hash
 
     def test_complex_timeout_cleanup(self, basic_logger):
         """Complex: Cleanup of old messages (timeout)"""
-        from hw_management_lib import _MsgState
+        _MsgState = hw_management_lib._MsgState
 
         current_time = current_milli_time()
 
@@ -742,9 +745,9 @@ class TestHashGarbageCollect:
 class TestHashMessageCountOverload:
     """Tests for hash message count overload scenarios"""
 
-    def test_exceed_max_hash_size_clear_all(self, basic_logger):
-        """Test: Hash exceeds MAX_MSG_HASH_SIZE (100) - should clear all messages"""
-        from hw_management_lib import _MsgState
+    def test_exceed_max_hash_size_evict_lru(self, basic_logger):
+        """Test: Hash exceeds MAX_MSG_HASH_SIZE (100) - least recently seen messages evicted"""
+        _MsgState = hw_management_lib._MsgState
 
         # Add more than MAX_MSG_HASH_SIZE entries manually
         now = current_milli_time()
@@ -763,12 +766,13 @@ class TestHashMessageCountOverload:
         # Trigger garbage collection
         basic_logger._msg_hash_garbage_collect(basic_logger.log_hash)
 
-        # Should clear the entire hash
-        assert len(basic_logger.log_hash) == 0
+        # Only overflow is evicted, repeat state of the rest is kept
+        assert len(basic_logger.log_hash) == basic_logger.MAX_MSG_HASH_SIZE
+        assert basic_logger.get_hash_stat()["evict"] == 20
 
     def test_exceed_timeout_hash_size_cleanup_expired(self, basic_logger):
         """Test: Hash exceeds MAX_MSG_TIMEOUT_HASH_SIZE (50) but < 100 - should clean expired"""
-        from hw_management_lib import _MsgState
+        _MsgState = hw_management_lib._MsgState
 
         now = current_milli_time()
         old_time = now - basic_logger.MSG_HASH_TIMEOUT - 10000  # Expired messages
@@ -835,7 +839,7 @@ class TestHashMessageCountOverload:
 
     def test_hash_size_boundary_conditions(self, basic_logger):
         """Test: Boundary conditions for hash size thresholds"""
-        from hw_management_lib import _MsgState
+        _MsgState = hw_management_lib._MsgState
 
         now = current_milli_time()
 
@@ -878,9 +882,11 @@ class TestHashMessageCountOverload:
             seen_count=1
         )
 
-        # Should trigger full clear
+        # Should evict single least recently seen message
         basic_logger._msg_hash_garbage_collect(basic_logger.log_hash)
-        assert len(basic_logger.log_hash) == 0
+        assert len(basic_logger.log_hash) == basic_logger.MAX_MSG_HASH_SIZE
+        assert hash("id_0") not in basic_logger.log_hash
+        assert hash("one_more") in basic_logger.log_hash
 
     def test_concurrent_hash_overload(self, basic_logger):
         """Test: Concurrent access during hash overload"""
@@ -913,13 +919,92 @@ class TestHashMessageCountOverload:
         assert final_size <= basic_logger.MAX_MSG_HASH_SIZE
 
         # Verify no corruption occurred - all entries should be _MsgState instances
-        from hw_management_lib import _MsgState
+        _MsgState = hw_management_lib._MsgState
         for key, msg_state in basic_logger.log_hash.items():
             assert isinstance(msg_state, _MsgState)
             assert hasattr(msg_state, 'msg')
             assert hasattr(msg_state, 'seen_count')
             assert hasattr(msg_state, 'last_seen')
 
+    def test_burst_keeps_recently_seen_collapsed_messages(self, basic_logger, log_file):
+        """Test: burst of new ids evicts only least recently seen ids, active repeats stay collapsed"""
+        basic_logger.set_log_hash_max_size(256)
+        basic_logger.warning("module1 fault", id="module1", log_repeat=1)
+        for i in range(600):
+            basic_logger.warning("burst {}".format(i), id="burst_{}".format(i), log_repeat=1)
+            if i % 100 == 0:
+                # active condition keeps reporting
+                basic_logger.warning("module1 fault", id="module1", log_repeat=1)
+
+        assert len(basic_logger.log_hash) == 256
+        assert hash("module1") in basic_logger.log_hash
+        assert basic_logger.get_hash_stat()["evict"] == 601 - 256
+        with open(log_file) as f:
+            assert f.read().count("module1 fault") == 1
+
+    def test_burst_does_not_evict_collapsed_messages(self, basic_logger, log_file):
+        """Test: collapsed messages are kept over hash max size, burst evicts messages still logged"""
+        basic_logger.set_log_hash_max_size(256)
+        for i in range(300):
+            for _ in range(3):
+                basic_logger.warning("module{} fault".format(i), id="module{}".format(i), log_repeat=2)
+        assert len(basic_logger.log_hash) == 300
+        assert basic_logger.get_hash_stat()["evict"] == 0
+
+        for i in range(1000):
+            basic_logger.warning("burst {}".format(i), id="burst_{}".format(i), log_repeat=2)
+        # collapsed messages and the newest one
+        assert len(basic_logger.log_hash) == 301
+        assert basic_logger.get_hash_stat()["evict"] == 999
+
+        for i in range(300):
+            basic_logger.warning("module{} fault".format(i), id="module{}".format(i), log_repeat=2)
+        with open(log_file) as f:
+            assert f.read().count("module0 fault") == 2
+
+    def test_hash_sized_for_ids_collapses_all(self, basic_logger, log_file):
+        """Test: 512 ids reported each cycle with repeat=2 are logged twice, then collapsed"""
+        basic_logger.set_log_hash_max_size(512)
+        logged = []
+        for _ in range(4):
+            with open(log_file) as f:
+                start = f.read().count("fault")
+            for i in range(512):
+                basic_logger.warning("module{} fault".format(i), id="module{}".format(i), log_repeat=2)
+            with open(log_file) as f:
+                logged.append(f.read().count("fault") - start)
+        assert logged == [512, 512, 0, 0]
+        assert basic_logger.get_hash_stat()["evict"] == 0
+
+    def test_hash_stat(self, basic_logger):
+        """Test: get_hash_stat() reports counters and hash sizes"""
+        basic_logger.info("msg", id="msg", log_repeat=1)
+        assert basic_logger.get_hash_stat() == {"evict": 0, "expire": 0, "log_hash_size": 1, "syslog_hash_size": 0}
+
+    def test_scheduled_expiry(self, basic_logger, monkeypatch):
+        """Test: expired messages removed by periodic expiry, not on each message"""
+        now = [current_milli_time()]
+        monkeypatch.setattr(hw_management_lib, "current_milli_time", lambda: now[0])
+        basic_logger._hash_expire_ts = 0
+        basic_logger.info("old", id="old", log_repeat=1)
+        now[0] += basic_logger.MSG_HASH_TIMEOUT + 1
+        basic_logger.info("new", id="new", log_repeat=1)
+        assert hash("old") not in basic_logger.log_hash
+        assert basic_logger.get_hash_stat()["expire"] == 1
+
+        # next expiry run not earlier than MSG_HASH_EXPIRE_INTERVAL
+        gc_calls = []
+        gc_orig = basic_logger._msg_hash_garbage_collect
+        monkeypatch.setattr(basic_logger, "_msg_hash_garbage_collect",
+                            lambda log_hash, now=None: gc_calls.append(log_hash) or gc_orig(log_hash, now))
+        for i in range(10):
+            now[0] += 1000
+            basic_logger.info("msg {}".format(i), id="msg_{}".format(i), log_repeat=1)
+        assert gc_calls == []
+        now[0] += basic_logger.MSG_HASH_EXPIRE_INTERVAL
+        basic_logger.info("other", id="other", log_repeat=1)
+        assert len(gc_calls) == 2
+
 
 class TestResourceManagement:
     """Tests for stop(), close_log_handler(), __del__()"""
@@ -1456,6 +1541,306 @@ class TestRepeatedTimerCoverage:
         assert result
 
 
+class TestAsyncLogger:
+    """Test async (queue-backed) output mode of HW_Mgmt_Logger"""
+
+    @pytest.fixture
+    def async_logger(self, log_file):
+        logger = HW_Mgmt_Logger(log_file=log_file, log_level=HW_Mgmt_Logger.INFO, syslog_level=0)
+        logger.set_async_mode(16)
+        yield logger
+        logger.stop()
+
+    @staticmethod
+    def _read(log_file):
+        with open(log_file) as f:
+            return [line.split(" - ", 2)[2].rstrip("\n") for line in f]
+
+    def test_records_written_in_order(self, async_logger, log_file):
+        for idx in range(10):
+            async_logger.info("msg {}".format(idx))
+        async_logger.flush()
+        assert self._read(log_file) == ["msg {}".format(idx) for idx in range(10)]
+
+    def test_overflow_drops_oldest_and_reports(self, async_logger, log_file):
+        # hold writer output while ring overflows
+        with async_logger._async_io_lock:
+            for idx in range(20):
+                async_logger.info("msg {}".format(idx))
+            assert async_logger.async_dropped == 4
+        async_logger.flush()
+        lines = self._read(log_file)
+        assert lines[0] == "Logger queue overflow: 4 messages dropped"
+        assert lines[1:] == ["msg {}".format(idx) for idx in range(4, 20)]
+
+    def test_critical_written_synchronously(self, async_logger, log_file):
+        async_logger.info("pending")
+        async_logger.critical("fatal")
+        # no flush - CRITICAL flushes pending records and itself
+        assert self._read(log_file)[-2:] == ["pending", "fatal"]
+
+    def test_stop_flushes_and_disables_async(self, log_file):
+        logger = HW_Mgmt_Logger(log_file=log_file, log_level=HW_Mgmt_Logger.INFO, syslog_level=0)
+        logger.set_async_mode(16)
+        writer = logger._async_thread
+        logger.info("last message")
+        logger.stop()
+        assert not writer.is_alive()
+        assert logger._async_queue is None
+        assert self._read(log_file) == ["last message"]
+
+    def test_invalid_queue_size(self, basic_logger):
+        with pytest.raises(ValueError):
+            basic_logger.set_async_mode(-1)
+
+
+class TestJobScheduler:
+    """Test JobScheduler: single thread periodic jobs with drift compensation"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [100000]
+        monkeypatch.setattr(hw_management_lib, "current_milli_time", lambda: now[0])
+        return now
+
+    def test_fixed_grid_no_drift(self, clock):
+        sched = JobScheduler()
+        runs = []
+
+        def job_fn():
+            runs.append(clock[0])
+            clock[0] += 300  # job runtime does not shift the schedule
+
+        job = sched.add_job(job_fn, 1, auto_start=True)
+        for _ in range(3):
+            sched.run_pending()
+            clock[0] = 100000 + len(runs) * 1000 + 50
+        assert runs == [100000, 101050, 102050]
+        stat = sched.get_stat()["job_fn"]
+        assert stat["run_cnt"] == 3
+        assert stat["late_max_ms"] == 50
+        assert job.due_ts == 103000
+
+    def test_overrun_skips_missed_periods(self, clock):
+        sched = JobScheduler()
+        job = sched.add_job(lambda: None, 1, auto_start=True, name="slow")
+        sched.run_pending()
+        clock[0] += 3500
+        assert sched.run_pending() == 1
+        # 102000 and 103000 runs missed, next run stays on 1s grid
+        assert job.stat["skip_cnt"] == 2
+        assert job.due_ts == 104000
+        assert sched.get_next_timeout() == pytest.approx(0.5)
+
+    def test_priority_order_of_due_jobs(self, clock):
+        sched = JobScheduler()
+        order = []
+        sched.add_job(lambda: order.append("report"), 5, auto_start=True)
+        sched.add_job(lambda: order.append("pwm"), 5, priority=1, auto_start=True)
+        sched.run_pending()
+        assert order == ["pwm", "report"]
+
+    def test_stop_from_job_and_restart(self, clock):
+        sched = JobScheduler()
+        runs = []
+
+        def job_fn():
+            runs.append(clock[0])
+            job.stop()
+
+        job = sched.add_job(job_fn, 1)
+        assert not job.is_running()
+        job.start()
+        sched.run_pending()
+        assert not job.is_running()
+        clock[0] += 1000
+        assert sched.run_pending() == 0
+        assert sched.get_next_timeout(10) == 10
+
+        job.start()
+        assert sched.run_pending() == 1
+        assert len(runs) == 2
+
+    def test_jitter_and_error_accounting(self, clock):
+        sched = JobScheduler()
+
+        def job_fn():
+            raise ValueError("job error")
+
+        job = sched.add_job(job_fn, 10, jitter=0.5, auto_start=True)
+        assert 100000 <= job.due_ts < 105000
+        clock[0] = job.due_ts
+        sched.run_pending()
+        assert job.stat["err_cnt"] == 1
+        assert 110000 <= job.due_ts < 115000
+        with pytest.raises(ValueError):
+            sched.add_job(job_fn, 1, jitter=1.5)
+
+    def test_thread_mode_runs_jobs(self):
+        sched = JobScheduler()
+        event = threading.Event()
+        sched.add_job(event.set, 0.05, auto_start=True)
+        sched.start()
+        try:
+            assert event.wait(1.0)
+            assert sched.is_running()
+        finally:
+            assert sched.stop()
+        assert not sched.is_running()
+
+
+def _attr(fn, poll, fin=None, **kwargs):
+    attr = {"fin": fin, "fn": fn, "arg": [fn], "poll": poll, "ts": 0}
+    attr.update(kwargs)
+    return attr
+
+
+class TestAttrEntry:
+    """Test updater attribute entries scheduled as JobScheduler jobs"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [100000]
+        monkeypatch.setattr(hw_management_lib, "current_milli_time", lambda: now[0])
+        return now
+
+    def test_compile_entry(self):
+        handler = MagicMock()
+        entry = hw_management_lib.AttrEntry(_attr("sync_fan", 5, fin="/sys/hwmon/{hwmon}/fan1", hwmon="hwmon2"),
+                                            {"sync_fan": handler})
+        assert entry.fn is handler
+        assert entry.fin == "/sys/hwmon/hwmon2/fan1"
+        assert (entry.poll, entry.poll_cfg, entry.oldval, entry.watch) == (5, None, None, "poll")
+        assert entry.name == "/sys/hwmon/hwmon2/fan1"
+        assert hw_management_lib.AttrEntry(_attr("run_cmd", 1), {"run_cmd": handler}).name == "run_cmd(['run_cmd'])"
+        with pytest.raises(KeyError):
+            hw_management_lib.AttrEntry(_attr("no_such_fn", 1), {})
+        with pytest.raises(ValueError):
+            JobScheduler().add_entry(_attr("nopoll", 0), {"nopoll": None}, print)
+
+    def test_entries_run_and_reschedule(self, clock):
+        sched = JobScheduler()
+        runs = []
+        fast = sched.add_entry(_attr("fast", 1), {"fast": None}, lambda entry: runs.append(entry.fn_name))
+        slow = sched.add_entry(_attr("slow", 5), {"slow": None}, lambda entry: runs.append(entry.fn_name))
+        assert sched.get_jobs() == [fast, slow]
+
+        assert sched.run_pending() == 2
+        assert runs == ["fast", "slow"]
+        assert sched.get_next_timeout(10) == 1
+        clock[0] += 1000
+        runs.clear()
+        assert sched.run_pending() == 1
+        assert runs == ["fast"]
+        assert (fast.due_ts, slow.due_ts) == (102000, 105000)
+
+    def test_wake_and_set_interval(self, clock):
+        sched = JobScheduler()
+        entry = sched.add_entry(_attr("bmc", 30), {"bmc": None}, lambda entry: None)
+        sched.run_pending()
+        assert sched.get_next_timeout(60) == 30
+
+        # longer interval applies after next run, shorter one moves next run earlier
+        entry.set_interval(300)
+        assert (entry.poll, entry.due_ts) == (300, 130000)
+        entry.set_interval(10)
+        assert (entry.poll, entry.due_ts) == (10, 110000)
+        assert sched.get_next_timeout(60) == 10
+
+        clock[0] += 2000
+        entry.wake()
+        entry.wake()
+        assert sched.get_next_timeout(60) == 0
+        assert sched.run_pending() == 1
+        # stale heap items are skipped, schedule continues from woken run
+        assert sched.get_next_timeout(60) == 10
+        assert sched.stat["wake"] == 2
+
+    def test_wake_while_running_is_kept(self, clock):
+        sched = JobScheduler()
+        runs = []
+
+        def run(entry):
+            runs.append(clock[0])
+            if len(runs) == 1:
+                entry.wake()
+
+        sched.add_entry(_attr("fin", 30), {"fin": None}, run)
+        sched.run_pending()
+        assert sched.get_next_timeout(60) == 0
+        sched.run_pending()
+        assert len(runs) == 2
+        assert sched.get_next_timeout(60) == 30
+
+    def test_stop_and_shutdown_keep_jobs_due(self, clock):
+        class Shutdown(BaseException):
+            pass
+
+        sched = JobScheduler()
+        runs = []
+
+        def run(entry):
+            runs.append(entry.fn_name)
+            if entry.fn_name == "c":
+                raise Shutdown()
+
+        for name in ("a", "b", "c"):
+            sched.add_entry(_attr(name, 1), {name: None}, run)
+        assert sched.run_pending(stop=lambda: len(runs) == 1) == 1
+        assert sched.get_next_timeout(10) == 0
+        with pytest.raises(Shutdown):
+            sched.run_pending()
+        assert runs == ["a", "b", "c"]
+        assert sched.get_next_timeout(10) == 0
+        assert len([job for job in sched.get_jobs() if job.due_ts == 100000]) == 1
+
+    def test_runtime_lateness_report(self, clock):
+        logger = MagicMock()
+        sched = JobScheduler(logger=logger, slow_ms=5)
+
+        def run(entry):
+            if entry.fn_name == "slow_fn":
+                clock[0] += 2000
+                time.sleep(0.02)
+            elif entry.fn_name == "err_fn":
+                raise ValueError("read error")
+
+        slow = sched.add_entry(_attr("slow_fn", 3), {"slow_fn": None}, run)
+        late = sched.add_entry(_attr("late_fn", 3), {"late_fn": None}, run)
+        err = sched.add_entry(_attr("err_fn", 3), {"err_fn": None}, run)
+        sched.run_pending()
+        assert (slow.stat["run_cnt"], slow.stat["late_max_ms"]) == (1, 0)
+        # waited for slow handler
+        assert late.stat["late_max_ms"] == 2000
+        assert err.stat["err_cnt"] == 1
+        logger.warning.assert_called_once()
+        assert "slow_fn" in logger.warning.call_args[0][0]
+        assert "read error" in logger.error.call_args[0][0]
+        assert sched.stat == {"run": 3, "wake": 0, "slow": 1}
+
+        lines = sched.report()
+        assert lines[0] == "Jobs: 3 runs 3 wakes 0 slow 1"
+        assert lines[1].startswith("  slow_fn(['slow_fn']): runs 1 avg ")
+
+    def test_fin_resolved_again(self, tmp_path):
+        # tmp_path is named after the test: no "hwmon" before device directory
+        hwmon_dir = tmp_path / "mlxreg-io" / "hwmon"
+        (hwmon_dir / "hwmon3").mkdir(parents=True)
+        fin = str(hwmon_dir / "{hwmon}" / "fan1")
+        assert hw_management_lib.hwmon_lookup(fin) == "hwmon3"
+        assert hw_management_lib.hwmon_lookup("/nonexistent/hwmon/{hwmon}/fan1") == ""
+
+        entry = hw_management_lib.AttrEntry(_attr("sync_fan", 5, fin=fin, hwmon="hwmon3"), {"sync_fan": None})
+        assert not entry.resolve_fin()
+        # driver reload renumbered hwmon device
+        os.rename(str(hwmon_dir / "hwmon3"), str(hwmon_dir / "hwmon5"))
+        assert entry.resolve_fin()
+        assert entry.fin == entry.name == str(hwmon_dir / "hwmon5" / "fan1")
+        # no hwmon in path
+        assert not hw_management_lib.AttrEntry(_attr("run_cmd", 5, fin="/tmp/power_button_clr"),
+                                               {"run_cmd": None}).resolve_fin()
+
+
 # =============================================================================
 # TEST MAIN
 # =============================================================================
@@ -145,6 +145,55 @@ class TestRetrieveValue:
         assert result is None
 
 
+class TestLabelIndex:
+    """Test LabelIndex and retrieve_bulk against retrieve_value"""
+
+    LABELS_DIR = Path(__file__).resolve().parents[2] / "usr" / "etc" / "hw-management-sensors"
+
+    def test_exact_key_fast_path(self):
+        """Literal pattern not matched by earlier patterns resolved via exact map"""
+        section = {"voltmon1_in1": "VIN", "voltmon1": "prefix", "psu.*": "psu"}
+        index = parse_labels.LabelIndex(section)
+        assert index.exact == {"voltmon1_in1": "VIN", "voltmon1": "prefix"}
+        assert index.lookup("voltmon1_in1") == "VIN"
+        assert index.lookup("psu2_volt") == "psu"
+        assert index.lookup("fan1") is None
+
+    def test_shadowed_literal_keeps_order(self):
+        """Earlier prefix literal or regex wins over later exact key, as in retrieve_value"""
+        section = {"voltmon1": "prefix", "fan[0-9]_speed": "regex",
+                   "voltmon10_in1": "shadowed", "fan1_speed": "shadowed"}
+        index = parse_labels.LabelIndex(section)
+        assert "voltmon10_in1" not in index.exact
+        assert "fan1_speed" not in index.exact
+        for key in ("voltmon10_in1", "fan1_speed"):
+            assert index.lookup(key) == parse_labels.retrieve_value({"l": section}, "l", key)
+
+    def test_same_result_as_retrieve_value_for_shipped_labels(self):
+        """Index lookup matches ordered re.match() for all shipped label files"""
+        label_files = sorted(self.LABELS_DIR.glob("*_sensors_labels.json"))
+        assert label_files
+        for label_file in label_files:
+            dictionary = parse_labels.load_json(str(label_file))
+            for label, section in dictionary.items():
+                if not isinstance(section, dict) or not label.endswith("_array"):
+                    continue
+                keys = list(section.keys())
+                keys += [key + "_1" for key in keys] + ["fan1_speed", "voltmon10_in1", "psu1_volt", "unknown"]
+                index = parse_labels.LabelIndex(section)
+                for key in keys:
+                    assert index.lookup(key) == parse_labels.retrieve_value(dictionary, label, key), (label_file, key)
+
+    def test_retrieve_bulk_missing_sections(self):
+        """Missing label or scale section yields None values"""
+        dictionary = {"labels_X_rev1_array": {"temp1": "t1"}}
+        result = parse_labels.retrieve_bulk(dictionary, "labels_X_rev1_array", "labels_scale_X_rev1_array",
+                                            ["temp1", "temp2"])
+        assert result == [("temp1", "t1", None), ("temp2", None, None)]
+        assert parse_labels.format_bulk_line("temp2", None, None) == "temp2\t\t"
+        assert parse_labels.format_bulk_line("temp1", "t1", 1000) == "temp1\tt1\t1000"
+
+
 class TestProcessBOMDictionary:
     """Test process_BOM_dictionary function"""
 
@@ -390,6 +439,29 @@ class TestMain:
             # Should print empty line when not found
             assert captured.out.strip() == ""
 
+    def test_main_bulk(self, capsys):
+        """Test main with --bulk: keys from stdin, label and scale per line"""
+        test_dict = {
+            "labels_MSN1234_rev1_array": {"voltmon1_in1": "VIN", "temp.*": "temperature_value"},
+            "labels_scale_MSN1234_rev1_array": {"voltmon1_in1": 1000}
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dict_file = os.path.join(tmpdir, "dict.pkl")
+
+            with open(dict_file, 'wb') as f:
+                pickle.dump(test_dict, f)
+
+            with patch('sys.argv', ['parse_labels.py', '--bulk', '--sku', 'MSN1234',
+                                    '--dictionary_file', dict_file]):
+                with patch('sys.stdin', ["voltmon1_in1\n", "\n", "temp3\n", "fan1\n"]):
+                    parse_labels.main()
+
+            captured = capsys.readouterr()
+            assert captured.out.splitlines() == ["voltmon1_in1\tVIN\t1000",
+                                                 "temp3\ttemperature_value\t",
+                                                 "fan1\t\t"]
+
     def test_main_no_arguments(self, capsys):
         """Test main with no arguments - should print help"""
         with patch('sys.argv', ['parse_labels.py']):
@@ -36,11 +36,16 @@ import builtins
 import tempfile
 import shutil
 import importlib.util
-from unittest.mock import patch, MagicMock
+import subprocess
+import threading
+import time
+from unittest.mock import patch, MagicMock, mock_open
 
 # Add parent directory to path to import the module under test
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../usr/usr/bin'))
 
+from hw_management_lib import AttrEntry, JobScheduler, current_milli_time  # noqa: E402
+
 
 def _peripheral_updater_script_path():
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -305,19 +310,19 @@ class TestUpdatePeripheralAttrLogic(unittest.TestCase):
         }
 
         with patch.dict(peripheral_module.__dict__, {'mock_fn': mock_fn}):
+            entry = AttrEntry(attr_prop, vars(peripheral_module))
             # First call - should trigger
-            peripheral_module.update_peripheral_attr(attr_prop)
+            peripheral_module.update_peripheral_attr(entry)
             self.assertEqual(mock_fn.call_count, 1)
 
             # Second call with same value - should NOT trigger
-            peripheral_module.update_peripheral_attr(attr_prop)
+            peripheral_module.update_peripheral_attr(entry)
             self.assertEqual(mock_fn.call_count, 1, "Should not trigger on same value")
 
             # Change value - should trigger again
             with open(test_file, 'w') as f:
                 f.write("200\n")
-            attr_prop["ts"] = 0  # Reset timestamp to allow immediate trigger
-            peripheral_module.update_peripheral_attr(attr_prop)
+            peripheral_module.update_peripheral_attr(entry)
             self.assertEqual(mock_fn.call_count, 2, "Should trigger on value change")
 
     def test_no_fin_always_triggers(self):
@@ -334,8 +339,9 @@ class TestUpdatePeripheralAttrLogic(unittest.TestCase):
         }
 
         with patch.dict(peripheral_module.__dict__, {'mock_fn': mock_fn}):
-            peripheral_module.update_peripheral_attr(attr_prop)
-            peripheral_module.update_peripheral_attr(attr_prop)
+            entry = AttrEntry(attr_prop, vars(peripheral_module))
+            peripheral_module.update_peripheral_attr(entry)
+            peripheral_module.update_peripheral_attr(entry)
 
         # Should trigger both times (no change detection without fin)
         self.assertGreaterEqual(mock_fn.call_count, 1)
@@ -354,7 +360,7 @@ class TestUpdatePeripheralAttrLogic(unittest.TestCase):
         }
 
         with patch.dict(peripheral_module.__dict__, {'mock_fn': mock_fn}):
-            peripheral_module.update_peripheral_attr(attr_prop)
+            peripheral_module.update_peripheral_attr(AttrEntry(attr_prop, vars(peripheral_module)))
 
         # Should not trigger
         mock_fn.assert_not_called()
@@ -642,59 +648,354 @@ class TestUtilityFunctions(unittest.TestCase):
     """Test utility functions in peripheral_updater"""
 
     def test_run_power_button_event(self):
-        """Test run_power_button_event executes commands"""
+        """Test run_power_button_event queues chassis events"""
         import hw_management_peripheral_updater as peripheral_module
 
-        with patch('hw_management_peripheral_updater.os.system') as mock_system:
+        with patch.object(peripheral_module.EVENT_POOL, 'submit') as mock_submit:
             peripheral_module.run_power_button_event(None, "1")
 
-            # Should call os.system 3 times (2 hotplug events + logger)
-            self.assertEqual(mock_system.call_count, 3)
+            # 2 hotplug events + logger, in order under one key
+            mock_submit.assert_called_once()
+            key, cmd = mock_submit.call_args[0]
+            self.assertEqual(key, "POWER_BUTTON")
+            self.assertEqual(cmd.split("; ")[:2],
+                             ["/usr/bin/hw-management-chassis-events.sh hotplug-event POWER_BUTTON 1",
+                              "/usr/bin/hw-management-chassis-events.sh hotplug-event GRACEFUL_PWR_OFF 1"])
+            self.assertTrue(cmd.split("; ")[2].startswith("logger -t hw-management-peripheral-updater"))
 
     def test_run_power_button_event_released(self):
         """Test run_power_button_event when released (value=0)"""
         import hw_management_peripheral_updater as peripheral_module
 
-        with patch('hw_management_peripheral_updater.os.system') as mock_system:
+        with patch.object(peripheral_module.EVENT_POOL, 'submit') as mock_submit:
             peripheral_module.run_power_button_event(None, "0")
 
-            # Should call os.system 2 times (no logger for release)
-            self.assertEqual(mock_system.call_count, 2)
+            # no logger for release
+            mock_submit.assert_called_once()
+            self.assertEqual(mock_submit.call_args[0][1].split("; "),
+                             ["/usr/bin/hw-management-chassis-events.sh hotplug-event POWER_BUTTON 0",
+                              "/usr/bin/hw-management-chassis-events.sh hotplug-event GRACEFUL_PWR_OFF 0"])
 
     def test_run_cmd_with_command_list(self):
-        """Test run_cmd executes list of commands"""
+        """Test run_cmd queues each command, keyed by command template"""
         import hw_management_peripheral_updater as peripheral_module
 
         cmd_list = ["echo test_{arg1}", "echo another_{arg1}"]
 
-        with patch('hw_management_peripheral_updater.os.system') as mock_system:
+        with patch.object(peripheral_module.EVENT_POOL, 'submit') as mock_submit:
             peripheral_module.run_cmd(cmd_list, "arg_value")
 
-            # Should call os.system for each command
-            self.assertEqual(mock_system.call_count, 2)
+            self.assertEqual([c[0] for c in mock_submit.call_args_list],
+                             [("echo test_{arg1}", "echo test_arg_value"),
+                              ("echo another_{arg1}", "echo another_arg_value")])
 
-    def test_sync_fan_absent(self):
-        """Test sync_fan with fan absent (val=0)"""
+    def _sync_fan(self, fan_id, val):
         import hw_management_peripheral_updater as peripheral_module
 
-        with patch('hw_management_peripheral_updater.os.system') as mock_system:
-            peripheral_module.sync_fan(1, "0")
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        status_file = os.path.join(tmp_dir, "fan{}_status")
+        with patch.object(peripheral_module, 'FAN_STATUS_FILE', status_file), \
+                patch.object(peripheral_module.EVENT_POOL, 'submit') as mock_submit:
+            peripheral_module.sync_fan(fan_id, val)
+        with open(status_file.format(fan_id)) as f:
+            return f.read(), mock_submit.call_args_list
 
-            # Should call os.system twice (echo + hotplug event)
-            self.assertEqual(mock_system.call_count, 2)
-            # Check that status=1 for absent fan
-            calls = [str(call) for call in mock_system.call_args_list]
-            self.assertTrue(any("fan1_status" in str(call) for call in calls))
+    def test_sync_fan_absent(self):
+        """Test sync_fan with fan absent (val=0): status written in-process, event queued"""
+        status, calls = self._sync_fan(1, "0")
+        self.assertEqual(status, "1\n")
+        self.assertEqual([c[0] for c in calls],
+                         [("FAN1", "/usr/bin/hw-management-chassis-events.sh hotplug-event FAN1 1")])
 
     def test_sync_fan_present(self):
         """Test sync_fan with fan present (val=1)"""
+        status, calls = self._sync_fan(2, "1")
+        self.assertEqual(status, "0\n")
+        self.assertEqual(calls[0][0][0], "FAN2")
+
+    def test_sync_fan_write_error(self):
+        """Status file write error does not block chassis event"""
         import hw_management_peripheral_updater as peripheral_module
 
-        with patch('hw_management_peripheral_updater.os.system') as mock_system:
-            peripheral_module.sync_fan(2, "1")
+        with patch.object(peripheral_module, 'FAN_STATUS_FILE', "/nonexistent/dir/fan{}_status"), \
+                patch.object(peripheral_module.EVENT_POOL, 'submit') as mock_submit:
+            peripheral_module.sync_fan(3, "0")
+        self.assertEqual(mock_submit.call_count, 1)
+
+
+class TestEventWorkerPool(unittest.TestCase):
+    """Test bounded coalescing worker pool for event commands"""
 
-            # Should call os.system twice
-            self.assertEqual(mock_system.call_count, 2)
+    def setUp(self):
+        import hw_management_peripheral_updater as peripheral_module
+        self.module = peripheral_module
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.started = []
+        self.done = []
+        self.active = 0
+        self.max_active = 0
+
+    def _run(self, cmd, timeout):
+        with self.lock:
+            self.started.append(cmd)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.release.wait(5)
+        with self.lock:
+            self.active -= 1
+            self.done.append(cmd)
+        return 0
+
+    def _pool(self, workers=2, run=None):
+        pool = self.module.EventWorkerPool(workers=workers, timeout=1, run=run or self._run)
+        self.addCleanup(pool.stop)
+        return pool
+
+    def test_bounded_workers(self):
+        pool = self._pool(workers=2)
+        for idx in range(6):
+            pool.submit("LEAKAGE{}".format(idx), "event {}".format(idx))
+        self.release.set()
+        self.assertTrue(pool.wait_idle(5))
+        self.assertEqual(sorted(self.done), sorted("event {}".format(idx) for idx in range(6)))
+        self.assertLessEqual(self.max_active, 2)
+        self.assertLessEqual(len(pool._threads), 2)
+        self.assertEqual(pool.stat["done"], 6)
+
+    def test_coalesce_and_serialize_same_key(self):
+        pool = self._pool(workers=4)
+        pool.submit("FAN1", "FAN1 1")
+        # wait first command started, then queue superseded values
+        for _ in range(500):
+            if self.started:
+                break
+            time.sleep(0.01)
+        pool.submit("FAN1", "FAN1 0")
+        pool.submit("FAN1", "FAN1 1")
+        pool.submit("FAN1", "FAN1 0")
+        self.release.set()
+        self.assertTrue(pool.wait_idle(5))
+        # running command completed, queued values replaced by the last one
+        self.assertEqual(self.done, ["FAN1 1", "FAN1 0"])
+        self.assertEqual(self.max_active, 1)
+        self.assertEqual((pool.stat["submit"], pool.stat["coalesced"]), (4, 2))
+
+    def test_timeout_and_latency(self):
+        def run(cmd, timeout):
+            if cmd == "hang":
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            return 1
+
+        pool = self._pool(run=run)
+        pool.submit("A", "hang")
+        pool.submit("B", "fail")
+        self.assertTrue(pool.wait_idle(5))
+        self.assertEqual((pool.stat["timeout"], pool.stat["fail"], pool.stat["done"]), (1, 1, 2))
+        self.assertGreaterEqual(pool.stat["latency_max_ms"], 0)
+
+    def test_run_command(self):
+        pool_cls = self.module.EventWorkerPool
+        self.assertEqual(pool_cls.run_command("true", 5), 0)
+        self.assertEqual(pool_cls.run_command("exit 3", 5), 3)
+        # executed without shell
+        with patch.object(self.module.subprocess, 'run') as mock_run:
+            pool_cls.run_command("/usr/bin/hw-management-chassis-events.sh hotplug-event FAN1 0", 5)
+            self.assertEqual(mock_run.call_args[0][0],
+                             ["/usr/bin/hw-management-chassis-events.sh", "hotplug-event", "FAN1", "0"])
+            self.assertFalse(mock_run.call_args[1]["shell"])
+        with self.assertRaises(subprocess.TimeoutExpired):
+            pool_cls.run_command("sleep 5", 0.2)
+
+    def test_stop_drops_queued(self):
+        pool = self._pool(workers=1)
+        pool.submit("A", "a")
+        pool.submit("B", "b")
+        self.release.set()
+        pool.stop()
+        pool.submit("C", "c")
+        self.assertNotIn("c", self.started)
+
+
+class TestFinWatcher(unittest.TestCase):
+    """Test sysfs_notify/inotify change detection of fin files"""
+
+    def setUp(self):
+        import hw_management_peripheral_updater as peripheral_module
+        self.module = peripheral_module
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.watcher = peripheral_module.FinWatcher()
+        self.addCleanup(self.watcher.close)
+        self.sched = JobScheduler()
+
+    def _entry(self, fin, poll=2, fn="run_cmd", **kwargs):
+        attr = {"fin": fin, "fn": fn, "arg": [], "poll": poll, "ts": 0}
+        attr.update(kwargs)
+        return self.sched.add_entry(attr, vars(self.module), lambda entry: None)
+
+    def _run_all(self):
+        """Run entries once: next run is due after poll interval"""
+        self.sched.run_pending()
+
+    @staticmethod
+    def _woken(entry):
+        return entry.due_ts <= current_milli_time()
+
+    def test_inotify_write_and_create(self):
+        leak = self._entry(os.path.join(self.tmp_dir, "leakage1"))
+        with open(leak.fin, "w") as f:
+            f.write("0\n")
+        button = self._entry(os.path.join(self.tmp_dir, "power_button_clr"), poll=1)
+        self.assertEqual(self.watcher.add(leak), "inotify")
+        self.assertEqual(self.watcher.add(button), "inotify")
+        self.assertEqual((leak.poll, leak.poll_cfg), (self.module.FIN_INOTIFY_LIVENESS_POLL, 2))
+        self._run_all()
+
+        self.assertFalse(self.watcher.wait(0))
+        with open(leak.fin, "w") as f:
+            f.write("1\n")
+        start = time.monotonic()
+        self.assertTrue(self.watcher.wait(5))
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual((self._woken(leak), self._woken(button)), (True, False))
+
+        # file which does not exist yet
+        with open(button.fin, "w") as f:
+            f.write("1")
+        self.assertTrue(self.watcher.wait(5))
+        self.assertTrue(self._woken(button))
+
+        # not watched anymore: configured poll restored
+        self.watcher.remove(leak)
+        self.assertEqual((leak.watch, leak.poll, leak.poll_cfg), ("poll", 2, None))
+
+    def _sysfs_entry(self, sock):
+        entry = self._entry("/sys/devices/platform/mlxplat/mlxreg-io/hwmon/{hwmon}/fan1", poll=5, fn="sync_fan",
+                            hwmon="hwmon3")
+        opened = []
+
+        def sysfs_open(path):
+            opened.append(path)
+            return sock.fileno()
+
+        with patch.object(self.module.FinWatcher, "sysfs_open", staticmethod(sysfs_open)), \
+                patch.object(self.module.os.path, "realpath", side_effect=lambda path: path):
+            self.assertEqual(self.watcher.add(entry), "sysfs_notify")
+        self.assertEqual(opened, ["/sys/devices/platform/mlxplat/mlxreg-io/hwmon/hwmon3/fan1"])
+        return entry
+
+    def test_sysfs_notify(self):
+        import socket
+        sock_a, sock_b = socket.socketpair()
+        self.addCleanup(sock_a.close)
+        self.addCleanup(sock_b.close)
+        entry = self._sysfs_entry(sock_b)
+        # configured poll kept as fallback
+        self.assertEqual(entry.poll, 5)
+        self._run_all()
+
+        self.assertFalse(self.watcher.wait(0))
+        # urgent data raises POLLPRI as sysfs_notify does
+        sock_a.send(b"!", socket.MSG_OOB)
+        with patch.object(self.module.FinWatcher, "sysfs_alive", staticmethod(lambda fd, path: True)), \
+                patch.object(self.module.FinWatcher, "sysfs_rearm",
+                             staticmethod(lambda fd: sock_b.recv(1, socket.MSG_OOB))):
+            self.assertTrue(self.watcher.wait(5))
+        self.assertTrue(self._woken(entry))
+        self.assertEqual(entry.watch, "sysfs_notify")
+        self.watcher.sysfs_fd = {}
+
+    def test_sysfs_removed_hwmon_resolved_again(self):
+        """Removed sysfs attribute: watch dropped, entry run finds renumbered hwmon and watches new file"""
+        import socket
+        sock_a, sock_b = socket.socketpair()
+        self.addCleanup(sock_a.close)
+        entry = self._sysfs_entry(sock_b)
+        self._run_all()
+
+        sock_a.send(b"!", socket.MSG_OOB)
+        self.assertTrue(self.watcher.wait(5))
+        # fd closed, entry polled and scheduled to read the file again
+        self.assertEqual((self.watcher.sysfs_fd, entry.watch), ({}, "poll"))
+        self.assertTrue(self._woken(entry))
+
+        fin = os.path.join(self.tmp_dir, "hwmon", "hwmon4", "fan1")
+        os.makedirs(os.path.dirname(fin))
+        with open(fin, "w") as f:
+            f.write("6000\n")
+        entry.fin_tmpl = os.path.join(self.tmp_dir, "hwmon", "{hwmon}", "fan1")
+        entry.fin = entry.fin_tmpl.format(hwmon=entry.hwmon)
+        entry.fn = MagicMock()
+        with patch.object(self.module, "FIN_WATCHER", self.watcher), patch.object(self.module, "LOGGER"):
+            self.module.update_peripheral_attr(entry)
+        self.assertEqual((entry.hwmon, entry.fin), ("hwmon4", fin))
+        entry.fn.assert_called_once_with([], "6000")
+        self.assertEqual(entry.watch, "inotify")
+
+    def test_sysfs_removed_same_path_rearmed(self):
+        """Sysfs attribute removed and created again at the same path: watched again on next read"""
+        import socket
+        sock_a, sock_b = socket.socketpair()
+        self.addCleanup(sock_a.close)
+        entry = self._sysfs_entry(sock_b)
+        self._run_all()
+
+        sock_a.send(b"!", socket.MSG_OOB)
+        self.assertTrue(self.watcher.wait(5))
+        self.assertEqual(entry.watch, "poll")
+        # fd closed by watcher
+        sock_b.detach()
+
+        sock_c, sock_d = socket.socketpair()
+        self.addCleanup(sock_c.close)
+        self.addCleanup(sock_d.close)
+        entry.fn = MagicMock()
+        with patch.object(self.module, "FIN_WATCHER", self.watcher), \
+                patch.object(self.module.FinWatcher, "sysfs_open", staticmethod(lambda path: sock_d.fileno())), \
+                patch.object(self.module.os.path, "realpath", side_effect=lambda path: path), \
+                patch("builtins.open", mock_open(read_data="6000\n")):
+            self.module.update_peripheral_attr(entry)
+            self.module.update_peripheral_attr(entry)
+        entry.fn.assert_called_once_with([], "6000")
+        self.assertEqual(entry.watch, "sysfs_notify")
+        self.assertEqual((list(self.watcher.sysfs_fd), self.watcher.sysfs_lost), ([sock_d.fileno()], set()))
+        self.watcher.sysfs_fd = {}
+
+    def test_inotify_watch_removed_with_last_entry(self):
+        leak1 = self._entry(os.path.join(self.tmp_dir, "leakage1"))
+        leak2 = self._entry(os.path.join(self.tmp_dir, "leakage2"))
+        self.assertEqual(self.watcher.add(leak1), "inotify")
+        self.assertEqual(self.watcher.add(leak2), "inotify")
+        self.assertEqual(len(self.watcher.inotify_wd), 1)
+        wd = list(self.watcher.inotify_wd)[0]
+
+        self.watcher.remove(leak1)
+        self.assertEqual(list(self.watcher.inotify_wd[wd]), ["leakage2"])
+        self.watcher.remove(leak2)
+        self.assertEqual(self.watcher.inotify_wd, {})
+        # kernel watch released: invalid wd
+        self.assertEqual(self.watcher._libc.inotify_rm_watch(self.watcher.inotify_fd, wd), -1)
+
+        # watched again after removal
+        self.assertEqual(self.watcher.add(leak1), "inotify")
+        self._run_all()
+        with open(leak1.fin, "w") as f:
+            f.write("1\n")
+        self.assertTrue(self.watcher.wait(5))
+        self.assertTrue(self._woken(leak1))
+
+    def test_poll_fallback_and_wake(self):
+        missing = self._entry("/nonexistent/dir/leakage1")
+        self.assertEqual(self.watcher.add(missing), "poll")
+        self.assertEqual(missing.poll, 2)
+        self.assertEqual(self.watcher.add(self._entry(None, poll=5)), "poll")
+
+        threading.Timer(0.05, self.watcher.wake).start()
+        start = time.monotonic()
+        self.assertFalse(self.watcher.wait(5))
+        self.assertLess(time.monotonic() - start, 1)
 
 
 class TestRedfishSensorFunctions(unittest.TestCase):
@@ -793,6 +1094,222 @@ class TestRedfishSensorFunctions(unittest.TestCase):
                 self.assertGreaterEqual(mock_open.call_count, 1)
 
 
+class TestRedfishSensorCollection(unittest.TestCase):
+    """Test Redfish Sensors collection ($expand) bulk read"""
+
+    COLLECTION = "/redfish/v1/Chassis/MGX_BMC_0/Sensors"
+
+    @staticmethod
+    def _sensor(name, reading):
+        return {
+            "@odata.id": "/redfish/v1/Chassis/MGX_BMC_0/Sensors/{}".format(name),
+            "Status": {"State": "Enabled", "Health": "OK"},
+            "ReadingType": "Temperature",
+            "Reading": reading,
+            "Thresholds": {"UpperCritical": {"Reading": 100.0}}
+        }
+
+    def _sensor_list(self):
+        return [["{}/BMC_TEMP".format(self.COLLECTION), "bmc", 1000],
+                ["{}/CPU_TEMP".format(self.COLLECTION), "cpu_bmc", 1000]]
+
+    def setUp(self):
+        import hw_management_peripheral_updater as peripheral_module
+        self.module = peripheral_module
+        self.module.REDFISH_EXPAND_UNSUPPORTED.clear()
+        self.written = {}
+
+    def tearDown(self):
+        self.module.REDFISH_EXPAND_UNSUPPORTED.clear()
+
+    def _write(self, response, sensor_name, sensor_scale):
+        self.written[sensor_name] = int(response["Reading"] * sensor_scale) if response else None
+
+    def test_group_sensors_same_collection(self):
+        """redfish_get_sensor entries of one collection/poll become one redfish_get_sensors entry"""
+        other = {"fin": None, "fn": "run_cmd", "arg": [], "poll": 5, "ts": 0}
+        sensor_list = self._sensor_list()
+        sys_attr = [
+            {"fin": None, "fn": "redfish_get_sensor", "arg": sensor_list[0], "poll": 30, "ts": 0},
+            other,
+            {"fin": None, "fn": "redfish_get_sensor", "arg": sensor_list[1], "poll": 30, "ts": 0},
+            {"fin": None, "fn": "redfish_get_sensor", "arg": ["/redfish/v1/Chassis/X/Sensors/T", "t", 1], "poll": 30, "ts": 0},
+        ]
+        result = self.module.redfish_group_sensors(sys_attr)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0]["fn"], "redfish_get_sensors")
+        self.assertEqual(result[0]["arg"], [self.COLLECTION, sensor_list])
+        self.assertEqual(result[0]["poll"], 30)
+        self.assertIs(result[1], other)
+        # single sensor in collection is left as is
+        self.assertIs(result[2], sys_attr[3])
+
+    def test_expand_single_request(self):
+        """All sensors are taken from one $expand collection response"""
+        response = {"Members": [self._sensor("BMC_TEMP", 45.5), self._sensor("CPU_TEMP", 50.0)]}
+        with patch('hw_management_peripheral_updater.redfish_get_req', return_value=response) as mock_get, \
+                patch('hw_management_peripheral_updater.redfish_write_sensor', side_effect=self._write):
+            self.module.redfish_get_sensors([self.COLLECTION, self._sensor_list()], None)
+
+        mock_get.assert_called_once_with(self.COLLECTION + "?$expand=.($levels=1)")
+        self.assertEqual(self.written, {"bmc": 45500, "cpu_bmc": 50000})
+
+    def test_expand_unsupported_falls_back_per_sensor(self):
+        """Members without inline resource: per-sensor GET, $expand not retried"""
+        links = {"Members": [{"@odata.id": path} for path, _, _ in self._sensor_list()]}
+
+        def get_req(path):
+            if path.startswith(self.COLLECTION + "?"):
+                return links
+            return self._sensor(os.path.basename(path), 40.0)
+
+        with patch('hw_management_peripheral_updater.redfish_get_req', side_effect=get_req) as mock_get, \
+                patch('hw_management_peripheral_updater.redfish_write_sensor', side_effect=self._write), \
+                patch('hw_management_peripheral_updater.LOGGER'):
+            self.module.redfish_get_sensors([self.COLLECTION, self._sensor_list()], None)
+            self.assertEqual(mock_get.call_count, 3)
+            self.module.redfish_get_sensors([self.COLLECTION, self._sensor_list()], None)
+            self.assertEqual(mock_get.call_count, 5)
+
+        self.assertEqual(self.written, {"bmc": 40000, "cpu_bmc": 40000})
+        self.assertIn(self.COLLECTION, self.module.REDFISH_EXPAND_UNSUPPORTED)
+
+    def test_missing_member_and_bad_sensor(self):
+        """Sensor missing in collection is read by GET; bad sensor does not stop the group"""
+        bad = self._sensor("BMC_TEMP", None)
+        del bad["Thresholds"]
+        response = {"Members": [bad]}
+
+        def get_req(path):
+            if path.startswith(self.COLLECTION + "?"):
+                return response
+            return self._sensor("CPU_TEMP", 50.0)
+
+        mock_open = unittest.mock.mock_open()
+        with patch('hw_management_peripheral_updater.redfish_get_req', side_effect=get_req) as mock_get, \
+                patch('hw_management_peripheral_updater.LOGGER') as mock_logger, \
+                patch('builtins.open', mock_open):
+            self.module.redfish_get_sensors([self.COLLECTION, self._sensor_list()], None)
+
+        mock_get.assert_called_with("{}/CPU_TEMP".format(self.COLLECTION))
+        mock_logger.warning.assert_called_once()
+        mock_open.assert_any_call("/var/run/hw-management/thermal/cpu_bmc", "w")
+
+    def test_no_response_skips_group(self):
+        """BMC not accessible: no per-sensor requests, $expand support not cleared"""
+        with patch('hw_management_peripheral_updater.redfish_get_req', return_value=None) as mock_get, \
+                patch('hw_management_peripheral_updater.redfish_write_sensor', side_effect=self._write):
+            self.module.redfish_get_sensors([self.COLLECTION, self._sensor_list()], None)
+
+        mock_get.assert_called_once()
+        self.assertEqual(self.written, {})
+        self.assertNotIn(self.COLLECTION, self.module.REDFISH_EXPAND_UNSUPPORTED)
+
+
+class TestRedfishEventListener(unittest.TestCase):
+    """Test BMC EventService (SSE) listener of peripheral updater"""
+
+    SENSOR = "/redfish/v1/Chassis/MGX_BMC_0/Sensors/BMC_TEMP"
+    COLLECTION = "/redfish/v1/Chassis/MGX_BMC_1/Sensors"
+
+    def setUp(self):
+        import hw_management_peripheral_updater as peripheral_module
+        self.module = peripheral_module
+        sched = JobScheduler()
+
+        def add(attr):
+            return sched.add_entry(attr, vars(peripheral_module), lambda entry: None)
+        self.single = add({"fin": None, "fn": "redfish_get_sensor", "arg": [self.SENSOR, "bmc", 1000], "poll": 30, "ts": 0})
+        self.group = add({"fin": None, "fn": "redfish_get_sensors", "poll": 30, "ts": 0,
+                          "arg": [self.COLLECTION, [[self.COLLECTION + "/T1", "t1", 1000], [self.COLLECTION + "/T2", "t2", 1000]]]})
+        self.other = add({"fin": None, "fn": "run_cmd", "arg": [], "poll": 5, "ts": 0})
+        # first run done: next one is due after poll interval
+        sched.run_pending()
+        self.listener = self.module.RedfishEventListener(sched.get_jobs(), liveness_poll=300)
+
+    @staticmethod
+    def _woken(entry):
+        return entry.due_ts <= current_milli_time()
+
+    def _origins(self, *origins):
+        return patch.object(self.module.RedfishEventStream, "event_origins", return_value=list(origins))
+
+    def test_event_schedules_related_entries(self):
+        """Event of sensor or its collection forces update of its entry only"""
+        with self._origins(self.COLLECTION + "/T2", "/redfish/v1/TaskService/Tasks/1"):
+            self.listener.handle_event({})
+        self.assertEqual((self._woken(self.single), self._woken(self.group), self._woken(self.other)),
+                         (False, True, False))
+
+        with self._origins(self.SENSOR):
+            self.listener.handle_event({})
+        self.assertTrue(self._woken(self.single))
+        self.assertEqual(self.listener.stat, {"event": 2, "update": 2, "connect": 0})
+
+    def test_liveness_poll(self):
+        """Stream up: BMC sensors polled at liveness interval, restored on stream loss"""
+        due = self.single.due_ts
+        self.listener.set_liveness_poll(True)
+        self.assertEqual((self.single.poll, self.group.poll, self.other.poll), (300, 300, 5))
+        # longer interval applies after next run
+        self.assertEqual(self.single.due_ts, due)
+        self.listener.set_liveness_poll(False)
+        self.assertEqual((self.single.poll, self.group.poll), (30, 30))
+        self.assertIsNone(self.single.poll_cfg)
+        self.assertLessEqual(self.single.due_ts, due)
+
+    def test_run_reads_stream_until_exit(self):
+        """Listener thread body: stream events handled, poll restored and stream closed on exit"""
+        stream = MagicMock()
+
+        def read_event():
+            if stream.read_event.call_count == 1:
+                self.assertEqual(self.single.poll, 300)
+                return {}
+            self.module.EXIT.set()
+            return None
+        stream.read_event.side_effect = read_event
+        redfish_obj = MagicMock()
+        redfish_obj.rf_client.open_event_stream.return_value = (0, stream)
+
+        self.module.EXIT.clear()
+        try:
+            with patch.object(self.module.RedfishConnection, "get_instance", return_value=redfish_obj), \
+                    patch.object(self.module, "LOGGER"), \
+                    self._origins(self.SENSOR):
+                self.listener.run()
+        finally:
+            self.module.EXIT.clear()
+
+        self.assertTrue(self._woken(self.single))
+        self.assertEqual(self.single.poll, 30)
+        stream.close.assert_called_once()
+        self.assertEqual(self.listener.stat["connect"], 1)
+
+    def test_run_backoff_when_not_available(self):
+        """No stream (SSE not supported / no BMC): retry with growing backoff"""
+        waits = []
+
+        def exit_wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 3:
+                self.module.EXIT.set()
+            return self.module.EXIT.is_set()
+        redfish_obj = MagicMock()
+        redfish_obj.rf_client.open_event_stream.return_value = (-3, None)
+
+        self.module.EXIT.clear()
+        try:
+            with patch.object(self.module.RedfishConnection, "get_instance", return_value=redfish_obj), \
+                    patch.object(self.module, "LOGGER"), \
+                    patch.object(self.module.EXIT, "wait", side_effect=exit_wait):
+                self.listener.run()
+        finally:
+            self.module.EXIT.clear()
+        self.assertEqual(waits, [5, 10, 20])
+
+
 class TestRedfishConnectionSingleton(unittest.TestCase):
     """Test RedfishConnection singleton class"""
 
@@ -869,13 +1386,14 @@ class TestUpdatePeripheralAttr(unittest.TestCase):
                 "hwmon": ""
             }
 
+            entry = AttrEntry(attr_prop, vars(peripheral_module))
             # First call - should trigger
-            peripheral_module.update_peripheral_attr(attr_prop)
+            peripheral_module.update_peripheral_attr(entry)
             mock_fn.assert_called_with(["arg1"], "100")
 
             # Second call with same value - should NOT trigger
             mock_fn.reset_mock()
-            peripheral_module.update_peripheral_attr(attr_prop)
+            peripheral_module.update_peripheral_attr(entry)
             mock_fn.assert_not_called()
 
         finally:
@@ -901,8 +1419,9 @@ class TestUpdatePeripheralAttr(unittest.TestCase):
         with open("/tmp/test_sensor", 'w') as f:
             f.write("100\n")
 
+        entry = AttrEntry(attr_prop, vars(peripheral_module))
         with patch('builtins.open', side_effect=OSError()):
-            peripheral_module.update_peripheral_attr(attr_prop)
+            peripheral_module.update_peripheral_attr(entry)
 
             # Should call function with empty string on error
             mock_fn.assert_called_with(["arg1"], "")
@@ -921,7 +1440,7 @@ class TestUpdatePeripheralAttr(unittest.TestCase):
             "ts": 0
         }
 
-        peripheral_module.update_peripheral_attr(attr_prop)
+        peripheral_module.update_peripheral_attr(AttrEntry(attr_prop, vars(peripheral_module)))
 
         # Should call function with None
         mock_fn.assert_called_with(["arg1"], None)
@@ -941,7 +1460,7 @@ class TestUpdatePeripheralAttr(unittest.TestCase):
         }
 
         # Should not crash even if function raises error
-        peripheral_module.update_peripheral_attr(attr_prop)
+        peripheral_module.update_peripheral_attr(AttrEntry(attr_prop, vars(peripheral_module)))
 
 
 class TestInitAndWriteFunctions(unittest.TestCase):
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for hw-management-pmbus-device-dump.py in-process SMBus
+# backend. Kernel i2c-dev is emulated by FakePmbusBus which decodes
+# I2C_SMBUS/I2C_RDWR ioctl arguments against a per-page register map.
+########################################################################
+
+import errno
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+HW_MGMT_BIN = Path(__file__).resolve().parents[2] / "usr" / "usr" / "bin"
+if str(HW_MGMT_BIN) not in sys.path:
+    sys.path.insert(0, str(HW_MGMT_BIN))
+
+import hw_management_psu_fw_update_common as psu_common  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("pmbus_device_dump", str(HW_MGMT_BIN / "hw-management-pmbus-device-dump.py"))
+dump = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(dump)
+
+pytestmark = pytest.mark.offline
+
+DEV_ADDR = 0x40
+
+
+class FakePmbusBus:
+    """i2c-dev emulation for one PMBus device: open/close/ioctl for SMBusIoctlBackend."""
+
+    def __init__(self, addr, regs, unsupported=()):
+        self.addr = addr
+        self.regs = regs
+        self.unsupported = set(unsupported)
+        self.page = 0
+        self.pec = False
+        self.corrupt_pec = False
+        self.slave = None
+        self.opened = []
+        self.closed = []
+        self.ioctl_cnt = 0
+
+    def open(self, path, flags):
+        self.opened.append(path)
+        return 100 + len(self.opened)
+
+    def close(self, fd):
+        self.closed.append(fd)
+
+    def _get_reg(self, cmd):
+        value = self.regs.get(self.page, {}).get(cmd)
+        if value is None:
+            raise OSError(errno.ENXIO, "No such device or address")
+        return value
+
+    def ioctl(self, fd, request, arg):
+        self.ioctl_cnt += 1
+        if request == dump.I2C_PEC:
+            self.pec = bool(arg)
+            return 0
+        if request == dump.I2C_SLAVE_FORCE:
+            self.slave = arg
+            return 0
+        if request in self.unsupported:
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+        if self.slave != self.addr:
+            raise OSError(errno.ENXIO, "No such device or address")
+
+        if request == dump.I2C_SMBUS:
+            data = arg.data.contents
+            if arg.read_write == dump.I2C_SMBUS_WRITE:
+                if arg.command == 0x00:
+                    self.page = data.byte
+                return 0
+            value = self._get_reg(arg.command)
+            if arg.size == dump.I2C_SMBUS_BYTE_DATA:
+                data.byte = value
+            else:
+                data.word = value
+            return 0
+
+        if request == dump.I2C_RDWR:
+            assert arg.nmsgs == 2
+            wr, rd = arg.msgs[0], arg.msgs[1]
+            assert rd.flags & dump.I2C_M_RD
+            cmd = wr.buf[0]
+            block = self._get_reg(cmd)
+            payload = [len(block)] + list(block)
+            if self.pec:
+                pec = dump.smbus_pec([self.addr << 1, cmd, (self.addr << 1) | 1] + payload)
+                payload.append(pec ^ 0xFF if self.corrupt_pec else pec)
+            payload += [0xFF] * (rd.len - len(payload))
+            for idx in range(rd.len):
+                rd.buf[idx] = payload[idx]
+            return 0
+        raise OSError(errno.ENOTTY, "Inappropriate ioctl")
+
+
+class RecordingBackend:
+    """Fallback backend stand-in which records calls."""
+
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+
+    def set_page(self, bus, addr, page):
+        self.calls.append(("page", page))
+        return True
+
+    def read_byte(self, bus, addr, cmd):
+        self.calls.append(("byte", cmd))
+        return 0x11
+
+    def read_word(self, bus, addr, cmd):
+        self.calls.append(("word", cmd))
+        return 0x2222
+
+    def read_block(self, bus, addr, cmd):
+        self.calls.append(("block", cmd))
+        return [0x41]
+
+
+def _regs(pages):
+    regs = {}
+    for page in range(pages):
+        regs[page] = {
+            0x20: 0x17,
+            0x79: 0x0800 + page,
+            0x88: 0xD300 + page,
+            0x8B: 0x0C00 + page,
+            0x98: 0x22,
+            0x99: list(b"NVDA"),
+            0x9A: list("PSU-{}".format(page).encode()),
+            0xE0: 0x5A,
+        }
+    return regs
+
+
+def _backend(bus_dev, pec=False, fallback=None):
+    return dump.SMBusIoctlBackend(pec=pec, fallback=fallback, dev_open=bus_dev.open,
+                                  dev_close=bus_dev.close, ioctl=bus_dev.ioctl)
+
+
+def test_smbus_pec_matches_psu_fw_update_crc8():
+    data = [DEV_ADDR << 1, 0x99, (DEV_ADDR << 1) | 1, 4] + list(b"NVDA")
+    assert dump.smbus_pec(data) == psu_common.calc_crc8(data)
+    assert dump.smbus_pec([]) == 0
+
+
+def test_full_dump_in_process_single_fd(capsys):
+    bus_dev = FakePmbusBus(DEV_ADDR, _regs(4))
+    backend = _backend(bus_dev)
+
+    with patch.object(dump.subprocess, "run", side_effect=AssertionError("fork path used")):
+        dump.dump_all_commands(5, DEV_ADDR, 4, backend=backend)
+    backend.close()
+
+    out = capsys.readouterr().out
+    assert "Access: ioctl" in out
+    for page in range(4):
+        assert "{} (0x{:04X})".format(0x0C00 + page, 0x0C00 + page) in out
+        assert "('PSU-{}')".format(page) in out
+    assert "0xE0 MFR_UNKNOWN_E0" in out
+    # single open per bus, closed on exit
+    assert bus_dev.opened == ["/dev/i2c-5"]
+    assert bus_dev.closed == [101]
+
+
+def test_block_read_pec():
+    bus_dev = FakePmbusBus(DEV_ADDR, _regs(1))
+    backend = _backend(bus_dev, pec=True)
+
+    assert backend.read_block(1, DEV_ADDR, 0x99) == list(b"NVDA")
+    assert bus_dev.pec is True
+
+    bus_dev.corrupt_pec = True
+    assert backend.read_block(1, DEV_ADDR, 0x99) is None
+
+
+def test_unsupported_transfer_uses_fallback():
+    bus_dev = FakePmbusBus(DEV_ADDR, _regs(1), unsupported=[dump.I2C_RDWR])
+    fallback = RecordingBackend()
+    backend = _backend(bus_dev, fallback=fallback)
+
+    assert backend.read_block(1, DEV_ADDR, 0x99) == [0x41]
+    ioctl_cnt = bus_dev.ioctl_cnt
+    # fallback sticks for the transfer type, other types stay in-process
+    assert backend.read_block(1, DEV_ADDR, 0x9A) == [0x41]
+    assert bus_dev.ioctl_cnt == ioctl_cnt
+    assert backend.read_word(1, DEV_ADDR, 0x88) == 0xD300
+    assert fallback.calls == [("block", 0x99), ("block", 0x9A)]
+
+
+def test_nak_returns_none_without_fallback():
+    bus_dev = FakePmbusBus(DEV_ADDR, _regs(1))
+    fallback = RecordingBackend()
+    backend = _backend(bus_dev, fallback=fallback)
+
+    assert backend.read_byte(1, DEV_ADDR, 0xE5) is None
+    assert backend.read_word(1, DEV_ADDR, 0x8D) is None
+    assert backend.read_block(1, DEV_ADDR, 0x9E) is None
+    assert fallback.calls == []
+    assert not backend.unsupported
+
+
+def test_set_page_and_address_switch():
+    bus_dev = FakePmbusBus(DEV_ADDR, _regs(2))
+    backend = _backend(bus_dev)
+
+    assert backend.set_page(1, DEV_ADDR, 1) is True
+    assert backend.read_word(1, DEV_ADDR, 0x8B) == 0x0C01
+    # other address on same bus - same fd, slave address re-set
+    assert backend.set_page(1, DEV_ADDR + 1, 0) is False
+    assert bus_dev.opened == ["/dev/i2c-1"]
+    assert bus_dev.slave == DEV_ADDR + 1
+
+
+def test_get_backend_auto_falls_back_to_i2c_tools():
+    with patch.object(dump.os, "open", side_effect=FileNotFoundError(errno.ENOENT, "No such file")):
+        assert isinstance(dump.get_backend("auto", 99, DEV_ADDR), dump.I2cToolsBackend)
+        with pytest.raises(OSError):
+            dump.get_backend("ioctl", 99, DEV_ADDR)
+    assert isinstance(dump.get_backend("i2c-tools", 99, DEV_ADDR), dump.I2cToolsBackend)
@@ -7,6 +7,8 @@
 ########################################################################
 
 import hw_management_psu_fw_update_common as psu_common
+import ctypes
+import errno
 import sys
 import os
 import pytest
@@ -17,6 +19,52 @@ from io import StringIO
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'usr', 'usr', 'bin'))
 
 
+def _no_i2c_dev(path, flags):
+    raise OSError(errno.ENOENT, "No such file or directory", path)
+
+
+@pytest.fixture(autouse=True)
+def i2c_transport():
+    """Bus device is not available: i2ctransfer (os.popen) is used"""
+    with patch.object(psu_common, 'I2C_TRANSPORT', psu_common.I2cRdwrTransport(dev_open=_no_i2c_dev)), \
+            patch.dict(psu_common._pmbus_ready_ts, clear=True):
+        yield
+
+
+class FakeI2cDev:
+    """I2C_RDWR ioctl of /dev/i2c-N: records messages, returns read data"""
+
+    def __init__(self, read_data=b"", error=None):
+        self.read_data = read_data
+        self.error = error
+        self.opened = []
+        self.closed = []
+        self.msgs = []
+
+    def open(self, path, flags):
+        self.opened.append(path)
+        return 10 + len(self.opened)
+
+    def close(self, fd):
+        self.closed.append(fd)
+
+    def ioctl(self, fd, request, arg):
+        assert request == psu_common.I2C_RDWR
+        if self.error:
+            raise OSError(self.error, os.strerror(self.error))
+        for idx in range(arg.nmsgs):
+            msg = arg.msgs[idx]
+            if msg.flags & psu_common.I2C_M_RD:
+                ctypes.memmove(msg.buf, self.read_data, msg.len)
+                self.msgs.append((msg.addr, "r", msg.len))
+            else:
+                self.msgs.append((msg.addr, "w", bytes(msg.buf[:msg.len])))
+        return 0
+
+    def transport(self):
+        return psu_common.I2cRdwrTransport(dev_open=self.open, dev_close=self.close, ioctl=self.ioctl)
+
+
 class TestCalcCRC8:
     """Test calc_crc8 CRC calculation function"""
 
@@ -303,5 +351,104 @@ class TestCheckPsuRedundancy:
             assert "previous update is in progress" in captured.out
 
 
+class TestI2cRdwrTransport:
+    """Test in-process PMBus transactions by I2C_RDWR ioctl"""
+
+    def test_pmbus_write_pec(self):
+        dev = FakeI2cDev()
+        with patch.object(psu_common, 'I2C_TRANSPORT', dev.transport()), patch('os.popen') as mock_popen:
+            assert psu_common.pmbus_write(5, 0x58, [0xd6, 0x01]) == ''
+            assert psu_common.pmbus_write_nopec(5, 0x58, [0xd6, 0x00]) == ''
+            psu_common.I2C_TRANSPORT.close()
+        pec = psu_common.calc_crc8([0x58 << 1, 0xd6, 0x01])
+        assert dev.msgs == [(0x58, "w", bytes([0xd6, 0x01, pec])), (0x58, "w", bytes([0xd6, 0x00]))]
+        # bus device opened once
+        assert dev.opened == ["/dev/i2c-5"]
+        assert dev.closed == [11]
+        assert not mock_popen.called
+
+    def test_pmbus_read(self):
+        dev = FakeI2cDev(read_data=bytes([0x05, 0x41, 0x42]))
+        with patch.object(psu_common, 'I2C_TRANSPORT', dev.transport()):
+            assert psu_common.pmbus_read(5, 0x58, 0x9a, 3) == "0x05 0x41 0x42\n"
+        assert dev.msgs == [(0x58, "w", bytes([0x9a])), (0x58, "r", 3)]
+
+    def test_transaction_failure(self):
+        """NACK is reported as failed i2ctransfer (empty output)"""
+        dev = FakeI2cDev(error=errno.EREMOTEIO)
+        with patch.object(psu_common, 'I2C_TRANSPORT', dev.transport()), patch('os.popen') as mock_popen:
+            assert psu_common.pmbus_read(5, 0x58, 0x9a, 1) == ''
+            assert psu_common.pmbus_write(5, 0x58, [0x01]) == ''
+        assert not mock_popen.called
+
+    def test_fallback_to_i2ctransfer(self):
+        """ioctl is not supported by bus driver: i2ctransfer is used"""
+        dev = FakeI2cDev(error=errno.EOPNOTSUPP)
+        transport = dev.transport()
+        with patch.object(psu_common, 'I2C_TRANSPORT', transport), patch('os.popen') as mock_popen:
+            mock_popen.return_value.read.return_value = "0x01\n"
+            assert psu_common.pmbus_read(5, 0x58, 0x9a, 1) == "0x01\n"
+            assert psu_common.pmbus_read(5, 0x58, 0x9a, 1) == "0x01\n"
+        assert mock_popen.call_count == 2
+        # not retried for this bus
+        assert transport.unsupported == {5}
+        assert len(dev.opened) == 1
+
+
+class TestPmbusTiming:
+    """Test per-device transaction spacing and status polling"""
+
+    def test_spacing_per_device(self):
+        now = [100.0]
+        sleeps = []
+
+        def sleep(delay):
+            sleeps.append(round(delay, 3))
+            now[0] += delay
+
+        dev = FakeI2cDev(read_data=b"\x00")
+        with patch.object(psu_common, 'I2C_TRANSPORT', dev.transport()), \
+                patch.object(psu_common.time, 'monotonic', lambda: now[0]), \
+                patch.object(psu_common.time, 'sleep', side_effect=sleep), \
+                patch.object(psu_common, '_pmbus_spacing', 0.01):
+            psu_common.pmbus_write(5, 0x58, [0x01])
+            # other device is not delayed
+            psu_common.pmbus_read(5, 0x59, 0x01, 1)
+            assert sleeps == []
+            psu_common.pmbus_read(5, 0x58, 0x01, 1)
+            assert sleeps == [0.01]
+            # block write time is kept before next transaction
+            psu_common.pmbus_write(5, 0x58, [0x01])
+            psu_common.pmbus_hold(5, 0x58, 0.12)
+            now[0] += 0.02
+            psu_common.pmbus_write(5, 0x58, [0x01])
+            assert sleeps == [0.01, 0.01, 0.1]
+
+    def test_set_spacing(self):
+        with patch.object(psu_common, '_pmbus_spacing', psu_common.PMBUS_DELAY):
+            psu_common.pmbus_set_spacing(0.02)
+            assert psu_common._pmbus_spacing == 0.02
+
+    def test_poll_backoff(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(delay):
+            sleeps.append(delay)
+            now[0] += delay
+
+        status = iter(["busy"] * 4 + ["done"])
+        with patch.object(psu_common.time, 'monotonic', lambda: now[0]), \
+                patch.object(psu_common.time, 'sleep', side_effect=sleep):
+            assert psu_common.pmbus_poll(lambda: next(status), lambda s: s == "done", 1, 0.01, 0.03) == "done"
+            assert sleeps == [0.01, 0.02, 0.03, 0.03]
+
+            # timeout: last status returned, no sleep past deadline
+            sleeps[:] = []
+            now[0] = 0.0
+            assert psu_common.pmbus_poll(lambda: "busy", lambda s: s == "done", 0.05, 0.02, 0.02) == "busy"
+            assert sum(sleeps) == pytest.approx(0.05)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
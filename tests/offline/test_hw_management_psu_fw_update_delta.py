@@ -143,5 +143,36 @@ class TestHeaderParsing:
         assert psu_delta.FW_HEADER["write_time"] == 20
 
 
+
+class TestFwFileBurn:
+    """Test FW image burn timing: block write time and status polling"""
+
+    def test_delta_fw_file_burn_holds_write_time(self, tmp_path, capsys):
+        fw_file = tmp_path / "fw.bin"
+        fw_file.write_bytes(bytes(range(16)))
+        with patch.dict(psu_delta.FW_HEADER, {"block_size": 8, "write_time": 120}), \
+                patch.object(psu_delta, 'write_mfr_fw_upload') as mock_write, \
+                patch.object(psu_delta.psu_upd_cmn, 'pmbus_hold') as mock_hold, \
+                patch.object(psu_delta.time, 'sleep') as mock_sleep:
+            psu_delta.delta_fw_file_burn(5, 0x58, str(fw_file))
+        assert mock_write.call_args_list[1][0] == (5, 0x58, [8] + list(range(8, 16)))
+        assert [c[0] for c in mock_hold.call_args_list] == [(5, 0x58, 0.12)] * 2
+        assert not mock_sleep.called
+
+    def test_acbel_460_fw_file_burn_polls_busy(self, tmp_path, capsys):
+        fw_file = tmp_path / "fw.bin"
+        fw_file.write_bytes(bytes(32))
+        status = iter(["ISP Busy", "ISP No Error",
+                       "ISP Checksum Error", "ISP Busy", "ISP No Error"])
+        with patch.object(psu_delta, 'write_mfr_fw_upload_acbel_460') as mock_write, \
+                patch.object(psu_delta, 'read_mfr_fw_upload_status_acbel_460', side_effect=lambda bus, addr: next(status)), \
+                patch.object(psu_delta.psu_upd_cmn.time, 'sleep'):
+            psu_delta.acbel_460_fw_file_burn(5, 0x58, str(fw_file))
+        # busy is polled, error resends block
+        offsets = [c[0][2][:4] for c in mock_write.call_args_list]
+        assert offsets == [[0, 0, 0, 0], [0, 0, 0, 16], [0, 0, 0, 16]]
+        assert "Send FW Done." in capsys.readouterr().out
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
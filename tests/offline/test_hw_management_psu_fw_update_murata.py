@@ -153,5 +153,24 @@ class TestCheckPowerSupplyStatus:
             psu_murata.check_power_supply_status(i2c_bus=5, i2c_addr=0x58)
 
 
+
+class TestPollUpgradeStatus:
+    """Test upgrade status polling after data line"""
+
+    def test_busy_polled_until_success(self):
+        status = iter(["POLL_STATUS_BUSY", "POLL_STATUS_BUSY", "POLL_STATUS_SUCCSESS"])
+        sleeps = []
+        with patch.object(psu_murata, 'poll_upgrade_status', side_effect=lambda bus, addr: next(status)), \
+                patch.object(psu_murata.psu_upd_cmn.time, 'sleep', side_effect=sleeps.append):
+            psu_murata.test_poll_upgrade_status(5, psu_murata.BOOTLOADER_I2C_ADDR)
+        assert sleeps == [psu_murata.UPGRADE_POLL_MIN, psu_murata.UPGRADE_POLL_MIN * 2]
+
+    def test_failure_exits(self, capsys):
+        with patch.object(psu_murata, 'poll_upgrade_status', return_value="POLL_STATUS_DATA_ERROR"):
+            with pytest.raises(SystemExit):
+                psu_murata.test_poll_upgrade_status(5, psu_murata.BOOTLOADER_I2C_ADDR)
+        assert "PSU FW upgrade failed." in capsys.readouterr().out
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# PSU firmware update flows (Delta, Acbel 460, Murata) against simulated
+# PMBus PSUs on I2C_RDWR transport, virtual time.
+########################################################################
+
+import argparse
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HW_MGMT_BIN = TESTS_DIR.parent / "usr" / "usr" / "bin"
+for _path in (HW_MGMT_BIN, TESTS_DIR / "tools" / "pmbus_psu_stub"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import hw_management_psu_fw_update_common as psu_common  # noqa: E402
+import hw_management_psu_fw_update_delta as psu_delta  # noqa: E402
+import hw_management_psu_fw_update_murata as psu_murata  # noqa: E402
+import pmbus_psu_stub as stub  # noqa: E402
+
+pytestmark = pytest.mark.offline
+
+BUS = 5
+ADDR = 0x58
+
+
+@pytest.fixture
+def sim():
+    clock = stub.SimClock()
+    bus = stub.SimPmbusBus(clock, bus=BUS)
+    transport = psu_common.I2cRdwrTransport(dev_open=bus.dev_open, dev_close=bus.dev_close, ioctl=bus.ioctl)
+    with patch.object(psu_common, "I2C_TRANSPORT", transport), \
+            patch.object(psu_common, "_pmbus_spacing", psu_common.PMBUS_DELAY), \
+            patch.dict(psu_common._pmbus_ready_ts, clear=True), \
+            patch("os.popen", side_effect=AssertionError("i2ctransfer is not expected")), \
+            clock.patch():
+        yield bus
+    transport.close()
+
+
+def _run(func, *args):
+    try:
+        func(*args)
+    except SystemExit as exc:
+        return exc.code
+    return None
+
+
+def test_delta_update(sim, tmp_path):
+    image = str(tmp_path / "delta.bin")
+    size = stub.make_delta_image(image, blocks=64, block_size=64, write_time_ms=20)
+    psu = sim.add(stub.DeltaPsu(sim.clock, ADDR, size, write_time=0.02))
+
+    assert _run(psu_delta.update_delta, BUS, ADDR, image) == 0
+    assert psu.revision == "DT0101"
+    assert (psu.stat["block"], psu.stat["nak"], psu.stat["pec_error"]) == (64, 0, 0)
+    # block write time from FW header overlaps transaction spacing instead of
+    # being added to it: max(20 ms, spacing) + 67 bytes at 100 kHz
+    block_gap = max(0.02, psu_delta.PMBUS_SPACING)
+    burn = psu.last_block_ts - psu.first_block_ts
+    assert 63 * block_gap <= burn < 63 * (block_gap + 0.007)
+
+
+def test_delta_update_nak_retry(sim, tmp_path):
+    image = str(tmp_path / "delta.bin")
+    size = stub.make_delta_image(image, blocks=16)
+    psu = sim.add(stub.DeltaPsu(sim.clock, ADDR, size))
+    psu.faults.at["nak"] = {5}
+
+    # lost block: image not received, upload repeated
+    assert _run(psu_delta.update_delta, BUS, ADDR, image) == 0
+    assert psu.stat["block"] == 16 + 15
+    assert psu.stat["nak"] == 1
+
+
+def test_acbel_460_update(sim, tmp_path):
+    image = str(tmp_path / "acbel.bin")
+    size = stub.make_acbel_460_image(image, blocks=128)
+    psu = sim.add(stub.Acbel460Psu(sim.clock, ADDR, size, block_time=0.012, exit_time=3.0))
+    psu.faults.at["error"] = {10}
+    psu.faults.at["busy"] = {20}
+
+    assert _run(psu_delta.update_acbel_460, BUS, ADDR, image) == 0
+    assert psu.revision == (1, 3, 0, 0)
+    assert psu.stat["block"] == 128
+    # rejected block resent
+    assert (psu.stat["block_attempt"], psu.stat["block_error"]) == (129, 1)
+    assert psu.stat["busy_read"] > 0
+    # status polled: less than fixed 50 ms wait and delay after write and read per block
+    burn = psu.last_block_ts - psu.first_block_ts
+    assert burn < 127 * (0.05 + 2 * psu_common.PMBUS_DELAY)
+    # ISP mode exit polled, not fixed 10 sec
+    assert sim.clock.now - psu.last_block_ts < 5
+
+
+def test_murata_update(sim, tmp_path):
+    image = str(tmp_path / "murata.txt")
+    lines = stub.make_murata_image(image, lines=40)
+    psu = sim.add(stub.MurataPsu(sim.clock, ADDR, lines, line_time=0.02))
+    psu.faults.at["busy"] = {3}
+    psu.faults.busy_time = 0.4
+
+    with patch.object(psu_murata, "args", argparse.Namespace(skip_redundancy_check=False), create=True):
+        assert _run(psu_murata.murata_update, BUS, ADDR, False, image, False) == 0
+    assert psu.revision == "A01"
+    assert not psu.bootload
+    assert (psu.stat["block"], psu.stat["nak"]) == (40, 0)
+    assert psu.stat["busy_read"] > 0
+
+
+def test_murata_data_error_fails(sim, tmp_path):
+    image = str(tmp_path / "murata.txt")
+    lines = stub.make_murata_image(image, lines=8)
+    psu = sim.add(stub.MurataPsu(sim.clock, ADDR, lines))
+    psu.faults.at["error"] = {4}
+
+    with patch.object(psu_murata, "args", argparse.Namespace(skip_redundancy_check=False), create=True):
+        assert _run(psu_murata.murata_update, BUS, ADDR, False, image, False) == 1
+    assert psu.stat["block_attempt"] == 5
+    assert psu.bootload
+    assert psu.revision == "A00"
+
+
+def test_bad_pec_is_nacked(sim):
+    psu = sim.add(stub.DeltaPsu(sim.clock, ADDR, 64))
+    with patch.object(psu_common, "calc_crc8", return_value=0):
+        assert psu_common.pmbus_write(BUS, ADDR, [0xd6, 0x01]) == ''
+    assert (psu.stat["pec_error"], psu.mode) == (1, 0)
+    # NACK does not switch bus to i2ctransfer
+    assert psu_common.I2C_TRANSPORT.unsupported == set()
+    assert psu_common.pmbus_read(BUS, 0x59, 0x9a, 1) == ''
+    psu_common.pmbus_write(BUS, ADDR, [0xd6, 0x01])
+    assert psu.mode == 1
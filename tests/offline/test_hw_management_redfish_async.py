@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for AsyncRedfishClient (asyncio concurrent Redfish GETs
+# sharing login/token of RedfishClient) against the local Redfish stub.
+########################################################################
+
+import asyncio
+import http.client
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HW_MGMT_BIN = TESTS_DIR.parent / "usr" / "usr" / "bin"
+for _path in (HW_MGMT_BIN, TESTS_DIR / "tools" / "redfish_stub"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import hw_management_redfish_client as redfish_client  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+RedfishClient = redfish_client.RedfishClient
+AsyncRedfishClient = redfish_client.AsyncRedfishClient
+
+pytestmark = pytest.mark.offline
+
+SENSORS = "/redfish/v1/Chassis/BMC_0/Sensors"
+SENSOR_COUNT = 16
+
+
+def _sensor_uri(idx):
+    return "{}/BMC_0_Temp_{}".format(SENSORS, idx)
+
+
+class ChunkedHandler(stub.RedfishStubHandler):
+    """Stub handler with /chunked resource sent in chunked transfer encoding."""
+
+    def handle_resource(self, body):
+        if self.path != "/chunked":
+            super().handle_resource(body)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        data = json.dumps({"Name": "chunked", "Data": "x" * 100}).encode("utf-8")
+        for offset in range(0, len(data), 40):
+            chunk = data[offset:offset + 40]
+            self.wfile.write("{:x};ext=1\r\n".format(len(chunk)).encode("ascii") + chunk + b"\r\n")
+        self.wfile.write(b"0\r\nX-Trailer: 1\r\n\r\n")
+
+
+def _open_connection(host, port):
+    return asyncio.open_connection(host, port)
+
+
+@pytest.fixture
+def server():
+    with stub.RedfishStubServer(handler=ChunkedHandler) as srv:
+        members = []
+        for idx in range(SENSOR_COUNT):
+            srv.state.add_resource(_sensor_uri(idx), {"Id": "BMC_0_Temp_{}".format(idx), "Reading": 40.0 + idx})
+            members.append({"@odata.id": _sensor_uri(idx)})
+        srv.state.add_resource(SENSORS, {"Members": members})
+        yield srv
+
+
+@pytest.fixture
+def client(server):
+    rf_client = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, stub.DEF_PASSWORD,
+                              redfish_client.RedfishHttpTransport(
+                                  connection_factory=lambda host, timeout: http.client.HTTPConnection(
+                                      host, timeout=timeout)))
+    yield rf_client
+    rf_client.get_transport().close()
+
+
+def _run(client, coro_func, **kwargs):
+    async def main():
+        async with AsyncRedfishClient(client, connection_factory=_open_connection, **kwargs) as aclient:
+            if not client.has_login():
+                assert await aclient.login() == RedfishClient.ERR_CODE_OK
+            return await coro_func(aclient), aclient.stat
+    return asyncio.run(main())
+
+
+def test_gather_many_in_order(server, client):
+    uris = [_sensor_uri(idx) for idx in range(SENSOR_COUNT)] + ["/redfish/v1/NoSuchResource"]
+    results, stat = _run(client, lambda aclient: aclient.gather_many(uris), concurrency=4)
+
+    for idx in range(SENSOR_COUNT):
+        ret, body, _ = results[idx]
+        assert ret == RedfishClient.ERR_CODE_OK
+        assert json.loads(body)["Reading"] == 40.0 + idx
+    # HTTP error status is returned as body, same as exec_curl_cmd()
+    assert json.loads(results[-1][1])["error"]["message"] == "Resource not found"
+    # kept-alive connections reused, limited by concurrency
+    assert stat["connect"] <= 4
+    assert server.state.stat["max_in_flight"] <= 4
+    assert server.state.stat["login"] == 1
+
+
+def test_concurrent_latency(server, client):
+    server.state.latency = 0.2
+    start = time.monotonic()
+    (ret, members), _ = _run(client, lambda aclient: aclient.gather_collection(SENSORS), concurrency=8)
+    elapsed = time.monotonic() - start
+
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert sorted(members) == sorted(_sensor_uri(idx) for idx in range(SENSOR_COUNT))
+    assert all(result[0] == RedfishClient.ERR_CODE_OK for result in members.values())
+    # collection + 2 waves of 8 members, sequential is 17 * 0.2 sec
+    assert elapsed < 1.2
+    assert server.state.stat["max_in_flight"] == 8
+
+
+def test_single_relogin_on_expired_token(server, client):
+    assert client.login() == RedfishClient.ERR_CODE_OK
+    token = client.get_token()
+    server.state.expire_tokens()
+    uris = [_sensor_uri(idx) for idx in range(8)]
+    results, stat = _run(client, lambda aclient: aclient.gather_many(uris), concurrency=8)
+
+    assert [result[0] for result in results] == [RedfishClient.ERR_CODE_OK] * 8
+    assert client.get_token() != token
+    assert server.state.stat["login"] == 2
+    assert stat["relogin"] == 1
+
+
+def test_timeout_drops_connection(server, client):
+    async def scenario(aclient):
+        server.state.latency = 1.0
+        slow = await aclient.get(_sensor_uri(0), timeout=0.2)
+        server.state.latency = 0
+        fast = await aclient.get(_sensor_uri(1))
+        return slow, fast
+
+    (slow, fast), stat = _run(client, scenario)
+    assert slow[0] == RedfishClient.ERR_CODE_CURL_FAILURE
+    assert "timed out" in slow[2]
+    assert fast[0] == RedfishClient.ERR_CODE_OK
+    assert stat["connect"] == 2
+
+
+def test_chunked_and_connection_close(server, client):
+    server.state.close_after_response = True
+    results, stat = _run(client, lambda aclient: aclient.gather_many(["/chunked", _sensor_uri(0), _sensor_uri(1)]),
+                         concurrency=1)
+    assert json.loads(results[0][1])["Data"] == "x" * 100
+    assert json.loads(results[2][1])["Reading"] == 41.0
+    assert stat["connect"] >= 2
+
+
+def test_not_login_and_refused(server, client):
+    ret, _ = _run(client, lambda aclient: aclient.get(_sensor_uri(0)))
+    assert ret[0] == RedfishClient.ERR_CODE_OK
+
+    not_login = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, stub.DEF_PASSWORD)
+
+    async def get_not_login():
+        async with AsyncRedfishClient(not_login, connection_factory=_open_connection) as aclient:
+            return await aclient.get(_sensor_uri(0))
+    assert asyncio.run(get_not_login())[0] == RedfishClient.ERR_CODE_NOT_LOGIN
+
+    async def refused(host, port):
+        raise ConnectionRefusedError("Connection refused")
+
+    async def get_refused():
+        async with AsyncRedfishClient(client, connection_factory=refused) as aclient:
+            return await aclient.get(_sensor_uri(0))
+    ret, _, err = asyncio.run(get_refused())
+    assert (ret, err) == (RedfishClient.ERR_CODE_CURL_FAILURE, "Connection refused")
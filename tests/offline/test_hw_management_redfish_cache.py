@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for RedfishResponseCache (per-URI TTL / ETag GET response
+# cache of hw_management_redfish_client.RedfishClient).
+########################################################################
+
+import http.client
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HW_MGMT_BIN = TESTS_DIR.parent / "usr" / "usr" / "bin"
+for _path in (HW_MGMT_BIN, TESTS_DIR / "tools" / "redfish_stub"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import hw_management_redfish_client as redfish_client  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+RedfishClient = redfish_client.RedfishClient
+RedfishResponseCache = redfish_client.RedfishResponseCache
+
+pytestmark = pytest.mark.offline
+
+FW_INVENTORY = RedfishClient.REDFISH_URI_FW_INVENTORY
+ACCOUNTS = RedfishClient.REDFISH_URI_ACCOUNTS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with patch.object(redfish_client.time, "monotonic", fake_clock):
+        yield fake_clock
+
+
+def test_ttl_longest_prefix():
+    cache = RedfishResponseCache(default_ttl=1, ttl={"/redfish/v1": 5, FW_INVENTORY: 60})
+    assert cache.get_ttl(FW_INVENTORY + "/BMC_0") == 60
+    assert cache.get_ttl(ACCOUNTS) == 5
+    assert cache.get_ttl("/other") == 1
+
+
+def test_fresh_hit_and_expiry(clock):
+    cache = RedfishResponseCache(default_ttl=10)
+    assert cache.lookup(FW_INVENTORY) == (None, None)
+    cache.store(FW_INVENTORY, '{"Members": []}')
+    assert cache.lookup(FW_INVENTORY) == ('{"Members": []}', None)
+
+    clock.now += 10
+    # no ETag: expired entry is dropped
+    assert cache.lookup(FW_INVENTORY) == (None, None)
+    assert cache.lookup(FW_INVENTORY) == (None, None)
+    assert cache.stat == {"hit": 1, "revalidated": 0, "miss": 3, "invalidated": 0}
+    assert cache.hit_rate() == pytest.approx(0.25)
+
+
+def test_etag_revalidate(clock):
+    cache = RedfishResponseCache(default_ttl=0)
+    cache.store(ACCOUNTS, '{"Name": "no etag"}')
+    assert cache.lookup(ACCOUNTS) == (None, None)
+
+    body = json.dumps({"@odata.etag": 'W/"1"', "Name": "Accounts"})
+    cache.store(ACCOUNTS, body)
+    assert cache.lookup(ACCOUNTS) == (None, 'W/"1"')
+    assert cache.revalidate(ACCOUNTS) == body
+    # header ETag takes precedence over @odata.etag
+    cache.store(ACCOUNTS, body, '"2"')
+    assert cache.lookup(ACCOUNTS) == (None, '"2"')
+
+
+def test_invalidate_prefix_and_parents():
+    cache = RedfishResponseCache(default_ttl=60)
+    for uri in (ACCOUNTS, ACCOUNTS + "/admin", ACCOUNTS + "/admin?$select=Id", FW_INVENTORY, "/redfish/v1"):
+        cache.store(uri, "{}")
+
+    cache.invalidate(ACCOUNTS + "/admin")
+    assert cache.lookup(FW_INVENTORY)[0] == "{}"
+    for uri in (ACCOUNTS, ACCOUNTS + "/admin", ACCOUNTS + "/admin?$select=Id", "/redfish/v1"):
+        assert cache.lookup(uri) == (None, None)
+    assert cache.stat["invalidated"] == 4
+
+
+def test_invalidate_path_segment_boundary():
+    cache = RedfishResponseCache(default_ttl=60)
+    chassis = "/redfish/v1/Chassis"
+    for uri in (chassis + "/1", chassis + "/1/Sensors", chassis + "/10", chassis + "/10/Sensors", chassis + "/1Sensors"):
+        cache.store(uri, "{}")
+
+    cache.invalidate(chassis + "/1")
+    for uri in (chassis + "/10", chassis + "/10/Sensors", chassis + "/1Sensors"):
+        assert cache.lookup(uri)[0] == "{}"
+    assert cache.stat["invalidated"] == 2
+
+    # parent of other resource only on segment boundary
+    cache.invalidate(chassis + "/10/Sensors/TEMP")
+    assert cache.lookup(chassis + "/1Sensors")[0] == "{}"
+    assert cache.lookup(chassis + "/10") == (None, None)
+
+
+def test_curl_conditional_get_odata_etag(clock):
+    """curl path: ETag from @odata.etag, If-None-Match added to curl config, 304 served from cache"""
+    body = json.dumps({"@odata.etag": '"abc"', "UserName": "admin"})
+    stdin_cfg = []
+
+    def popen(*_args, **_kwargs):
+        process = MagicMock()
+        process.returncode = 0
+
+        def communicate(input):
+            stdin_cfg.append(input.decode("utf-8"))
+            if len(stdin_cfg) == 1:
+                return ("{}\nHTTP Status Code: 200".format(body).encode("utf-8"), b"")
+            return (b"\nHTTP Status Code: 304", b"")
+        process.communicate.side_effect = communicate
+        return process
+
+    cache = RedfishResponseCache(default_ttl=0)
+    rf_client = RedfishClient("/usr/bin/curl", "10.0.1.1", "admin", "pwd", cache=cache)
+    rf_client._RedfishClient__token = "token"
+    cmd = rf_client.build_get_cmd(ACCOUNTS + "/admin")
+    with patch.object(redfish_client.subprocess, "Popen", side_effect=popen):
+        assert rf_client.exec_curl_cmd(cmd) == (RedfishClient.ERR_CODE_OK, body, "")
+        assert rf_client.exec_curl_cmd(cmd) == (RedfishClient.ERR_CODE_OK, body, "")
+
+    assert "If-None-Match" not in stdin_cfg[0]
+    assert 'header = "If-None-Match: \\"abc\\""' in stdin_cfg[1]
+    assert rf_client.has_login()
+
+
+@pytest.fixture
+def server():
+    with stub.RedfishStubServer() as srv:
+        srv.state.add_resource(FW_INVENTORY, {"Members": [{"@odata.id": FW_INVENTORY + "/BMC_0"}]})
+        srv.state.add_resource(ACCOUNTS + "/admin", {"UserName": "admin"})
+        yield srv
+
+
+def _client(server, cache):
+    transport = redfish_client.RedfishHttpTransport(
+        connection_factory=lambda host, timeout: http.client.HTTPConnection(host, timeout=timeout))
+    rf_client = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, stub.DEF_PASSWORD,
+                              transport, cache)
+    assert rf_client.login() == RedfishClient.ERR_CODE_OK
+    return rf_client
+
+
+def test_client_ttl_cache(server, clock):
+    cache = RedfishResponseCache(default_ttl=30)
+    rf_client = _client(server, cache)
+    cmd = rf_client.build_get_cmd(FW_INVENTORY)
+    requests = server.state.stat["request"]
+    for _ in range(5):
+        ret, response, _ = rf_client.exec_curl_cmd(cmd)
+        assert ret == RedfishClient.ERR_CODE_OK
+        assert json.loads(response)["Members"]
+    assert server.state.stat["request"] == requests + 1
+    assert cache.stat["hit"] == 4
+    rf_client.get_transport().close()
+
+
+def test_client_conditional_get_and_invalidate(server, clock):
+    cache = RedfishResponseCache(default_ttl=0)
+    rf_client = _client(server, cache)
+    cmd = rf_client.build_get_cmd(ACCOUNTS + "/admin")
+
+    for _ in range(3):
+        ret, response, _ = rf_client.exec_curl_cmd(cmd)
+        assert ret == RedfishClient.ERR_CODE_OK
+        assert json.loads(response) == {"UserName": "admin"}
+    # first GET full body, then 304 Not Modified
+    assert server.state.stat["not_modified"] == 2
+    assert cache.stat["revalidated"] == 2
+    assert server.state.stat["login"] == 1
+
+    ret = rf_client.exec_curl_cmd(rf_client._build_change_user_password_cmd("admin", "new"))[0]
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert cache.lookup(ACCOUNTS + "/admin") == (None, None)
+
+    ret, response, _ = rf_client.exec_curl_cmd(cmd)
+    assert json.loads(response)["Password"] == "new"
+    rf_client.get_transport().close()
+
+
+def test_client_without_cache_unchanged(server):
+    rf_client = _client(server, None)
+    cmd = rf_client.build_get_cmd(FW_INVENTORY)
+    requests = server.state.stat["request"]
+    for _ in range(3):
+        assert rf_client.exec_curl_cmd(cmd)[0] == RedfishClient.ERR_CODE_OK
+    assert server.state.stat["request"] == requests + 3
+    assert rf_client.get_cache() is None
+    rf_client.get_transport().close()
@@ -7,7 +7,7 @@
 # Tests RedfishClient and BMCAccessor classes with simple, medium, and complex scenarios
 ########################################################################
 
-from hw_management_redfish_client import RedfishClient, BMCAccessor
+from hw_management_redfish_client import RedfishClient, BMCAccessor, NetIfAddrCache
 import sys
 import os
 import pytest
@@ -16,6 +16,7 @@ import shutil
 import re
 import json
 import base64
+import socket
 from pathlib import Path
 from unittest.mock import patch, MagicMock, call, mock_open, Mock
 from io import StringIO
@@ -24,6 +25,10 @@ from io import StringIO
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'usr', 'usr', 'bin'))
 
 
+# Unpatched in-process address lookup (ifaddr_cache fixture patches it)
+IOCTL_ADDR = NetIfAddrCache.ioctl_addr
+
+
 def mock_curl_stdout(body='', http_status=200):
     '''Mimic curl stdout with -w "\\nHTTP Status Code: %{http_code}" trailer.'''
     if isinstance(body, bytes):
@@ -35,6 +40,24 @@ def mock_curl_stdout(body='', http_status=200):
 # FIXTURES
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def token_cache_dir(tmp_path):
+    """Keep BMCAccessor token cache and its lock off the host /run"""
+    with patch.object(BMCAccessor, 'TOKEN_CACHE_DIR', str(tmp_path / 'token')), \
+            patch.object(BMCAccessor, 'LOCK_DIR', str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture(autouse=True)
+def ifaddr_cache():
+    """Fresh per-test BMC interface address cache, no usb0 address on test host by default"""
+    cache = NetIfAddrCache()
+    with patch.object(BMCAccessor, 'ifaddr_cache', cache), \
+            patch.object(NetIfAddrCache, 'ioctl_addr', return_value=None) as ioctl_addr:
+        yield ioctl_addr
+    cache.close()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files"""
@@ -556,6 +579,63 @@ class TestBMCAccessorGetIPAddr:
             ip = accessor.get_ip_addr()
             assert ip == '192.168.1.1'  # Last byte replaced with '1'
 
+    def test_medium_usb0_ip_in_process(self, mock_subprocess, ifaddr_cache):
+        """Medium: usb0 address by ioctl, no ip/awk processes, cached"""
+        ifaddr_cache.return_value = '192.168.1.100'
+
+        with patch.object(BMCAccessor, 'get_login_password', return_value='****'):
+            accessor = BMCAccessor()
+            assert accessor.get_ip_addr() == '192.168.1.1'
+            ifaddr_cache.assert_called_with('usb0')
+            mock_subprocess.run.assert_not_called()
+            if BMCAccessor.ifaddr_cache._sock is not None:
+                # netlink notifications available: one ioctl for both lookups
+                assert ifaddr_cache.call_count == 1
+
+
+class TestNetIfAddrCache:
+    """Tests for NetIfAddrCache (SIOCGIFADDR lookup, rtnetlink invalidation)"""
+
+    def test_simple_ioctl_loopback(self):
+        """Simple: SIOCGIFADDR of loopback and of missing interface"""
+        assert IOCTL_ADDR('lo') == '127.0.0.1'
+        assert IOCTL_ADDR('nosuchif0') is None
+
+    def test_medium_cache_invalidated_by_notification(self, ifaddr_cache):
+        """Medium: cached until link/address notification is pending"""
+        ifaddr_cache.side_effect = ['192.168.1.100', '192.168.2.100', '192.168.3.100']
+        cache = NetIfAddrCache()
+        assert cache.get('usb0') == '192.168.1.100'
+        if cache._sock is None:
+            pytest.skip('rtnetlink socket is not available')
+        assert cache.get('usb0') == '192.168.1.100'
+        assert ifaddr_cache.call_count == 1
+
+        # Pending notification (link down/up, address change)
+        notify, cache._sock = cache._sock, None
+        notify.close()
+        watch, peer = socket.socketpair()
+        watch.setblocking(False)
+        cache._sock = watch
+        peer.send(b'RTM_NEWADDR')
+        assert cache.get('usb0') == '192.168.2.100'
+        assert cache.get('usb0') == '192.168.2.100'
+
+        # Forked process re-subscribes and drops inherited cache
+        cache._pid = -1
+        assert cache.get('usb0') == '192.168.3.100'
+        assert ifaddr_cache.call_count == 3
+        peer.close()
+        cache.close()
+
+    def test_medium_no_address_not_cached(self, ifaddr_cache):
+        """Medium: interface without address is looked up again"""
+        ifaddr_cache.side_effect = [None, '192.168.1.100']
+        cache = NetIfAddrCache()
+        assert cache.get('usb0') is None
+        assert cache.get('usb0') == '192.168.1.100'
+        cache.close()
+
 
 class TestBMCAccessorPasswordGeneration:
     """Tests for get_login_password() and legacy password handling"""
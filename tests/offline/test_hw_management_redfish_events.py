@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for RedfishEventStream (EventService Server-Sent Events
+# stream of hw_management_redfish_client.RedfishClient) against the SSE
+# endpoint of the local Redfish stub server.
+########################################################################
+
+import http.client
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HW_MGMT_BIN = TESTS_DIR.parent / "usr" / "usr" / "bin"
+for _path in (HW_MGMT_BIN, TESTS_DIR / "tools" / "redfish_stub"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import hw_management_redfish_client as redfish_client  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+RedfishClient = redfish_client.RedfishClient
+RedfishEventStream = redfish_client.RedfishEventStream
+
+pytestmark = pytest.mark.offline
+
+SENSOR_URI = "/redfish/v1/Chassis/MGX_BMC_0/Sensors/BMC_TEMP"
+TASK_URI = "/redfish/v1/TaskService/Tasks/1"
+
+
+def _http_connection(host, timeout):
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _event(origin, message_id="SensorEvent.1.0.ReadingAboveUpperCautionThreshold"):
+    return {"@odata.type": "#Event.v1_7_0.Event",
+            "Events": [{"MessageId": message_id, "OriginOfCondition": {"@odata.id": origin}}]}
+
+
+@pytest.fixture
+def server():
+    with stub.RedfishStubServer() as srv:
+        srv.state.sse_keepalive = 0.1
+        yield srv
+
+
+@pytest.fixture
+def client(server):
+    rf_client = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, stub.DEF_PASSWORD,
+                              redfish_client.RedfishHttpTransport(connection_factory=_http_connection))
+    assert rf_client.login() == RedfishClient.ERR_CODE_OK
+    yield rf_client
+    rf_client.get_transport().close()
+
+
+def _open(client, **kwargs):
+    ret, stream = client.open_event_stream(read_timeout=5, connection_factory=_http_connection, **kwargs)
+    assert ret == RedfishClient.ERR_CODE_OK
+    return stream
+
+
+def test_event_origins():
+    event = {"Events": [{"OriginOfCondition": {"@odata.id": SENSOR_URI}},
+                        {"OriginOfCondition": TASK_URI},
+                        {"MessageId": "Base.1.0.Success"}]}
+    assert RedfishEventStream.event_origins(event) == [SENSOR_URI, TASK_URI]
+    assert RedfishEventStream.event_origins({}) == []
+
+
+def test_stream_events_and_keepalive(server, client):
+    stream = _open(client)
+    server.state.publish(_event(SENSOR_URI))
+    server.state.publish(_event(TASK_URI, "TaskEvent.1.0.TaskCompletedOK"))
+
+    assert RedfishEventStream.event_origins(stream.read_event()) == [SENSOR_URI]
+    event = stream.read_event()
+    assert event["Events"][0]["MessageId"] == "TaskEvent.1.0.TaskCompletedOK"
+    assert stream.last_event_id == "2"
+
+    # idle stream: keep-alive comments are skipped, next event is returned
+    time.sleep(0.3)
+    server.state.publish(_event(SENSOR_URI))
+    assert stream.read_event() is not None
+    assert stream.stat["keepalive"] >= 1
+    assert stream.stat["event"] == 3
+    # one stream request, no polling
+    assert server.state.stat["request"] == 2
+    stream.close()
+
+
+def test_stream_resume_after_drop(server, client):
+    stream = _open(client)
+    server.state.publish(_event(SENSOR_URI))
+    assert stream.read_event() is not None
+
+    server.state.drop_sse_streams()
+    assert stream.read_event() is None
+    assert not stream.is_open()
+
+    # published while disconnected: delivered after reconnect by Last-Event-ID
+    server.state.publish(_event(TASK_URI))
+    assert stream.open() == RedfishClient.ERR_CODE_OK
+    assert RedfishEventStream.event_origins(stream.read_event()) == [TASK_URI]
+    assert server.state.stat["sse_stream"] == 2
+    stream.close()
+
+
+def test_open_relogin_on_expired_token(server, client):
+    server.state.expire_tokens()
+    stream = _open(client)
+    assert server.state.stat["login"] == 2
+    server.state.publish(_event(SENSOR_URI))
+    assert stream.read_event() is not None
+    stream.close()
+
+
+def test_listener_relogin_serialized_with_main_loop(server, client, monkeypatch):
+    """Requests of other thread wait for relogin of listener, no NOT_LOGIN and no second login"""
+    login = client._RedfishClient__login
+    in_login = threading.Event()
+    release = threading.Event()
+
+    def slow_login(password):
+        in_login.set()
+        release.wait(5)
+        return login(password)
+
+    monkeypatch.setattr(client, "_RedfishClient__login", slow_login)
+    server.state.expire_tokens()
+    opened = []
+    listener = threading.Thread(target=lambda: opened.append(client.open_event_stream(
+        read_timeout=5, connection_factory=_http_connection)))
+    listener.start()
+    assert in_login.wait(5)
+
+    result = []
+    main_loop = threading.Thread(target=lambda: result.append(
+        client.exec_curl_cmd(client.build_get_cmd(SENSOR_URI))))
+    main_loop.start()
+    main_loop.join(0.3)
+    # blocked until token is replaced
+    assert not result
+    release.set()
+    listener.join(5)
+    main_loop.join(5)
+
+    assert result[0][0] == RedfishClient.ERR_CODE_OK
+    assert opened[0][0] == RedfishClient.ERR_CODE_OK
+    assert server.state.stat["login"] == 2
+    opened[0][1].close()
+
+
+def test_open_not_supported(server, client):
+    ret, stream = client.open_event_stream(uri="/redfish/v1/EventService/NoSSE", read_timeout=1,
+                                           connection_factory=_http_connection)
+    assert (ret, stream) == (RedfishClient.ERR_CODE_UNEXPECTED_RESPONSE, None)
+
+    not_login = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, stub.DEF_PASSWORD)
+    assert not_login.open_event_stream() == (RedfishClient.ERR_CODE_NOT_LOGIN, None)
+
+
+def test_read_timeout_closes_stream(server, client):
+    server.state.sse_keepalive = 5
+    ret, stream = client.open_event_stream(read_timeout=0.3, connection_factory=_http_connection)
+    assert ret == RedfishClient.ERR_CODE_OK
+    # no event and no keep-alive within read timeout: dead stream
+    assert stream.read_event() is None
+    assert not stream.is_open()
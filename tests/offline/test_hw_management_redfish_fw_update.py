@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for RedfishClient streaming firmware update: mmap'd upload
+# body (RedfishUploadBody), push URI selection, retry of interrupted
+# transfer and adaptive task monitoring, against the local Redfish stub.
+########################################################################
+
+import hashlib
+import http.client
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HW_MGMT_BIN = TESTS_DIR.parent / "usr" / "usr" / "bin"
+for _path in (HW_MGMT_BIN, TESTS_DIR / "tools" / "redfish_stub"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import hw_management_redfish_client as redfish_client  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+RedfishClient = redfish_client.RedfishClient
+RedfishUploadBody = redfish_client.RedfishUploadBody
+task_poll_delay = RedfishClient._RedfishClient__task_poll_delay
+
+pytestmark = pytest.mark.offline
+
+MB = 1024 * 1024
+
+
+def _http_connection(host, timeout):
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _image(tmp_path, size, name="fw.bin"):
+    path = tmp_path / name
+    with open(str(path), "wb") as image:
+        pattern = bytes(range(256)) * 4096
+        for offset in range(0, size, len(pattern)):
+            image.write(pattern[:size - offset])
+    return str(path)
+
+
+def _sha256(path):
+    with open(path, "rb") as image:
+        return hashlib.sha256(image.read()).hexdigest()
+
+
+def _client(server):
+    rf_client = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, stub.DEF_PASSWORD,
+                              redfish_client.RedfishHttpTransport(connection_factory=_http_connection))
+    assert rf_client.login() == RedfishClient.ERR_CODE_OK
+    return rf_client
+
+
+@pytest.fixture
+def server():
+    with stub.RedfishStubServer() as srv:
+        yield srv
+
+
+@pytest.fixture
+def sleeps():
+    delays = []
+    with patch.object(redfish_client.time, "sleep", side_effect=delays.append):
+        yield delays
+
+
+def test_parse_iso8601_duration():
+    assert redfish_client.parse_iso8601_duration("PT2M30S") == 150
+    assert redfish_client.parse_iso8601_duration("P1DT1H") == 90000
+    assert redfish_client.parse_iso8601_duration("PT0.5S") == 0.5
+    for value in (None, "", "PT", "2M", "PT-1S", 30):
+        assert redfish_client.parse_iso8601_duration(value) is None
+
+
+def test_task_poll_delay():
+    # EstimatedDuration: remaining time split in TASK_POLL_STEPS polls
+    assert task_poll_delay({"EstimatedDuration": "PT2M"}, 40, 1) == 20
+    # PercentComplete rate: 25% in 20 sec -> 60 sec remaining
+    assert task_poll_delay({"PercentComplete": 25}, 20, 1) == 15
+    # overdue estimate falls back to PercentComplete
+    assert task_poll_delay({"EstimatedDuration": "PT10S", "PercentComplete": 50}, 20, 1) == 5
+    # no estimate: exponential backoff, clamped
+    assert task_poll_delay({}, 5, 4) == 8
+    assert task_poll_delay({"PercentComplete": 0}, 5, 20) == RedfishClient.TASK_POLL_MAX
+    assert task_poll_delay({"PercentComplete": 99}, 1, 1) == RedfishClient.TASK_POLL_MIN
+
+
+def test_upload_body_octet_stream(tmp_path):
+    path = _image(tmp_path, 3 * RedfishUploadBody.CHUNK_SIZE + 100)
+    progress = []
+    body = RedfishUploadBody(path, progress=lambda sent, total, rate: progress.append((sent, total)))
+    data = b"".join(iter(lambda: body.read(body.chunk_size), b""))
+    assert hashlib.sha256(data).hexdigest() == _sha256(path)
+    assert len(body) == len(data)
+    assert body.content_type == "application/octet-stream"
+    assert progress[-1] == (len(data), len(data))
+    assert len(progress) == 4
+
+    # rewind for resend
+    body.seek(0)
+    assert body.read(10) == data[:10]
+    with pytest.raises(OSError):
+        body.seek(5)
+    body.close()
+
+
+def test_upload_body_multipart_from_curl_config(tmp_path):
+    path = _image(tmp_path, 5000)
+    opts = redfish_client.parse_curl_config("\n".join([
+        'form = "UpdateParameters={\\"Targets\\": []};type=application/json"',
+        'form = "UpdateFile=@{};type=application/octet-stream"'.format(path),
+    ]))
+    body = RedfishUploadBody.from_curl_opts(opts)
+    data = b"".join(iter(lambda: body.read(body.chunk_size), b""))
+    body.close()
+    assert len(data) == len(body)
+
+    receiver = stub.ImageReceiver(body.content_type)
+    # closing boundary split across chunks
+    for offset in range(0, len(data), 777):
+        receiver.feed(data[offset:offset + 777])
+    assert receiver.finish()
+    assert receiver.parameters == {"Targets": []}
+    assert (receiver.size, receiver.sha256.hexdigest()) == (5000, _sha256(path))
+
+
+def test_update_firmware_multipart(server, tmp_path, sleeps):
+    path = _image(tmp_path, 2 * MB)
+    server.state.task_step = 25
+    rf_client = _client(server)
+    upload_progress = []
+    task_progress = []
+    ret, msg = rf_client.redfish_api_update_firmware(
+        path, targets=["/redfish/v1/UpdateService/FirmwareInventory/CPLD_0"],
+        progress_callback=lambda sent, total, rate: upload_progress.append((sent, total, rate)),
+        task_callback=lambda percent, state: task_progress.append((percent, state)))
+    rf_client.get_transport().close()
+
+    assert (ret, msg) == (RedfishClient.ERR_CODE_OK, "")
+    upload = server.state.fw_uploads[0]
+    assert upload["uri"] == stub.MULTIPART_PUSH_URI
+    assert upload["content_type"] == "multipart/form-data"
+    assert upload["parameters"] == {"Targets": ["/redfish/v1/UpdateService/FirmwareInventory/CPLD_0"]}
+    assert (upload["size"], upload["sha256"]) == (2 * MB, _sha256(path))
+    assert upload_progress[-1][0] == upload_progress[-1][1]
+    assert upload_progress[-1][2] > 0
+    assert task_progress == [(25, "Running"), (50, "Running"), (75, "Running"), (100, "Completed")]
+    assert len(sleeps) == 3
+    assert all(RedfishClient.TASK_POLL_MIN <= delay <= RedfishClient.TASK_POLL_MAX for delay in sleeps)
+
+
+def test_update_firmware_http_push_force(server, tmp_path, sleeps):
+    path = _image(tmp_path, 100000)
+    service = server.state.resources[stub.UPDATE_SERVICE_URI]
+    del service["MultipartHttpPushUri"]
+    rf_client = _client(server)
+    ret, _ = rf_client.redfish_api_update_firmware(path, force_update=True)
+    rf_client.get_transport().close()
+
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert service["HttpPushUriOptions"] == {"ForceUpdate": True}
+    upload = server.state.fw_uploads[0]
+    assert (upload["uri"], upload["content_type"]) == (stub.PUSH_URI, "application/octet-stream")
+    assert upload["sha256"] == _sha256(path)
+
+
+def test_update_firmware_retry_interrupted_transfer(server, tmp_path, sleeps):
+    path = _image(tmp_path, 16 * MB)
+    server.state.fw_abort_after = MB
+    server.state.fw_abort_count = 2
+    rf_client = _client(server)
+    ret, _ = rf_client.redfish_api_update_firmware(path)
+    rf_client.get_transport().close()
+
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert server.state.stat["fw_upload_aborted"] == 2
+    assert server.state.stat["fw_upload"] == 1
+    assert server.state.fw_uploads[0]["sha256"] == _sha256(path)
+    assert RedfishClient.FW_UPLOAD_RETRY_DELAY in sleeps
+
+
+def test_update_firmware_retry_interrupted_transfer_curl(tmp_path, sleeps):
+    curl = shutil.which("curl")
+    tls_cert = stub.make_self_signed_cert(str(tmp_path))
+    if not (curl and tls_cert):
+        pytest.skip("curl or openssl is not available")
+    path = _image(tmp_path, 16 * MB)
+    progress = []
+    with stub.RedfishStubServer(tls_cert=tls_cert) as srv:
+        srv.state.fw_abort_after = MB
+        srv.state.fw_abort_count = 2
+        rf_client = RedfishClient(curl, srv.address, stub.DEF_USER, stub.DEF_PASSWORD)
+        assert rf_client.login() == RedfishClient.ERR_CODE_OK
+        ret, _ = rf_client.redfish_api_update_firmware(
+            path, progress_callback=lambda sent, total, rate: progress.append((sent, total)))
+
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert srv.state.stat["fw_upload_aborted"] == 2
+    assert srv.state.stat["fw_upload"] == 1
+    assert srv.state.fw_uploads[0]["sha256"] == _sha256(path)
+    # partial transfers reported by curl size_upload, then complete one
+    assert len(progress) == 3
+    assert all(sent < total for sent, total in progress[:2])
+    assert progress[2] == (16 * MB, 16 * MB)
+    assert RedfishClient.FW_UPLOAD_RETRY_DELAY in sleeps
+
+
+def test_update_firmware_task_failure(server, tmp_path, sleeps):
+    path = _image(tmp_path, 1000)
+    server.state.task_fail_message = "Component image is identical"
+    rf_client = _client(server)
+    ret, msg = rf_client.redfish_api_update_firmware(path)
+    assert (ret, msg) == (RedfishClient.ERR_CODE_IDENTICAL_IMAGE, "Component image is identical")
+
+    server.state.task_fail_message = "Image verification failed"
+    ret, msg = rf_client.redfish_api_update_firmware(path)
+    assert (ret, msg) == (RedfishClient.ERR_CODE_GENERIC_ERROR, "Image verification failed")
+
+    server.state.task_fail_message = None
+    server.state.task_step = 0
+    ret, _ = rf_client.redfish_api_update_firmware(path, timeout=0)
+    assert ret == RedfishClient.ERR_CODE_TIMEOUT
+    rf_client.get_transport().close()
+
+
+def _vm_hwm_kb():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    return None
+
+
+def _upload_worker(address, path, result):
+    rf_client = RedfishClient("/nonexistent/curl", address, stub.DEF_USER, stub.DEF_PASSWORD,
+                              redfish_client.RedfishHttpTransport(connection_factory=_http_connection))
+    rf_client.login()
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        # reset peak RSS (VmHWM) to current RSS
+        clear_refs.write("5")
+    hwm_start = _vm_hwm_kb()
+    start = time.monotonic()
+    with patch.object(redfish_client.time, "sleep"):
+        ret, _ = rf_client.redfish_api_update_firmware(path)
+    elapsed = time.monotonic() - start
+    result.put((ret, hwm_start, _vm_hwm_kb(), elapsed))
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="VmHWM reset is not supported")
+def test_upload_throughput_and_peak_rss(server, tmp_path):
+    """Peak RSS does not grow with image size (image pages are released after send)."""
+    size = 128 * MB
+    path = _image(tmp_path, size)
+    ctx = multiprocessing.get_context("fork")
+    result = ctx.Queue()
+    proc = ctx.Process(target=_upload_worker, args=(server.address, path, result))
+    proc.start()
+    ret, hwm_start, hwm_end, elapsed = result.get(timeout=60)
+    proc.join(10)
+
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert server.state.fw_uploads[0]["size"] == size
+    rss_growth_mb = (hwm_end - hwm_start) / 1024.0
+    print("upload {} MB: {:.1f} MB/s, peak RSS growth {:.1f} MB".format(size // MB, size / MB / elapsed,
+                                                                        rss_growth_mb))
+    assert rss_growth_mb < 16
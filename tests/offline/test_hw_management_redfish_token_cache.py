@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for RedfishTokenCache (cross-process Redfish session token
+# cache with flock single-flight refresh) and its use by RedfishClient
+# and BMCAccessor.
+########################################################################
+
+import asyncio
+import http.client
+import json
+import multiprocessing
+import os
+import stat
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HW_MGMT_BIN = TESTS_DIR.parent / "usr" / "usr" / "bin"
+for _path in (HW_MGMT_BIN, TESTS_DIR / "tools" / "redfish_stub"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import hw_management_redfish_client as redfish_client  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+RedfishClient = redfish_client.RedfishClient
+RedfishTokenCache = redfish_client.RedfishTokenCache
+BMCAccessor = redfish_client.BMCAccessor
+
+pytestmark = pytest.mark.offline
+
+HOST = "10.0.1.1"
+
+
+@pytest.fixture
+def token_cache(tmp_path):
+    return RedfishTokenCache(str(tmp_path / "token_dir" / "token"), str(tmp_path / "token.lock"), ttl=60)
+
+
+def test_store_load_private(token_cache):
+    assert token_cache.load(HOST, "user") is None
+    assert token_cache.store(HOST, "user", "tok1")
+
+    assert token_cache.load(HOST, "user") == "tok1"
+    assert token_cache.load(HOST, "admin") is None
+    assert token_cache.load("10.0.2.1", "user") is None
+    token_path = token_cache.user_token_path("user")
+    assert stat.S_IMODE(os.stat(token_path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(os.path.dirname(token_path)).st_mode) == 0o700
+
+    # token readable by others is not trusted
+    os.chmod(token_path, 0o644)
+    assert token_cache.load(HOST, "user") is None
+
+    token_cache.invalidate("user")
+    assert token_cache.load(HOST, "user") is None
+
+
+def test_token_file_per_user(token_cache):
+    assert token_cache.store(HOST, "user", "tok1")
+    assert token_cache.store(HOST, "admin", "tok2")
+    assert (token_cache.load(HOST, "user"), token_cache.load(HOST, "admin")) == ("tok1", "tok2")
+    token_cache.invalidate("admin")
+    assert (token_cache.load(HOST, "user"), token_cache.load(HOST, "admin")) == ("tok1", None)
+    # user name is not a path
+    assert not token_cache.store(HOST, "../user", "tok3")
+    assert token_cache.load(HOST, "../user") is None
+
+    # token of user not listed is neither shared nor taken
+    restricted = RedfishTokenCache(token_cache.token_path, token_cache.lock_path, ttl=60, users=("user",))
+    assert not restricted.store(HOST, "admin", "tok4")
+    token_cache.store(HOST, "admin", "tok4")
+    assert restricted.load(HOST, "admin") is None
+    assert restricted.load(HOST, "user") == "tok1"
+
+
+def test_ttl_expiry(token_cache):
+    with patch.object(redfish_client.time, "monotonic", return_value=100.0):
+        token_cache.store(HOST, "user", "tok1")
+    with patch.object(redfish_client.time, "monotonic", return_value=159.0):
+        assert token_cache.load(HOST, "user") == "tok1"
+    with patch.object(redfish_client.time, "monotonic", return_value=160.0):
+        assert token_cache.load(HOST, "user") is None
+
+
+def test_shared_dir_not_used(tmp_path):
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir(mode=0o755)
+    os.chmod(str(shared_dir), 0o755)
+    cache = RedfishTokenCache(str(shared_dir / "token"), str(tmp_path / "token.lock"), ttl=60)
+    assert not cache.store(HOST, "user", "tok1")
+    assert os.listdir(str(shared_dir)) == []
+
+
+def test_lock_reentrant_and_unavailable(tmp_path, token_cache):
+    with token_cache:
+        with token_cache:
+            assert token_cache._lock_fd is not None
+        assert token_cache._lock_fd is not None
+    assert token_cache._lock_fd is None
+
+    # lock directory not accessible: no locking, no failure
+    cache = RedfishTokenCache(str(tmp_path / "t"), str(tmp_path / "missing" / "lock"), ttl=60)
+    with cache:
+        assert cache._lock_fd is None
+
+
+def _http_client(address, token_cache, password=stub.DEF_PASSWORD):
+    transport = redfish_client.RedfishHttpTransport(
+        connection_factory=lambda host, timeout: http.client.HTTPConnection(host, timeout=timeout))
+    return RedfishClient("/nonexistent/curl", address, stub.DEF_USER, password, transport,
+                         token_cache=token_cache)
+
+
+def _login_worker(address, token_path, lock_path, result):
+    cache = RedfishTokenCache(token_path, lock_path, ttl=60)
+    rf_client = _http_client(address, cache)
+    ret = rf_client.login()
+    result.put((ret, rf_client.get_token()))
+
+
+def test_single_flight_login_across_processes(token_cache):
+    ctx = multiprocessing.get_context("fork")
+    result = ctx.Queue()
+    with stub.RedfishStubServer() as srv:
+        procs = [ctx.Process(target=_login_worker,
+                             args=(srv.address, token_cache.token_path, token_cache.lock_path, result))
+                 for _ in range(4)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(10)
+        logins = [result.get(timeout=5) for _ in procs]
+        assert srv.state.stat["login"] == 1
+
+    assert {ret for ret, _ in logins} == {RedfishClient.ERR_CODE_OK}
+    assert len({token for _, token in logins}) == 1
+
+
+def test_relogin_replaces_stale_token(token_cache):
+    with stub.RedfishStubServer() as srv:
+        srv.state.add_resource("/redfish/v1/Chassis", {"Members": []})
+        first = _http_client(srv.address, token_cache)
+        assert first.login() == RedfishClient.ERR_CODE_OK
+        # second consumer takes cached token, no password needed
+        second = _http_client(srv.address, token_cache, password=None)
+        assert second.login() == RedfishClient.ERR_CODE_OK
+        assert second.get_token() == first.get_token()
+        assert srv.state.stat["login"] == 1
+
+        srv.state.expire_tokens()
+        ret, response, _ = first.exec_curl_cmd(first.build_get_cmd("/redfish/v1/Chassis"))
+        assert ret == RedfishClient.ERR_CODE_OK
+        assert json.loads(response) == {"Members": []}
+        assert srv.state.stat["login"] == 2
+        new_token = first.get_token()
+        assert token_cache.load(srv.address, stub.DEF_USER) == new_token
+
+        # stale token is not taken from cache again: refreshed token is reused
+        ret, _, _ = second.exec_curl_cmd(second.build_get_cmd("/redfish/v1/Chassis"))
+        assert ret == RedfishClient.ERR_CODE_OK
+        assert second.get_token() == new_token
+        assert srv.state.stat["login"] == 2
+        first.get_transport().close()
+        second.get_transport().close()
+
+
+def test_bmc_accessor_cached_token_skips_tpm(tmp_path):
+    password_provider = MagicMock(return_value="tpm-password")
+    with patch.object(BMCAccessor, "TOKEN_CACHE_DIR", str(tmp_path / "token_dir")), \
+            patch.object(BMCAccessor, "LOCK_DIR", str(tmp_path)), \
+            patch.object(BMCAccessor, "get_ip_addr", return_value=HOST), \
+            patch.object(BMCAccessor, "get_login_password", password_provider):
+        accessor = BMCAccessor()
+        password_provider.assert_not_called()
+
+        accessor.token_cache.store(HOST, BMCAccessor.BMC_NOS_ACCOUNT, "shared-token")
+        with patch.object(BMCAccessor, "_login_flow") as login_flow:
+            assert accessor.login() == RedfishClient.ERR_CODE_OK
+            login_flow.assert_not_called()
+        assert accessor.rf_client.get_token() == "shared-token"
+        password_provider.assert_not_called()
+
+        # no valid token: full login flow
+        accessor.token_cache.invalidate(BMCAccessor.BMC_NOS_ACCOUNT)
+        accessor.rf_client.update_credentials(BMCAccessor.BMC_NOS_ACCOUNT)
+        with patch.object(BMCAccessor, "_login_flow", return_value=RedfishClient.ERR_CODE_OK) as login_flow:
+            assert accessor.login() == RedfishClient.ERR_CODE_OK
+            login_flow.assert_called_once()
+
+
+def test_bmc_accessor_admin_token_not_shared(tmp_path):
+    users = {BMCAccessor.BMC_NOS_ACCOUNT: "tpm-password",
+             BMCAccessor.BMC_ADMIN_ACCOUNT: BMCAccessor.BMC_DEFAULT_PASSWORD}
+    with stub.RedfishStubServer(users=users) as srv, \
+            patch.object(BMCAccessor, "TOKEN_CACHE_DIR", str(tmp_path / "token_dir")), \
+            patch.object(BMCAccessor, "LOCK_DIR", str(tmp_path)), \
+            patch.object(BMCAccessor, "get_ip_addr", return_value=srv.address), \
+            patch.object(BMCAccessor, "get_login_password", return_value="tpm-password"):
+        transport = _http_client(srv.address, None).get_transport()
+        accessor = BMCAccessor(transport=transport)
+        # provisioning step of login flow: admin session is not stored
+        assert accessor.try_rf_login(BMCAccessor.BMC_ADMIN_ACCOUNT,
+                                     BMCAccessor.BMC_DEFAULT_PASSWORD) == RedfishClient.ERR_CODE_OK
+        assert accessor.token_cache.load(srv.address, BMCAccessor.BMC_ADMIN_ACCOUNT) is None
+        assert not (tmp_path / "token_dir").exists()
+
+        # NOS account session is shared with other consumer, admin session is not
+        assert accessor.try_rf_login(BMCAccessor.BMC_NOS_ACCOUNT, "tpm-password") == RedfishClient.ERR_CODE_OK
+        other = BMCAccessor(transport=transport)
+        assert other.login() == RedfishClient.ERR_CODE_OK
+        assert other.rf_client.get_token() == accessor.rf_client.get_token()
+        other.rf_client.update_credentials(BMCAccessor.BMC_ADMIN_ACCOUNT, BMCAccessor.BMC_DEFAULT_PASSWORD)
+        assert other.rf_client.login() == RedfishClient.ERR_CODE_OK
+        assert srv.state.stat["login"] == 3
+        transport.close()
+
+
+def _get(client):
+    ret, _, _ = client.exec_curl_cmd(client.build_get_cmd("/redfish/v1/Chassis"))
+    return ret
+
+
+def _event_stream(client):
+    ret, stream = client.open_event_stream(
+        read_timeout=1, connection_factory=lambda host, timeout: http.client.HTTPConnection(host, timeout=timeout))
+    if stream:
+        stream.close()
+    return ret
+
+
+def _async_get(client):
+    async def main():
+        async with redfish_client.AsyncRedfishClient(
+                client, connection_factory=lambda host, port: asyncio.open_connection(host, port)) as aclient:
+            return (await aclient.get("/redfish/v1/Chassis"))[0]
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("request_fn", [_get, _event_stream, _async_get])
+def test_rejected_cached_token_relogin(token_cache, request_fn):
+    """Cached token is not validated: token rejected by BMC (BMC reboot) is replaced on first request"""
+    with stub.RedfishStubServer() as srv:
+        srv.state.add_resource("/redfish/v1/Chassis", {"Members": []})
+        token_cache.store(srv.address, stub.DEF_USER, "stale-token")
+        client = _http_client(srv.address, token_cache)
+        assert client.login() == RedfishClient.ERR_CODE_OK
+        assert client.get_token() == "stale-token"
+        assert srv.state.stat["login"] == 0
+
+        assert request_fn(client) == RedfishClient.ERR_CODE_OK
+        assert srv.state.stat["login"] == 1
+        assert client.get_token() not in (None, "stale-token")
+        assert token_cache.load(srv.address, stub.DEF_USER) == client.get_token()
+        client.get_transport().close()
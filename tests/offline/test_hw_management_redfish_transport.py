@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for RedfishHttpTransport (persistent http.client transport of
+# hw_management_redfish_client.RedfishClient) against the local Redfish
+# stub server from tests/tools/redfish_stub.
+########################################################################
+
+import http.client
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HW_MGMT_BIN = TESTS_DIR.parent / "usr" / "usr" / "bin"
+for _path in (HW_MGMT_BIN, TESTS_DIR / "tools" / "redfish_stub"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import hw_management_redfish_client as redfish_client  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+RedfishClient = redfish_client.RedfishClient
+RedfishHttpTransport = redfish_client.RedfishHttpTransport
+
+pytestmark = pytest.mark.offline
+
+SENSOR_URI = "/redfish/v1/Chassis/BMC_0/Sensors/BMC_0_Temp_0"
+SENSOR = {"Reading": 45.0, "Status": {"State": "Enabled", "Health": "OK"}}
+
+
+class SlowRedirectHandler(stub.RedfishStubHandler):
+    """Stub handler with /moved redirect and /slow (sleeps past client timeout)."""
+
+    def handle_resource(self, body):
+        if self.path == "/moved":
+            self._send(302, headers={"Location": SENSOR_URI})
+        elif self.path == "/slow":
+            time.sleep(1.5)
+            self._send(200, SENSOR)
+        else:
+            super().handle_resource(body)
+
+
+def _plain_http_transport():
+    # stub without TLS: plain HTTP connection, same keep-alive logic
+    return RedfishHttpTransport(
+        connection_factory=lambda host, timeout: http.client.HTTPConnection(host, timeout=timeout))
+
+
+@pytest.fixture
+def server():
+    with stub.RedfishStubServer(handler=SlowRedirectHandler) as srv:
+        srv.state.add_resource(SENSOR_URI, dict(SENSOR))
+        yield srv
+
+
+@pytest.fixture
+def client(server):
+    rf_client = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, stub.DEF_PASSWORD,
+                              _plain_http_transport())
+    yield rf_client
+    rf_client.get_transport().close()
+
+
+def _config(url, *extra):
+    return "\n".join(["insecure", "max-time = 1"] + list(extra) + ['url = "{}"'.format(url)])
+
+
+def test_parse_curl_config():
+    opts = redfish_client.parse_curl_config("\n".join([
+        "# comment",
+        "insecure",
+        "max-time = 3",
+        'header = "X-Auth-Token: a\\"b"',
+        'header = "Content-Type: application/json"',
+        'data-raw = "{\\"password\\": \\"p\\\\\\\\w\\"}"',
+        'url = "https://10.0.1.1/login"',
+    ]))
+    assert opts["insecure"] is True
+    assert opts["max-time"] == "3"
+    assert opts["header"] == ['X-Auth-Token: a"b', "Content-Type: application/json"]
+    assert json.loads(opts["data-raw"]) == {"password": "p\\w"}
+    assert opts["url"] == "https://10.0.1.1/login"
+
+
+def test_client_http_transport_selection():
+    assert RedfishClient("/usr/bin/curl", "127.0.0.1", "u", "p").get_transport() is None
+    assert RedfishClient("/usr/bin/curl", "127.0.0.1", "u", "p", RedfishClient.TRANSPORT_CURL).get_transport() is None
+    transport = RedfishClient("/usr/bin/curl", "127.0.0.1", "u", "p", RedfishClient.TRANSPORT_HTTP).get_transport()
+    assert isinstance(transport, RedfishHttpTransport)
+
+
+def test_login_and_get_single_connection(server, client):
+    assert client.login() == RedfishClient.ERR_CODE_OK
+    cmd = client.build_get_cmd(SENSOR_URI)
+    for _ in range(5):
+        ret, response, _ = client.exec_curl_cmd(cmd)
+        assert ret == RedfishClient.ERR_CODE_OK
+        assert json.loads(response)["Reading"] == 45.0
+
+    assert server.state.stat["connection"] == 1
+    assert server.state.stat["request"] == 6
+    assert client.get_transport().stat["connect"] == 1
+
+
+def test_bad_credential(server):
+    rf_client = RedfishClient("/nonexistent/curl", server.address, stub.DEF_USER, "wrong",
+                              _plain_http_transport())
+    assert rf_client.login() == RedfishClient.ERR_CODE_BAD_CREDENTIAL
+    assert not rf_client.has_login()
+
+
+def test_relogin_on_expired_token(server, client):
+    assert client.login() == RedfishClient.ERR_CODE_OK
+    token = client.get_token()
+    server.state.expire_tokens()
+
+    ret, response, _ = client.exec_curl_cmd(client.build_get_cmd(SENSOR_URI))
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert json.loads(response)["Reading"] == 45.0
+    assert client.get_token() != token
+    assert server.state.stat["unauthorized"] == 1
+    assert server.state.stat["login"] == 2
+
+
+def test_reconnect_after_server_close(server, client):
+    assert client.login() == RedfishClient.ERR_CODE_OK
+    server.state.close_after_response = True
+    cmd = client.build_get_cmd(SENSOR_URI)
+    for _ in range(3):
+        ret, response, _ = client.exec_curl_cmd(cmd)
+        assert ret == RedfishClient.ERR_CODE_OK
+        assert json.loads(response)["Reading"] == 45.0
+    # login connection is reused once, then new connection per request
+    assert server.state.stat["connection"] == 3
+    assert client.get_transport().stat["error"] == 0
+
+
+def test_redirect_followed(server):
+    transport = _plain_http_transport()
+    url = "http://{}/moved".format(server.address)
+    ret, response, _, status, _ = transport.exec_config(_config(url, "location", "user = \"{}:{}\"".format(
+        stub.DEF_USER, stub.DEF_PASSWORD)))
+    assert (ret, status) == (0, 200)
+    assert json.loads(response)["Reading"] == 45.0
+
+    # no 'location' option: redirect returned as is, like curl
+    ret, response, _, status, _ = transport.exec_config(_config(url, "user = \"{}:{}\"".format(
+        stub.DEF_USER, stub.DEF_PASSWORD)))
+    assert (ret, response, status) == (0, "", 302)
+    transport.close()
+
+
+def test_timeout_and_refused_map_to_curl_failure(server):
+    transport = _plain_http_transport()
+    url = "http://{}/slow".format(server.address)
+    ret, response, err, status, _ = transport.exec_config(_config(url, "user = \"{}:{}\"".format(
+        stub.DEF_USER, stub.DEF_PASSWORD)))
+    assert (ret, response, status) == (RedfishClient.ERR_CODE_CURL_FAILURE, "", None)
+    assert "timed out" in err
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    ret, _, err, status, _ = transport.exec_config(_config("http://127.0.0.1:{}/redfish/v1".format(port)))
+    assert ret == RedfishClient.ERR_CODE_CURL_FAILURE
+    assert err
+    assert transport.stat["error"] == 2
+
+
+def test_default_tls_transport(tmp_path):
+    tls_cert = stub.make_self_signed_cert(str(tmp_path))
+    if not tls_cert:
+        pytest.skip("openssl is not available")
+    with stub.RedfishStubServer(tls_cert=tls_cert) as srv:
+        srv.state.add_resource(SENSOR_URI, dict(SENSOR))
+        rf_client = RedfishClient("/nonexistent/curl", srv.address, stub.DEF_USER, stub.DEF_PASSWORD,
+                                  RedfishClient.TRANSPORT_HTTP)
+        assert rf_client.login() == RedfishClient.ERR_CODE_OK
+        ret, response, _ = rf_client.exec_curl_cmd(rf_client.build_get_cmd(SENSOR_URI))
+        rf_client.get_transport().close()
+    assert ret == RedfishClient.ERR_CODE_OK
+    assert json.loads(response)["Reading"] == 45.0
+    assert srv.state.stat["connection"] == 1
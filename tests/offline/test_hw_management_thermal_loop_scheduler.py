@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+################################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for TC 2.5 main loop scheduler: ThermalManagement.run() services
+# only devices which poll time expired (heap keyed on get_timestamp()),
+# keeps incremental max PWM and reports per-iteration cost. Error exclusion
+# rules and config name masks are precompiled and attached to devices so the
+# loop does no regex work in steady state.
+################################################################################
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+TESTS_DIR = Path(__file__).parent
+PROJECT_ROOT = TESTS_DIR.parent.parent
+HW_MGMT_BIN = PROJECT_ROOT / "usr" / "usr" / "bin"
+if str(HW_MGMT_BIN) not in sys.path:
+    sys.path.insert(0, str(HW_MGMT_BIN))
+
+import hw_management_thermal_control_2_5 as tc25  # noqa: E402
+
+pytestmark = pytest.mark.offline
+
+
+class _FakeDev:
+    """Minimal system_device stand-in for scheduler tests."""
+
+    def __init__(self, name, timestamp, pwm=30, poll_time=3):
+        self.name = name
+        self.enable = True
+        self.state = tc25.CONST.RUNNING
+        self.poll_time_next = timestamp
+        self.poll_time = poll_time
+        self.pwm = pwm
+        self.faults = []
+        self.dynamic_faults = []
+        self.err_exclusion_conf_list = []
+        self.dynamic_filter_ena = False
+        self.process_cnt = 0
+        self.handle_err_cnt = 0
+
+    def get_timestamp(self):
+        return self.poll_time_next
+
+    def update_timestamp(self, timeout=0):
+        if not timeout:
+            timeout = self.poll_time * 1000
+        self.poll_time_next = tc25.current_milli_time() + timeout
+
+    def process(self, thermal_table, flow_dir, amb_tmp):
+        self.process_cnt += 1
+
+    def handle_err(self, thermal_table, flow_dir, amb_tmp):
+        self.handle_err_cnt += 1
+
+    def get_pwm(self):
+        return self.pwm
+
+    def get_value(self):
+        return 25
+
+    def get_fault_list_static_filtered(self):
+        return self.faults
+
+    def get_fault_list_dynamic(self):
+        return self.dynamic_faults
+
+    def get_fault_cnt(self):
+        return 1 if self.faults else 0
+
+    def set_dynamic_filter_ena(self, ena):
+        self.dynamic_filter_ena = ena
+
+
+def _make_tm(dev_list):
+    tm = tc25.ThermalManagement.__new__(tc25.ThermalManagement)
+    tm.log = Mock()
+    tm.dev_obj_list = list(dev_list)
+    tm.dev_obj_dict = {}
+    tm.dev_child_obj_dict = {}
+    tm.dev_err_exclusion_conf = {}
+    tm.conf_rule_index = {}
+    tm.dev_sched_heap = []
+    tm.dev_sched_seq = 0
+    tm.dev_pwm_dict = {}
+    tm.dev_pwm_max = (0, "")
+    tm.dev_pwm_max_dirty = True
+    tm.dev_fault_dict = {}
+    tm._loop_stat_reset()
+    tm._sched_rebuild()
+    return tm
+
+
+def test_pop_due_returns_only_expired_devices():
+    now = tc25.current_milli_time()
+    devs = [_FakeDev("module{}".format(idx), now + 20000) for idx in range(1, 129)]
+    asic = _FakeDev("asic1", now - 10)
+    tm = _make_tm(devs + [asic])
+
+    assert tm._sched_pop_due(now) == [asic]
+    # all other entries stay in heap
+    assert len(tm.dev_sched_heap) == 128
+    assert tm._sched_get_next_timestamp(now + 60000) == now + 20000
+
+
+def test_pop_due_skips_removed_and_moved_forward_devices():
+    now = tc25.current_milli_time()
+    dev_removed = _FakeDev("module1", now - 10)
+    dev_moved = _FakeDev("module2", now - 10)
+    tm = _make_tm([dev_removed, dev_moved])
+
+    del tm.dev_obj_dict["module1"]
+    dev_moved.poll_time_next = now + 5000
+
+    assert tm._sched_pop_due(now) == []
+    # moved device re-pushed with actual timestamp, removed device dropped
+    assert [entry[2] for entry in tm.dev_sched_heap] == [dev_moved]
+    assert tm.dev_sched_heap[0][0] == now + 5000
+
+
+def test_pop_due_disabled_device_removed_from_pwm_and_rechecked():
+    now = tc25.current_milli_time()
+    dev = _FakeDev("dpu1_cpu", now - 10, pwm=70)
+    tm = _make_tm([dev])
+    assert tm._pwm_get_cached_max() == (70, "dpu1_cpu")
+
+    dev.enable = False
+    assert tm._sched_pop_due(now) == []
+    assert "dpu1_cpu" not in tm.dev_pwm_dict
+    assert tm._pwm_get_cached_max() == (0, "")
+    assert tm.dev_sched_heap[0][0] == now + tc25.CONST.SCHED_DISABLED_RECHECK_TIME
+
+
+def test_cached_max_pwm_incremental_update():
+    now = tc25.current_milli_time()
+    dev1 = _FakeDev("asic1", now, pwm=40)
+    dev2 = _FakeDev("module1", now, pwm=60)
+    tm = _make_tm([dev1, dev2])
+    assert tm._pwm_get_cached_max() == (60, "module1")
+
+    # new max - no full recalculation required
+    dev1.pwm = 80
+    tm._sched_sync_pwm(dev1)
+    assert not tm.dev_pwm_max_dirty
+    assert tm._pwm_get_cached_max() == (80, "asic1")
+
+    # non-max device changed below max - cache stays valid
+    dev2.pwm = 50
+    tm._sched_sync_pwm(dev2)
+    assert not tm.dev_pwm_max_dirty
+
+    # max source decreased - recalculated on next request
+    dev1.pwm = 30
+    tm._sched_sync_pwm(dev1)
+    assert tm.dev_pwm_max_dirty
+    assert tm._pwm_get_cached_max() == (50, "module1")
+
+    tm._pwm_dict_rm("module1")
+    assert tm._pwm_get_cached_max() == (30, "asic1")
+
+
+def test_fault_cache_tracks_running_faulty_devices():
+    now = tc25.current_milli_time()
+    dev = _FakeDev("drwr1", now)
+    tm = _make_tm([dev])
+    assert tm.dev_fault_dict == {}
+
+    dev.faults = [tc25.CONST.TACHO]
+    tm._sched_sync_fault(dev)
+    assert tm.dev_fault_dict == {"drwr1": dev}
+
+    dev.state = tc25.CONST.STOPPED
+    tm._sched_sync_fault(dev)
+    assert tm.dev_fault_dict == {}
+
+
+def _prepare_run(tm, monkeypatch, iterations=1):
+    monkeypatch.setattr(tc25, "gmemory_snapshot_profiler", None)
+    tm.exit = threading.Event()
+    tm.cmd_arg = {"verbosity": 20}
+    tm.read_file = Mock(return_value="20")
+    tm.emergency = False
+    tm.is_fan_tacho_init = Mock(return_value=True)
+    tm.is_pwm_exists = Mock(return_value=True)
+    tm._is_i2c_control_with_bmc = Mock(return_value=False)
+    tm._is_attention_fan_insertion_fail = Mock(return_value=False)
+    tm._is_suspend = Mock(return_value=False)
+    tm.start = Mock()
+    tm.module_scan = Mock()
+    tm.sys_config = {tc25.CONST.SYS_CONF_DMIN: {}}
+    tm.system_flow_dir = tc25.CONST.C2P
+    tm.amb_tmp = 25
+    calls = []
+
+    def _set_pwm(pwm, reason="", force_reason=False):
+        calls.append((pwm, reason, force_reason))
+        if len(calls) >= iterations:
+            tm.exit.set()
+
+    tm._set_pwm = _set_pwm
+    return calls
+
+
+def test_run_services_only_due_devices(monkeypatch):
+    now = tc25.current_milli_time()
+    idle_devs = [_FakeDev("module{}".format(idx), now + 20000, pwm=30) for idx in range(1, 257)]
+    asic = _FakeDev("asic1", now - 10, pwm=55)
+    tm = _make_tm(idle_devs + [asic])
+    calls = _prepare_run(tm, monkeypatch)
+
+    tm.run()
+
+    assert asic.process_cnt == 1
+    assert asic.handle_err_cnt == 1
+    assert all(dev.process_cnt == 0 and dev.handle_err_cnt == 0 for dev in idle_devs)
+    assert calls == [(55, "asic1", False)]
+    # asic rescheduled with its next poll time
+    assert asic.get_timestamp() > now
+    assert tm.loop_stat["iter_cnt"] == 1
+    assert tm.loop_stat["due_cnt"] == 1
+    assert "dev serviced avg/max:1.0/1 of 257" in tm._loop_stat_str()
+
+
+def test_run_total_err_count_uses_fault_cache(monkeypatch):
+    now = tc25.current_milli_time()
+    drwr1 = _FakeDev("drwr1", now + 20000, pwm=30)
+    drwr2 = _FakeDev("drwr2", now - 10, pwm=30)
+    tm = _make_tm([drwr1, drwr2])
+    drwr1.faults = [tc25.CONST.TACHO]
+    tm._sched_sync_fault(drwr1)
+    drwr2.faults = [tc25.CONST.TACHO]
+    calls = _prepare_run(tm, monkeypatch)
+
+    tm.run()
+
+    # drwr1 is not due but its fault is still counted
+    assert drwr1.process_cnt == 0
+    assert calls[0][0] == tc25.CONST.PWM_MAX
+    assert calls[0][1].startswith("total_err_cnt(2)")
+    assert calls[0][2] is True
+
+
+def test_err_exclusion_conf_attached_to_matching_devices():
+    now = tc25.current_milli_time()
+    drwr1 = _FakeDev("drwr1", now)
+    psu1 = _FakeDev("psu1_fan", now)
+    tm = _make_tm([drwr1, psu1])
+
+    tm._add_err_exclusion_conf(tc25.CONST.FAN_ERR, r"drwr\d+", 2)
+    assert drwr1.err_exclusion_conf_list == [tm.dev_err_exclusion_conf[tc25.CONST.FAN_ERR]]
+    assert psu1.err_exclusion_conf_list == []
+
+    tm._rm_dev_obj("drwr1")
+    assert drwr1.err_exclusion_conf_list == []
+    assert tm._get_dev_obj("drwr1") is None
+
+
+def test_get_dev_obj_exact_name_lookup():
+    now = tc25.current_milli_time()
+    module10 = _FakeDev("module10", now)
+    module1 = _FakeDev("module1", now)
+    tm = _make_tm([module10, module1])
+    tm.dev_obj_dict = {"module10": module10, "module1": module1}
+
+    # exact name wins over regex prefix match
+    assert tm._get_dev_obj("module1") is module1
+    # regex masks still supported
+    assert tm._get_dev_obj(r"module\d+") is module10
+
+
+def test_conf_rule_match_compiles_once():
+    tm = _make_tm([])
+    conf = {r"module\d+": {"pwm_min": 40}, r"asic": {"pwm_min": 50}}
+
+    assert tm._conf_rule_match("dev_param", conf, "module12") == (True, {"pwm_min": 40})
+    # '$' is appended - no prefix match
+    assert tm._conf_rule_match("dev_param", conf, "asic1") == (False, None)
+    assert tm._conf_rule_match("user_dev_param", conf, "asic1", full_match=False) == (True, {"pwm_min": 50})
+    assert len(tm.conf_rule_index["dev_param"]) == 2
+
+
+def test_run_steady_state_no_regex(monkeypatch):
+    now = tc25.current_milli_time()
+    drwrs = [_FakeDev("drwr{}".format(idx), now - 10) for idx in range(1, 7)]
+    modules = [_FakeDev("module{}".format(idx), now - 10) for idx in range(1, 257)]
+    tm = _make_tm(drwrs + modules)
+    tm._add_err_exclusion_conf(tc25.CONST.FAN_ERR, r"drwr\d+", 2)
+    for drwr in drwrs[:1]:
+        drwr.faults = [tc25.CONST.TACHO]
+        drwr.dynamic_faults = [tc25.CONST.TACHO]
+        tm._sched_sync_fault(drwr)
+    calls = _prepare_run(tm, monkeypatch)
+
+    match_calls = []
+    re_match = tc25.re.match
+
+    def _match(*args, **kwargs):
+        match_calls.append(args)
+        return re_match(*args, **kwargs)
+
+    monkeypatch.setattr(tc25.re, "match", _match)
+    tm.run()
+    monkeypatch.undo()
+
+    assert match_calls == []
+    # single faulty drawer is below min_err_cnt - error skipped
+    assert calls[0][0] == 30
+    assert drwrs[0].dynamic_filter_ena is True
+    assert all(dev.process_cnt == 1 for dev in drwrs + modules)
@@ -21,9 +21,14 @@ import os
 import sys
 import unittest
 import re
+import shutil
+import tempfile
+import threading
+import time
 from collections import defaultdict
+from types import SimpleNamespace
 import importlib.util
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import MagicMock, patch, mock_open, call
 
 
 class TestThermalConfigValidation(unittest.TestCase):
@@ -664,6 +669,257 @@ class TestModuleTempPopulate(unittest.TestCase):
             self.assertEqual(writes[path], "0\n")
 
 
+class TestLogHashSize(unittest.TestCase):
+    """
+    Unit tests for logger repeat-collapse hash size (log_hash_size)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Load hw_management_thermal_updater for use in tests."""
+        TestModuleTempPopulate.setUpClass.__func__(cls)
+
+    def test_sized_for_modules_and_asics(self):
+        m = self.thermal_module
+        thermal_attr = [{"fn": "asic_temp_populate", "arg": {"asic": {}, "asic1": {}}},
+                        {"fn": "module_temp_populate", "arg": {"module_count": 512}},
+                        {"fn": "print_periodic_info", "arg": []}]
+        self.assertEqual(m.log_hash_size(thermal_attr), 514 * m.CONST.LOG_HASH_IDS_PER_MODULE)
+
+    def test_min_size(self):
+        m = self.thermal_module
+        thermal_attr = [{"fn": "module_temp_populate", "arg": {"module_count": 32}}]
+        self.assertEqual(m.log_hash_size(thermal_attr), m.CONST.LOG_HASH_SIZE_MIN)
+
+
+class TestAttrWriteCache(unittest.TestCase):
+    """
+    Unit tests for change-only thermal attribute writes (attr_write):
+    unchanged values are not rewritten until refresh interval expires.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Load hw_management_thermal_updater for use in tests."""
+        TestModuleTempPopulate.setUpClass.__func__(cls)
+
+    def setUp(self):
+        m = self.thermal_module
+        self.now = [1000000]
+        self.attr_file_ino = m._attr_file_ino
+        for name, value in (('LOGGER', MagicMock()),
+                            ('current_milli_time', lambda: self.now[0]),
+                            ('_attr_file_ino', lambda f_name: 1)):
+            patcher = patch.object(m, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        m.attr_write_cache_init(60)
+        m._attr_write_stat.clear()
+        self.addCleanup(m.attr_write_cache_init, 0)
+
+    def _populate(self, afw):
+        m = self.thermal_module
+        with patch.object(m, 'atomic_file_write', afw), \
+                patch.object(m, 'is_module_host_management_mode', return_value=False), \
+                patch('os.path.islink', return_value=False), \
+                patch('builtins.open', mock_open(read_data="0")):
+            m.module_temp_populate(TestModuleTempPopulate._arg_list(), None)
+
+    def test_unchanged_values_skipped_until_refresh(self):
+        m = self.thermal_module
+        afw = MagicMock()
+        self._populate(afw)
+        self.assertEqual(afw.call_count, 6)
+
+        afw.reset_mock()
+        self.now[0] += 20000
+        self._populate(afw)
+        self.assertEqual(afw.call_count, 0)
+        self.assertEqual(m._attr_write_stat["skipped"], 6)
+
+        # forced refresh after interval
+        self.now[0] += 60000
+        self._populate(afw)
+        self.assertEqual(afw.call_count, 6)
+        self.assertEqual(m._attr_write_stat["written"], 12)
+
+    def test_changed_value_written(self):
+        m = self.thermal_module
+        afw = MagicMock()
+        with patch.object(m, 'atomic_file_write', afw):
+            m.attr_write("/tmp/module1_temp_input", "40000\n")
+            m.attr_write("/tmp/module1_temp_input", "40000\n")
+            m.attr_write("/tmp/module1_temp_input", "41000\n")
+        self.assertEqual(afw.call_args_list, [call("/tmp/module1_temp_input", "40000\n"),
+                                              call("/tmp/module1_temp_input", "41000\n")])
+
+    def test_failed_write_retried(self):
+        m = self.thermal_module
+        afw = MagicMock(side_effect=[Exception("disk"), None])
+        with patch.object(m, 'atomic_file_write', afw):
+            with self.assertRaises(Exception):
+                m.attr_write("/tmp/asic", "50000\n")
+            m.attr_write("/tmp/asic", "50000\n")
+        self.assertEqual(afw.call_count, 2)
+
+    def test_removed_file_rewritten(self):
+        m = self.thermal_module
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        f_name = os.path.join(tmp_dir, "module1_temp_input")
+
+        def afw(file_name, value):
+            with open(file_name + ".tmp", "w") as f:
+                f.write(value)
+            os.replace(file_name + ".tmp", file_name)
+
+        with patch.object(m, '_attr_file_ino', self.attr_file_ino), \
+                patch.object(m, 'atomic_file_write', afw):
+            m.attr_write(f_name, "40000\n")
+            m.attr_write(f_name, "40000\n")
+            # removed by thermal events script on module removal
+            os.unlink(f_name)
+            m.attr_write(f_name, "40000\n")
+            self.assertTrue(os.path.exists(f_name))
+            # replaced by other writer
+            with open(f_name + ".new", "w") as f:
+                f.write("0\n")
+            os.replace(f_name + ".new", f_name)
+            m.attr_write(f_name, "40000\n")
+        with open(f_name) as f:
+            self.assertEqual(f.read(), "40000\n")
+        self.assertEqual((m._attr_write_stat["written"], m._attr_write_stat["skipped"]), (3, 1))
+
+    def test_link_drops_cached_module_values(self):
+        m = self.thermal_module
+        afw = MagicMock()
+        self._populate(afw)
+        with patch.object(m, 'atomic_file_write', afw), \
+                patch('os.path.islink', return_value=True):
+            m.module_temp_populate(TestModuleTempPopulate._arg_list(), None)
+        self.assertEqual(m._attr_write_cache, {})
+
+    def test_cache_disabled_writes_always(self):
+        m = self.thermal_module
+        m.attr_write_cache_init(0)
+        afw = MagicMock()
+        self._populate(afw)
+        self._populate(afw)
+        self.assertEqual(afw.call_count, 12)
+
+
+class TestThermalReadPool(unittest.TestCase):
+    """
+    Unit tests for parallel SDK sysfs reads (ThermalReadPool): one worker per
+    ASIC root, stuck reads are skipped and counted.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Load hw_management_thermal_updater for use in tests."""
+        TestModuleTempPopulate.setUpClass.__func__(cls)
+
+    def setUp(self):
+        m = self.thermal_module
+        self.now = [1000000]
+        for name, value in (('LOGGER', MagicMock()),
+                            ('current_milli_time', lambda: self.now[0])):
+            patcher = patch.object(m, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        m.EXIT.clear()
+        self.pool = m.ThermalReadPool(4, 1000)
+        self.release = threading.Event()
+        self.addCleanup(self.pool.stop)
+        self.addCleanup(self.release.set)
+
+    def _entry(self, attr):
+        """Entry fields used by update_thermal_attr (AttrEntry of mocked lib)"""
+        return SimpleNamespace(fn_name=attr["fn"], fn=getattr(self.thermal_module, attr["fn"]), arg=attr["arg"])
+
+    def _wait(self, cond, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not cond():
+            if time.monotonic() > deadline:
+                self.fail("timeout")
+            time.sleep(0.005)
+
+    def test_read_root(self):
+        m = self.thermal_module
+        self.assertEqual(m.thermal_read_root("/sys/module/sx_core/asic0/"), "/sys/module/sx_core/asic0")
+        self.assertEqual(m.thermal_read_root("/sys/module/sx_core/asic1/module12/"), "/sys/module/sx_core/asic1")
+
+    def test_roots_read_in_parallel_modules_serialized(self):
+        started = []
+        lock = threading.Lock()
+
+        def job(name):
+            with lock:
+                started.append(name)
+            self.release.wait(2)
+
+        self.pool.submit("/asic0", "module1", job, "module1")
+        self.pool.submit("/asic0", "module2", job, "module2")
+        self.pool.submit("/asic1", "asic2", job, "asic2")
+        self._wait(lambda: len(started) == 2)
+        # module2 waits for module1 on the same ASIC root
+        self.assertEqual(sorted(started), ["asic2", "module1"])
+        self.release.set()
+        self._wait(lambda: self.pool.get_stat()["done"] == 3)
+        self.assertEqual(started[-1], "module2")
+
+    def test_pending_job_not_queued_twice(self):
+        self.pool.submit("/asic0", "module1", self.release.wait, 2)
+        self.assertFalse(self.pool.submit("/asic0", "module1", self.release.wait, 2))
+        self.assertEqual(self.pool.get_stat()["skipped"], 1)
+
+    def test_stuck_read_skipped_rest_of_root_continues(self):
+        done = threading.Event()
+        self.pool.submit("/asic0", "module1", self.release.wait, 5)
+        self.pool.submit("/asic0", "module2", done.set)
+        self._wait(lambda: self.pool.workers["/asic0"].job_name == "module1")
+
+        self.now[0] += 1500
+        self.pool.check_deadline()
+        self.assertTrue(done.wait(2))
+        stat = self.pool.get_stat()
+        self.assertEqual(stat["timeout"], 1)
+        self.assertEqual(stat["stuck"], 1)
+        # stuck module is not queued again until its read returns
+        self.assertFalse(self.pool.submit("/asic0", "module1", self.release.wait, 5))
+
+        self.release.set()
+        self._wait(lambda: self.pool.get_stat()["stuck"] == 0)
+        self.assertTrue(self.pool.submit("/asic0", "module1", done.set))
+
+    def test_worker_limit(self):
+        pool = self.thermal_module.ThermalReadPool(1, 1000)
+        self.addCleanup(pool.stop)
+        self.assertTrue(pool.submit("/asic0", "asic1", self.release.wait, 2))
+        self.assertFalse(pool.submit("/asic1", "asic2", self.release.wait, 2))
+        self.assertEqual(pool.get_stat()["skipped"], 1)
+
+    def test_update_thermal_attr_splits_entry_per_module(self):
+        m = self.thermal_module
+        pool = MagicMock()
+        attr = {"fn": "module_temp_populate", "poll": 20, "ts": 0,
+                "arg": {"fin": "/sys/module/sx_core/asic0/module{}/", "fout_idx_offset": 1, "module_count": 2}}
+        with patch.object(m, 'READ_POOL', pool):
+            m.update_thermal_attr(self._entry(attr))
+        self.assertEqual(pool.submit.call_args_list, [
+            call("/sys/module/sx_core/asic0", "module1", m.module_temp_update, "module1", "/sys/module/sx_core/asic0/module0/"),
+            call("/sys/module/sx_core/asic0", "module2", m.module_temp_update, "module2", "/sys/module/sx_core/asic0/module1/"),
+        ])
+
+        pool.reset_mock()
+        attr = {"fn": "asic_temp_populate", "poll": 3, "ts": 0,
+                "arg": {"asic1": {"fin": "/sys/module/sx_core/asic0/"}, "asic2": {"fin": "/sys/module/sx_core/asic1/"}}}
+        with patch.object(m, 'READ_POOL', pool):
+            m.update_thermal_attr(self._entry(attr))
+        self.assertEqual([c[0][:2] for c in pool.submit.call_args_list],
+                         [("/sys/module/sx_core/asic0", "asic1"), ("/sys/module/sx_core/asic1", "asic2")])
+
+
 def main():
     """Main test runner"""
     print("=" * 80)
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for uevent handler service (hw_management_uevent_handler):
+# udev rules compilation and matching, persistent bash workers, dispatcher
+# and settle.
+########################################################################
+
+import glob
+import os
+import socket
+import subprocess
+import sys
+import time
+import zlib
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+HW_MGMT_BIN = REPO_ROOT / "usr" / "usr" / "bin"
+if str(HW_MGMT_BIN) not in sys.path:
+    sys.path.insert(0, str(HW_MGMT_BIN))
+
+import hw_management_uevent_handler as uevent  # noqa: E402
+
+pytestmark = pytest.mark.offline
+
+RULES_DIR = REPO_ROOT / "usr" / "lib" / "udev" / "rules.d"
+
+
+def _event(action, devpath, sysfs="/nonexistent", **env):
+    env.update(ACTION=action, DEVPATH=devpath)
+    return uevent.Uevent(action, devpath, env, sysfs=sysfs)
+
+
+def _table(tmp_path, text, sysfs="/nonexistent"):
+    path = tmp_path / "50-test-events.rules"
+    path.write_text(text)
+    table = uevent.RuleTable(sysfs=sysfs)
+    return table, table.load(str(path))
+
+
+def test_installed_rules_compiled():
+    table = uevent.RuleTable(sysfs="/sys")
+    for path in sorted(glob.glob(str(RULES_DIR / "*hw-management*events*.rules")), key=os.path.basename):
+        assert table.load(path), path
+    assert len(table.files) == 4
+    assert len(table.rules) > 600
+    # ATTRS (parent attribute) match isn't supported: file is left to udev
+    assert not table.load(str(RULES_DIR / "70-hw-management-bmc.rules"))
+    assert len(table.files) == 4
+
+    devpath = "/devices/platform/mlxplat/i2c_mlxcpld.1/i2c-1/i2c-7/7-0049/hwmon/hwmon3"
+    assert ["/usr/bin/hw-management-thermal-events.sh", "add", "fan_amb", "/sys", devpath] in \
+        table.apply(_event("add", devpath, "/sys", SUBSYSTEM="hwmon"))
+    devpath = "/devices/virtual/thermal/thermal_zone2"
+    assert table.apply(_event("change", devpath, "/sys", SUBSYSTEM="thermal", TZ_HIGHEST="3")) == [
+        ["/usr/bin/hw-management-thermal-events.sh", "change", "thermal_zone", "/sys", devpath, "thermal_zone2",
+         "highest", "3"]]
+    # Not existing device: ATTR{power/control} assignment fails
+    devpath = "/devices/hw-management-test/tpm/tpm0"
+    assert table.apply(_event("add", devpath, "/sys", SUBSYSTEM="tpm")) == [
+        ["/bin/sh", "-c", "echo on > /sys{}/device/power/control".format(devpath)]]
+    assert table.apply(_event("add", "/devices/virtual/block/loop0", "/sys", SUBSYSTEM="block")) == []
+
+
+def test_match_keys(tmp_path):
+    sysfs = tmp_path / "sys"
+    dev = sysfs / "devices" / "pci0000:00" / "0000:00:01.0" / "0000:01:00.0"
+    (dev / "hwmon" / "hwmon4").mkdir(parents=True)
+    (dev / "hwmon" / "hwmon4" / "name").write_text("mlxsw\n")
+    (dev / "hwmon" / "hwmon4" / "temp1_input").write_text("45000\n")
+    (sysfs / "bus" / "pci" / "drivers" / "mlxsw_spectrum").mkdir(parents=True)
+    os.symlink(str(sysfs / "bus" / "pci" / "drivers" / "mlxsw_spectrum"), str(dev / "driver"))
+    table, loaded = _table(tmp_path, "\n".join([
+        '# comment',
+        'SUBSYSTEM=="hwmon", DEVPATH=="/devices/pci0000:00/*/hwmon/hwmon*", ATTR{name}=="mlxsw", '
+        'ACTION=="add", RUN+="/bin/run1 %S %p %k %n %s{temp1_input}"',
+        'SUBSYSTEM=="hwmon", ATTR{name}!="mlxsw", ACTION=="add", RUN+="/bin/run2"',
+        'SUBSYSTEM=="hwmon", ATTR{missing}!="1", ACTION=="add", RUN+="/bin/run3"',
+        'SUBSYSTEM=="hwmon", DRIVERS=="mlxsw_*", ACTION=="add|change", RUN+="/bin/run4 $env{FOO}"',
+        'SUBSYSTEM=="hwmon", ENV{FOO}!="", ACTION=="change", RUN+="/bin/run5 $$1 %%"',
+        'SUBSYSTEM=="hwmon", KERNEL=="hwmon[0-3]", RUN+="/bin/run6"',
+        'SUBSYSTEM=="hwmon", ACTION=="add", \\',
+        '    RUN+="/bin/run7"',
+    ]), sysfs=str(sysfs))
+    assert loaded
+    devpath = "/devices/pci0000:00/0000:00:01.0/0000:01:00.0/hwmon/hwmon4"
+    assert table.apply(_event("add", devpath, str(sysfs), SUBSYSTEM="hwmon", FOO="x")) == [
+        ["/bin/run1", str(sysfs), devpath, "hwmon4", "4", "45000"],
+        ["/bin/run4", "x"],
+        ["/bin/run7"],
+    ]
+    assert table.apply(_event("change", devpath, str(sysfs), SUBSYSTEM="hwmon", FOO="x")) == [
+        ["/bin/run4", "x"],
+        ["/bin/run5", "$1", "%"],
+    ]
+    assert table.apply(_event("change", devpath, str(sysfs), SUBSYSTEM="hwmon")) == [["/bin/run4"]]
+    assert table.apply(_event("remove", "/devices/virtual/hwmon/hwmon2", str(sysfs), SUBSYSTEM="hwmon")) == [
+        ["/bin/run6"]]
+
+
+def test_attr_assignment(tmp_path):
+    sysfs = tmp_path / "sys"
+    (sysfs / "devices" / "tpm0" / "power").mkdir(parents=True)
+    (sysfs / "devices" / "tpm0" / "power" / "control").write_text("auto")
+    table, loaded = _table(tmp_path, 'SUBSYSTEM=="tpm", KERNEL=="tpm0", ATTR{power/control}="on"\n'
+                                     'SUBSYSTEM=="tpm", KERNEL=="tpm0", ACTION=="add", RUN="/bin/x"\n',
+                           sysfs=str(sysfs))
+    assert loaded
+    assert table.apply(_event("add", "/devices/tpm0", str(sysfs), SUBSYSTEM="tpm")) == [["/bin/x"]]
+    assert (sysfs / "devices" / "tpm0" / "power" / "control").read_text() == "on"
+
+
+@pytest.mark.parametrize("rule", [
+    'SUBSYSTEM=="hwmon", GOTO="end"',
+    'SUBSYSTEM=="net", ATTRS{idVendor}=="0525", RUN+="/bin/x"',
+    'SUBSYSTEM=="hwmon", RUN+="/bin/x %b"',
+    'SUBSYSTEM=="hwmon", RUN+="/bin/x',
+])
+def test_unsupported_rules_file_not_loaded(tmp_path, rule):
+    table, loaded = _table(tmp_path, 'SUBSYSTEM=="hwmon", RUN+="/bin/ok"\n' + rule + "\n")
+    assert not loaded
+    assert table.rules == [] and table.files == []
+
+
+def test_uevent_parse():
+    event = uevent.Uevent.parse(b"change@/devices/virtual/thermal/thermal_zone0\0ACTION=change\0"
+                                b"DEVPATH=/devices/virtual/thermal/thermal_zone0\0SUBSYSTEM=thermal\0"
+                                b"TZ_DOWN=1\0SEQNUM=4711\0")
+    assert (event.action, event.devpath, event.seqnum, event.kernel, event.number) == \
+        ("change", "/devices/virtual/thermal/thermal_zone0", 4711, "thermal_zone0", "0")
+    assert event.env["TZ_DOWN"] == "1"
+    assert uevent.Uevent.parse(b"libudev\0\xfe\xed") is None
+    assert _event("add", "/devices/platform/x/0-0048/hwmon/hwmon3").key == \
+        _event("add", "/devices/platform/x/0-0048").key
+
+
+@pytest.fixture
+def scripts(tmp_path, monkeypatch):
+    """Event script sourcing helpers from PATH, helpers count their loads"""
+    monkeypatch.setenv("PATH", "{}:{}".format(tmp_path, os.environ["PATH"]))
+    monkeypatch.setattr(uevent.CONST, "UDEV_READY", str(tmp_path / ".udev_ready"))
+    helpers = tmp_path / "hw-management-helpers.sh"
+    helpers.write_text('echo x >> "{}"\nhelper_val=loaded\n'.format(tmp_path / "helpers_loads"))
+    script = tmp_path / "events.sh"
+    script.write_text('#!/bin/bash\nsource hw-management-helpers.sh\n'
+                      'echo "$0 $* $ACTION $helper_val" >> "{}"\n'
+                      'if [ "$1" == "fail" ]; then\n\texit 7\nfi\n'.format(tmp_path / "out"))
+    script.chmod(0o755)
+    return tmp_path
+
+
+def _loads(path):
+    return len((path / "helpers_loads").read_text().split())
+
+
+def test_worker_preloaded_script(scripts):
+    worker = uevent.ShellWorker("w0", preload=[str(scripts / "events.sh")], helpers=str(scripts / "hw-management-helpers.sh"),
+                                timeout=5, stderr=subprocess.DEVNULL)
+    script = str(scripts / "events.sh")
+    event = _event("add", "/devices/x")
+    try:
+        assert worker.run_batch([uevent.HandlerCmd(event, [script, "add", "a b"]),
+                                 uevent.HandlerCmd(event, [script, "fail"]),
+                                 uevent.HandlerCmd(event, ["/bin/sh", "-c", "exit 3"])]) == [0, 7, 3]
+        assert worker.run_batch([uevent.HandlerCmd(event, [script, "add", "c"])]) == [0]
+        assert (scripts / "out").read_text().splitlines() == [
+            "{} add a b add loaded".format(script),
+            "{} fail add loaded".format(script),
+            "{} add c add loaded".format(script),
+        ]
+        # Helpers are sourced by worker once, again when udev ready flag is touched
+        assert _loads(scripts) == 1
+        (scripts / ".udev_ready").touch()
+        assert worker.run_batch([uevent.HandlerCmd(event, [script, "add"])]) == [0]
+        assert _loads(scripts) == 2
+    finally:
+        worker.stop()
+
+
+def test_worker_timeout_restart(scripts):
+    worker = uevent.ShellWorker("w0", preload=[], helpers=str(scripts / "hw-management-helpers.sh"), timeout=0.3)
+    event = _event("add", "/devices/x")
+    try:
+        start = time.monotonic()
+        assert worker.run_batch([uevent.HandlerCmd(event, ["sleep", "5"]),
+                                 uevent.HandlerCmd(event, ["true"])]) == [None, None]
+        assert time.monotonic() - start < 2
+        assert worker.proc is None
+        assert worker.run_batch([uevent.HandlerCmd(event, ["true"])]) == [0]
+    finally:
+        worker.stop()
+
+
+def test_dispatcher_order_and_merge(scripts):
+    script = str(scripts / "events.sh")
+    dispatcher = uevent.Dispatcher(3, preload=[script], helpers=str(scripts / "hw-management-helpers.sh"), timeout=5)
+    dev = "/devices/platform/mlxplat/mlxreg-hotplug"
+    try:
+        # Not started: commands are queued and run as one batch
+        cmds = []
+        for idx in range(5):
+            cmds.append(uevent.HandlerCmd(_event("add", dev + "/hwmon/hwmon{}".format(idx)), [script, "add", str(idx)]))
+        change = _event("change", dev + "/hwmon/hwmon1", PSU1="1")
+        cmds += [uevent.HandlerCmd(change, [script, "change", "psu1"]) for _ in range(3)]
+        cmds.append(uevent.HandlerCmd(_event("change", dev + "/hwmon/hwmon1", PSU1="0"), [script, "change", "psu1"]))
+        dispatcher.submit(cmds)
+        assert not dispatcher.idle.is_set()
+        dispatcher.start()
+        assert dispatcher.idle.wait(10)
+    finally:
+        dispatcher.stop()
+    assert [line.split()[1:3] for line in (scripts / "out").read_text().splitlines()] == \
+        [["add", str(idx)] for idx in range(5)] + [["change", "psu1"]] * 2
+    assert dispatcher.stat["run"] == 7 and dispatcher.stat["merged"] == 2
+    assert dispatcher.stat["batch"] == 1
+    assert dispatcher.latency.cnt == 7
+
+
+def test_dispatcher_related_devices_serialized(scripts):
+    out = scripts / "out"
+    dispatcher = uevent.Dispatcher(4, preload=[], helpers=str(scripts / "hw-management-helpers.sh"), timeout=5)
+
+    def worker_idx(devpath):
+        return zlib.crc32(devpath.encode()) % len(dispatcher.workers)
+
+    def cmd(action, devpath, name, delay=0):
+        return uevent.HandlerCmd(_event(action, devpath),
+                                 ["/bin/sh", "-c", "sleep {}; echo {} >> {}".format(delay, name, out)])
+
+    adapter = "/devices/platform/mlxplat/i2c_mlxcpld.1/i2c-1/i2c-2"
+    # client and unrelated device handled by other workers than adapter
+    client = next(adapter + "/2-{:04x}".format(addr) for addr in range(0x40, 0x80)
+                  if worker_idx(adapter + "/2-{:04x}".format(addr)) != worker_idx(adapter))
+    other = next("/devices/platform/mlxplat/i2c_mlxcpld.1/i2c-1/i2c-{}".format(bus) for bus in range(3, 40)
+                 if worker_idx("/devices/platform/mlxplat/i2c_mlxcpld.1/i2c-1/i2c-{}".format(bus)) not in
+                 (worker_idx(adapter), worker_idx(client)))
+    dispatcher.start()
+    try:
+        dispatcher.submit([cmd("add", adapter, "adapter", 0.3)])
+        dispatcher.submit([cmd("add", client + "/hwmon/hwmon5", "client")])
+        dispatcher.submit([cmd("add", other, "other")])
+        assert dispatcher.idle.wait(10)
+    finally:
+        dispatcher.stop()
+    # client waits for its adapter, unrelated device doesn't
+    assert out.read_text().split() == ["other", "adapter", "client"]
+    assert dispatcher.stat["held"] == 1
+    assert not dispatcher.active and not dispatcher.held
+
+
+def test_settle(tmp_path):
+    kernel = tmp_path / "uevent_seqnum"
+    handled = tmp_path / "handled"
+    kernel.write_text("100\n")
+    # Service isn't running
+    assert uevent.settle(1, str(handled), str(kernel))
+    handled.write_text("99\n")
+    start = time.monotonic()
+    assert not uevent.settle(0.2, str(handled), str(kernel))
+    assert time.monotonic() - start >= 0.2
+    handled.write_text("100\n")
+    assert uevent.settle(1, str(handled), str(kernel))
+
+
+def test_cleanup_after_kill(tmp_path, monkeypatch):
+    rules = tmp_path / "lib"
+    rules.mkdir()
+    for name in ("50-hw-management-events.rules", "60-hw-management-thermal-events.rules",
+                 "70-hw-management-other-events.rules"):
+        (rules / name).write_text("\n")
+    run_dir = tmp_path / "run"
+    seqnum = tmp_path / "seqnum"
+    reloads = []
+    monkeypatch.setattr(uevent.subprocess, "run", lambda argv, **kwargs: reloads.append(argv))
+    # Masks and seqnum file of service killed without cleanup, admin override file
+    uevent.mask_udev_rules(sorted(glob.glob(str(rules / "*")))[:2], str(run_dir))
+    (run_dir / "70-hw-management-other-events.rules").write_text("# override\n")
+    seqnum.write_text("100\n")
+
+    uevent.cleanup(str(rules / "*"), str(run_dir), str(seqnum))
+    assert sorted(os.listdir(str(run_dir))) == ["70-hw-management-other-events.rules"]
+    assert not seqnum.exists()
+    assert reloads == [["udevadm", "control", "--reload"]] * 2
+    # Nothing left after clean exit: no udev reload
+    uevent.cleanup(str(rules / "*"), str(run_dir), str(seqnum))
+    assert len(reloads) == 2
+
+
+@pytest.mark.parametrize("abstract", [False, True])
+def test_sd_notify(tmp_path, monkeypatch, abstract):
+    path = "hw-mgmt-test-notify-{}".format(os.getpid()) if abstract else str(tmp_path / "notify")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.bind("\0" + path if abstract else path)
+        sock.settimeout(2)
+        monkeypatch.setenv("NOTIFY_SOCKET", "@" + path if abstract else path)
+        assert uevent.sd_notify("READY=1")
+        assert sock.recv(64) == b"READY=1"
+    # Not run by systemd
+    monkeypatch.delenv("NOTIFY_SOCKET")
+    assert not uevent.sd_notify("READY=1")
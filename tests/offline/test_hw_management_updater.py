@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Unit tests for combined updater runner (hw_management_updater):
+# job group main loop thread, restart of failed group and watchdog
+# replacement of hung main loop.
+########################################################################
+
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+HW_MGMT_BIN = Path(__file__).resolve().parents[2] / "usr" / "usr" / "bin"
+if str(HW_MGMT_BIN) not in sys.path:
+    sys.path.insert(0, str(HW_MGMT_BIN))
+
+import hw_management_updater as runner  # noqa: E402
+import hw_management_lib  # noqa: E402
+
+pytestmark = pytest.mark.offline
+
+
+class ShutdownRequested(BaseException):
+    pass
+
+
+class FakeUpdater:
+    """Updater module interface: parse_args/updater_init/updater_loop/updater_stop"""
+
+    ShutdownRequested = ShutdownRequested
+
+    def __init__(self):
+        self.EXIT = threading.Event()
+        self.LOGGER = MagicMock()
+        self.init = []
+        self.stop_cnt = 0
+        self.fail_init = 0
+        self.block = None
+        self.loops = 0
+
+    def parse_args(self, argv):
+        return {"argv": argv}
+
+    def updater_init(self, args, ident=None):
+        self.init.append((args, ident))
+        if self.fail_init:
+            self.fail_init -= 1
+            raise OSError("init failed")
+        self.EXIT.clear()
+
+    def updater_loop(self, stop=None, heartbeat=None):
+        self.loops += 1
+        block = self.block
+        while not self.EXIT.is_set() and not stop():
+            heartbeat()
+            if block:
+                block.wait()
+            self.EXIT.wait(0.01)
+
+    def updater_stop(self):
+        self.stop_cnt += 1
+
+
+class LoggingUpdater(FakeUpdater):
+    """Updater which creates its logger with syslog in updater_init, like real updaters"""
+
+    def updater_init(self, args, ident=None):
+        super().updater_init(args, ident)
+        self.LOGGER = runner.Logger(ident=ident, syslog_level=runner.Logger.NOTICE)
+
+
+def _wait(cond, timeout=2):
+    end = time.monotonic() + timeout
+    while not cond():
+        assert time.monotonic() < end
+        time.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def logger():
+    with patch.object(runner, "LOGGER") as log:
+        yield log
+
+
+def test_group_start_stop():
+    module = FakeUpdater()
+    group = runner.UpdaterGroup("thermal", module, ["-v", "10"])
+    group.start()
+    _wait(lambda: module.loops == 1)
+    assert module.init == [({"argv": ["-v", "10"]}, "hw_management_thermal_updater")]
+    beat_ts = group.beat_ts
+    _wait(lambda: group.beat_ts > beat_ts)
+    assert group.check(time.monotonic())
+
+    group.stop()
+    assert not group.thread.is_alive()
+    assert module.stop_cnt == 1
+
+
+def test_failed_group_restarted_with_backoff(logger):
+    module = FakeUpdater()
+    module.fail_init = 2
+    group = runner.UpdaterGroup("peripheral", module, [])
+    group.start()
+    _wait(lambda: not group.thread.is_alive())
+    assert "init failed" in logger.error.call_args[0][0]
+
+    now = time.monotonic()
+    assert group.check(now)
+    assert (group.stat["fail"], group.restart_ts) == (1, now + runner.CONST.RESTART_DELAY_MIN)
+    # not initialized: updater_stop not called
+    assert module.stop_cnt == 0
+    assert group.check(now + 1)
+    assert group.stat["start"] == 1
+
+    group.check(now + runner.CONST.RESTART_DELAY_MIN)
+    assert group.stat["start"] == 2
+    _wait(lambda: not group.thread.is_alive())
+    group.check(now + runner.CONST.RESTART_DELAY_MIN)
+    # delay doubled
+    assert group.restart_ts == now + 3 * runner.CONST.RESTART_DELAY_MIN
+
+    group.check(group.restart_ts)
+    _wait(lambda: module.loops == 1)
+    assert len(module.init) == 3
+    group.stop()
+
+
+def test_hung_loop_replaced():
+    module = FakeUpdater()
+    release = threading.Event()
+    module.block = release
+    group = runner.UpdaterGroup("peripheral", module, [], watchdog_timeout=5)
+    group.start()
+    _wait(lambda: module.loops == 1)
+    hung_thread = group.thread
+
+    now = time.monotonic()
+    assert group.check(now + 1)
+    assert group.stat["hung"] == 0
+    module.block = None
+    assert group.check(now + 6)
+    assert group.stat["hung"] == 1
+    assert group.thread is not hung_thread
+    _wait(lambda: module.loops == 2)
+    # same initialized updater, no init/stop
+    assert (len(module.init), module.stop_cnt) == (1, 0)
+
+    # retired loop leaves when its handler returns
+    release.set()
+    hung_thread.join(2)
+    assert not hung_thread.is_alive()
+    assert group.thread.is_alive()
+    group.stop()
+
+
+def test_too_many_hung_loops():
+    module = FakeUpdater()
+    release = threading.Event()
+    module.block = release
+    group = runner.UpdaterGroup("thermal", module, [], watchdog_timeout=5)
+    group.start()
+    try:
+        for hung in range(runner.CONST.HUNG_MAX):
+            _wait(lambda: module.loops == hung + 1)
+            assert group.check(time.monotonic() + 6)
+        _wait(lambda: module.loops == runner.CONST.HUNG_MAX + 1)
+        assert not group.check(time.monotonic() + 6)
+    finally:
+        release.set()
+        group.stop()
+
+
+def test_exit_not_restarted():
+    module = FakeUpdater()
+    group = runner.UpdaterGroup("thermal", module, [])
+    group.start()
+    _wait(lambda: module.loops == 1)
+    module.EXIT.set()
+    group.thread.join(2)
+    assert group.check(time.monotonic() + 1000)
+    assert group.stat == {"start": 1, "fail": 0, "hung": 0}
+    group.stop()
+
+
+def test_groups_keep_own_syslog_ident(tmp_path, monkeypatch):
+    sock_path = str(tmp_path / "log")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(sock_path)
+    server.settimeout(2)
+    monkeypatch.setattr(hw_management_lib._IdentSyslog, "SYSLOG_SOCKET", sock_path)
+    monkeypatch.setattr(runner.Logger, "SYSLOG_OWN_IDENT", True)
+
+    modules = {name: LoggingUpdater() for name in ("thermal", "peripheral")}
+    groups = [runner.UpdaterGroup(name, module, []) for name, module in modules.items()]
+    try:
+        for group in groups:
+            group.start()
+            _wait(lambda: group.module.loops == 1)
+        # thermal group logs after peripheral logger was initialized
+        modules["thermal"].LOGGER.error("thermal fault")
+        modules["peripheral"].LOGGER.error("peripheral fault")
+        records = [server.recv(4096).decode() for _ in range(4)]
+    finally:
+        for group in groups:
+            group.stop()
+        for module in modules.values():
+            module.LOGGER.stop()
+        server.close()
+
+    for name in modules:
+        ident = "hw_management_{}_updater".format(name)
+        own = [record for record in records if " {}: ".format(ident) in record]
+        assert len(own) == 2
+        assert any("hw-management-{}-updater: start main loop".format(name) in record for record in own)
+    assert any(record.startswith("<11>") and "hw_management_thermal_updater: ERR: thermal fault" in record
+               for record in records)
@@ -626,6 +626,51 @@ class TestRunner:
                 'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_redfish_client.py', '--tb=short'],
                 'cwd': self.tests_dir
             },
+            {
+                'name': 'Pytest: Redfish http transport',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_redfish_transport.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: Redfish response cache',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_redfish_cache.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: Redfish token cache',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_redfish_token_cache.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: Redfish EventService SSE',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_redfish_events.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: Redfish firmware update',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_redfish_fw_update.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: Redfish async client',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_redfish_async.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: PSU FW update simulated PSUs',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_psu_fw_update_sim.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: Combined Updater',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_updater.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: Uevent Handler',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_uevent_handler.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
             {
                 'name': 'Pytest: Thermal Updater',
                 'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_thermal_updater.py', '--tb=short'],
@@ -646,6 +691,21 @@ class TestRunner:
                 'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_start_post_tc.py', '--tb=short'],
                 'cwd': self.tests_dir
             },
+            {
+                'name': 'Pytest: TC 2.5 main loop scheduler',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_thermal_loop_scheduler.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: File handle cache',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_file_handle_cache.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
+            {
+                'name': 'Pytest: PMBus device dump SMBus backend',
+                'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_pmbus_device_dump.py', '--tb=short'],
+                'cwd': self.tests_dir
+            },
             {
                 'name': 'Pytest: TC _exit_wait (stop timeout)',
                 'cmd': [sys.executable, '-m', 'pytest', 'offline/test_hw_management_thermal_exit_wait.py', '--tb=short'],
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+Sensor labels lookup benchmark
+
+Resolves label and scale for every key of a sensors labels JSON file:
+    per-key  - hw_management_parse_labels.py --get_value process per key and
+               label section (labels-maker.sh before --bulk)
+    bulk     - single hw_management_parse_labels.py --bulk process, keys on stdin
+    in-proc  - lookup cost only: retrieve_value() vs LabelIndex
+
+Usage:
+    python3 parse_labels_benchmark.py [--json_file FILE] [--sku SKU] [--keys N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+HW_MGMT_BIN = REPO_ROOT / "usr" / "usr" / "bin"
+sys.path.insert(0, str(HW_MGMT_BIN))
+
+import hw_management_parse_labels as parse_labels  # noqa: E402
+
+PARSE_LABELS = str(HW_MGMT_BIN / "hw_management_parse_labels.py")
+DEF_JSON = REPO_ROOT / "usr" / "etc" / "hw-management-sensors" / "n51xxld_sensors_labels.json"
+
+
+def bench_per_key(dict_file, label, scale_label, keys):
+    start = time.perf_counter()
+    for key in keys:
+        for section in (label, scale_label):
+            subprocess.run([sys.executable, PARSE_LABELS, "--get_value", "--dictionary_file", dict_file,
+                            "--label", section, "--key", key], stdout=subprocess.PIPE, check=True)
+    return time.perf_counter() - start
+
+
+def bench_bulk(dict_file, label, scale_label, keys):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, PARSE_LABELS, "--bulk", "--dictionary_file", dict_file,
+                    "--label", label, "--scale_label", scale_label],
+                   input="\n".join(keys), stdout=subprocess.PIPE, check=True, universal_newlines=True)
+    return time.perf_counter() - start
+
+
+def bench_in_process(dictionary, label, scale_label, keys):
+    start = time.perf_counter()
+    for key in keys:
+        parse_labels.retrieve_value(dictionary, label, key)
+        parse_labels.retrieve_value(dictionary, scale_label, key)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parse_labels.retrieve_bulk(dictionary, label, scale_label, keys)
+    return legacy, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sensor labels lookup benchmark")
+    parser.add_argument("--json_file", default=str(DEF_JSON), help="sensors labels JSON file")
+    parser.add_argument("--sku", help="SKU, default: first labels_<sku>_rev1_array in JSON")
+    parser.add_argument("--keys", type=int, default=0, help="limit number of keys (0 - all)")
+    args = parser.parse_args()
+
+    dictionary = parse_labels.load_json(args.json_file)
+    sku = args.sku
+    if not sku:
+        sku = next(name[len("labels_"):-len("_rev1_array")] for name in dictionary
+                   if name.startswith("labels_") and name.endswith("_rev1_array") and "scale" not in name)
+    label = "labels_{}_rev1_array".format(sku)
+    scale_label = "labels_scale_{}_rev1_array".format(sku)
+    keys = list(dictionary[label].keys())
+    if args.keys:
+        keys = keys[:args.keys]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dict_file = os.path.join(tmpdir, "sensor_labels_dictionary.pkl")
+        parse_labels.save_dictionary(dictionary, dict_file)
+        per_key_s = bench_per_key(dict_file, label, scale_label, keys)
+        bulk_s = bench_bulk(dict_file, label, scale_label, keys)
+    legacy_s, index_s = bench_in_process(dictionary, label, scale_label, keys)
+
+    print("{}: {} keys, {} label patterns".format(os.path.basename(args.json_file), len(keys), len(dictionary[label])))
+    print("{:<10} {:>12} {:>10}".format("mode", "total(ms)", "processes"))
+    print("{:<10} {:>12.1f} {:>10}".format("per-key", per_key_s * 1000, len(keys) * 2))
+    print("{:<10} {:>12.1f} {:>10}".format("bulk", bulk_s * 1000, 1))
+    print("lookup only: retrieve_value {:.2f} ms, LabelIndex {:.2f} ms".format(legacy_s * 1000, index_s * 1000))
+
+
+if __name__ == "__main__":
+    main()
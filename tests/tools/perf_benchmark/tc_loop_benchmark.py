@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+TC 2.5 main loop micro-benchmark
+
+Measures the cost of one ThermalManagement.run() iteration with N module
+sensors (default 256) plus fan drawers and PSUs with redundancy rules:
+    legacy  - three passes over dev_obj_list with re.match() per device x rule
+              (main loop before scheduler/rule index)
+    current - ThermalManagement.run() (heap scheduler + precompiled rule index)
+
+Sensor I/O is not measured - devices are in-memory stand-ins.
+
+Usage:
+    python3 tc_loop_benchmark.py [--modules 256] [--iterations 200]
+"""
+
+import argparse
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+HW_MGMT_BIN = Path(__file__).resolve().parents[3] / "usr" / "usr" / "bin"
+sys.path.insert(0, str(HW_MGMT_BIN))
+
+import hw_management_thermal_control_2_5 as tc25  # noqa: E402
+
+CONST = tc25.CONST
+
+
+class NullLog:
+    """Logger stand-in: log level filtered out"""
+
+    def __getattr__(self, _name):
+        return self._noop
+
+    def _noop(self, *_args, **_kwargs):
+        pass
+
+
+class BenchDev:
+    """In-memory system_device stand-in"""
+
+    def __init__(self, name, due=True):
+        self.name = name
+        self.enable = True
+        self.state = CONST.RUNNING
+        self.poll_time = 0 if due else 3600
+        self.poll_time_next = 0 if due else tc25.current_milli_time() + 3600 * 1000
+        self.pwm = 30
+        self.faults = []
+        self.err_exclusion_conf_list = []
+
+    def get_timestamp(self):
+        return self.poll_time_next
+
+    def update_timestamp(self, timeout=0):
+        self.poll_time_next = tc25.current_milli_time() + (timeout or self.poll_time * 1000)
+
+    def process(self, *_):
+        pass
+
+    def handle_err(self, *_):
+        pass
+
+    def get_pwm(self):
+        return self.pwm
+
+    def get_value(self):
+        return 25
+
+    def get_fault_list_static_filtered(self):
+        return self.faults
+
+    def get_fault_list_dynamic(self):
+        return self.faults
+
+    def get_fault_cnt(self):
+        return 1 if self.faults else 0
+
+    def set_dynamic_filter_ena(self, ena):
+        pass
+
+
+def build_tm(module_cnt, modules_due):
+    tm = tc25.ThermalManagement.__new__(tc25.ThermalManagement)
+    tm.log = NullLog()
+    tm.dev_obj_list = [BenchDev("asic1")]
+    tm.dev_obj_list += [BenchDev("drwr{}".format(idx)) for idx in range(1, 7)]
+    tm.dev_obj_list += [BenchDev("psu{}_fan".format(idx)) for idx in range(1, 3)]
+    tm.dev_obj_list += [BenchDev("module{}".format(idx), modules_due) for idx in range(1, module_cnt + 1)]
+    tm.dev_obj_dict = {}
+    tm.dev_child_obj_dict = {}
+    tm.dev_err_exclusion_conf = {}
+    tm.conf_rule_index = {}
+    tm.dev_sched_heap = []
+    tm.dev_sched_seq = 0
+    tm.dev_pwm_dict = {}
+    tm.dev_pwm_max = (0, "")
+    tm.dev_pwm_max_dirty = True
+    tm.dev_fault_dict = {}
+    tm._loop_stat_reset()
+    tm._add_err_exclusion_conf(CONST.PSU_ERR, r"psu\d+_fan", 2)
+    tm._add_err_exclusion_conf(CONST.FAN_ERR, r"drwr\d+", 2)
+    tm._sched_rebuild()
+
+    tm.exit = threading.Event()
+    tm.cmd_arg = {"verbosity": 20}
+    tm.read_file = Mock(return_value="20")
+    tm.emergency = False
+    tm.is_fan_tacho_init = Mock(return_value=True)
+    tm.is_pwm_exists = Mock(return_value=True)
+    tm._is_i2c_control_with_bmc = Mock(return_value=False)
+    tm._is_attention_fan_insertion_fail = Mock(return_value=False)
+    tm._is_suspend = Mock(return_value=False)
+    tm.start = Mock()
+    tm.module_scan = Mock()
+    tm.sys_config = {CONST.SYS_CONF_DMIN: {}}
+    tm.system_flow_dir = CONST.C2P
+    tm.amb_tmp = 25
+    return tm
+
+
+def legacy_iteration(tm):
+    """Device processing part of ThermalManagement.run() iteration before scheduler and rule index"""
+    pwm_list = {}
+    curr_timestamp = tc25.current_milli_time()
+    for dev_obj in tm.dev_obj_list:
+        if dev_obj.enable and curr_timestamp >= dev_obj.get_timestamp():
+            dev_obj.process(tm.sys_config[CONST.SYS_CONF_DMIN], tm.system_flow_dir, tm.amb_tmp)
+            if dev_obj.name == "sensor_amb":
+                tm.amb_tmp = dev_obj.get_value()
+
+    total_err_count = 0
+    for conf in tm.dev_err_exclusion_conf.values():
+        conf["curr_err_cnt"] = 0
+        conf["skip_err"] = False
+
+    for dev_obj in tm.dev_obj_list:
+        if dev_obj.enable:
+            if dev_obj.state != CONST.RUNNING:
+                continue
+            fault_list = dev_obj.get_fault_list_static_filtered()
+            if not fault_list:
+                continue
+            fault_cnt = dev_obj.get_fault_cnt()
+            total_err_count += fault_cnt
+            if not dev_obj.get_fault_list_dynamic():
+                continue
+            for conf in tm.dev_err_exclusion_conf.values():
+                min_num = conf.get("min_err_cnt", 0)
+                if not min_num:
+                    continue
+                if re.match(conf["name_mask"], dev_obj.name):
+                    conf["curr_err_cnt"] += 1
+                    conf["skip_err"] = (conf["curr_err_cnt"] < min_num)
+                    if conf["skip_err"]:
+                        total_err_count -= fault_cnt
+
+    for dev_obj in tm.dev_obj_list:
+        if dev_obj.enable:
+            if curr_timestamp >= dev_obj.get_timestamp():
+                if dev_obj.state == CONST.RUNNING:
+                    for conf in tm.dev_err_exclusion_conf.values():
+                        if re.match(conf["name_mask"], dev_obj.name):
+                            dev_obj.set_dynamic_filter_ena(conf["skip_err"])
+                    dev_obj.handle_err(tm.sys_config[CONST.SYS_CONF_DMIN], tm.system_flow_dir, tm.amb_tmp)
+                dev_obj.update_timestamp()
+            pwm = dev_obj.get_pwm()
+            tm.log.debug("{0:25}: PWM {1}".format(dev_obj.name, pwm))
+            pwm_list[dev_obj.name] = pwm
+    return tm._pwm_get_max(pwm_list)
+
+
+def bench_legacy(module_cnt, modules_due, iterations):
+    tm = build_tm(module_cnt, modules_due)
+    time_total = 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        legacy_iteration(tm)
+        time_total += time.perf_counter() - start
+    return time_total * 1000 / iterations
+
+
+def bench_current(module_cnt, modules_due, iterations):
+    tm = build_tm(module_cnt, modules_due)
+    iter_cnt = [0]
+
+    def _set_pwm(*_args, **_kwargs):
+        iter_cnt[0] += 1
+        if iter_cnt[0] >= iterations:
+            tm.exit.set()
+
+    tm._set_pwm = _set_pwm
+    exit_wait = tc25.exit_wait
+    tc25.exit_wait = lambda *_args, **_kwargs: None
+    tc25.gmemory_snapshot_profiler, profiler = None, tc25.gmemory_snapshot_profiler
+    try:
+        tm.run()
+    finally:
+        tc25.exit_wait = exit_wait
+        tc25.gmemory_snapshot_profiler = profiler
+    return tm.loop_stat["time_ms"] / tm.loop_stat["iter_cnt"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TC 2.5 main loop micro-benchmark")
+    parser.add_argument("--modules", type=int, default=256, help="number of module sensors")
+    parser.add_argument("--iterations", type=int, default=200, help="loop iterations per measurement")
+    args = parser.parse_args()
+
+    print("Devices: {} modules + asic1 + 6 drwr + 2 psu, {} iterations".format(args.modules, args.iterations))
+    print("{:<28} {:>12} {:>12} {:>8}".format("scenario", "legacy(ms)", "current(ms)", "speedup"))
+    for title, modules_due in (("all sensors due", True), ("modules idle, 9 dev due", False)):
+        legacy_ms = bench_legacy(args.modules, modules_due, args.iterations)
+        current_ms = bench_current(args.modules, modules_due, args.iterations)
+        print("{:<28} {:>12.3f} {:>12.3f} {:>7.1f}x".format(title, legacy_ms, current_ms, legacy_ms / current_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+Uevent handling benchmark: udev RUN+= hooks vs hw_management_uevent_handler
+
+Builds "add" uevent burst (like "udevadm trigger --action=add" at boot) with
+one device per DEVPATH/KERNEL pattern of hw-management rules and runs the
+matched handler commands of hw-management-*-events.sh:
+    udev     - fork/exec of new process per command, commands of one event
+               in order, events in parallel (udev children_max workers)
+    service  - hw_management_uevent_handler rule table and Dispatcher (persistent
+               bash workers with preloaded event scripts)
+Reports burst time (first event to last handler done), latency of burst
+events (udev: event to its last handler done, service: event to handler
+done) and latency of single event on idle system.
+
+Handlers run against the repository scripts without hw-management runtime
+directory: event scripts exit after helpers/config are loaded (before any
+sysfs change), so the benchmark measures per-command overhead.
+
+Usage:
+    python3 uevent_handler_benchmark.py [--events N] [--children 8] [--workers 4] [--single 20]
+"""
+
+import argparse
+import glob
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+HW_MGMT_BIN = REPO_ROOT / "usr" / "usr" / "bin"
+RULES = str(REPO_ROOT / "usr" / "lib" / "udev" / "rules.d" / "*hw-management*events*.rules")
+sys.path.insert(0, str(HW_MGMT_BIN))
+
+import hw_management_uevent_handler as uevent  # noqa: E402
+
+
+def glob_sample(pattern):
+    """
+    @summary: Path matching udev glob pattern (first alternative)
+    """
+    pattern = pattern.split("|")[0]
+    return re.sub(r"\[([^\]])[^\]]*\]", r"\1", pattern).replace("*", "0").replace("?", "0")
+
+
+def burst_events(table):
+    """
+    @summary: One "add" event per DEVPATH/KERNEL pattern of add rules
+    """
+    devpaths = {}
+    for rule in table.rules:
+        if rule.action != "add" or not rule.subsystem:
+            continue
+        devpath = None
+        for matcher, negate in rule.match:
+            if negate:
+                continue
+            if matcher.key == "DEVPATH":
+                devpath = glob_sample(matcher.pattern)
+            elif matcher.key == "KERNEL" and devpath is None:
+                devpath = "/devices/virtual/{}/{}".format(rule.subsystem, glob_sample(matcher.pattern))
+        if devpath and devpath not in devpaths:
+            devpaths[devpath] = rule.subsystem
+    return list(devpaths.items())
+
+
+def make_events(table, sample):
+    events = []
+    for devpath, subsystem in sample:
+        event = uevent.Uevent("add", devpath, {"ACTION": "add", "DEVPATH": devpath, "SUBSYSTEM": subsystem},
+                              sysfs="/nonexistent")
+        argv_list = [[arg.replace("/usr/bin/", str(HW_MGMT_BIN) + "/", 1) for arg in argv]
+                     for argv in table.apply(event)]
+        if argv_list:
+            events.append((event, argv_list))
+    return events
+
+
+def percentile(vals, pct):
+    vals = sorted(vals)
+    return vals[min(len(vals) - 1, int(len(vals) * pct / 100))] if vals else 0.0
+
+
+def run_udev(events, children):
+    """
+    @return: (burst ms, [event latency ms])
+    """
+    start = time.monotonic()
+
+    def handle(item):
+        _event, argv_list = item
+        for argv in argv_list:
+            subprocess.run(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=False)
+        return (time.monotonic() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=children) as pool:
+        lat = list(pool.map(handle, events))
+    return (time.monotonic() - start) * 1000, lat
+
+
+def run_service(dispatcher, events):
+    """
+    @return: (burst ms, [handler latency ms])
+    """
+    dispatcher.latency = uevent.LatencyStat(samples=1000000)
+    start = time.monotonic()
+    for event, argv_list in events:
+        event.ts = start
+        dispatcher.submit([uevent.HandlerCmd(event, argv) for argv in argv_list])
+    dispatcher.idle.wait()
+    return (time.monotonic() - start) * 1000, list(dispatcher.latency.samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uevent handling benchmark: udev RUN+= vs uevent handler service")
+    parser.add_argument("--events", type=int, default=0, help="burst events (default: all add rules devices)")
+    parser.add_argument("--children", type=int, default=8, help="udev parallel workers (children_max)")
+    parser.add_argument("--workers", type=int, default=uevent.CONST.WORKERS, help="service workers")
+    parser.add_argument("--single", type=int, default=20, help="isolated events for single event latency")
+    args = parser.parse_args()
+
+    os.environ["PATH"] = "{}:{}".format(HW_MGMT_BIN, os.environ.get("PATH", ""))
+    table = uevent.RuleTable(sysfs="/nonexistent")
+    for path in sorted(glob.glob(RULES), key=os.path.basename):
+        table.load(path)
+    sample = burst_events(table)
+    if args.events:
+        sample = (sample * (args.events // len(sample) + 1))[:args.events]
+    events = make_events(table, sample)
+    handlers = sum(len(argv_list) for _event, argv_list in events)
+
+    preload = [str(HW_MGMT_BIN / os.path.basename(path)) for path in uevent.CONST.PRELOAD]
+    dispatcher = uevent.Dispatcher(args.workers, preload=preload, helpers=str(HW_MGMT_BIN / "hw-management-helpers.sh"),
+                                   stderr=subprocess.DEVNULL)
+    dispatcher.start()
+    # Workers load event scripts at start, not part of event handling
+    run_service(dispatcher, events[:args.workers])
+
+    print("{} rules, burst: {} events, {} handlers".format(len(table.rules), len(events), handlers))
+    print("{:<8} {:>10} {:>9} {:>9} {:>9} {:>11}".format("path", "burst(ms)", "p50(ms)", "p95(ms)", "max(ms)",
+                                                        "single(ms)"))
+    results = {}
+    results["udev"] = run_udev(events, args.children)
+    results["service"] = run_service(dispatcher, events)
+    single = {"udev": [], "service": []}
+    for event, argv_list in events[:args.single]:
+        single["udev"].append(run_udev([(event, argv_list)], 1)[0])
+        single["service"].append(run_service(dispatcher, [(event, argv_list)])[0])
+    dispatcher.stop()
+    for name, (burst, lat) in results.items():
+        print("{:<8} {:>10.0f} {:>9.1f} {:>9.1f} {:>9.1f} {:>11.1f}".format(
+            name, burst, percentile(lat, 50), percentile(lat, 95), max(lat), percentile(single[name], 50)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
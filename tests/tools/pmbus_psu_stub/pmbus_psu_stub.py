@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+Simulated PMBus PSUs for PSU firmware update tools tests and benchmarks
+
+Devices are attached to SimPmbusBus, which provides dev_open/dev_close/ioctl
+(I2C_RDWR) for I2cRdwrTransport of hw_management_psu_fw_update_common:
+    DeltaPsu      - MFR_FW_UPLOAD_MODE/MFR_FW_UPLOAD/MFR_FW_UPLOAD_STATUS, NACK while
+                    block is written (FW header write time)
+    Acbel460Psu   - ISP mode, 16 byte blocks with offset, "ISP Busy" status while
+                    block is written, exit of ISP mode takes time
+    MurataPsu     - ENTER_BOOTLOAD_MODE moves device to bootloader address 0x60,
+                    power down and erase, data lines with checksum (BUSY/SUCCESS), END_OF_FILE
+                    checksum test (NOT_ACTIVE), POWER_SUPPLY_RESET
+Time is virtual (SimClock): sleeps advance the clock, each transaction takes
+bus time, so flows run in milliseconds and burn time is reproducible.
+PEC is verified on devices which use it, bad PEC is NACKed.
+
+Faults are injected by attempt index (DeviceFaults.at) or rate (DeviceFaults.rate):
+    nak   - transaction NACKed (ENXIO)
+    error - block/line rejected (Acbel 460 "ISP Checksum Error",
+            Murata POLL_STATUS_DATA_ERROR)
+    busy  - block/line write takes busy_time longer
+"""
+
+import contextlib
+import errno
+import random
+import time
+from unittest.mock import patch
+
+I2C_RDWR = 0x0707
+I2C_M_RD = 0x0001
+
+MURATA_BOOTLOADER_ADDR = 0x60
+
+
+def crc8(data):
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xff if crc & 0x80 else (crc << 1) & 0xff
+    return crc
+
+
+class PmbusNak(Exception):
+    pass
+
+
+class SimClock(object):
+    """Virtual time for time.monotonic()/time.sleep()."""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+        self.slept = 0.0
+        self.sleeps = 0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        if delay > 0:
+            self.now += delay
+            self.slept += delay
+        self.sleeps += 1
+
+    def advance(self, delay):
+        self.now += delay
+
+    @contextlib.contextmanager
+    def patch(self):
+        with patch.object(time, "monotonic", self.monotonic), patch.object(time, "sleep", self.sleep):
+            yield self
+
+
+class DeviceFaults(object):
+    def __init__(self, seed=0):
+        self.at = {"nak": set(), "error": set(), "busy": set()}
+        self.rate = {"nak": 0.0, "error": 0.0, "busy": 0.0}
+        self.busy_time = 0.5
+        self._rng = random.Random(seed)
+
+    def hit(self, kind, attempt):
+        if attempt in self.at[kind]:
+            return True
+        return self.rate[kind] > 0 and self._rng.random() < self.rate[kind]
+
+
+class SimPmbusDevice(object):
+    """Common PMBus registers: PAGE, MFR_ID, MFR_MODEL, MFR_REVISION."""
+
+    def __init__(self, clock, addr, mfr_model, revision, new_revision):
+        self.clock = clock
+        self.addr = addr
+        self.mfr_id = "SIM"
+        self.mfr_model = mfr_model
+        self.revision = revision
+        self.new_revision = new_revision
+        self.page = 0
+        self.faults = DeviceFaults()
+        self.first_block_ts = None
+        self.last_block_ts = None
+        self.stat = {"write": 0, "read": 0, "nak": 0, "pec_error": 0,
+                     "block": 0, "block_attempt": 0, "block_error": 0, "busy_read": 0}
+
+    def responds(self, addr):
+        return addr == self.addr
+
+    def use_pec(self, addr):
+        return True
+
+    def nak(self, reason="nak"):
+        self.stat["nak"] += 1
+        raise PmbusNak(reason)
+
+    def block_attempt(self):
+        """Count block write attempt, return attempt index; NACK injected."""
+        attempt = self.stat["block_attempt"]
+        self.stat["block_attempt"] += 1
+        if self.faults.hit("nak", attempt):
+            self.nak()
+        return attempt
+
+    def block_done(self):
+        self.stat["block"] += 1
+        if self.first_block_ts is None:
+            self.first_block_ts = self.clock.now
+        self.last_block_ts = self.clock.now
+
+    def write(self, addr, data):
+        self.stat["write"] += 1
+        if self.use_pec(addr):
+            if len(data) < 2 or crc8([addr << 1] + list(data[:-1])) != data[-1]:
+                self.stat["pec_error"] += 1
+                self.nak("pec")
+            data = data[:-1]
+        if data[0] == 0x00 and len(data) == 2:
+            self.page = data[1]
+            return
+        self.handle_write(addr, data)
+
+    def read(self, addr, cmd, length):
+        self.stat["read"] += 1
+        if cmd in (0x99, 0x9a, 0x9b):
+            text = {0x99: self.mfr_id, 0x9a: self.mfr_model, 0x9b: self.read_revision()}[cmd]
+            return bytes([len(text)]) + text.encode("ascii")
+        return self.handle_read(addr, cmd, length)
+
+    def read_revision(self):
+        return self.revision
+
+    def handle_write(self, addr, data):
+        self.nak()
+
+    def handle_read(self, addr, cmd, length):
+        self.nak()
+
+
+class DeltaPsu(SimPmbusDevice):
+    MFR_FWUPLOAD_MODE = 0xd6
+    MFR_FWUPLOAD = 0xd7
+    MFR_FWUPLOAD_STATUS = 0xd2
+    MFR_FW_REVISION = 0xd5
+
+    def __init__(self, clock, addr, image_size, write_time=0.02, mode_delay=0.05,
+                 mfr_model="DPS-2000AB", revision="DT0100", new_revision="DT0101"):
+        SimPmbusDevice.__init__(self, clock, addr, mfr_model, revision, new_revision)
+        self.image_size = image_size
+        self.write_time = write_time
+        self.mode_delay = mode_delay
+        self.mode = 0
+        self.mode_ts = 0
+        self.received = 0
+        self.busy_until = 0
+
+    def handle_write(self, addr, data):
+        if data[0] == self.MFR_FWUPLOAD_MODE:
+            self.mode = data[1]
+            self.mode_ts = self.clock.now + self.mode_delay
+            if self.mode:
+                self.received = 0
+            elif self.received >= self.image_size:
+                # new image runs after PSU reboot
+                self.revision = self.new_revision
+        elif data[0] == self.MFR_FWUPLOAD:
+            if not self.mode or self.clock.now < self.busy_until:
+                self.nak("busy")
+            attempt = self.block_attempt()
+            self.received += len(data) - 2
+            self.busy_until = self.clock.now + self.write_time
+            if self.faults.hit("busy", attempt):
+                self.busy_until += self.faults.busy_time
+            self.block_done()
+        else:
+            self.nak()
+
+    def handle_read(self, addr, cmd, length):
+        if cmd == self.MFR_FWUPLOAD_MODE:
+            return bytes([self.mode if self.clock.now >= self.mode_ts else 1 - self.mode])
+        if cmd == self.MFR_FWUPLOAD_STATUS:
+            return bytes([1 << 0 if self.received >= self.image_size else 1 << 1])
+        if cmd == self.MFR_FW_REVISION:
+            return self.revision.encode("ascii")[:length].ljust(length, b"\0")
+        self.nak()
+
+
+class Acbel460Psu(SimPmbusDevice):
+    MFR_FWUPLOAD_MODE = 0xfa
+    MFR_FWUPLOAD = 0xfb
+    MFR_FWUPLOAD_STATUS = 0xfc
+    MFR_FW_REVISION = 0xd9
+
+    ISP_MODE_DISABLED = 0x51
+    ISP_NO_ERROR = 0x30
+    ISP_CHECKSUM_ERROR = 0x31
+    ISP_INCORRECT_IMAGE = 0x33
+    ISP_BUSY = 0x36
+
+    def __init__(self, clock, addr, image_size, block_time=0.012, enter_time=0.2, exit_time=3.0,
+                 mfr_model="FSF008-9G0G", revision=(1, 2, 0, 0), new_revision=(1, 3, 0, 0)):
+        SimPmbusDevice.__init__(self, clock, addr, mfr_model, revision, new_revision)
+        self.image_size = image_size
+        self.block_time = block_time
+        self.enter_time = enter_time
+        self.exit_time = exit_time
+        self.isp = False
+        self.enter_ts = 0
+        self.offset = 0
+        self.busy_until = 0
+        self.result = self.ISP_MODE_DISABLED
+
+    def handle_write(self, addr, data):
+        now = self.clock.now
+        if data[0] == self.MFR_FWUPLOAD_MODE:
+            self.isp = bool(data[1])
+            if self.isp:
+                self.offset = 0
+                # status reads "ISP Mode Disabled" until mode entered
+                self.busy_until = 0
+                self.result = self.ISP_MODE_DISABLED
+                self.enter_ts = now + self.enter_time
+            else:
+                if self.offset >= self.image_size:
+                    self.revision = self.new_revision
+                self.busy_until = now + self.exit_time
+                self.result = self.ISP_MODE_DISABLED
+        elif data[0] == self.MFR_FWUPLOAD and self.isp:
+            if now < self.busy_until:
+                self.nak("busy")
+            attempt = self.block_attempt()
+            offset = int.from_bytes(bytes(data[1:5]), "big")
+            self.busy_until = now + self.block_time
+            if self.faults.hit("busy", attempt):
+                self.busy_until += self.faults.busy_time
+            if self.faults.hit("error", attempt):
+                self.stat["block_error"] += 1
+                self.result = self.ISP_CHECKSUM_ERROR
+            elif offset != self.offset:
+                self.stat["block_error"] += 1
+                self.result = self.ISP_INCORRECT_IMAGE
+            else:
+                self.offset += len(data) - 5
+                self.result = self.ISP_NO_ERROR
+                self.block_done()
+        else:
+            self.nak()
+
+    def handle_read(self, addr, cmd, length):
+        now = self.clock.now
+        if cmd == self.MFR_FWUPLOAD_STATUS:
+            if now < self.busy_until:
+                self.stat["busy_read"] += 1
+                return bytes([self.ISP_BUSY])
+            if self.isp and self.result == self.ISP_MODE_DISABLED and now >= self.enter_ts:
+                self.result = self.ISP_NO_ERROR
+            return bytes([self.result])
+        if cmd == self.MFR_FW_REVISION:
+            rev = self.revision
+            return bytes([4, rev[1], rev[0], rev[3], rev[2]])[:length]
+        self.nak()
+
+
+class MurataPsu(SimPmbusDevice):
+    PS_STATUS = 0xe0
+    UPGRADE_STATUS = 0xfa
+    CMD_ENTER_BOOTLOAD = 0x42
+    CMD_UPGRADE_DATA = 0x44
+
+    POLL_STATUS_POWERDOWN = 0x33
+    POLL_STATUS_BUSY = 0x55
+    POLL_STATUS_SUCCESS = 0x81
+    POLL_STATUS_NOTACTIVE = 0xaa
+    POLL_STATUS_DATA_ERROR = 0x16
+
+    def __init__(self, clock, addr, lines, line_time=0.02, powerdown_time=0.3, erase_time=0.5,
+                 checksum_time=0.8, mfr_model="D1U54P-W-1200", revision="A00", new_revision="A01"):
+        SimPmbusDevice.__init__(self, clock, addr, mfr_model, revision, new_revision)
+        self.lines = lines
+        self.line_time = line_time
+        self.powerdown_time = powerdown_time
+        self.erase_time = erase_time
+        self.checksum_time = checksum_time
+        self.bootload = False
+        self.eof = False
+        self.powerdown_until = 0
+        self.busy_until = 0
+        self.result = self.POLL_STATUS_SUCCESS
+
+    def responds(self, addr):
+        return addr == (MURATA_BOOTLOADER_ADDR if self.bootload else self.addr)
+
+    def use_pec(self, addr):
+        return addr != MURATA_BOOTLOADER_ADDR
+
+    def read_revision(self):
+        # primary/secondary revision by PAGE
+        return self.revision + ("S" if self.page else "P")
+
+    def handle_write(self, addr, data):
+        now = self.clock.now
+        if not self.bootload:
+            if data[:2] == [0xfa, self.CMD_ENTER_BOOTLOAD]:
+                self.bootload = True
+                self.eof = False
+                self.powerdown_until = now + self.powerdown_time
+                self.busy_until = self.powerdown_until + self.erase_time
+                self.result = self.POLL_STATUS_SUCCESS
+                return
+            self.nak()
+        if data[:2] == [0xf8, 0xaf]:
+            # POWER_SUPPLY_RESET: leave bootloader, run new image if checksum test passed
+            if self.eof and self.stat["block"] == self.lines:
+                self.revision = self.new_revision
+            self.bootload = False
+            self.page = 0
+            return
+        if data[:2] != [0xfa, self.CMD_UPGRADE_DATA]:
+            self.nak()
+        if now < self.busy_until:
+            self.nak("busy")
+        if data[2] == 0x01:
+            # END_OF_FILE
+            self.eof = True
+            self.busy_until = now + self.checksum_time
+            return
+        attempt = self.block_attempt()
+        self.busy_until = now + self.line_time
+        if self.faults.hit("busy", attempt):
+            self.busy_until += self.faults.busy_time
+        if sum(data) & 0xff or self.faults.hit("error", attempt):
+            self.stat["block_error"] += 1
+            self.result = self.POLL_STATUS_DATA_ERROR
+            return
+        self.result = self.POLL_STATUS_SUCCESS
+        self.block_done()
+
+    def handle_read(self, addr, cmd, length):
+        if not self.bootload and cmd == self.PS_STATUS:
+            return bytes([0x02, 0x00, 0x00])[:length]
+        if self.bootload and cmd == self.UPGRADE_STATUS:
+            now = self.clock.now
+            if now < self.powerdown_until:
+                return bytes([self.POLL_STATUS_POWERDOWN])
+            if now < self.busy_until:
+                self.stat["busy_read"] += 1
+                return bytes([self.POLL_STATUS_BUSY])
+            if self.eof:
+                passed = self.stat["block"] == self.lines
+                return bytes([self.POLL_STATUS_NOTACTIVE if passed else self.POLL_STATUS_SUCCESS])
+            return bytes([self.result])
+        self.nak()
+
+
+class SimPmbusBus(object):
+    """
+    I2C bus with simulated devices, I2C_RDWR ioctl of /dev/i2c-N.
+    Transaction time: 9 bit times per byte (address byte included) at bus_hz
+    plus per transfer overhead.
+    """
+
+    def __init__(self, clock, bus=5, bus_hz=100000, xfer_overhead=0.0002):
+        self.clock = clock
+        self.bus = bus
+        self.bus_hz = bus_hz
+        self.xfer_overhead = xfer_overhead
+        self.devices = []
+        self.stat = {"open": 0, "xfer": 0, "nak": 0}
+
+    def add(self, device):
+        self.devices.append(device)
+        return device
+
+    def dev_open(self, path, flags):
+        if path != "/dev/i2c-{}".format(self.bus):
+            raise OSError(errno.ENOENT, "No such file or directory", path)
+        self.stat["open"] += 1
+        return 100 + self.bus
+
+    def dev_close(self, fd):
+        pass
+
+    def ioctl(self, fd, request, arg):
+        if request != I2C_RDWR:
+            raise OSError(errno.ENOTTY, "Inappropriate ioctl for device")
+        self.stat["xfer"] += 1
+        msgs = [arg.msgs[idx] for idx in range(arg.nmsgs)]
+        self.clock.advance(self.xfer_overhead + sum(msg.len + 1 for msg in msgs) * 9.0 / self.bus_hz)
+        addr = msgs[0].addr
+        device = next((dev for dev in self.devices if dev.responds(addr)), None)
+        try:
+            if device is None:
+                raise PmbusNak("no device")
+            wdata = list(msgs[0].buf[:msgs[0].len])
+            if len(msgs) == 1:
+                device.write(addr, wdata)
+                return 0
+            rmsg = msgs[1]
+            data = device.read(addr, wdata[0], rmsg.len)
+            for idx in range(rmsg.len):
+                rmsg.buf[idx] = data[idx] if idx < len(data) else 0xff
+        except PmbusNak:
+            self.stat["nak"] += 1
+            # NACK reported by mlxcpld i2c adapter
+            raise OSError(errno.ENXIO, "No such device or address")
+        return 0
+
+
+def make_delta_image(path, blocks, block_size=64, write_time_ms=20, model="DPS-2000AB"):
+    """Delta FW image: 32 byte header (model, block size, write time), blocks * block_size bytes."""
+    header = bytearray(32)
+    header[10:22] = model.encode("ascii")[:12].ljust(12, b" ")
+    header[23:26] = bytes([1, 0, 1])
+    header[26:28] = b"A0"
+    header[28:30] = block_size.to_bytes(2, "little")
+    header[30:32] = write_time_ms.to_bytes(2, "little")
+    body = bytes(idx & 0xff for idx in range(blocks * block_size - len(header)))
+    with open(path, "wb") as image:
+        image.write(bytes(header) + body)
+    return blocks * block_size
+
+
+def make_acbel_460_image(path, blocks):
+    """Acbel 460 FW image: blocks * 16 bytes."""
+    with open(path, "wb") as image:
+        image.write(bytes(idx & 0xff for idx in range(blocks * 16)))
+    return blocks * 16
+
+
+def make_murata_image(path, lines, line_size=32):
+    """Murata FW image: [data] section of hex lines, [checksum] section."""
+    with open(path, "w") as image:
+        image.write("[header]\nversion=A01\n[data]\n")
+        for line in range(lines):
+            image.write("{:05d}={}\n".format(line, "".join("{:02X}".format((line + idx) & 0xff)
+                                                           for idx in range(line_size))))
+        image.write("[checksum]\nsum=00\n")
+    return lines
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+PSU firmware update benchmark against simulated PMBus PSUs
+
+Runs Delta, Acbel 460 and Murata update flows of hw_management_psu_fw_update_*
+against pmbus_psu_stub devices in virtual time and reports per flow:
+    blocks    - blocks/lines accepted by PSU
+    burn(s)   - time from first to last accepted block
+    blocks/s  - burn rate
+    total(s)  - whole update flow incl. mode changes and PSU reboot waits
+    naks      - NACKed transactions (busy PSU, injected)
+    errors    - blocks rejected by PSU (resent by Acbel 460 flow)
+    busy      - "busy" status reads while block is written
+    xfers     - I2C transactions
+Fault rates and vendor spacing are set by options to tune the delays offline.
+
+Usage:
+    python3 psu_fw_update_benchmark.py [--blocks 1024] [--nak-rate 0.01] [--error-rate 0.01]
+                                       [--busy-rate 0.01] [--spacing 0.01] [--bus-hz 100000]
+"""
+
+import argparse
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+HW_MGMT_BIN = Path(__file__).resolve().parents[3] / "usr" / "usr" / "bin"
+sys.path.insert(0, str(HW_MGMT_BIN))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import hw_management_psu_fw_update_common as psu_common  # noqa: E402
+import hw_management_psu_fw_update_delta as psu_delta  # noqa: E402
+import hw_management_psu_fw_update_murata as psu_murata  # noqa: E402
+import pmbus_psu_stub as stub  # noqa: E402
+
+BUS = 5
+ADDR = 0x58
+
+
+def run_flow(name, args, work_dir):
+    clock = stub.SimClock()
+    bus = stub.SimPmbusBus(clock, bus=BUS, bus_hz=args.bus_hz)
+    image = str(Path(work_dir) / name)
+    if name == "delta":
+        size = stub.make_delta_image(image, args.blocks, write_time_ms=args.write_time_ms)
+        psu = bus.add(stub.DeltaPsu(clock, ADDR, size, write_time=args.write_time_ms * 0.001))
+        flow = (psu_delta.update_delta, BUS, ADDR, image)
+        module = psu_delta
+    elif name == "acbel460":
+        size = stub.make_acbel_460_image(image, args.blocks)
+        psu = bus.add(stub.Acbel460Psu(clock, ADDR, size))
+        flow = (psu_delta.update_acbel_460, BUS, ADDR, image)
+        module = psu_delta
+    else:
+        lines = stub.make_murata_image(image, args.blocks)
+        psu = bus.add(stub.MurataPsu(clock, ADDR, lines))
+        flow = (psu_murata.murata_update, BUS, ADDR, False, image, False)
+        module = psu_murata
+    psu.faults = stub.DeviceFaults(seed=args.seed)
+    psu.faults.rate.update({"nak": args.nak_rate, "error": args.error_rate, "busy": args.busy_rate})
+
+    transport = psu_common.I2cRdwrTransport(dev_open=bus.dev_open, dev_close=bus.dev_close, ioctl=bus.ioctl)
+    spacing = args.spacing if args.spacing is not None else module.PMBUS_SPACING
+    start_ts = clock.now
+    wall = time.perf_counter()
+    with patch.object(psu_common, "I2C_TRANSPORT", transport), \
+            patch.object(module, "PMBUS_SPACING", spacing), \
+            patch.object(psu_murata, "args", argparse.Namespace(skip_redundancy_check=False), create=True), \
+            patch.dict(psu_common._pmbus_ready_ts, clear=True), \
+            contextlib.redirect_stdout(io.StringIO()), \
+            clock.patch():
+        try:
+            flow[0](*flow[1:])
+            rc = None
+        except SystemExit as exc:
+            rc = exc.code
+    wall = time.perf_counter() - wall
+    transport.close()
+
+    burn = (psu.last_block_ts - psu.first_block_ts) if psu.stat["block"] > 1 else 0
+    return {"rc": rc, "blocks": psu.stat["block"], "burn": burn,
+            "rate": psu.stat["block"] / burn if burn else 0, "total": clock.now - start_ts,
+            "naks": psu.stat["nak"], "errors": psu.stat["block_error"], "busy": psu.stat["busy_read"],
+            "xfers": bus.stat["xfer"], "wall": wall}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PSU firmware update benchmark (simulated PSUs)")
+    parser.add_argument("--blocks", type=int, default=1024, help="image blocks (Murata: data lines)")
+    parser.add_argument("--flows", default="delta,acbel460,murata")
+    parser.add_argument("--write-time-ms", type=int, default=20, help="Delta FW header block write time")
+    parser.add_argument("--nak-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--busy-rate", type=float, default=0.0)
+    parser.add_argument("--spacing", type=float, default=None,
+                        help="override vendor PMBUS_SPACING (sec)")
+    parser.add_argument("--bus-hz", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        print("{:<9} {:>4} {:>7} {:>9} {:>9} {:>9} {:>6} {:>6} {:>6} {:>7} {:>8}".format(
+            "flow", "rc", "blocks", "burn(s)", "blocks/s", "total(s)", "naks", "errors", "busy", "xfers",
+            "wall(s)"))
+        for name in args.flows.split(","):
+            res = run_flow(name, args, work_dir)
+            print("{:<9} {:>4} {:>7} {:>9.2f} {:>9.1f} {:>9.2f} {:>6} {:>6} {:>6} {:>7} {:>8.2f}".format(
+                name, str(res["rc"]), res["blocks"], res["burn"], res["rate"], res["total"],
+                res["naks"], res["errors"], res["busy"], res["xfers"], res["wall"]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+RedfishClient firmware upload benchmark against local TLS Redfish stub
+
+Uploads an image of given size by redfish_api_update_firmware() per transport
+and reports throughput and peak RSS growth of the uploading process:
+    curl - curl process uploads the file (RSS of curl child)
+    http - RedfishHttpTransport, mmap'd RedfishUploadBody
+Each mode runs in its own process.
+
+Usage:
+    python3 redfish_fw_upload_benchmark.py [--size-mb 256] [--curl /usr/bin/curl]
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+HW_MGMT_BIN = Path(__file__).resolve().parents[3] / "usr" / "usr" / "bin"
+sys.path.insert(0, str(HW_MGMT_BIN))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import hw_management_redfish_client as redfish_client  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+RedfishClient = redfish_client.RedfishClient
+MB = 1024 * 1024
+
+
+def vm_hwm_kb():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    return 0
+
+
+def upload_worker(curl, address, transport, path, result):
+    client = RedfishClient(curl, address, stub.DEF_USER, stub.DEF_PASSWORD, transport)
+    with contextlib.redirect_stderr(io.StringIO()):
+        client.login()
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        hwm_start = vm_hwm_kb()
+        start = time.perf_counter()
+        # task polls are not part of the transfer
+        with patch.object(redfish_client.time, "sleep"):
+            ret, msg = client.redfish_api_update_firmware(path)
+        wall = time.perf_counter() - start
+    rss_kb = vm_hwm_kb() - hwm_start
+    if transport == RedfishClient.TRANSPORT_CURL:
+        rss_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    result.put((ret, msg, wall, rss_kb))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RedfishClient firmware upload benchmark")
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--curl", default=shutil.which("curl") or "/usr/bin/curl")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        tls_cert = stub.make_self_signed_cert(work_dir)
+        if not tls_cert:
+            print("openssl is required to create stub TLS certificate")
+            return 1
+        path = str(Path(work_dir) / "fw.bin")
+        with open(path, "wb") as image:
+            block = bytes(range(256)) * 4096
+            for _ in range(args.size_mb):
+                image.write(block)
+
+        ctx = multiprocessing.get_context("fork")
+        with stub.RedfishStubServer(tls_cert=tls_cert) as srv:
+            print("{} MB image upload, TLS stub on {}".format(args.size_mb, srv.address))
+            print("{:<6} {:>10} {:>14} {:>16}".format("mode", "time(s)", "MB/s", "peak RSS(MB)"))
+            for transport in (RedfishClient.TRANSPORT_CURL, RedfishClient.TRANSPORT_HTTP):
+                result = ctx.Queue()
+                proc = ctx.Process(target=upload_worker, args=(args.curl, srv.address, transport, path, result))
+                proc.start()
+                ret, msg, wall, rss_kb = result.get()
+                proc.join()
+                if ret != RedfishClient.ERR_CODE_OK:
+                    print("{:<6} failed: {} {}".format(transport, ret, msg))
+                    continue
+                print("{:<6} {:>10.2f} {:>14.1f} {:>16.1f}".format(transport, wall, args.size_mb / wall,
+                                                                    rss_kb / 1024.0))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
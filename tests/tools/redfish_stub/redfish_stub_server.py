@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+Local stand-in Redfish (BMC) server for RedfishClient tests and benchmarks
+
+Implements the subset of the BMC Redfish API used by hw-mgmt:
+    POST /login                  - {"username", "password"} -> {"token"}
+    GET/PATCH/POST/DELETE <uri>  - X-Auth-Token (or Basic auth) protected resources,
+                                   GET returns ETag and honors If-None-Match
+    GET /redfish/v1/EventService/SSE
+                                 - Server-Sent Events stream of published events,
+                                   honors Last-Event-ID, sends keep-alive comments
+    POST HttpPushUri / MultipartHttpPushUri of /redfish/v1/UpdateService
+                                 - firmware image (octet-stream or multipart), received
+                                   in chunks (not buffered), creates update Task which
+                                   advances PercentComplete on each GET
+HTTP/1.1 keep-alive, optional TLS (self-signed certificate by openssl CLI).
+
+Usage:
+    python3 redfish_stub_server.py [--port 8443] [--tls]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEF_USER = "yormnAnb"
+DEF_PASSWORD = "stub-password"
+SSE_URI = "/redfish/v1/EventService/SSE"
+UPDATE_SERVICE_URI = "/redfish/v1/UpdateService"
+PUSH_URI = UPDATE_SERVICE_URI + "/update"
+MULTIPART_PUSH_URI = UPDATE_SERVICE_URI + "/update-multipart"
+TASKS_URI = "/redfish/v1/TaskService/Tasks"
+RECV_CHUNK = 256 * 1024
+
+
+def make_self_signed_cert(cert_dir):
+    """
+    Create self-signed certificate/key in cert_dir by openssl CLI.
+    @return: (cert_file, key_file) or None if openssl is not available
+    """
+    openssl = shutil.which("openssl")
+    if not openssl:
+        return None
+    cert_file = os.path.join(cert_dir, "stub.crt")
+    key_file = os.path.join(cert_dir, "stub.key")
+    ret = subprocess.run([openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                          "-subj", "/CN=redfish-stub", "-keyout", key_file, "-out", cert_file],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if ret.returncode != 0:
+        return None
+    return cert_file, key_file
+
+
+class RedfishStubState:
+    """Resources, accounts, sessions and counters of the stub BMC."""
+
+    def __init__(self, users=None):
+        self.lock = threading.Lock()
+        self.users = dict(users) if users else {DEF_USER: DEF_PASSWORD}
+        self.tokens = set()
+        self.token_seq = 0
+        self.resources = {
+            "/redfish/v1": {"@odata.id": "/redfish/v1", "Name": "Root Service"},
+            "/redfish/v1/EventService": {"@odata.id": "/redfish/v1/EventService",
+                                         "ServiceEnabled": True, "ServerSentEventUri": SSE_URI},
+            UPDATE_SERVICE_URI: {"@odata.id": UPDATE_SERVICE_URI, "HttpPushUri": PUSH_URI,
+                                 "MultipartHttpPushUri": MULTIPART_PUSH_URI},
+        }
+        self.stat = {"request": 0, "login": 0, "connection": 0, "unauthorized": 0, "not_modified": 0,
+                     "sse_stream": 0, "fw_upload": 0, "fw_upload_aborted": 0, "task_poll": 0, "max_in_flight": 0}
+        self.in_flight = 0
+        self.requests = []
+        # Published SSE events, event id is index + 1
+        self.events = []
+        self.events_cond = threading.Condition(self.lock)
+        self.sse_keepalive = 1.0
+        self.sse_generation = 0
+        self.closed = False
+        # Received firmware images: {"uri", "size", "sha256", "content_type", "parameters"}
+        self.fw_uploads = []
+        # Update tasks: uri -> Task resource
+        self.tasks = {}
+        # PercentComplete added per task GET, task result message (Exception state)
+        self.task_step = 50
+        self.task_fail_message = None
+        # Test hooks
+        self.close_after_response = False
+        # Resource GET response delay (sec), BMC round trip latency
+        self.latency = 0.0
+        # Drop connection of next fw_abort_count firmware uploads after receiving fw_abort_after bytes
+        self.fw_abort_after = None
+        self.fw_abort_count = 1
+
+    def add_resource(self, uri, body):
+        with self.lock:
+            self.resources[uri] = body
+
+    def publish(self, event):
+        """Publish Redfish Event payload to SSE streams."""
+        with self.events_cond:
+            self.events.append(event)
+            self.events_cond.notify_all()
+
+    def drop_sse_streams(self):
+        """Close open SSE streams (BMC restart / network loss)."""
+        with self.events_cond:
+            self.sse_generation += 1
+            self.events_cond.notify_all()
+
+    def close(self):
+        with self.events_cond:
+            self.closed = True
+            self.events_cond.notify_all()
+
+    def expire_tokens(self):
+        with self.lock:
+            self.tokens.clear()
+
+    def login(self, username, password):
+        with self.lock:
+            self.stat["login"] += 1
+            if self.users.get(username) != password:
+                return None
+            self.token_seq += 1
+            token = "stub-token-{}".format(self.token_seq)
+            self.tokens.add(token)
+            return token
+
+
+class ImageReceiver:
+    """
+    Streaming firmware image receiver: SHA-256 and size of the image, octet-stream
+    body or UpdateFile part of multipart/form-data (UpdateParameters JSON parsed).
+    Holds only multipart headers and the closing boundary in memory.
+    """
+
+    HEADER_MAX = 64 * 1024
+
+    def __init__(self, content_type):
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+        self.parameters = None
+        self._closing = None
+        self._head = None
+        self._held = b""
+        match = re.search(r"boundary=([^;]+)", content_type)
+        if content_type.startswith("multipart/form-data") and match:
+            self._boundary = match.group(1).strip('"').encode("utf-8")
+            self._closing = b"\r\n--" + self._boundary + b"--\r\n"
+            self._head = b""
+
+    def _image(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+
+    def feed(self, chunk):
+        if self._closing is None:
+            self._image(chunk)
+            return
+        if self._head is not None:
+            self._head += chunk
+            match = re.search(rb'name="UpdateFile"[^\r]*\r\n(?:[^\r]+\r\n)*\r\n', self._head)
+            if not match:
+                if len(self._head) > ImageReceiver.HEADER_MAX:
+                    raise ValueError("multipart headers too long")
+                return
+            self._parse_fields(self._head[:match.start()])
+            chunk = self._head[match.end():]
+            self._head = None
+        # Closing boundary may arrive split: hold back its length
+        data = self._held + chunk
+        keep = len(self._closing)
+        self._image(data[:-keep] if len(data) > keep else b"")
+        self._held = data[-keep:] if len(data) > keep else data
+
+    def _parse_fields(self, head):
+        for part in head.split(b"--" + self._boundary):
+            headers, _, value = part.partition(b"\r\n\r\n")
+            if b'name="UpdateParameters"' in headers:
+                try:
+                    self.parameters = json.loads(value.rstrip(b"\r\n").decode("utf-8"))
+                except ValueError:
+                    self.parameters = None
+
+    def finish(self):
+        if self._closing is None:
+            return True
+        return (self._head is None) and (self._held == self._closing)
+
+
+class RedfishStubHandler(BaseHTTPRequestHandler):
+    """Request handler: state is RedfishStubServer.state."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.state.lock:
+            self.server.state.stat["connection"] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def _read_chunks(self, limit=None):
+        """Yield request body chunks, stop after limit bytes."""
+        remaining = int(self.headers.get("Content-Length", 0))
+        if limit is not None:
+            remaining = min(remaining, limit)
+        while remaining > 0:
+            chunk = self.rfile.read(min(RECV_CHUNK, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    def _is_push(self):
+        return (self.command == "POST") and (self.path in (PUSH_URI, MULTIPART_PUSH_URI))
+
+    def _send(self, status, body=None, headers=None):
+        data = b""
+        if body is not None:
+            data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        for name, val in (headers or {}).items():
+            self.send_header(name, val)
+        self.send_header("Content-Length", str(len(data)))
+        if self.server.state.close_after_response:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        if data and self.command != "HEAD":
+            self.wfile.write(data)
+
+    def _authorized(self):
+        state = self.server.state
+        token = self.headers.get("X-Auth-Token")
+        with state.lock:
+            if token and token in state.tokens:
+                return True
+        auth = self.headers.get("Authorization", "")
+        if auth.startswith("Basic "):
+            user, _, password = base64.b64decode(auth[6:]).decode("utf-8").partition(":")
+            with state.lock:
+                return state.users.get(user) == password
+        return False
+
+    def _handle(self):
+        state = self.server.state
+        # Firmware image is received by handle_push() in chunks
+        body = b"" if self._is_push() else self._read_body()
+        with state.lock:
+            state.stat["request"] += 1
+            state.requests.append((self.command, self.path))
+
+        if self.command == "POST" and self.path == "/login":
+            try:
+                cred = json.loads(body.decode("utf-8"))
+            except ValueError:
+                self._send(400, {"error": {"message": "Invalid json"}})
+                return
+            token = state.login(cred.get("username"), cred.get("password"))
+            if token is None:
+                self._send(401)
+            else:
+                self._send(200, {"token": token})
+            return
+
+        if not self._authorized():
+            with state.lock:
+                state.stat["unauthorized"] += 1
+            for _ in self._read_chunks():
+                pass
+            self._send(401)
+            return
+        if self.command == "GET" and self.path == SSE_URI:
+            self.handle_sse()
+            return
+        if self._is_push():
+            self.handle_push()
+            return
+        self.handle_resource(body)
+
+    def handle_push(self):
+        state = self.server.state
+        with state.lock:
+            abort_after = state.fw_abort_after
+            if abort_after is not None:
+                state.fw_abort_count -= 1
+                if state.fw_abort_count <= 0:
+                    state.fw_abort_after = None
+        content_type = self.headers.get("Content-Type", "")
+        receiver = ImageReceiver(content_type)
+        for chunk in self._read_chunks(abort_after):
+            receiver.feed(chunk)
+        if abort_after is not None:
+            with state.lock:
+                state.stat["fw_upload_aborted"] += 1
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        if not receiver.finish():
+            self._send(400, {"error": {"message": "Malformed multipart firmware upload"}})
+            return
+        with state.lock:
+            state.stat["fw_upload"] += 1
+            state.fw_uploads.append({"uri": self.path, "size": receiver.size, "sha256": receiver.sha256.hexdigest(),
+                                     "content_type": content_type.split(";")[0],
+                                     "parameters": receiver.parameters})
+            task_uri = "{}/{}".format(TASKS_URI, len(state.tasks) + 1)
+            task = {"@odata.id": task_uri, "@odata.type": "#Task.v1_7_0.Task", "Id": str(len(state.tasks) + 1),
+                    "TaskState": "Running", "TaskStatus": "OK", "PercentComplete": 0, "Messages": []}
+            state.tasks[task_uri] = task
+            body = dict(task)
+        self._send(202, body, headers={"Location": task_uri})
+
+    def handle_task(self, task):
+        """Advance update task by task_step on each poll."""
+        state = self.server.state
+        with state.lock:
+            state.stat["task_poll"] += 1
+            if task["TaskState"] == "Running":
+                task["PercentComplete"] = min(100, task["PercentComplete"] + state.task_step)
+                if task["PercentComplete"] == 100:
+                    if state.task_fail_message:
+                        task.update(TaskState="Exception", TaskStatus="Critical",
+                                    Messages=[{"Message": state.task_fail_message}])
+                    else:
+                        task.update(TaskState="Completed", Messages=[{"Message": "Task completed OK"}])
+            body = dict(task)
+        self._send(200, body)
+
+    def handle_sse(self):
+        state = self.server.state
+        try:
+            next_idx = int(self.headers.get("Last-Event-ID", 0))
+        except ValueError:
+            next_idx = 0
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.close_connection = True
+        with state.lock:
+            state.stat["sse_stream"] += 1
+            generation = state.sse_generation
+        try:
+            while True:
+                with state.events_cond:
+                    if len(state.events) <= next_idx:
+                        state.events_cond.wait(state.sse_keepalive)
+                    if state.closed or state.sse_generation != generation:
+                        return
+                    events = state.events[next_idx:]
+                if not events:
+                    self.wfile.write(b": keep-alive\n\n")
+                for event in events:
+                    next_idx += 1
+                    data = "id: {}\ndata: {}\n\n".format(next_idx, json.dumps(event))
+                    self.wfile.write(data.encode("utf-8"))
+                self.wfile.flush()
+        except OSError:
+            pass
+
+    def handle_resource(self, body):
+        state = self.server.state
+        path = self.path.split("?")[0]
+        with state.lock:
+            resource = state.resources.get(path)
+            task = state.tasks.get(path)
+            state.in_flight += 1
+            state.stat["max_in_flight"] = max(state.stat["max_in_flight"], state.in_flight)
+            latency = state.latency
+        try:
+            if latency and (self.command == "GET"):
+                time.sleep(latency)
+            self._handle_resource(path, body, resource, task)
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _handle_resource(self, path, body, resource, task):
+        state = self.server.state
+        if (self.command == "GET") and (task is not None):
+            self.handle_task(task)
+        elif self.command == "GET":
+            if resource is None:
+                self._send(404, {"error": {"message": "Resource not found"}})
+                return
+            data = json.dumps(resource).encode("utf-8")
+            etag = '"{}"'.format(hashlib.sha1(data).hexdigest()[:16])
+            if self.headers.get("If-None-Match") == etag:
+                with state.lock:
+                    state.stat["not_modified"] += 1
+                self._send(304, headers={"ETag": etag})
+            else:
+                self._send(200, data, headers={"ETag": etag})
+        elif self.command == "DELETE":
+            with state.lock:
+                state.resources.pop(path, None)
+            self._send(204)
+        else:
+            try:
+                data = json.loads(body.decode("utf-8")) if body else {}
+            except ValueError:
+                data = {"Size": len(body)}
+            with state.lock:
+                if self.command == "PATCH" and isinstance(resource, dict):
+                    resource.update(data)
+                else:
+                    state.resources[path] = data
+            self._send(200, {"@odata.id": path})
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PATCH = _handle
+    do_DELETE = _handle
+
+
+class RedfishStubServer(ThreadingHTTPServer):
+    """
+    Stub BMC on 127.0.0.1. Use as context manager:
+        with RedfishStubServer() as srv:
+            client = RedfishClient(curl, srv.address, user, pwd)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, tls_cert=None, handler=RedfishStubHandler, users=None):
+        super().__init__(("127.0.0.1", port), handler)
+        self.state = RedfishStubState(users)
+        self.tls = False
+        if tls_cert:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*tls_cert)
+            self.socket = context.wrap_socket(self.socket, server_side=True)
+            self.tls = True
+        self._thread = None
+
+    @property
+    def address(self):
+        return "{}:{}".format(*self.server_address[:2])
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="redfish_stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.state.close()
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_args):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in Redfish server")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--tls", action="store_true", help="serve HTTPS with self-signed certificate")
+    args = parser.parse_args()
+
+    cert_dir = tempfile.mkdtemp()
+    tls_cert = make_self_signed_cert(cert_dir) if args.tls else None
+    srv = RedfishStubServer(args.port, tls_cert)
+    print("Redfish stub on {}://{} user {} password {}".format("https" if srv.tls else "http",
+                                                               srv.address, DEF_USER, DEF_PASSWORD))
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+        shutil.rmtree(cert_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+#
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms and conditions of the GNU General Public License,
+# version 2, as published by the Free Software Foundation.
+#
+# This program is distributed in the hope it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+RedfishClient transport benchmark against local TLS Redfish stub
+
+Runs N sensor GETs per transport and reports latency and CPU per request:
+    curl - curl process per request, TLS handshake per request
+    http - RedfishHttpTransport, one kept-alive TLS connection
+CPU includes child processes (curl).
+
+Usage:
+    python3 redfish_transport_benchmark.py [--requests 200] [--curl /usr/bin/curl]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HW_MGMT_BIN = Path(__file__).resolve().parents[3] / "usr" / "usr" / "bin"
+sys.path.insert(0, str(HW_MGMT_BIN))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from hw_management_redfish_client import RedfishClient  # noqa: E402
+import redfish_stub_server as stub  # noqa: E402
+
+SENSOR_URI = "/redfish/v1/Chassis/BMC_0/Sensors/BMC_0_Temp_0"
+
+
+def bench(client, count):
+    cmd = client.build_get_cmd(SENSOR_URI)
+    times_start = os.times()
+    start = time.perf_counter()
+    # request debug trace goes to stderr
+    with contextlib.redirect_stderr(io.StringIO()):
+        for _ in range(count):
+            ret, _resp, err = client.exec_curl_cmd(cmd)
+            if ret != RedfishClient.ERR_CODE_OK:
+                raise RuntimeError("request failed: {} {}".format(ret, err))
+    wall = time.perf_counter() - start
+    times_end = os.times()
+    cpu = sum(times_end[idx] - times_start[idx] for idx in range(4))
+    return wall * 1000 / count, cpu * 1000 / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RedfishClient transport benchmark")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--curl", default=shutil.which("curl") or "/usr/bin/curl")
+    args = parser.parse_args()
+
+    cert_dir = tempfile.mkdtemp()
+    try:
+        tls_cert = stub.make_self_signed_cert(cert_dir)
+        if not tls_cert:
+            print("openssl is required to create stub TLS certificate")
+            return 1
+        with stub.RedfishStubServer(tls_cert=tls_cert) as srv:
+            srv.state.add_resource(SENSOR_URI, {"Reading": 45.0, "ReadingType": "Temperature",
+                                                "Status": {"State": "Enabled", "Health": "OK"},
+                                                "Thresholds": {"UpperCritical": {"Reading": 105.0}}})
+            print("{} GET requests, TLS stub on {}".format(args.requests, srv.address))
+            print("{:<6} {:>14} {:>14} {:>12}".format("mode", "latency(ms)", "cpu/req(ms)", "connections"))
+            for transport in (RedfishClient.TRANSPORT_CURL, RedfishClient.TRANSPORT_HTTP):
+                client = RedfishClient(args.curl, srv.address, stub.DEF_USER, stub.DEF_PASSWORD, transport)
+                with contextlib.redirect_stderr(io.StringIO()):
+                    client.login()
+                conn_start = srv.state.stat["connection"]
+                latency, cpu = bench(client, args.requests)
+                print("{:<6} {:>14.2f} {:>14.2f} {:>12}".format(transport, latency, cpu,
+                                                                 srv.state.stat["connection"] - conn_start))
+                if client.get_transport():
+                    client.get_transport().close()
+    finally:
+        shutil.rmtree(cert_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -109,18 +109,16 @@ get_label_files3()
 	echo "$folder" "$key" "$attr_file"
 }
 
-# Create labels
-# $1 - file path
-make_labels()
+# Get label key and location of attribute
+# $1 - attribute name
+# output: "key subfolder folder attr_file", return 1 if attribute has no label
+get_label_attr()
 {
-	local attr_full_name="$1"
-	local oper="$2"
+	local attr_name="$1"
 	local folder
 	local subfolder
 	local key
 	local attr_file
-	local scale
-	local attr_name=$(basename $attr_full_name)
 
 	case $attr_name in
 	comex_voltmon1_in*|comex_voltmon2_in*)
@@ -283,11 +281,31 @@ make_labels()
 		read folder key attr_file < <(get_label_files2 $attr_name)
 		;;
 	*)
-		return 0
+		return 1
 		;;
 	esac
+	echo "$key" "$subfolder" "$folder" "$attr_file"
+}
 
-	label_name=$(hw_management_parse_labels.py --get_value --label "labels_${sku}_rev1_array" --key "$key")
+# Create or remove label of one attribute
+# $1 - file path
+# $2 - operation: link/unlink
+# $3 - label attribute: "key subfolder folder attr_file"
+# $4 - bulk lookup line: "key<TAB>label<TAB>scale"
+make_label()
+{
+	local attr_full_name="$1"
+	local oper="$2"
+	local key
+	local subfolder
+	local folder
+	local attr_file
+	local labels="${4#*$'\t'}"
+	local label_name=${labels%%$'\t'*}
+	local scale=${labels#*$'\t'}
+	local label_dir
+
+	read key subfolder folder attr_file <<< "$3"
 	[ -z "$label_name" ] && return 0
 	label_dir="$ui_path"/"$subfolder"/"$folder"/"$label_name"
 
@@ -296,7 +314,6 @@ make_labels()
 			mkdir -p "$label_dir"
 		fi
 		ln -sf "$attr_full_name" "$label_dir/$attr_file"
-		scale=$(hw_management_parse_labels.py --get_value --label "labels_scale_${sku}_rev1_array" --key "$key")
 		[ -z "$scale" ] && return 0
 		echo "$scale" > "$label_dir"/scale
 	else
@@ -310,4 +327,43 @@ make_labels()
 	fi
 }
 
-make_labels "$1" "$2"
+# Create or remove labels
+# $1 - operation: link/unlink
+# $2.. - file paths
+make_labels()
+{
+	local oper="$1"
+	local attr_full_name
+	local attr_info
+	local line
+	local i=0
+	local -a attrs=()
+	local -a attr_infos=()
+	local -a keys=()
+
+	shift
+	for attr_full_name in "$@"; do
+		attr_info=$(get_label_attr "$(basename "$attr_full_name")") || continue
+		attrs+=("$attr_full_name")
+		attr_infos+=("$attr_info")
+		keys+=("${attr_info%% *}")
+	done
+	[ ${#keys[@]} -eq 0 ] && return 0
+
+	# Single lookup of label and scale for all keys: one "key<TAB>label<TAB>scale" line per key
+	while IFS= read -r line; do
+		make_label "${attrs[$i]}" "$oper" "${attr_infos[$i]}" "$line"
+		i=$((i + 1))
+	done < <(printf '%s\n' "${keys[@]}" | hw_management_parse_labels.py --bulk --sku "$sku")
+}
+
+# Usage: hw-management-labels-maker.sh <file path> <link|unlink>
+#        hw-management-labels-maker.sh <link|unlink> <file path> [<file path> ...]
+case "$1" in
+link|unlink)
+	make_labels "$@"
+	;;
+*)
+	make_labels "$2" "$1"
+	;;
+esac
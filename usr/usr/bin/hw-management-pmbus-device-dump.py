@@ -39,9 +39,52 @@ Dumps all PMBus registers for a given I2C device across multiple pages.
 import subprocess
 import sys
 import argparse
+import ctypes
+import errno
+import fcntl
 import os
 from typing import Optional, Dict, List
 
+# Linux i2c-dev ioctl interface (linux/i2c-dev.h, linux/i2c.h)
+I2C_RDWR = 0x0707
+I2C_SLAVE_FORCE = 0x0706
+I2C_PEC = 0x0708
+I2C_SMBUS = 0x0720
+I2C_M_RD = 0x0001
+I2C_SMBUS_READ = 1
+I2C_SMBUS_WRITE = 0
+I2C_SMBUS_BYTE_DATA = 2
+I2C_SMBUS_WORD_DATA = 3
+I2C_SMBUS_BLOCK_MAX = 32
+
+# Transfer not supported by adapter/driver - use i2c-tools fallback
+SMBUS_UNSUPPORTED_ERRNO = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL)
+
+
+class i2c_smbus_data(ctypes.Union):
+    _fields_ = [("byte", ctypes.c_uint8),
+                ("word", ctypes.c_uint16),
+                ("block", ctypes.c_uint8 * (I2C_SMBUS_BLOCK_MAX + 2))]
+
+
+class i2c_smbus_ioctl_data(ctypes.Structure):
+    _fields_ = [("read_write", ctypes.c_uint8),
+                ("command", ctypes.c_uint8),
+                ("size", ctypes.c_uint32),
+                ("data", ctypes.POINTER(i2c_smbus_data))]
+
+
+class i2c_msg(ctypes.Structure):
+    _fields_ = [("addr", ctypes.c_uint16),
+                ("flags", ctypes.c_uint16),
+                ("len", ctypes.c_uint16),
+                ("buf", ctypes.POINTER(ctypes.c_uint8))]
+
+
+class i2c_rdwr_ioctl_data(ctypes.Structure):
+    _fields_ = [("msgs", ctypes.POINTER(i2c_msg)),
+                ("nmsgs", ctypes.c_uint32)]
+
 # PMBus command definitions
 PMBUS_COMMANDS = {
     # Standard PMBus commands
@@ -323,7 +366,167 @@ def i2c_read_block(bus: int, addr: int, cmd: int) -> Optional[List[int]]:
     return None
 
 
-def dump_pmbus_command(bus: int, addr: int, cmd: int, name: str, data_type: str, rw: str, page: int) -> Dict:
+def smbus_pec(data: List[int]) -> int:
+    """Calculate SMBus PEC (CRC-8, x^8 + x^2 + x + 1)."""
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+class I2cToolsBackend:
+    """PMBus access by i2cget/i2cset process per transaction."""
+
+    name = "i2c-tools"
+
+    def set_page(self, bus: int, addr: int, page: int) -> bool:
+        return i2c_set_page(bus, addr, page)
+
+    def read_byte(self, bus: int, addr: int, cmd: int) -> Optional[int]:
+        return i2c_read_byte(bus, addr, cmd)
+
+    def read_word(self, bus: int, addr: int, cmd: int) -> Optional[int]:
+        return i2c_read_word(bus, addr, cmd)
+
+    def read_block(self, bus: int, addr: int, cmd: int) -> Optional[List[int]]:
+        return i2c_read_block(bus, addr, cmd)
+
+    def close(self):
+        pass
+
+
+class SMBusIoctlBackend:
+    """
+    In-process PMBus access to /dev/i2c-N by I2C_SMBUS/I2C_RDWR ioctl.
+    One fd is kept per bus. Byte/word transfers use I2C_SMBUS with kernel PEC
+    (I2C_PEC), block reads use I2C_RDWR with PEC checked here.
+    Transfer types not supported by the adapter go to fallback backend.
+    """
+
+    name = "ioctl"
+
+    def __init__(self, pec: bool = False, fallback=None, dev_open=None, dev_close=None, ioctl=None):
+        self.pec = pec
+        self.fallback = fallback if fallback else I2cToolsBackend()
+        self._open = dev_open if dev_open else os.open
+        self._close = dev_close if dev_close else os.close
+        self._ioctl = ioctl if ioctl else fcntl.ioctl
+        self._fd = {}
+        self._addr = {}
+        self.unsupported = set()
+
+    def _get_fd(self, bus: int, addr: int) -> int:
+        fd = self._fd.get(bus)
+        if fd is None:
+            fd = self._open(f"/dev/i2c-{bus}", os.O_RDWR)
+            self._fd[bus] = fd
+            self._ioctl(fd, I2C_PEC, 1 if self.pec else 0)
+        if self._addr.get(bus) != addr:
+            self._ioctl(fd, I2C_SLAVE_FORCE, addr)
+            self._addr[bus] = addr
+        return fd
+
+    def open(self, bus: int, addr: int):
+        """Open bus device, raise OSError if not available."""
+        self._get_fd(bus, addr)
+
+    def _smbus_access(self, bus: int, addr: int, read_write: int, cmd: int, size: int, data: i2c_smbus_data):
+        fd = self._get_fd(bus, addr)
+        msg = i2c_smbus_ioctl_data(read_write=read_write, command=cmd, size=size, data=ctypes.pointer(data))
+        self._ioctl(fd, I2C_SMBUS, msg)
+
+    def _read(self, kind: str, bus: int, addr: int, cmd: int, read_fn):
+        if kind in self.unsupported:
+            return getattr(self.fallback, f"read_{kind}")(bus, addr, cmd)
+        try:
+            return read_fn()
+        except OSError as e:
+            if e.errno in SMBUS_UNSUPPORTED_ERRNO:
+                print(f"SMBus {kind} read not supported on bus {bus} ({e}), using {self.fallback.name}", file=sys.stderr)
+                self.unsupported.add(kind)
+                return getattr(self.fallback, f"read_{kind}")(bus, addr, cmd)
+            print(f"SMBus read failed for command 0x{cmd:02x}: {e}", file=sys.stderr)
+        return None
+
+    def set_page(self, bus: int, addr: int, page: int) -> bool:
+        data = i2c_smbus_data()
+        data.byte = page
+        try:
+            self._smbus_access(bus, addr, I2C_SMBUS_WRITE, 0x00, I2C_SMBUS_BYTE_DATA, data)
+            return True
+        except OSError as e:
+            if e.errno in SMBUS_UNSUPPORTED_ERRNO:
+                return self.fallback.set_page(bus, addr, page)
+            print(f"Error setting page {page}: {e}", file=sys.stderr)
+        return False
+
+    def read_byte(self, bus: int, addr: int, cmd: int) -> Optional[int]:
+        def _read():
+            data = i2c_smbus_data()
+            self._smbus_access(bus, addr, I2C_SMBUS_READ, cmd, I2C_SMBUS_BYTE_DATA, data)
+            return data.byte
+        return self._read("byte", bus, addr, cmd, _read)
+
+    def read_word(self, bus: int, addr: int, cmd: int) -> Optional[int]:
+        def _read():
+            data = i2c_smbus_data()
+            self._smbus_access(bus, addr, I2C_SMBUS_READ, cmd, I2C_SMBUS_WORD_DATA, data)
+            return data.word
+        return self._read("word", bus, addr, cmd, _read)
+
+    def read_block(self, bus: int, addr: int, cmd: int) -> Optional[List[int]]:
+        def _read():
+            fd = self._get_fd(bus, addr)
+            # Length byte + data (+ PEC): same 32 bytes window as "i2cget ... i"
+            read_len = 1 + I2C_SMBUS_BLOCK_MAX + (1 if self.pec else 0)
+            wbuf = (ctypes.c_uint8 * 1)(cmd)
+            rbuf = (ctypes.c_uint8 * read_len)()
+            msgs = (i2c_msg * 2)(i2c_msg(addr, 0, 1, wbuf),
+                                 i2c_msg(addr, I2C_M_RD, read_len, rbuf))
+            self._ioctl(fd, I2C_RDWR, i2c_rdwr_ioctl_data(msgs, 2))
+            length = rbuf[0]
+            if length > I2C_SMBUS_BLOCK_MAX:
+                print(f"Warning: Invalid block length {length} for command 0x{cmd:02x}", file=sys.stderr)
+                return None
+            data = list(rbuf[1:length + 1])
+            if self.pec:
+                pec = smbus_pec([addr << 1, cmd, (addr << 1) | 1, length] + data)
+                if pec != rbuf[length + 1]:
+                    print(f"PEC error for command 0x{cmd:02x}: got 0x{rbuf[length + 1]:02x} expected 0x{pec:02x}",
+                          file=sys.stderr)
+                    return None
+            return data
+        return self._read("block", bus, addr, cmd, _read)
+
+    def close(self):
+        for fd in self._fd.values():
+            self._close(fd)
+        self._fd = {}
+        self._addr = {}
+
+
+def get_backend(name: str, bus: int, addr: int, pec: bool = False):
+    """
+    Get PMBus access backend.
+    name: "ioctl", "i2c-tools" or "auto" - ioctl if /dev/i2c-N can be opened, else i2c-tools.
+    """
+    if name == "i2c-tools":
+        return I2cToolsBackend()
+    backend = SMBusIoctlBackend(pec=pec)
+    try:
+        backend.open(bus, addr)
+    except OSError as e:
+        backend.close()
+        if name == "ioctl":
+            raise
+        print(f"Warning: /dev/i2c-{bus} not available ({e}), using i2c-tools", file=sys.stderr)
+        return I2cToolsBackend()
+    return backend
+
+
+def dump_pmbus_command(bus: int, addr: int, cmd: int, name: str, data_type: str, rw: str, page: int, backend=None) -> Dict:
     """Dump a single PMBus command."""
     result = {
         "page": page,
@@ -341,23 +544,26 @@ def dump_pmbus_command(bus: int, addr: int, cmd: int, name: str, data_type: str,
         result["status"] = "write_only"
         return result
 
+    if backend is None:
+        backend = I2cToolsBackend()
+
     try:
         if data_type == "byte" or data_type == "send_byte":
-            value = i2c_read_byte(bus, addr, cmd)
+            value = backend.read_byte(bus, addr, cmd)
             if value is not None:
                 result["status"] = "success"
                 result["raw"] = f"0x{value:02X}"
                 result["formatted"] = f"{value} (0x{value:02X})"
 
         elif data_type == "word":
-            value = i2c_read_word(bus, addr, cmd)
+            value = backend.read_word(bus, addr, cmd)
             if value is not None:
                 result["status"] = "success"
                 result["raw"] = f"0x{value:04X}"
                 result["formatted"] = f"{value} (0x{value:04X})"
 
         elif data_type == "block":
-            data = i2c_read_block(bus, addr, cmd)
+            data = backend.read_block(bus, addr, cmd)
             if data is not None:
                 result["status"] = "success"
                 result["raw"] = " ".join([f"0x{b:02X}" for b in data])
@@ -374,13 +580,16 @@ def dump_pmbus_command(bus: int, addr: int, cmd: int, name: str, data_type: str,
     return result
 
 
-def dump_all_commands(bus: int, addr: int, num_pages: int, verbose: bool = False):
+def dump_all_commands(bus: int, addr: int, num_pages: int, verbose: bool = False, backend=None):
     """Dump all PMBus commands for all pages."""
+    if backend is None:
+        backend = I2cToolsBackend()
     print("=" * 80)
     print(f"PMBus Register Dump")
     print(f"I2C Bus: {bus}")
     print(f"Slave Address: 0x{addr:02X}")
     print(f"Number of Pages: {num_pages}")
+    print(f"Access: {backend.name}")
     print("=" * 80)
     print()
 
@@ -388,12 +597,12 @@ def dump_all_commands(bus: int, addr: int, num_pages: int, verbose: bool = False
     # Initialize to page 0 to ensure device is in a known state
     print("Device Identification (Page-independent):")
     print("-" * 80)
-    if not i2c_set_page(bus, addr, 0):
+    if not backend.set_page(bus, addr, 0):
         print("Warning: Failed to initialize device to page 0", file=sys.stderr)
     for cmd in [0x98, 0x99, 0x9A, 0x9B, 0xAD, 0xAE]:
         if cmd in PMBUS_COMMANDS:
             name, dtype, rw = PMBUS_COMMANDS[cmd]
-            result = dump_pmbus_command(bus, addr, cmd, name, dtype, rw, -1)
+            result = dump_pmbus_command(bus, addr, cmd, name, dtype, rw, -1, backend)
             if result["status"] == "success":
                 print(f"  {result['command']} {name:30s}: {result['formatted']}")
     print()
@@ -405,7 +614,7 @@ def dump_all_commands(bus: int, addr: int, num_pages: int, verbose: bool = False
         print(f"{'=' * 80}\n")
 
         # Set the page
-        if not i2c_set_page(bus, addr, page):
+        if not backend.set_page(bus, addr, page):
             print(f"ERROR: Failed to set page {page}. Device may not support this page or is not responding.", file=sys.stderr)
             print(f"       Skipping page {page} and continuing with next page...", file=sys.stderr)
             continue
@@ -414,7 +623,7 @@ def dump_all_commands(bus: int, addr: int, num_pages: int, verbose: bool = False
         success_count = 0
         for cmd in sorted(PMBUS_COMMANDS.keys()):
             name, dtype, rw = PMBUS_COMMANDS[cmd]
-            result = dump_pmbus_command(bus, addr, cmd, name, dtype, rw, page)
+            result = dump_pmbus_command(bus, addr, cmd, name, dtype, rw, page, backend)
 
             if verbose or result["status"] == "success":
                 status_str = result["status"].upper()
@@ -435,7 +644,7 @@ def dump_all_commands(bus: int, addr: int, num_pages: int, verbose: bool = False
         for cmd in range(0xD0, 0x100):
             if cmd not in PMBUS_COMMANDS:
                 # Try reading as byte first
-                value = i2c_read_byte(bus, addr, cmd)
+                value = backend.read_byte(bus, addr, cmd)
                 if value is not None:
                     print(f"0x{cmd:02X} {f'MFR_UNKNOWN_{cmd:02X}':30s} [byte      ] [??] : {value} (0x{value:02X})")
                     mfr_success += 1
@@ -468,6 +677,11 @@ Examples:
     parser.add_argument("pages", type=int, help="Number of pages to dump")
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Show all commands including failed/unsupported ones")
+    parser.add_argument("--backend", choices=["auto", "ioctl", "i2c-tools"], default="auto",
+                        help="Bus access: in-process ioctl on /dev/i2c-N or i2cget/i2cset per command "
+                             "(default: auto - ioctl if available)")
+    parser.add_argument("--pec", action="store_true",
+                        help="Use SMBus PEC (ioctl backend)")
 
     args = parser.parse_args()
 
@@ -496,14 +710,19 @@ Examples:
     if os.geteuid() != 0:
         print("Warning: This script typically needs to run as root (use sudo)", file=sys.stderr)
 
+    backend = None
     try:
-        dump_all_commands(args.bus, addr, args.pages, args.verbose)
+        backend = get_backend(args.backend, args.bus, addr, args.pec)
+        dump_all_commands(args.bus, addr, args.pages, args.verbose, backend)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if backend:
+            backend.close()
 
 
 if __name__ == "__main__":
@@ -4066,6 +4066,10 @@ do_start()
 
 	udevadm trigger --action=add
 	udevadm settle
+	# Wait for uevent handler service if it handles hw-management udev rules
+	if [ -f /run/hw-management-uevent-handler.seqnum ]; then
+		hw_management_uevent_handler.py --settle
+	fi
 	set_sodimm_temp_limits
 	set_gpios "export"
 	create_event_files
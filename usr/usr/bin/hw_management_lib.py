@@ -33,6 +33,13 @@
 
 import os
 import sys
+import atexit
+import weakref
+import errno
+import stat
+import heapq
+import random
+import socket
 import logging
 from logging.handlers import RotatingFileHandler
 import syslog
@@ -41,6 +48,7 @@ import time
 import json
 import tempfile
 import subprocess
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Any, Dict, Set, Optional, Hashable
 
@@ -168,6 +176,19 @@ def current_milli_time():
     return round(time.clock_gettime(time.CLOCK_MONOTONIC) * 1000)
 
 
+def _logger_flush_atexit(logger_ref):
+    """
+    @summary:
+        Write pending async records of HW_Mgmt_Logger (if it still exists) on interpreter exit
+    """
+    logger = logger_ref()
+    if logger is not None:
+        try:
+            logger.flush()
+        except Exception:
+            pass
+
+
 @dataclass
 class _MsgState:
     first_seen: float
@@ -177,6 +198,66 @@ class _MsgState:
     seen_count: int = 0  # total times error was seen
 
 
+class _IdentSyslog:
+    """
+    @summary:
+        syslog module replacement with own log identifier: records are sent to
+        local syslog socket directly instead of process-wide openlog() identifier.
+        Used when several loggers with different identifiers run in one process.
+    """
+    SYSLOG_SOCKET = "/dev/log"
+
+    def __init__(self, ident, logoption=syslog.LOG_NDELAY, facility=syslog.LOG_USER):
+        self.ident = ident
+        self.logoption = logoption
+        self.facility = facility
+        self._sock = None
+        self._lock = threading.Lock()
+        if logoption & syslog.LOG_NDELAY:
+            with self._lock:
+                self._connect()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.connect(self.SYSLOG_SOCKET)
+        except OSError:
+            sock.close()
+            return None
+        self._sock = sock
+        return sock
+
+    def _close(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    def syslog(self, priority, message):
+        """
+        @summary: Send message, same as syslog.syslog(priority, message)
+        """
+        tag = self.ident
+        if self.logoption & syslog.LOG_PID:
+            tag = "{}[{}]".format(tag, os.getpid())
+        record = "<{}>{} {}: {}".format(self.facility | priority, time.strftime("%b %e %H:%M:%S"), tag, message)
+        data = record.encode("utf-8", errors="replace")
+        with self._lock:
+            # Reconnect once if syslog daemon was restarted
+            for _ in range(2):
+                sock = self._sock or self._connect()
+                if not sock:
+                    return
+                try:
+                    sock.send(data)
+                    return
+                except OSError:
+                    self._close()
+
+    def closelog(self):
+        with self._lock:
+            self._close()
+
+
 class HW_Mgmt_Logger:
     """
     Hardware Management Logger - provides robust logging to files and syslog.
@@ -221,6 +302,9 @@ class HW_Mgmt_Logger:
     LOG_OPTION_PID = syslog.LOG_PID
     DEFAULT_LOG_FACILITY = syslog.LOG_USER
     DEFAULT_LOG_OPTION = syslog.LOG_NDELAY
+    # Send syslog records with own identifier of each logger instead of
+    # process-wide openlog() identifier (several updaters hosted in one process)
+    SYSLOG_OWN_IDENT = False
 
     # File rotation settings
     MAX_LOG_FILE_SIZE = 10485760  # 10 * 1024 * 1024 pre-computed
@@ -230,12 +314,17 @@ class HW_Mgmt_Logger:
     MAX_MSG_HASH_SIZE = 100
     MAX_MSG_TIMEOUT_HASH_SIZE = 50
     MSG_HASH_TIMEOUT = 3600000  # 60 * 60 * 1000 pre-computed
+    MSG_HASH_EXPIRE_INTERVAL = 60000  # expired messages removal period, ms
 
     LOG_REPEAT_UNLIMITED = 4294836225
 
     # Logging error alerting interval (in seconds)
     LOGGING_ERROR_ALERT_INTERVAL = 300  # Re-alert every 5 minutes (300 seconds)
 
+    # Async mode: max records written by writer thread in one batch, idle wakeup (sec)
+    ASYNC_BATCH_SIZE = 64
+    ASYNC_IDLE_TIMEOUT = 1.0
+
     def __init__(self, ident=None, log_file=None, log_level=INFO, syslog_level=CRITICAL, log_repeat=LOG_REPEAT_UNLIMITED, syslog_repeat=LOG_REPEAT_UNLIMITED):
         """
         Initialize the Hardware Management Logger.
@@ -274,11 +363,26 @@ class HW_Mgmt_Logger:
 
         self.log_repeat = log_repeat
         self.syslog_repeat = syslog_repeat
-        self.syslog_hash: Dict[Hashable, _MsgState] = {}    # hash array of the messages which was logged to syslog
-        self.log_hash: Dict[Hashable, _MsgState] = {}    # hash array of the messages which was logged to log
+        # hash arrays of the messages which was logged to syslog/log.
+        # Kept in LRU order: least recently seen message first.
+        self.syslog_hash: Dict[Hashable, _MsgState] = OrderedDict()
+        self.log_hash: Dict[Hashable, _MsgState] = OrderedDict()
+        self.hash_stat = {"evict": 0, "expire": 0}
+        self._hash_expire_ts = 0
         self._lock = threading.Lock()  # Thread safety for all logger operations
         self.log_hash_max_size = self.MAX_MSG_HASH_SIZE
 
+        # Async mode state: ring of pending records drained by writer thread.
+        # _async_io_lock serializes output between writer thread and synchronous flush.
+        self._async_queue = None
+        self._async_cond = threading.Condition()
+        self._async_io_lock = threading.RLock()
+        self._async_thread = None
+        self._async_stop = False
+        self._async_atexit = False
+        self.async_dropped = 0
+        self._async_dropped_unreported = 0
+
         self._set_param(ident, log_file, log_level, syslog_level)
         for level in ("debug", "info", "notice", "warn", "warning", "error", "critical"):
             setattr(self, level, self._make_log_level(level))
@@ -328,13 +432,17 @@ class HW_Mgmt_Logger:
         @param syslog_level: syslog level
         """
         try:
-            self._syslog = syslog
-
             if log_identifier is None:
                 log_identifier = os.path.basename(sys.argv[0])
 
             # Initialize syslog
-            self._syslog.openlog(ident=log_identifier, logoption=log_option, facility=log_facility)
+            if isinstance(self._syslog, _IdentSyslog):
+                self._syslog.closelog()
+            if self.SYSLOG_OWN_IDENT:
+                self._syslog = _IdentSyslog(log_identifier, logoption=log_option, facility=log_facility)
+            else:
+                self._syslog = syslog
+                self._syslog.openlog(ident=log_identifier, logoption=log_option, facility=log_facility)
 
             # Set the default minimum log priority to LOG_PRIORITY_NOTICE
             self._syslog_min_log_priority = syslog_level
@@ -581,6 +689,133 @@ class HW_Mgmt_Logger:
             except Exception as e:
                 print(f"Warning: Failed to write to syslog: {e}")
 
+    def set_async_mode(self, queue_size=0):
+        """
+        @summary:
+            Enable/disable asynchronous output.
+            In async mode caller only enqueues the record to bounded ring, file and syslog
+            output is done by writer thread. When ring is full the oldest record is dropped,
+            the number of dropped records is reported in log by the writer thread.
+            CRITICAL messages flush the ring and are written synchronously.
+        @param queue_size: Max number of pending records. 0 - synchronous output
+        """
+        if not isinstance(queue_size, int) or queue_size < 0:
+            raise ValueError(f"queue_size must be int >= 0, got {queue_size}")
+
+        if self._async_queue is not None:
+            with self._async_cond:
+                self._async_stop = True
+                self._async_cond.notify()
+            if self._async_thread and self._async_thread is not threading.current_thread():
+                # Writer exits after current batch, the rest is flushed below
+                self._async_thread.join(self.ASYNC_IDLE_TIMEOUT)
+            self._async_thread = None
+            with self._async_io_lock:
+                self.flush()
+                with self._async_cond:
+                    self._async_queue = None
+
+        if queue_size:
+            if not self._async_atexit:
+                # Writer is daemon thread - write pending records on interpreter exit
+                atexit.register(_logger_flush_atexit, weakref.ref(self))
+                self._async_atexit = True
+            self._async_stop = False
+            self._async_queue = deque(maxlen=queue_size)
+            self._async_thread = threading.Thread(target=self._async_writer, daemon=True,
+                                                  name="HW_Mgmt_Logger[{:x}]".format(id(self)))
+            self._async_thread.start()
+
+    def _async_put(self, record):
+        """
+        @summary:
+            Add record to async ring
+        @return: False if async mode is disabled
+        """
+        with self._async_cond:
+            queue = self._async_queue
+            if queue is None:
+                return False
+            if len(queue) == queue.maxlen:
+                # deque with maxlen drops the oldest record on append
+                self.async_dropped += 1
+                self._async_dropped_unreported += 1
+            queue.append(record)
+            self._async_cond.notify()
+        return True
+
+    def _async_pop_batch(self):
+        with self._async_cond:
+            queue = self._async_queue
+            if queue is None:
+                return [], 0
+            batch = [queue.popleft() for _ in range(min(len(queue), self.ASYNC_BATCH_SIZE))]
+            dropped = self._async_dropped_unreported
+            self._async_dropped_unreported = 0
+        return batch, dropped
+
+    def _emit(self, level, log_msg, syslog_msg, created=None):
+        """
+        @summary:
+            Write message to log file and/or syslog
+        @param log_msg: message to log file, None - skip
+        @param syslog_msg: message to syslog, None - skip
+        @param created: record time (time.time()), None - now
+        """
+        try:
+            if log_msg is not None:
+                if created is None:
+                    self.logger.log(level, log_msg)
+                else:
+                    record = self.logger.makeRecord(self.logger.name, level, "(unknown file)", 0, log_msg, None, None)
+                    record.created = created
+                    record.msecs = (created - int(created)) * 1000
+                    self.logger.handle(record)
+            if syslog_msg is not None:
+                self.syslog_log(level, syslog_msg)
+        except (IOError, OSError, ValueError) as e:
+            # Use the appropriate message for error reporting
+            error_msg = log_msg if log_msg else syslog_msg
+            print("Error logging message: {} - {}".format(error_msg, e))
+
+    def _async_write_batch(self):
+        """
+        @summary:
+            Write one batch of pending records
+        @return: number of written records
+        """
+        with self._async_io_lock:
+            batch, dropped = self._async_pop_batch()
+            if dropped:
+                msg = "Logger queue overflow: {} messages dropped".format(dropped)
+                self._emit(self.WARNING, msg, msg if self.WARNING >= self._syslog_min_log_priority else None)
+            for level, log_msg, syslog_msg, created in batch:
+                self._emit(level, log_msg, syslog_msg, created)
+        return len(batch)
+
+    def flush(self):
+        """
+        @summary:
+            Write all pending records of async mode in caller thread
+        """
+        if self._async_queue is None:
+            return
+        while self._async_write_batch():
+            pass
+
+    def _async_writer(self):
+        """
+        @summary:
+            Writer thread of async mode: drain ring in batches
+        """
+        while True:
+            with self._async_cond:
+                if not self._async_queue and not self._async_stop:
+                    self._async_cond.wait(self.ASYNC_IDLE_TIMEOUT)
+                if self._async_stop:
+                    return
+            self._async_write_batch()
+
     def _close_log_handler(self):
         """
         @summary:
@@ -602,6 +837,7 @@ class HW_Mgmt_Logger:
         """
         # Clean up only this logger's handlers (don't shutdown all logging)
         self.suspend()
+        self.set_async_mode(0)
 
         self.close_syslog()
         self._close_log_handler()
@@ -675,45 +911,81 @@ class HW_Mgmt_Logger:
         if level >= self.logger.level:
             log_msg, log_emit = self._push_log(msg, id, log_repeat)
 
+        if not log_emit and not syslog_emit:
+            return
+        log_msg = log_msg if log_emit else None
+        syslog_msg = syslog_msg if syslog_emit else None
+
+        if self._async_queue is not None:
+            if level != self.CRITICAL:
+                if self._async_put((level, log_msg, syslog_msg, time.time())):
+                    return
+            else:
+                # CRITICAL: write pending records and the message synchronously
+                with self._async_io_lock:
+                    self.flush()
+                    self._emit(level, log_msg, syslog_msg)
+                return
+
         # Perform actual logging operations (thread-safe)
-        try:
-            if log_emit:
-                self.logger.log(level, log_msg)
-            if syslog_emit:
-                self.syslog_log(level, syslog_msg)
-        except (IOError, OSError, ValueError) as e:
-            # Use the appropriate message for error reporting
-            error_msg = log_msg if log_msg else syslog_msg
-            print("Error logging message: {} - {}".format(error_msg, e))
+        self._emit(level, log_msg, syslog_msg)
 
-    def _msg_hash_garbage_collect(self, log_hash):
+    def _msg_hash_garbage_collect(self, log_hash, now=None):
         """
         @summary:
-            Remove from log_hash all messages older than MSG_HASH_TIMEOUT milliseconds or if hash is too big
+            Remove from log_hash messages older than MSG_HASH_TIMEOUT milliseconds and
+            least recently seen messages over log_hash_max_size.
+            Hash is kept in LRU order, so only removed entries are visited.
+        @param log_hash: message hash (OrderedDict)
+        @param now: current time (ms), default current_milli_time()
         """
-        hash_size = len(log_hash)
-
-        # don't clean up if hash size < log_hash_max_size
-        if hash_size > self.log_hash_max_size:
-            # some major issue. We never expect to have more than log_hash_max_size messages in hash.
-            # Use print instead of logger to avoid potential circular logging issues
-            print("hash_garbage_collect: too many ({}) messages in hash. Remove all messages.".format(hash_size))
-            log_hash.clear()  # Clear the actual dictionary, not reassign local variable
-            return
-
-        if hash_size > self.MAX_MSG_TIMEOUT_HASH_SIZE:
-            # some messages were not cleaned up.
-            # remove messages older than MSG_HASH_TIMEOUT milliseconds
+        self._msg_hash_evict(log_hash)
+        if now is None:
             now = current_milli_time()
-            cutoff_time = now - self.MSG_HASH_TIMEOUT
-
-            # More efficient: build list of keys to delete and batch delete
-            expired_keys = [key for key, msg_state in log_hash.items() if msg_state.last_seen < cutoff_time]
-
-            for key in expired_keys:
-                msg_state = log_hash.pop(key)
-                # Use print instead of logger to avoid potential circular logging issues
-                print("hash_garbage_collect: removed message \"{}\" last seen at {} from hash".format(msg_state.msg, msg_state.last_seen))
+        cutoff_time = now - self.MSG_HASH_TIMEOUT
+        while log_hash:
+            key = next(iter(log_hash))
+            msg_state = log_hash[key]
+            if msg_state.last_seen >= cutoff_time:
+                break
+            del log_hash[key]
+            self.hash_stat["expire"] += 1
+
+    def _msg_hash_evict(self, log_hash, keep=None):
+        """
+        @summary:
+            Remove least recently seen messages while log_hash is bigger than log_hash_max_size.
+            Only messages which are still logged (seen_count <= max_repeat) are evicted.
+            Collapsed messages are removed by expiry only: evicting them would log them
+            again on the next occurrence, so hash can stay bigger than log_hash_max_size
+            while it holds collapsed messages.
+        @param log_hash: message hash (OrderedDict)
+        @param keep: key of just added message, not evicted
+        """
+        excess = len(log_hash) - self.log_hash_max_size
+        if excess <= 0:
+            return
+        evict_keys = []
+        for key, msg_state in log_hash.items():
+            if msg_state.seen_count <= msg_state.max_repeat and key != keep:
+                evict_keys.append(key)
+                if len(evict_keys) == excess:
+                    break
+        for key in evict_keys:
+            del log_hash[key]
+        self.hash_stat["evict"] += len(evict_keys)
+
+    def get_hash_stat(self):
+        """
+        @summary:
+            Get repeat-collapse hash statistics
+        @return: dict with evict/expire counters and current log/syslog hash size
+        """
+        with self._lock:
+            ret = dict(self.hash_stat)
+            ret["log_hash_size"] = len(self.log_hash)
+            ret["syslog_hash_size"] = len(self.syslog_hash)
+        return ret
 
     def _push_syslog(self, msg="", id=None, repeat=None):
         with self._lock:
@@ -761,6 +1033,10 @@ class HW_Mgmt_Logger:
 
         # msg is not empty
         now = current_milli_time()
+        if now >= self._hash_expire_ts:
+            self._hash_expire_ts = now + self.MSG_HASH_EXPIRE_INTERVAL
+            self._msg_hash_garbage_collect(self.log_hash, now)
+            self._msg_hash_garbage_collect(self.syslog_hash, now)
         if msg:
             if repeat == 0:
                 log_emit = False
@@ -770,6 +1046,7 @@ class HW_Mgmt_Logger:
                     if msg_state:
                         msg_state.last_seen = now
                         msg_state.seen_count += 1
+                        log_hash.move_to_end(id_hash)
                     else:
                         msg_state = _MsgState(
                             first_seen=now,
@@ -779,7 +1056,7 @@ class HW_Mgmt_Logger:
                             max_repeat=repeat,
                         )
                         log_hash[id_hash] = msg_state
-                        self._msg_hash_garbage_collect(log_hash)
+                        self._msg_hash_evict(log_hash, keep=id_hash)
                     if msg_state.seen_count <= msg_state.max_repeat:
                         log_emit = True
                 else:
@@ -893,6 +1170,709 @@ class RepeatedTimer:
         return self._thread is not None and self._thread.is_alive()
 
 # ----------------------------------------------------------------------
+
+
+class ScheduledJob:
+    """
+    @summary: Periodic job registered in JobScheduler.
+        Provides RepeatedTimer compatible start()/stop()/is_running() interface.
+    """
+
+    def __init__(self, scheduler, function, interval, priority=0, jitter=0.0, name=None):
+        self.scheduler = scheduler
+        self.func = function
+        self.interval = interval
+        self.priority = priority
+        self.jitter = jitter
+        self.name = name or getattr(function, "__name__", "job")
+        self.active = False
+        # drift-free schedule grid and actual (jittered) due time, ms
+        self.base_ts = 0
+        self.due_ts = 0
+        self.seq = 0
+        # wake requested while job is due or running
+        self.wake_pending = False
+        self.stat = {}
+        self.reset_stat()
+
+    def reset_stat(self):
+        """
+        @summary:
+            Reset job runtime accounting
+        """
+        self.stat = {"run_cnt": 0, "err_cnt": 0, "skip_cnt": 0,
+                     "runtime_ms": 0.0, "runtime_max_ms": 0.0,
+                     "late_ms": 0, "late_max_ms": 0}
+
+    def start(self, immediately_run=False):
+        """
+        @summary:
+            Schedule job (if it not scheduled). First run is done immediately in scheduler thread.
+        @param immediately_run: Also run function in caller thread before scheduling
+        """
+        if immediately_run:
+            self.func()
+        self.scheduler.start_job(self)
+
+    def stop(self):
+        """
+        @summary:
+            Remove job from schedule. Running job is not interrupted.
+        @return: True
+        """
+        self.scheduler.stop_job(self)
+        return True
+
+    def is_running(self):
+        """
+        @summary:
+            Return True if the job is scheduled
+        """
+        return self.active
+
+    def wake(self):
+        """
+        @summary:
+            Run job as soon as possible, periodic schedule continues from this run
+        """
+        if self.scheduler:
+            self.scheduler.wake_job(self)
+        else:
+            self.due_ts = 0
+
+    def set_interval(self, interval):
+        """
+        @summary:
+            Change job interval. Next run is moved earlier if new interval is shorter.
+        @param interval: Interval in seconds
+        """
+        if self.scheduler:
+            self.scheduler.set_job_interval(self, interval)
+        else:
+            self.interval = interval
+
+# ----------------------------------------------------------------------
+
+
+def hwmon_lookup(fin):
+    """
+    @summary: Resolve hwmon device name of "fin" path
+    @param fin: Path with hwmon device, e.g. /sys/devices/platform/mlxplat/mlxreg-io/hwmon/{hwmon}/fan1
+    @return: hwmon device name (hwmonN), "" if not available
+    """
+    path = fin.split("hwmon")[0]
+    try:
+        flist = os.listdir(os.path.join(path, "hwmon"))
+        return [fn for fn in flist if "hwmon" in fn][0]
+    except (OSError, IndexError):
+        return ""
+
+
+class AttrEntry(ScheduledJob):
+    """
+    @summary: Updater attribute entry ({'fin', 'fn', 'arg', 'poll'} dict) compiled to scheduled job.
+        Handler function is resolved once, "fin" path is formatted with hwmon device name.
+        Job runs run_fn(entry), poll is job interval.
+    """
+
+    def __init__(self, attr, handlers, scheduler=None, run_fn=None):
+        """
+        @param attr: Attribute property dictionary
+        @param handlers: Namespace to resolve handler ("fn") in (module globals)
+        @param scheduler: JobScheduler
+        @param run_fn: Function to run entry with: run_fn(entry)
+        @raise KeyError: handler is not defined
+        """
+        self.fn_name = attr["fn"]
+        self.fn = handlers[self.fn_name]
+        self.arg = attr.get("arg")
+        self.fin_tmpl = attr.get("fin")
+        self.hwmon = attr.get("hwmon", "")
+        self.fin = self.fin_tmpl.format(hwmon=self.hwmon) if self.fin_tmpl else None
+        self.run_fn = run_fn
+        # configured poll interval while it is relaxed by change notification
+        self.poll_cfg = None
+        self.oldval = None
+        self.watch = "poll"
+        super().__init__(scheduler, self._run, attr["poll"], name=self._get_name())
+
+    def _get_name(self):
+        return self.fin or "{}({})".format(self.fn_name, str(self.arg)[:48])
+
+    def _run(self):
+        self.run_fn(self)
+
+    @property
+    def poll(self):
+        return self.interval
+
+    def resolve_fin(self):
+        """
+        @summary: Resolve hwmon device of "fin" path again (renumbered on driver reload)
+        @return: True if "fin" path is changed
+        """
+        if not self.fin_tmpl or "{hwmon}" not in self.fin_tmpl:
+            return False
+        hwmon = hwmon_lookup(self.fin_tmpl)
+        if hwmon == self.hwmon:
+            return False
+        self.hwmon = hwmon
+        self.fin = self.fin_tmpl.format(hwmon=hwmon)
+        self.name = self._get_name()
+        return True
+
+# ----------------------------------------------------------------------
+
+
+class JobScheduler:
+    """
+    @summary: Run periodic jobs from single thread.
+        Jobs are kept in min-heap by due time, the thread sleeps until the nearest due job.
+        - drift compensation: next run is scheduled on fixed grid (previous due + interval),
+          job runtime and wakeup lateness do not shift the schedule. Periods missed
+          because of overrun are skipped and counted.
+        - jitter: random delay up to jitter * interval added to each run to spread jobs
+          with the same interval.
+        - priority: jobs which are due at the same wakeup run in priority order (higher first).
+        - per-job accounting of run count, runtime and lateness (start time - due time).
+        - wake: job can be run out of schedule (change notification), interval can be changed.
+        Scheduler can run jobs in its own thread (start()) or in the caller loop (run_pending()).
+    """
+    THREAD_STOP_TIMEOUT = 0.2
+
+    def __init__(self, name="JobScheduler", logger=None, slow_ms=None):
+        """
+        @param name: Scheduler thread name
+        @param logger: HW_Mgmt_Logger for job errors and slow runs (default: print errors)
+        @param slow_ms: Job run longer than this (ms) is reported, None - not reported
+        """
+        self.name = name
+        self.logger = logger
+        self.slow_ms = slow_ms
+        self.stat = {"run": 0, "wake": 0, "slow": 0}
+        self._heap = []
+        self._seq = 0
+        self._jobs = []
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.wakeup_cnt = 0
+
+    def __del__(self):
+        """
+        @summary:
+            Ensure scheduler thread is stopped during cleanup
+        """
+        try:
+            self.stop()
+        except Exception:
+            pass
+
+    def add_job(self, function, interval, priority=0, jitter=0.0, auto_start=False, name=None):
+        """
+        @summary: Register periodic job
+        @param function: function to run
+        @param interval: Interval in seconds
+        @param priority: Job priority. Higher value runs first when several jobs are due
+        @param jitter: Max random delay of each run as fraction of interval (0..1)
+        @param auto_start: If True, schedule the job immediately
+        @param name: Job name for statistics (default: function name)
+        @return: ScheduledJob
+        """
+        if not 0 <= jitter < 1:
+            raise ValueError(f"jitter must be in range 0..1, got {jitter}")
+        return self._add(ScheduledJob(self, function, interval, priority, jitter, name), auto_start)
+
+    def add_entry(self, attr, handlers, run_fn):
+        """
+        @summary: Compile updater attribute entry and schedule it for immediate run
+        @param attr: Attribute property dictionary
+        @param handlers: Namespace to resolve handler ("fn") in (module globals)
+        @param run_fn: Function to run entry with: run_fn(entry)
+        @return: AttrEntry
+        @raise KeyError: handler is not defined
+        """
+        return self._add(AttrEntry(attr, handlers, self, run_fn), True)
+
+    def _add(self, job, auto_start):
+        if job.interval <= 0:
+            raise ValueError(f"interval must be > 0, got {job.interval}")
+        with self._cond:
+            self._jobs.append(job)
+        if auto_start:
+            job.start()
+        return job
+
+    def get_jobs(self):
+        """
+        @summary: Get registered jobs
+        @return: list of ScheduledJob
+        """
+        with self._cond:
+            return list(self._jobs)
+
+    def remove_job(self, job):
+        """
+        @summary: Unregister job
+        @param job: ScheduledJob returned by add_job()
+        """
+        self.stop_job(job)
+        with self._cond:
+            if job in self._jobs:
+                self._jobs.remove(job)
+
+    def _push(self, job):
+        # Heap entry is (due_ts, -priority, seq, job). Stale entries are dropped by seq mismatch.
+        self._seq += 1
+        job.seq = self._seq
+        heapq.heappush(self._heap, (job.due_ts, -job.priority, job.seq, job))
+
+    def _set_due(self, job, base_ts):
+        job.base_ts = base_ts
+        job.due_ts = base_ts
+        if job.jitter:
+            job.due_ts += int(random.random() * job.jitter * job.interval * 1000)
+
+    def start_job(self, job):
+        """
+        @summary: Schedule job to run now and then periodically
+        @param job: ScheduledJob
+        """
+        with self._cond:
+            if job.active:
+                return
+            job.active = True
+            self._set_due(job, current_milli_time())
+            self._push(job)
+            self._cond.notify()
+
+    def stop_job(self, job):
+        """
+        @summary: Remove job from schedule
+        @param job: ScheduledJob
+        """
+        with self._cond:
+            job.active = False
+            self._cond.notify()
+
+    def wake_job(self, job):
+        """
+        @summary: Run job as soon as possible. Wake of due or running job is kept for the next run.
+        @param job: ScheduledJob
+        """
+        with self._cond:
+            self.stat["wake"] += 1
+            if not job.active:
+                return
+            now = current_milli_time()
+            if job.due_ts > now:
+                self._set_due(job, now)
+                self._push(job)
+                self._cond.notify()
+            else:
+                job.wake_pending = True
+
+    def set_job_interval(self, job, interval):
+        """
+        @summary: Change job interval. Next run is moved earlier if new interval is shorter.
+        @param job: ScheduledJob
+        @param interval: Interval in seconds
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        with self._cond:
+            job.interval = interval
+            if not job.active:
+                return
+            base_ts = current_milli_time() + interval * 1000
+            if base_ts < job.due_ts:
+                self._set_due(job, base_ts)
+                self._push(job)
+                self._cond.notify()
+
+    def _pop_due(self, now):
+        due_list = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, seq, job = heapq.heappop(self._heap)
+            if job.active and job.seq == seq:
+                job.wake_pending = False
+                due_list.append(job)
+        due_list.sort(key=lambda job: (-job.priority, job.due_ts))
+        return due_list
+
+    def _run_job(self, job):
+        # lateness includes wait for jobs which ran before in the same wakeup
+        late_ms = max(0, current_milli_time() - job.due_ts)
+        start = time.perf_counter()
+        try:
+            job.func()
+        except Exception as e:
+            job.stat["err_cnt"] += 1
+            if self.logger:
+                self.logger.error(f"Error in periodic task {job.name}: {e}", id=f"{job.name} job_error")
+            else:
+                print(f"Error in periodic task {job.name}: {e}")
+        finally:
+            runtime_ms = (time.perf_counter() - start) * 1000
+            stat = job.stat
+            stat["run_cnt"] += 1
+            stat["runtime_ms"] += runtime_ms
+            stat["runtime_max_ms"] = max(stat["runtime_max_ms"], runtime_ms)
+            stat["late_ms"] += late_ms
+            stat["late_max_ms"] = max(stat["late_max_ms"], late_ms)
+            self.stat["run"] += 1
+            if self.slow_ms is not None and runtime_ms > self.slow_ms:
+                self.stat["slow"] += 1
+                if self.logger:
+                    self.logger.warning(f"{job.name} took {int(runtime_ms)} ms", id=f"{job.name} slow_run")
+
+    def _reschedule(self, job):
+        interval_ms = job.interval * 1000
+        now = current_milli_time()
+        if job.wake_pending:
+            # woken while running: run again, schedule continues from now
+            job.wake_pending = False
+            self._set_due(job, now)
+            self._push(job)
+            return
+        base_ts = job.base_ts + interval_ms
+        if base_ts <= now:
+            # overrun: skip missed periods, keep grid
+            missed = int((now - base_ts) // interval_ms) + 1
+            job.stat["skip_cnt"] += missed
+            base_ts += missed * interval_ms
+        self._set_due(job, base_ts)
+        self._push(job)
+
+    def run_pending(self, now=None, stop=None):
+        """
+        @summary: Run all due jobs in caller thread
+        @param now: Current time (ms), default current_milli_time()
+        @param stop: Function returning True to stop before next job. Jobs which are
+            not run (stop, exception) stay due.
+        @return: Number of jobs which were run
+        """
+        if now is None:
+            now = current_milli_time()
+        with self._cond:
+            due_list = self._pop_due(now)
+        cnt = 0
+        try:
+            for job in due_list:
+                if stop is not None and stop():
+                    break
+                self._run_job(job)
+                with self._cond:
+                    if job.active:
+                        self._reschedule(job)
+                cnt += 1
+        finally:
+            if cnt < len(due_list):
+                with self._cond:
+                    for job in due_list[cnt:]:
+                        if job.active:
+                            self._push(job)
+        return cnt
+
+    def get_next_timeout(self, max_timeout=None):
+        """
+        @summary: Get time until nearest due job
+        @param max_timeout: Upper limit (sec) of returned value
+        @return: Timeout in seconds (0 if job is due), max_timeout (or None) if no jobs scheduled
+        """
+        with self._cond:
+            while self._heap and not (self._heap[0][3].active and self._heap[0][3].seq == self._heap[0][2]):
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return max_timeout
+            timeout = max(0, self._heap[0][0] - current_milli_time()) / 1000
+        if max_timeout is not None:
+            timeout = min(timeout, max_timeout)
+        return timeout
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            with self._cond:
+                timeout = None
+                if self._heap:
+                    timeout = max(0, self._heap[0][0] - current_milli_time()) / 1000
+                if timeout != 0:
+                    self._cond.wait(timeout)
+            if self._stop_event.is_set():
+                break
+            self.wakeup_cnt += 1
+            self.run_pending()
+
+    def start(self):
+        """
+        @summary:
+            Start scheduler thread (if it not running)
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+        self._thread.start()
+
+    def stop(self):
+        """
+        @summary:
+            Stop scheduler thread. Jobs stay registered.
+        @return: True if thread stopped successfully, False if still alive after timeout
+        """
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify()
+        if self._thread:
+            if self._thread is threading.current_thread():
+                return True
+            self._thread.join(timeout=self.THREAD_STOP_TIMEOUT)
+            if self._thread.is_alive():
+                print("Warning: JobScheduler thread still alive after stop timeout")
+                return False
+            self._thread = None
+        return True
+
+    def is_running(self):
+        """
+        @summary:
+            Return True if the scheduler thread is running
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_stat(self):
+        """
+        @summary: Get per-job accounting
+        @return: dict {job name: stat dict} with runtime_avg_ms and late_avg_ms added
+        """
+        ret = {}
+        with self._cond:
+            jobs = list(self._jobs)
+        for job in jobs:
+            stat = dict(job.stat)
+            run_cnt = stat["run_cnt"] or 1
+            stat["runtime_avg_ms"] = stat["runtime_ms"] / run_cnt
+            stat["late_avg_ms"] = stat["late_ms"] / run_cnt
+            ret[job.name] = stat
+        return ret
+
+    def report(self, top=5):
+        """
+        @summary: Scheduler totals and accounting of jobs with longest runs
+        @param top: Number of jobs to report
+        @return: List of report lines
+        """
+        jobs = self.get_jobs()
+        lines = ["Jobs: {} runs {run} wakes {wake} slow {slow}".format(len(jobs), **self.stat)]
+        for job in sorted(jobs, key=lambda job: job.stat["runtime_max_ms"], reverse=True)[:top]:
+            stat = job.stat
+            if not stat["run_cnt"]:
+                continue
+            lines.append("  {}: runs {} avg {:.1f} ms max {:.1f} ms late max {} ms".format(
+                job.name, stat["run_cnt"], stat["runtime_ms"] / stat["run_cnt"], stat["runtime_max_ms"],
+                stat["late_max_ms"]))
+        return lines
+
+# ----------------------------------------------------------------------
+
+
+class FileHandleCache:
+    """
+    @summary: Cache of open read-only descriptors of sysfs/tmpfs attribute files.
+        Attribute is re-read by pread(fd, size, 0) instead of stat/open/read/close
+        sequence. For sysfs read from offset 0 re-runs the attribute show() handler,
+        for tmpfs it returns the current file content.
+        Descriptor is dropped and file re-opened when:
+        - read from descriptor fails with ENOENT/ENODEV/ESTALE/ENXIO/EBADF (device removed)
+        - path points to another inode (link re-created or file replaced by rename).
+          Path is re-validated by stat() not more often than revalidate_ms.
+        Number of open descriptors is limited by max_size, least recently used
+        descriptor is closed first.
+    """
+    READ_SIZE = 4096
+    INVALIDATE_ERRNO = (errno.ENOENT, errno.ENODEV, errno.ESTALE, errno.ENXIO, errno.EBADF)
+
+    def __init__(self, max_size=256, revalidate_ms=1000):
+        """
+        @summary: Create file handle cache
+        @param max_size: Max number of open descriptors
+        @param revalidate_ms: Interval (ms) of path to inode re-validation. 0 - validate on each access
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        self.max_size = max_size
+        self.revalidate_ms = revalidate_ms
+        # path -> [fd, st_dev, st_ino, last validation timestamp]
+        self._handles = OrderedDict()
+        self._lock = threading.Lock()
+        self.stat = {}
+        self.reset_stat()
+
+    def __del__(self):
+        """
+        @summary:
+            Close all cached descriptors
+        """
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def reset_stat(self):
+        """
+        @summary:
+            Reset cache counters
+        """
+        with self._lock:
+            self.stat = {"hit": 0, "miss": 0, "reopen": 0, "evict": 0}
+
+    def get_stat(self):
+        """
+        @summary:
+            Get cache counters
+        @return: dict hit/miss/reopen/evict and number of open descriptors
+        """
+        with self._lock:
+            ret = dict(self.stat)
+            ret["open"] = len(self._handles)
+        return ret
+
+    def _drop(self, path):
+        entry = self._handles.pop(path, None)
+        if entry:
+            try:
+                os.close(entry[0])
+            except OSError:
+                pass
+
+    def _validate(self, path, entry, now):
+        """
+        @summary:
+            Check that cached descriptor still belongs to path. Drop entry if not.
+        @return: True if entry valid, False if entry dropped
+        @raise: OSError from stat() if path not accessible (entry dropped)
+        """
+        if now - entry[3] < self.revalidate_ms:
+            return True
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._drop(path)
+            raise
+        if st.st_ino != entry[2] or st.st_dev != entry[1]:
+            self._drop(path)
+            return False
+        entry[3] = now
+        return True
+
+    @classmethod
+    def _pread(cls, fd):
+        data = os.pread(fd, cls.READ_SIZE, 0)
+        if len(data) == cls.READ_SIZE:
+            chunk = data
+            while len(chunk) == cls.READ_SIZE:
+                chunk = os.pread(fd, cls.READ_SIZE, len(data))
+                data += chunk
+        return data
+
+    def _open(self, path, now):
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                os.close(fd)
+                return None
+            data = self._pread(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._handles[path] = [fd, st.st_dev, st.st_ino, now]
+        while len(self._handles) > self.max_size:
+            _, entry = self._handles.popitem(last=False)
+            try:
+                os.close(entry[0])
+            except OSError:
+                pass
+            self.stat["evict"] += 1
+        return data
+
+    def read(self, path):
+        """
+        @summary:
+            Read whole file content using cached descriptor
+        @param path: full path to file
+        @return: file content (str) or None if file not exists or not a regular file
+        @raise: OSError on read errors other than device/file removal
+        """
+        now = current_milli_time()
+        with self._lock:
+            reopen = False
+            entry = self._handles.get(path)
+            if entry:
+                try:
+                    if not self._validate(path, entry, now):
+                        entry = None
+                        reopen = True
+                except FileNotFoundError:
+                    return None
+            if entry:
+                try:
+                    data = self._pread(entry[0])
+                    self._handles.move_to_end(path)
+                    self.stat["hit"] += 1
+                    return data.decode()
+                except OSError as e:
+                    if e.errno not in self.INVALIDATE_ERRNO:
+                        raise
+                    self._drop(path)
+                    reopen = True
+
+            self.stat["reopen" if reopen else "miss"] += 1
+            try:
+                data = self._open(path, now)
+            except FileNotFoundError:
+                return None
+            return data.decode() if data is not None else None
+
+    def is_file(self, path):
+        """
+        @summary:
+            Check if path is regular file. Served without syscall for recently validated descriptors.
+        @param path: full path to file
+        @return: True if path is regular file
+        """
+        now = current_milli_time()
+        with self._lock:
+            entry = self._handles.get(path)
+            if entry:
+                try:
+                    if self._validate(path, entry, now):
+                        return True
+                except OSError:
+                    return False
+        return os.path.isfile(path)
+
+    def invalidate(self, path=None):
+        """
+        @summary:
+            Close cached descriptor of path
+        @param path: full path to file. None - close all descriptors
+        """
+        with self._lock:
+            if path is None:
+                for path_ in list(self._handles):
+                    self._drop(path_)
+            else:
+                self._drop(path)
+
+    def close(self):
+        """
+        @summary:
+            Close all cached descriptors
+        """
+        self.invalidate()
+
+# ----------------------------------------------------------------------
 # Memory analysis tools
 # ----------------------------------------------------------------------
 
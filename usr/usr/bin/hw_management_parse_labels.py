@@ -22,6 +22,7 @@ import argparse
 import json
 import pickle
 import re
+import sys
 
 HW_MGMT_PATH = "/var/run/hw-management/"
 HW_MGMT_CACHE = f"{HW_MGMT_PATH}.cache/"
@@ -99,6 +100,63 @@ def retrieve_value(dictionary, label, key):
     return None
 
 
+class LabelIndex:
+    """
+    Precompiled lookup index for one label section of the dictionary.
+    Returns the same value as retrieve_value(): the value of the first
+    pattern in section order which re.match() the key.
+    Literal pattern equal to the key is resolved by dict lookup if no
+    earlier pattern matches it, otherwise patterns are checked in order.
+    """
+
+    def __init__(self, section):
+        self.patterns = []
+        self.exact = {}
+        self.memo = {}
+        literals = set()
+        regex_list = []
+        for pattern, value in (section or {}).items():
+            compiled = re.compile(pattern)
+            self.patterns.append((compiled, value))
+            if re.escape(pattern) == pattern:
+                # Earlier literal matches only as a prefix, earlier regex is checked directly
+                shadowed = any(pattern[:idx] in literals for idx in range(len(pattern) + 1))
+                if not shadowed:
+                    shadowed = any(regex.match(pattern) for regex in regex_list)
+                if not shadowed:
+                    self.exact[pattern] = value
+                literals.add(pattern)
+            else:
+                regex_list.append(compiled)
+
+    def lookup(self, key):
+        if key in self.exact:
+            return self.exact[key]
+        if key in self.memo:
+            return self.memo[key]
+        value = None
+        for compiled, pattern_value in self.patterns:
+            if compiled.match(key):
+                value = pattern_value
+                break
+        self.memo[key] = value
+        return value
+
+
+def retrieve_bulk(dictionary, label, scale_label, keys):
+    # Retrieve label and scale values for all keys with one index per label section
+    label_index = LabelIndex(dictionary.get(label))
+    scale_index = LabelIndex(dictionary.get(scale_label))
+    return [(key, label_index.lookup(key), scale_index.lookup(key)) for key in keys]
+
+
+def format_bulk_line(key, value, scale):
+    # Tab separated "key label scale", missing value is an empty field
+    return "{}\t{}\t{}".format(key,
+                                "" if value is None else value,
+                                "" if scale is None else scale)
+
+
 def main():
     parser = argparse.ArgumentParser(description='JSON Dictionary')
     parser.add_argument('--json_file', help='Path to JSON file')
@@ -107,6 +165,9 @@ def main():
     parser.add_argument('--label', help='Label section in the json file')
     parser.add_argument('--key', help='Key for value retrieval')
     parser.add_argument('--sku', help='Board SKU number')
+    parser.add_argument('--bulk', action='store_true',
+                        help='Read keys from stdin (one per line) and print "key<TAB>label<TAB>scale" for each key')
+    parser.add_argument('--scale_label', help='Scale section in the json file for --bulk')
 
     args = parser.parse_args()
 
@@ -131,6 +192,17 @@ def main():
         else:
             print("")
 
+    elif args.bulk and (args.label or args.sku):
+        # Resolve all keys from stdin in one process
+        label = args.label if args.label else f"labels_{args.sku}_rev1_array"
+        scale_label = args.scale_label
+        if not scale_label and args.sku:
+            scale_label = f"labels_scale_{args.sku}_rev1_array"
+        dictionary = load_dictionary(args.dictionary_file)
+        keys = [line.strip() for line in sys.stdin if line.strip()]
+        for key, value, scale in retrieve_bulk(dictionary, label, scale_label, keys):
+            print(format_bulk_line(key, value, scale))
+
     else:
         parser.print_help()
 
@@ -38,22 +38,28 @@
 
 try:
     import os
+    import ctypes
     import json
     import re
     import argparse
     import traceback
     import signal
     import threading
+    import select
     import shlex
+    import struct
+    import subprocess
+    import time
     import psutil
     from hw_management_lib import (
         HW_Mgmt_Logger as Logger,
         exit_wait,
-        current_milli_time,
+        JobScheduler,
+        hwmon_lookup,
     )
     from collections import Counter
 
-    from hw_management_redfish_client import RedfishClient, BMCAccessor
+    from hw_management_redfish_client import RedfishClient, BMCAccessor, RedfishResponseCache, RedfishEventStream
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found")
 
@@ -114,6 +120,8 @@ class CONST(object):
     DBG_MEMORY_USAGE_ALERT = 30000    # KB
     DBG_MEMORY_USAGE_ALERT_STEP = 5000  # KB
     PERIODIC_MEMORY_REPORT_TIME = 5 * 60  # 5 min
+    # Attribute entry run longer than this (ms) is reported
+    ATTR_SLOW_RUN_MS = 1000
 
 
 EXIT = threading.Event()
@@ -323,6 +331,12 @@ class RedfishConnection:
     reconnection on failures.
     """
     _instance = None
+    # Main loop and RedfishEventListener thread share the connection
+    _lock = threading.Lock()
+    # RedfishClient request transport: RedfishClient.TRANSPORT_CURL or TRANSPORT_HTTP
+    transport = None
+    # RedfishResponseCache for GET responses, None - no caching
+    cache = None
 
     @classmethod
     def get_instance(cls):
@@ -330,12 +344,13 @@ class RedfishConnection:
         @summary: Get or create the singleton Redfish connection
         @return: BMCAccessor object or None if connection failed
         """
-        if cls._instance is None:
-            bmc_accessor = BMCAccessor()
-            ret = bmc_accessor.login()
-            if ret == RedfishClient.ERR_CODE_OK:
-                cls._instance = bmc_accessor
-        return cls._instance
+        with cls._lock:
+            if cls._instance is None:
+                bmc_accessor = BMCAccessor(transport=cls.transport, cache=cls.cache)
+                ret = bmc_accessor.login()
+                if ret == RedfishClient.ERR_CODE_OK:
+                    cls._instance = bmc_accessor
+            return cls._instance
 
     @classmethod
     def reset_instance(cls):
@@ -370,6 +385,18 @@ redfish_attr = {"Temperature": {"folder": "/var/run/hw-management/thermal",
                             }
                 }
 
+# Sensors collection request with member resources inline (DSP0266 $expand)
+REDFISH_SENSOR_EXPAND_QUERY = "?$expand=.($levels=1)"
+# Minimal number of sensors in one collection to read them by collection request
+REDFISH_SENSOR_GROUP_MIN = 2
+# Sensors collections for which BMC does not support $expand
+REDFISH_EXPAND_UNSUPPORTED = set()
+# BMC sensors poll interval (sec) while EventService stream is up (liveness check)
+REDFISH_EVENT_LIVENESS_POLL = 300
+# EventService stream reconnect backoff (sec)
+REDFISH_EVENT_RECONNECT_MIN = 5
+REDFISH_EVENT_RECONNECT_MAX = 300
+
 # ----------------------------------------------------------------------
 
 
@@ -439,6 +466,18 @@ def redfish_get_sensor(argv, _dummy):
     """
     sensor_path = argv[0]
     response = redfish_get_req(sensor_path)
+    redfish_write_sensor(response, argv[1], argv[2])
+
+# ----------------------------------------------------------------------
+
+
+def redfish_write_sensor(response, sensor_name, sensor_scale):
+    """
+    @summary: Write Redfish sensor reading and thresholds to hw-management sysfs
+    @param response: Redfish Sensor resource as dictionary (None - skip)
+    @param sensor_name: hw-management sensor name
+    @param sensor_scale: Reading multiplier
+    """
     if not response:
         return
     if response["Status"]["State"] != "Enabled":
@@ -455,8 +494,6 @@ def redfish_get_sensor(argv, _dummy):
         return
 
     sensor_path = sensor_redfish_attr["folder"]
-    sensor_name = argv[1]
-    sensor_scale = argv[2]
     sensor_attr = {sensor_name: int(response["Reading"] * sensor_scale)}
     for responce_trh_name in response["Thresholds"].keys():
         if responce_trh_name in sensor_redfish_attr.keys():
@@ -472,32 +509,373 @@ def redfish_get_sensor(argv, _dummy):
 # ----------------------------------------------------------------------
 
 
+def redfish_expand_members(response):
+    """
+    @summary: Get expanded members of Redfish Sensors collection response
+    @param response: Sensors collection response as dictionary
+    @return: Dictionary {sensor_path: sensor resource}, or None if collection
+        members are not expanded (BMC does not support $expand)
+    """
+    if "Members" not in response:
+        return None
+
+    sensors = {}
+    for member in response["Members"]:
+        member_path = member.get("@odata.id")
+        # $expand not supported: members are links only
+        if not member_path or "Status" not in member:
+            return None
+        sensors[member_path] = member
+    return sensors
+
+# ----------------------------------------------------------------------
+
+
+def redfish_get_sensors(argv, _dummy):
+    """
+    @summary: Read group of sensors of one Redfish Sensors collection and write to hw-management sysfs.
+        Collection is read by single $expand request. Falls back to per-sensor GET
+        if BMC does not support $expand or if sensor is missing in collection.
+    @param argv: List containing [collection_path, [[sensor_path, sensor_name, sensor_scale], ...]]
+    @param _dummy: Unused parameter (for interface compatibility)
+    """
+    collection_path, sensor_list = argv
+    sensors = None
+    if collection_path not in REDFISH_EXPAND_UNSUPPORTED:
+        response = redfish_get_req(collection_path + REDFISH_SENSOR_EXPAND_QUERY)
+        if not response:
+            # BMC not accessible, skip the group like redfish_get_sensor does
+            return
+        sensors = redfish_expand_members(response)
+        if sensors is None:
+            LOGGER.notice("{}: $expand not supported, use per-sensor request".format(collection_path))
+            REDFISH_EXPAND_UNSUPPORTED.add(collection_path)
+
+    for sensor_path, sensor_name, sensor_scale in sensor_list:
+        try:
+            if sensors and sensor_path in sensors:
+                response = sensors[sensor_path]
+            else:
+                response = redfish_get_req(sensor_path)
+            redfish_write_sensor(response, sensor_name, sensor_scale)
+        except ShutdownRequested:
+            raise
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Bad sensor should not stop update of the rest of the group
+            LOGGER.warning("{}: sensor update failed: {}".format(sensor_path, e), id="redfish_get_sensors {}".format(sensor_path))
+
+# ----------------------------------------------------------------------
+
+
+def redfish_group_sensors(sys_attr):
+    """
+    @summary: Replace redfish_get_sensor entries of the same Sensors collection and
+        poll interval with single redfish_get_sensors entry
+    @param sys_attr: List of attribute property dictionaries
+    @return: New list of attribute property dictionaries
+    """
+    groups = {}
+    for attr in sys_attr:
+        if attr.get("fn") != "redfish_get_sensor":
+            continue
+        collection_path = os.path.dirname(attr["arg"][0])
+        if not collection_path.endswith("/Sensors"):
+            continue
+        groups.setdefault((collection_path, attr["poll"]), []).append(attr)
+
+    grouped = {}
+    for (collection_path, poll), attr_list in groups.items():
+        if len(attr_list) < REDFISH_SENSOR_GROUP_MIN:
+            continue
+        group_attr = {"fin": None, "fn": "redfish_get_sensors",
+                      "arg": [collection_path, [list(attr["arg"]) for attr in attr_list]],
+                      "poll": poll, "ts": 0}
+        grouped[id(attr_list[0])] = group_attr
+        for attr in attr_list[1:]:
+            grouped[id(attr)] = None
+
+    result = []
+    for attr in sys_attr:
+        if id(attr) not in grouped:
+            result.append(attr)
+        elif grouped[id(attr)]:
+            result.append(grouped[id(attr)])
+    return result
+
+# ----------------------------------------------------------------------
+
+
+class RedfishEventListener(threading.Thread):
+    """
+    @summary: BMC EventService SSE subscriber.
+        Event with OriginOfCondition of configured BMC sensor (or its Sensors
+        collection) schedules immediate update of the sensor attribute entry.
+        While stream is up, BMC sensor entries are polled only every
+        REDFISH_EVENT_LIVENESS_POLL sec. Stream failure restores configured
+        poll intervals and reconnects with exponential backoff.
+    """
+
+    def __init__(self, entries, liveness_poll=None):
+        threading.Thread.__init__(self, name="redfish_events", daemon=True)
+        self.liveness_poll = liveness_poll or REDFISH_EVENT_LIVENESS_POLL
+        self.stream = None
+        self.stat = {"event": 0, "update": 0, "connect": 0}
+        # {resource path: [AttrEntry, ...]}
+        self.origin_attr = {}
+        self.attr_list = []
+        for entry in entries:
+            if entry.fn_name == "redfish_get_sensor":
+                paths = [entry.arg[0]]
+            elif entry.fn_name == "redfish_get_sensors":
+                paths = [entry.arg[0]] + [sensor[0] for sensor in entry.arg[1]]
+            else:
+                continue
+            self.attr_list.append(entry)
+            for path in paths:
+                self.origin_attr.setdefault(path, []).append(entry)
+
+    def set_liveness_poll(self, enable):
+        """
+        @summary: Switch BMC sensor entries between liveness and configured poll interval
+        @param enable: True - stream is up, use liveness poll interval
+        """
+        for entry in self.attr_list:
+            if enable:
+                if entry.poll_cfg is None:
+                    entry.poll_cfg = entry.poll
+                entry.set_interval(max(entry.poll_cfg, self.liveness_poll))
+            elif entry.poll_cfg is not None:
+                entry.set_interval(entry.poll_cfg)
+                entry.poll_cfg = None
+
+    def handle_event(self, event):
+        """
+        @summary: Schedule update of attribute entries related to the event
+        @param event: Redfish Event payload dictionary
+        """
+        self.stat["event"] += 1
+        for origin in RedfishEventStream.event_origins(event):
+            for entry in self.origin_attr.get(origin, []):
+                entry.wake()
+                self.stat["update"] += 1
+        if FIN_WATCHER:
+            FIN_WATCHER.wake()
+
+    def run(self):
+        backoff = REDFISH_EVENT_RECONNECT_MIN
+        while not EXIT.is_set():
+            redfish_obj = RedfishConnection.get_instance()
+            ret = None
+            if redfish_obj:
+                ret, self.stream = redfish_obj.rf_client.open_event_stream()
+            if not self.stream:
+                LOGGER.notice("Redfish event stream not available ({}), retry in {} sec".format(ret, backoff),
+                              id="redfish_event_stream")
+                EXIT.wait(backoff)
+                backoff = min(backoff * 2, REDFISH_EVENT_RECONNECT_MAX)
+                continue
+
+            LOGGER.notice(None, id="redfish_event_stream")
+            LOGGER.info("Redfish event stream connected")
+            self.stat["connect"] += 1
+            backoff = REDFISH_EVENT_RECONNECT_MIN
+            self.set_liveness_poll(True)
+            try:
+                while not EXIT.is_set():
+                    event = self.stream.read_event()
+                    if event is None:
+                        break
+                    self.handle_event(event)
+            finally:
+                self.stream.close()
+                self.stream = None
+                self.set_liveness_poll(False)
+            if not EXIT.is_set():
+                LOGGER.info("Redfish event stream closed")
+                EXIT.wait(REDFISH_EVENT_RECONNECT_MIN)
+
+    def stop(self):
+        """
+        @summary: Stop listener, interrupt blocking stream read
+        """
+        stream = self.stream
+        if stream:
+            stream.close()
+
+# ----------------------------------------------------------------------
+
+# Event command workers and per command timeout (sec)
+EVENT_WORKERS = 4
+EVENT_TIMEOUT = 30
+CHASSIS_EVENTS_CMD = "/usr/bin/hw-management-chassis-events.sh"
+FAN_STATUS_FILE = "/var/run/hw-management/thermal/fan{}_status"
+_SHELL_CHARS = set(";&|<>$`'\"()[]{}*?~\\")
+
+
+class EventWorkerPool(object):
+    """
+    @summary: Bounded worker pool for event commands (chassis events, run_cmd).
+        Commands are queued by key (event attribute). Command for a key which is
+        queued but not started yet is replaced by the newer one (superseded value
+        dropped). Commands of the same key never run concurrently, so events of
+        one attribute complete in detection order. Each command is killed after
+        timeout. Latency is measured from submit (value change detection) to
+        command completion.
+    """
+
+    def __init__(self, workers=EVENT_WORKERS, timeout=EVENT_TIMEOUT, run=None):
+        self.workers = workers
+        self.timeout = timeout
+        self._run = run if run else self.run_command
+        self._cond = threading.Condition()
+        # {key: (cmd, submit_ts)}, ordered by first submit
+        self._pending = {}
+        self._running = set()
+        self._threads = []
+        self._stop = False
+        self.stat = {"submit": 0, "coalesced": 0, "done": 0, "fail": 0, "timeout": 0,
+                     "latency_max_ms": 0, "latency_sum_ms": 0}
+
+    @staticmethod
+    def run_command(cmd, timeout):
+        """
+        @summary: Run command, output discarded. Command of absolute program path
+            without shell syntax is executed directly, otherwise by /bin/sh.
+        @return: exit code
+        """
+        shell = not cmd.startswith("/") or bool(_SHELL_CHARS.intersection(cmd))
+        return subprocess.run(cmd if shell else shlex.split(cmd), shell=shell, timeout=timeout,
+                              stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL).returncode
+
+    def submit(self, key, cmd):
+        """
+        @summary: Queue command for key, replace queued command of the same key
+        """
+        with self._cond:
+            if self._stop:
+                return
+            self.stat["submit"] += 1
+            if key in self._pending:
+                self.stat["coalesced"] += 1
+                # keep queue position and detection time of the first event
+                self._pending[key] = (cmd, self._pending[key][1])
+            else:
+                self._pending[key] = (cmd, time.monotonic())
+            if len(self._threads) < self.workers and len(self._threads) < len(self._pending) + len(self._running):
+                thread = threading.Thread(target=self._worker, name="event_worker_{}".format(len(self._threads)),
+                                          daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+
+    def _next(self):
+        for key in self._pending:
+            if key not in self._running:
+                return key
+        return None
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                key = self._next()
+                while key is None and not self._stop:
+                    self._cond.wait()
+                    key = self._next()
+                if key is None:
+                    return
+                cmd, submit_ts = self._pending.pop(key)
+                self._running.add(key)
+            try:
+                rc = self._run(cmd, self.timeout)
+            except subprocess.TimeoutExpired:
+                rc = None
+            except (OSError, ValueError) as e:
+                rc = -1
+                if LOGGER:
+                    LOGGER.warning("Event command failed: {} ({})".format(cmd, e))
+            latency_ms = int((time.monotonic() - submit_ts) * 1000)
+            with self._cond:
+                self._running.discard(key)
+                self.stat["done"] += 1
+                if rc is None:
+                    self.stat["timeout"] += 1
+                elif rc != 0:
+                    self.stat["fail"] += 1
+                self.stat["latency_sum_ms"] += latency_ms
+                self.stat["latency_max_ms"] = max(self.stat["latency_max_ms"], latency_ms)
+                self._cond.notify_all()
+            if rc is None and LOGGER:
+                LOGGER.warning("Event command timeout {} sec: {}".format(self.timeout, cmd))
+
+    def wait_idle(self, timeout=None):
+        """
+        @summary: Wait until all queued commands completed
+        @return: True if idle
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._running, timeout)
+
+    def stop(self, timeout=1):
+        """
+        @summary: Stop workers after running commands, drop queued commands
+        """
+        with self._cond:
+            self._stop = True
+            self._pending.clear()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def report(self):
+        """
+        @summary: Log counters and latency
+        """
+        done = self.stat["done"]
+        LOGGER.info("Event commands: submit {submit} coalesced {coalesced} done {done} fail {fail} timeout {timeout}, "
+                    "latency avg {avg} ms max {latency_max_ms} ms".format(
+                        avg=self.stat["latency_sum_ms"] // done if done else 0, **self.stat))
+
+
+EVENT_POOL = EventWorkerPool()
+# BMC EventService listener (RedfishEventListener), None if not enabled
+EVENT_LISTENER = None
+
+
+def chassis_event(event, val):
+    """
+    @summary: Queue hw-management-chassis-events.sh hotplug-event for execution
+    @param event: Event name (FAN1, LEAKAGE1, POWER_BUTTON, ...)
+    @param val: Event value
+    """
+    EVENT_POOL.submit(event, "{} hotplug-event {} {}".format(CHASSIS_EVENTS_CMD, event, val))
+
+
 def run_power_button_event(argv, val):
     """
     @summary: Handle power button and graceful power-off events
     @param argv: Unused argument list (for interface compatibility)
     @param val: Event value (1=pressed/triggered, 0=released/cleared)
     """
-    cmd = "/usr/bin/hw-management-chassis-events.sh hotplug-event POWER_BUTTON {}".format(val)
-    os.system(cmd)
-    cmd = "/usr/bin/hw-management-chassis-events.sh hotplug-event GRACEFUL_PWR_OFF {}".format(val)
-    os.system(cmd)
+    # One command sequence under one key: events run in order, as by one shell
+    cmds = ["{} hotplug-event {} {}".format(CHASSIS_EVENTS_CMD, event, val)
+            for event in ("POWER_BUTTON", "GRACEFUL_PWR_OFF")]
     if str(val) == "1":
-        cmd = """logger -t hw-management-peripheral-updater -p daemon.info "Graceful CPU power off request " """
-        os.system(cmd)
+        cmds.append("logger -t hw-management-peripheral-updater -p daemon.info \"Graceful CPU power off request \"")
+    EVENT_POOL.submit("POWER_BUTTON", "; ".join(cmds))
 
 # ----------------------------------------------------------------------
 
 
 def run_cmd(cmd_list, arg):
     """
-    @summary: Execute list of shell commands with argument substitution
+    @summary: Queue list of shell commands with argument substitution
     @param cmd_list: List of command strings (supports {arg1} placeholder)
     @param arg: Argument value to substitute into commands
     """
     for cmd in cmd_list:
-        cmd = cmd + " 2> /dev/null 1> /dev/null"
-        os.system(cmd.format(arg1=arg))
+        # command template is the coalescing key: one queued value per attribute
+        EVENT_POOL.submit(cmd, cmd.format(arg1=arg))
 
 # ----------------------------------------------------------------------
 
@@ -513,64 +891,317 @@ def sync_fan(fan_id, val):
     else:
         status = 0
 
-    cmd = "echo {} > /var/run/hw-management/thermal/fan{}_status".format(status, fan_id)
-    os.system(cmd)
+    try:
+        with open(FAN_STATUS_FILE.format(fan_id), 'w', encoding="utf-8") as f:
+            f.write("{}\n".format(status))
+    except OSError as e:
+        if LOGGER:
+            LOGGER.warning("Failed to write fan{} status: {}".format(fan_id, e))
 
-    cmd = "/usr/bin/hw-management-chassis-events.sh hotplug-event FAN{} {} 2> /dev/null 1> /dev/null".format(fan_id, status)
-    os.system(cmd)
+    chassis_event("FAN{}".format(fan_id), status)
 
 # ----------------------------------------------------------------------
 
 
-def update_peripheral_attr(attr_prop):
+# "fin" change detection mode: poll interval (sec) of entries watched by inotify
+# (liveness check), max main loop wait (sec)
+FIN_INOTIFY_LIVENESS_POLL = 60
+FIN_WATCH_MAX_WAIT = 10
+
+
+class FinWatcher(object):
+    """
+    @summary: Change notification for "fin" files of attribute entries.
+        sysfs attribute: poll() for POLLPRI/POLLERR (sysfs_notify). Support of
+            sysfs_notify by the driver is not known, so configured poll interval
+            is kept as fallback.
+        Other files (tmpfs under /var/run/hw-management, /tmp): inotify on parent
+            directory (write, create, move, delete), poll interval is relaxed to
+            FIN_INOTIFY_LIVENESS_POLL.
+        Otherwise entry is polled only. Mechanism is recorded in entry "watch".
+        Notified entry is scheduled for immediate run. Entry whose sysfs attribute
+        was removed is polled and watched again on next successful read (rearm).
     """
-    @summary: Update peripheral attributes and invoke monitoring functions on value changes
 
-    This function is called for each peripheral monitoring entry (fans, leakage sensors,
-    power button, BMC sensors, etc.) at the configured polling interval. It reads the
-    input file and invokes the appropriate function only when the value changes,
-    implementing change-based triggering for peripheral monitoring.
-    """
-    ts = current_milli_time() // 1000
-    if ts >= attr_prop["ts"]:
-        # update timestamp
-        attr_prop["ts"] = ts + attr_prop["poll"]
-        fn_name = attr_prop["fn"]
-        argv = attr_prop["arg"]
-        fin = attr_prop.get("fin", None)
-        # File content based trigger
-        if fin:
-            fin_name = fin.format(hwmon=attr_prop.get("hwmon", ""))
-            if os.path.isfile(fin_name):
-                try:
-                    with open(fin_name, 'r', encoding="utf-8") as f:
-                        val = f.read().rstrip('\n')
-                    if "oldval" not in attr_prop.keys() or attr_prop["oldval"] != val:
-                        globals()[fn_name](argv, val)
-                        attr_prop["oldval"] = val
-                except ShutdownRequested:
-                    raise
-                except InterruptedError:
-                    # SIGTERM during sysfs I/O: do not treat as a normal read error
-                    raise ShutdownRequested()
-                except (OSError, ValueError):
-                    # File exists but read error
-                    globals()[fn_name](argv, "")
-                    attr_prop["oldval"] = ""
+    SYSFS_PREFIX = "/sys/"
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    IN_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    IN_EVENT_HDR = struct.Struct("iIII")
+
+    def __init__(self):
+        self.poller = select.poll()
+        # {fd: [entry, ...]}
+        self.sysfs_fd = {}
+        # {wd: {file name: [entry, ...]}}
+        self.inotify_wd = {}
+        self.inotify_fd = None
+        # entries moved from sysfs_notify to poll by removed attribute
+        self.sysfs_lost = set()
+        self._libc = None
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self.poller.register(self._wake_r, select.POLLIN)
+        self.stat = {"wait": 0, "event": 0, "update": 0}
+
+    @staticmethod
+    def sysfs_open(path):
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            # read is required to arm sysfs_notify
+            os.read(fd, 4096)
+        except OSError:
+            pass
+        return fd
+
+    @staticmethod
+    def sysfs_rearm(fd):
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.read(fd, 4096)
+        except OSError:
+            pass
+
+    @staticmethod
+    def sysfs_alive(fd, path):
+        """
+        @summary: Check that fd is still open on the file of path.
+            Removed sysfs attribute (driver unload) is reported POLLERR|POLLPRI forever.
+        """
+        try:
+            fd_stat = os.fstat(fd)
+            path_stat = os.stat(path)
+        except OSError:
+            return False
+        return (fd_stat.st_dev, fd_stat.st_ino) == (path_stat.st_dev, path_stat.st_ino)
+
+    def _inotify_add_watch(self, path):
+        if self.inotify_fd is None:
+            self._libc = ctypes.CDLL(None, use_errno=True)
+            fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            self.inotify_fd = fd
+            self.poller.register(fd, select.POLLIN)
+        wd = self._libc.inotify_add_watch(self.inotify_fd, path.encode(), self.IN_WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def _drop_sysfs(self, fd):
+        entries = self.sysfs_fd.pop(fd, [])
+        self.poller.unregister(fd)
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        for entry in entries:
+            entry.watch = "poll"
+            self.sysfs_lost.add(entry)
+        return entries
+
+    def _inotify_rm_watch(self, wd):
+        self.inotify_wd.pop(wd, None)
+        if self.inotify_fd is not None:
+            self._libc.inotify_rm_watch(self.inotify_fd, wd)
+
+    def remove(self, entry):
+        """
+        @summary: Stop watching entry, restore its configured poll interval
+        """
+        for fd, entries in list(self.sysfs_fd.items()):
+            if entry in entries:
+                entries.remove(entry)
+                if not entries:
+                    self._drop_sysfs(fd)
+        for wd, names in list(self.inotify_wd.items()):
+            for name, entries in list(names.items()):
+                if entry in entries:
+                    entries.remove(entry)
+                if not entries:
+                    del names[name]
+            if not names:
+                self._inotify_rm_watch(wd)
+        self.sysfs_lost.discard(entry)
+        if entry.watch == "inotify" and entry.poll_cfg is not None:
+            entry.set_interval(entry.poll_cfg)
+            entry.poll_cfg = None
+        entry.watch = "poll"
+
+    def add(self, entry):
+        """
+        @summary: Watch entry "fin" file, set entry "watch" to used mechanism
+        @return: Used mechanism: "sysfs_notify", "inotify" or "poll"
+        """
+        self.remove(entry)
+        if not entry.fin:
+            return entry.watch
+        path = entry.fin
+        try:
+            if os.path.realpath(path).startswith(self.SYSFS_PREFIX):
+                fd = self.sysfs_open(path)
+                if fd not in self.sysfs_fd:
+                    self.poller.register(fd, select.POLLPRI | select.POLLERR)
+                self.sysfs_fd.setdefault(fd, []).append(entry)
+                entry.watch = "sysfs_notify"
             else:
-                attr_prop["oldval"] = None
-        else:
-            try:
-                globals()[fn_name](argv, None)
-            except ShutdownRequested:
-                raise
-            except InterruptedError:
-                # SIGTERM during sysfs I/O: do not treat as a normal read error
-                raise ShutdownRequested()
-            except (OSError, ValueError, KeyError, TypeError):
-                # Catch common errors from dynamically called functions
-                # to prevent daemon crash
-                pass
+                wd = self._inotify_add_watch(os.path.dirname(path) or ".")
+                self.inotify_wd.setdefault(wd, {}).setdefault(os.path.basename(path), []).append(entry)
+                entry.watch = "inotify"
+                entry.poll_cfg = entry.poll
+                entry.set_interval(max(entry.poll, FIN_INOTIFY_LIVENESS_POLL))
+        except (OSError, AttributeError) as e:
+            if LOGGER:
+                LOGGER.info("fin watch not available, poll only: {} ({})".format(path, e))
+        return entry.watch
+
+    def rearm(self, entry):
+        """
+        @summary: Watch again entry whose sysfs attribute was removed and "fin"
+            is readable again (attribute recreated at the same path)
+        """
+        if entry in self.sysfs_lost and entry.watch == "poll":
+            self.add(entry)
+
+    def wake(self):
+        """
+        @summary: Interrupt wait() (entry rescheduled by other thread)
+        """
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def _schedule(self, entries):
+        for entry in entries:
+            entry.wake()
+            self.stat["update"] += 1
+
+    def _read_inotify(self):
+        try:
+            buf = os.read(self.inotify_fd, 4096)
+        except OSError:
+            return
+        offset = 0
+        while offset + self.IN_EVENT_HDR.size <= len(buf):
+            wd, _mask, _cookie, name_len = self.IN_EVENT_HDR.unpack_from(buf, offset)
+            offset += self.IN_EVENT_HDR.size
+            name = buf[offset:offset + name_len].split(b"\0", 1)[0].decode("utf-8", "replace")
+            offset += name_len
+            entries = self.inotify_wd.get(wd, {}).get(name, [])
+            self._schedule(entries)
+            for entry in list(entries):
+                # file created as link to sysfs attribute: move to sysfs_notify
+                if os.path.realpath(entry.fin).startswith(self.SYSFS_PREFIX):
+                    self.add(entry)
+
+    def wait(self, timeout):
+        """
+        @summary: Wait for change notification or timeout (sec)
+        @return: True if any entry was scheduled by notification
+        """
+        self.stat["wait"] += 1
+        update = self.stat["update"]
+        for fd, event in self.poller.poll(max(0, int(timeout * 1000))):
+            if fd == self._wake_r:
+                try:
+                    os.read(self._wake_r, 4096)
+                except OSError:
+                    pass
+                continue
+            self.stat["event"] += 1
+            if fd == self.inotify_fd:
+                self._read_inotify()
+            elif fd in self.sysfs_fd:
+                entries = self.sysfs_fd[fd]
+                if not self.sysfs_alive(fd, entries[0].fin):
+                    # attribute removed: poll, entry run resolves hwmon again and watches new file
+                    entries = self._drop_sysfs(fd)
+                else:
+                    self.sysfs_rearm(fd)
+                self._schedule(entries)
+        return self.stat["update"] != update
+
+    def close(self):
+        for fd in list(self.sysfs_fd) + [self.inotify_fd, self._wake_r, self._wake_w]:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self.sysfs_fd = {}
+        self.inotify_wd = {}
+        self.inotify_fd = None
+        self.sysfs_lost = set()
+
+
+FIN_WATCHER = None
+SCHEDULER = None
+
+
+def update_peripheral_attr(entry):
+    """
+    @summary: Run peripheral attribute entry, invoke its function on "fin" value change
+
+    Called by scheduler for each peripheral monitoring entry (fans, leakage sensors,
+    power button, BMC sensors, etc.) at the configured polling interval. It reads the
+    input file and invokes the entry function only when the value changes,
+    implementing change-based triggering for peripheral monitoring. Missing "fin"
+    file of hwmon device resolves hwmon device name again.
+    @param entry: AttrEntry
+    """
+    if entry.fin:
+        try:
+            with open(entry.fin, 'r', encoding="utf-8") as f:
+                val = f.read().rstrip('\n')
+        except ShutdownRequested:
+            raise
+        except InterruptedError:
+            # SIGTERM during sysfs I/O: do not treat as a normal read error
+            raise ShutdownRequested()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            entry.oldval = None
+            if entry.resolve_fin():
+                LOGGER.notice("{} moved to {}".format(entry.fin_tmpl, entry.fin))
+                if FIN_WATCHER:
+                    FIN_WATCHER.add(entry)
+                update_peripheral_attr(entry)
+            return
+        except (OSError, ValueError):
+            # File exists but read error
+            val = None
+        if val is not None and FIN_WATCHER:
+            FIN_WATCHER.rearm(entry)
+        if val is not None and entry.oldval == val:
+            return
+        try:
+            entry.fn(entry.arg, "" if val is None else val)
+            entry.oldval = "" if val is None else val
+        except ShutdownRequested:
+            raise
+        except InterruptedError:
+            raise ShutdownRequested()
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    else:
+        try:
+            entry.fn(entry.arg, None)
+        except ShutdownRequested:
+            raise
+        except InterruptedError:
+            # SIGTERM during sysfs I/O: do not treat as a normal read error
+            raise ShutdownRequested()
+        except (OSError, ValueError, KeyError, TypeError):
+            # Catch common errors from dynamically called functions
+            # to prevent daemon crash
+            pass
 
 
 def init_attr(attr_prop):
@@ -580,13 +1211,7 @@ def init_attr(attr_prop):
     """
     LOGGER.info("init_attr: {}".format(attr_prop))
     if "hwmon" in str(attr_prop["fin"]):
-        path = attr_prop["fin"].split("hwmon")[0]
-        try:
-            flist = os.listdir(os.path.join(path, "hwmon"))
-            hwmon_name = [fn for fn in flist if "hwmon" in fn]
-            attr_prop["hwmon"] = hwmon_name[0]
-        except (OSError, IndexError) as e:
-            attr_prop["hwmon"] = ""
+        attr_prop["hwmon"] = hwmon_lookup(attr_prop["fin"])
 
 
 def write_module_counter(product_sku):
@@ -697,6 +1322,14 @@ def print_periodic_info(_argv, _val):
     """
     LOGGER.info("Peripheral updater periodic report")
     LOGGER.info("=" * 40)
+    EVENT_POOL.report()
+    if FIN_WATCHER:
+        LOGGER.info("fin watch: wait {wait} event {event} update {update}".format(**FIN_WATCHER.stat))
+    LOGGER.info("Log hash: log {log_hash_size} syslog {syslog_hash_size} evict {evict} expire {expire}".format(
+        **LOGGER.get_hash_stat()))
+    if SCHEDULER:
+        for line in SCHEDULER.report():
+            LOGGER.info(line)
     if CONST.DBG_MEMORY_INFO:
         print_memory_info()
     LOGGER.info("=" * 40)
@@ -722,12 +1355,12 @@ def handle_shutdown(sig, _frame):
 # ----------------------------------------------------------------------
 
 
-def main():
+def parse_args(argv=None):
     """
-    @summary: Update attributes
-    arg1: system type
+    @summary: Parse peripheral updater command line
+    @param argv: Arguments list, sys.argv if None
+    @return: Arguments dictionary
     """
-
     CMD_PARSER = argparse.ArgumentParser(description="HW Management Peripheral Updater")
     CMD_PARSER.add_argument("--version", action="version", version="%(prog)s ver:{}".format(VERSION))
     CMD_PARSER.add_argument("-l", "--log_file",
@@ -748,10 +1381,38 @@ def main():
                         """,
                             type=int, default=20)
     CMD_PARSER.add_argument("-s", "--system_type", nargs='?', help="System type (optional) for custom system emulation.")
-
-    args = vars(CMD_PARSER.parse_args())
-    global LOGGER, PROCESS, _periodic_memory_timer
-    LOGGER = Logger(log_file=args["log_file"], log_level=args["verbosity"], log_repeat=2)
+    CMD_PARSER.add_argument("--redfish_transport",
+                            dest="redfish_transport",
+                            choices=[RedfishClient.TRANSPORT_CURL, RedfishClient.TRANSPORT_HTTP],
+                            help="BMC Redfish request transport: curl process per request or kept-alive HTTPS connection",
+                            default=RedfishClient.TRANSPORT_CURL)
+    CMD_PARSER.add_argument("--redfish_events",
+                            dest="redfish_events",
+                            help="Subscribe to BMC EventService (SSE), poll BMC sensors only as liveness check",
+                            action="store_true", default=False)
+    CMD_PARSER.add_argument("--fin_events",
+                            dest="fin_events",
+                            help="Detect attribute file changes by sysfs_notify/inotify, timed poll as fallback",
+                            action="store_true", default=False)
+    CMD_PARSER.add_argument("--redfish_cache_ttl",
+                            dest="redfish_cache_ttl",
+                            help="BMC Redfish GET response cache TTL in seconds (0 - cache disabled)",
+                            type=int, default=0)
+
+    return vars(CMD_PARSER.parse_args(argv))
+
+
+def updater_init(args, ident=None):
+    """
+    @summary: Init logger, load platform config, schedule its entries and start event sources
+    @param args: Arguments dictionary (parse_args)
+    @param ident: Log identifier, script name if None
+    """
+    RedfishConnection.transport = args["redfish_transport"]
+    if args["redfish_cache_ttl"] > 0:
+        RedfishConnection.cache = RedfishResponseCache(default_ttl=args["redfish_cache_ttl"])
+    global LOGGER, PROCESS, FIN_WATCHER, SCHEDULER, EVENT_POOL, EVENT_LISTENER, _periodic_memory_timer
+    LOGGER = Logger(ident=ident, log_file=args["log_file"], log_level=args["verbosity"], log_repeat=2)
     LOGGER.set_log_rotation_size(file_size=CONST.LOG_ROTATION_SIZE, file_count=CONST.LOG_ROTATION_COUNT)
 
     if not SONIC_CHECK_AVAILABLE:
@@ -768,7 +1429,7 @@ def main():
     product_sku = product_sku.strip()
 
     LOGGER.notice("hw-management-peripheral-updater: load config ({})".format(product_sku))
-    sys_attr = attrib_list["def"]
+    sys_attr = list(attrib_list["def"])
     for key, val in attrib_list.items():
         if re.match(key, product_sku):
             sys_attr.extend(val)
@@ -780,6 +1441,8 @@ def main():
     if is_sonic_os():
         sys_attr = [attr for attr in sys_attr if attr.get("fn") != "redfish_get_sensor"]
         LOGGER.notice("hw-management-peripheral-updater: SONiC host detected, BMC Redfish sync disabled")
+    else:
+        sys_attr = redfish_group_sensors(sys_attr)
 
     # Write module_counter for other services (must be done before they start)
     # This is done here in peripheral_updater to ensure it's written even if
@@ -790,13 +1453,101 @@ def main():
     for attr in sys_attr:
         init_attr(attr)
 
-    EXIT.clear()
-
     PROCESS = psutil.Process(os.getpid())
     LOGGER.info("periodic memory report {} sec".format(CONST.PERIODIC_MEMORY_REPORT_TIME))
     if CONST.DBG_MEMORY_INFO:
         sys_attr.append({'fin': None, 'fn': 'print_periodic_info', 'arg': [], 'poll': CONST.PERIODIC_MEMORY_REPORT_TIME, 'ts': 0})
 
+    SCHEDULER = JobScheduler("peripheral_attr", logger=LOGGER, slow_ms=CONST.ATTR_SLOW_RUN_MS)
+    for attr in sys_attr:
+        try:
+            SCHEDULER.add_entry(attr, globals(), update_peripheral_attr)
+        except KeyError:
+            LOGGER.error("Unknown function {} of {}, entry skipped".format(attr["fn"], attr["fin"]))
+    if args["fin_events"]:
+        FIN_WATCHER = FinWatcher()
+        for entry in SCHEDULER.get_jobs():
+            LOGGER.info("{} watch: {}".format(entry.name, FIN_WATCHER.add(entry)))
+
+    EXIT.clear()
+    EVENT_POOL = EventWorkerPool()
+
+    EVENT_LISTENER = None
+    if args["redfish_events"] and any(entry.fn_name in ("redfish_get_sensor", "redfish_get_sensors") for entry in SCHEDULER.get_jobs()):
+        EVENT_LISTENER = RedfishEventListener(SCHEDULER.get_jobs())
+        EVENT_LISTENER.start()
+
+
+def updater_loop(stop=None, heartbeat=None):
+    """
+    @summary: Run due peripheral entries until EXIT is set
+    @param stop: Function returning True to leave the loop
+    @param heartbeat: Function called on each loop iteration (watchdog)
+    """
+    def stopped():
+        return EXIT.is_set() or (stop is not None and stop())
+
+    while not stopped():
+        if heartbeat:
+            heartbeat()
+        try:
+            SCHEDULER.run_pending(stop=stopped)
+            try:
+                log_level_filename = os.path.join(CONST.HW_MGMT_FOLDER_DEF, CONST.LOG_LEVEL_FILENAME)
+                if os.path.isfile(log_level_filename):
+                    with open(log_level_filename, 'r', encoding="utf-8") as f:
+                        log_level = f.read().rstrip('\n')
+                        log_level = int(log_level)
+                        LOGGER.set_loglevel(log_level)
+            except InterruptedError:
+                raise ShutdownRequested()
+            except (OSError, ValueError):
+                # Expected errors when reading/parsing log level file
+                # These are non-critical, just skip and continue
+                pass
+        except ShutdownRequested:
+            raise
+        except Exception as e:
+            # Safety net: catch any unexpected exceptions to keep daemon alive
+            LOGGER.error("Unexpected error in main loop: {}".format(e))
+            LOGGER.notice(traceback.format_exc())
+            # Continue running despite error
+
+        if FIN_WATCHER:
+            FIN_WATCHER.wait(SCHEDULER.get_next_timeout(FIN_WATCH_MAX_WAIT))
+        else:
+            exit_wait(EXIT, SCHEDULER.get_next_timeout(1))
+
+
+def updater_wake():
+    """
+    @summary: Interrupt main loop wait (EXIT set by other thread)
+    """
+    if FIN_WATCHER:
+        FIN_WATCHER.wake()
+
+
+def updater_stop():
+    """
+    @summary: Stop event sources and event command workers
+    """
+    global FIN_WATCHER, EVENT_LISTENER
+    if EVENT_LISTENER:
+        EVENT_LISTENER.stop()
+        EVENT_LISTENER = None
+    if FIN_WATCHER:
+        FIN_WATCHER.close()
+        FIN_WATCHER = None
+    EVENT_POOL.stop()
+
+
+def main():
+    """
+    @summary: Update attributes
+    arg1: system type
+    """
+    updater_init(parse_args())
+
     try:
         for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
             signal.signal(sig, handle_shutdown)
@@ -804,34 +1555,7 @@ def main():
             signal.siginterrupt(sig, True)
 
         LOGGER.notice("hw-management-peripheral-updater: start main loop")
-        while not EXIT.is_set():
-            try:
-                for attr in sys_attr:
-                    if EXIT.is_set():
-                        break
-                    update_peripheral_attr(attr)
-                try:
-                    log_level_filename = os.path.join(CONST.HW_MGMT_FOLDER_DEF, CONST.LOG_LEVEL_FILENAME)
-                    if os.path.isfile(log_level_filename):
-                        with open(log_level_filename, 'r', encoding="utf-8") as f:
-                            log_level = f.read().rstrip('\n')
-                            log_level = int(log_level)
-                            LOGGER.set_loglevel(log_level)
-                except InterruptedError:
-                    raise ShutdownRequested()
-                except (OSError, ValueError):
-                    # Expected errors when reading/parsing log level file
-                    # These are non-critical, just skip and continue
-                    pass
-            except ShutdownRequested:
-                raise
-            except Exception as e:
-                # Safety net: catch any unexpected exceptions to keep daemon alive
-                LOGGER.error("Unexpected error in main loop: {}".format(e))
-                LOGGER.notice(traceback.format_exc())
-                # Continue running despite error
-
-            exit_wait(EXIT, 1)
+        updater_loop()
     except ShutdownRequested:
         pass
 
@@ -845,6 +1569,7 @@ def main():
                 signal.signal(sig, signal.SIG_DFL)
         except ShutdownRequested:
             pass
+    updater_stop()
     return
 
 
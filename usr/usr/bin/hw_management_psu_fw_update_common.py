@@ -45,11 +45,151 @@ Common functions and helpers function for NVidia PSU FW update tool.
 
 '''
 from __future__ import print_function
+import ctypes
+import errno
+import fcntl
 import os
 import time
 
+# Default minimal interval between PMBus transactions to a device (sec).
+# Vendor modules set own value by pmbus_set_spacing().
 PMBUS_DELAY = 0.1
 
+# Linux i2c-dev I2C_RDWR interface (linux/i2c-dev.h, linux/i2c.h)
+I2C_RDWR = 0x0707
+I2C_M_RD = 0x0001
+# I2C_RDWR not supported by bus driver - use i2ctransfer.
+# Other errors (ENXIO, EREMOTEIO on NACK, ETIMEDOUT, EAGAIN) fail the transaction.
+I2C_RDWR_UNSUPPORTED_ERRNO = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL)
+
+
+class i2c_msg(ctypes.Structure):
+    _fields_ = [("addr", ctypes.c_uint16),
+                ("flags", ctypes.c_uint16),
+                ("len", ctypes.c_uint16),
+                ("buf", ctypes.POINTER(ctypes.c_uint8))]
+
+
+class i2c_rdwr_ioctl_data(ctypes.Structure):
+    _fields_ = [("msgs", ctypes.POINTER(i2c_msg)),
+                ("nmsgs", ctypes.c_uint32)]
+
+
+class I2cRdwrTransport(object):
+    """
+    @summary: In-process PMBus transactions by I2C_RDWR ioctl on /dev/i2c-N:
+    one ioctl per transaction instead of i2ctransfer process. Device node is
+    kept open per bus. Same semantics as "i2ctransfer -f -y": write returns '',
+    read returns "0x.. 0x..\n", failed transaction returns ''.
+    None is returned if bus device or ioctl is not available (use i2ctransfer).
+    """
+
+    def __init__(self, dev_open=None, dev_close=None, ioctl=None):
+        self._open = dev_open if dev_open else os.open
+        self._close = dev_close if dev_close else os.close
+        self._ioctl = ioctl if ioctl else fcntl.ioctl
+        self._fd = {}
+        self.unsupported = set()
+
+    def _transfer(self, i2c_bus, msgs):
+        if i2c_bus in self.unsupported:
+            return False
+        fd = self._fd.get(i2c_bus)
+        if fd is None:
+            try:
+                fd = self._open("/dev/i2c-{}".format(i2c_bus), os.O_RDWR)
+            except OSError:
+                self.unsupported.add(i2c_bus)
+                return False
+            self._fd[i2c_bus] = fd
+        try:
+            msg_arr = (i2c_msg * len(msgs))(*msgs)
+            self._ioctl(fd, I2C_RDWR, i2c_rdwr_ioctl_data(msg_arr, len(msgs)))
+        except OSError as e:
+            if e.errno in I2C_RDWR_UNSUPPORTED_ERRNO:
+                self.unsupported.add(i2c_bus)
+                return False
+            # Transaction failed (NACK, timeout, arbitration lost)
+            return None
+        return True
+
+    def write(self, i2c_bus, i2c_addr, data):
+        """
+        @summary: Write bytes (command, data and PEC if any).
+        """
+        wbuf = (ctypes.c_uint8 * len(data))(*data)
+        ret = self._transfer(i2c_bus, [i2c_msg(i2c_addr, 0, len(data), wbuf)])
+        if ret is False:
+            return None
+        return ''
+
+    def read(self, i2c_bus, i2c_addr, cmd_addr, cmd_len):
+        """
+        @summary: Write command byte, read cmd_len bytes (repeated start).
+        """
+        wbuf = (ctypes.c_uint8 * 1)(cmd_addr)
+        rbuf = (ctypes.c_uint8 * cmd_len)()
+        ret = self._transfer(i2c_bus, [i2c_msg(i2c_addr, 0, 1, wbuf),
+                                       i2c_msg(i2c_addr, I2C_M_RD, cmd_len, rbuf)])
+        if ret is False:
+            return None
+        if ret is None:
+            return ''
+        return " ".join("0x{:02x}".format(x) for x in rbuf) + "\n"
+
+    def close(self):
+        for fd in self._fd.values():
+            self._close(fd)
+        self._fd = {}
+
+
+I2C_TRANSPORT = I2cRdwrTransport()
+
+# Per device (bus, addr): time.monotonic() when next transaction may start
+_pmbus_spacing = PMBUS_DELAY
+_pmbus_ready_ts = {}
+
+
+def pmbus_set_spacing(spacing):
+    """
+    @summary: Set minimal interval between PMBus transactions to a device.
+    """
+    global _pmbus_spacing
+    _pmbus_spacing = spacing
+
+
+def pmbus_hold(i2c_bus, i2c_addr, delay):
+    """
+    @summary: Do not start next transaction to device earlier than delay (sec) from now.
+    E.g. vendor block write time: wait is done before next transaction only.
+    """
+    ready_ts = time.monotonic() + delay
+    key = (i2c_bus, i2c_addr)
+    _pmbus_ready_ts[key] = max(_pmbus_ready_ts.get(key, 0), ready_ts)
+
+
+def _pmbus_wait(i2c_bus, i2c_addr):
+    wait = _pmbus_ready_ts.get((i2c_bus, i2c_addr), 0) - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+
+
+def pmbus_poll(read_fn, done_fn, timeout, interval_min, interval_max):
+    """
+    @summary: Poll status register until done_fn(status) is True or timeout.
+    Poll interval starts from interval_min and doubles up to interval_max.
+    @return: last read status
+    """
+    deadline = time.monotonic() + timeout
+    interval = interval_min
+    while True:
+        status = read_fn()
+        remain = deadline - time.monotonic()
+        if done_fn(status) or remain <= 0:
+            return status
+        time.sleep(min(interval, remain))
+        interval = min(interval * 2, interval_max)
+
 
 def calc_crc8(data):
     """
@@ -104,12 +244,15 @@ def pmbus_write(i2c_bus, i2c_addr, data):
     data_for_crc = [i2c_addr_sh]
     data_for_crc.extend(data)
     pec = calc_crc8(data_for_crc)
-    data_str = "".join("0x{:02x} ".format(x) for x in data)
-    # print("i2ctransfer -f -y {0:d} w{1:d}@0x{2:02X} {3}
-    #        0x{4:02X}".format(i2c_bus, cmd_len, i2c_addr, data_str, pec))
-    ret = os.popen("i2ctransfer -f -y {0:d} w{1:d}@0x{2:02X} {3} 0x{4:02X}"
-                   .format(i2c_bus, cmd_len, i2c_addr, data_str, pec)).read()
-    time.sleep(PMBUS_DELAY)
+    _pmbus_wait(i2c_bus, i2c_addr)
+    ret = I2C_TRANSPORT.write(i2c_bus, i2c_addr, list(data) + [pec])
+    if ret is None:
+        data_str = "".join("0x{:02x} ".format(x) for x in data)
+        # print("i2ctransfer -f -y {0:d} w{1:d}@0x{2:02X} {3}
+        #        0x{4:02X}".format(i2c_bus, cmd_len, i2c_addr, data_str, pec))
+        ret = os.popen("i2ctransfer -f -y {0:d} w{1:d}@0x{2:02X} {3} 0x{4:02X}"
+                       .format(i2c_bus, cmd_len, i2c_addr, data_str, pec)).read()
+    pmbus_hold(i2c_bus, i2c_addr, _pmbus_spacing)
     return ret
 
 
@@ -118,10 +261,13 @@ def pmbus_write_nopec(i2c_bus, i2c_addr, data):
     @summary: Write pmbus command without PEC.
     """
     cmd_len = len(data)
-    data_str = "".join("0x{:02x} ".format(x) for x in data)
-    ret = os.popen("i2ctransfer -f -y {0:d} w{1:d}@0x{2:02X} {3}"
-                   .format(i2c_bus, cmd_len, i2c_addr, data_str)).read()
-    time.sleep(PMBUS_DELAY)
+    _pmbus_wait(i2c_bus, i2c_addr)
+    ret = I2C_TRANSPORT.write(i2c_bus, i2c_addr, data)
+    if ret is None:
+        data_str = "".join("0x{:02x} ".format(x) for x in data)
+        ret = os.popen("i2ctransfer -f -y {0:d} w{1:d}@0x{2:02X} {3}"
+                       .format(i2c_bus, cmd_len, i2c_addr, data_str)).read()
+    pmbus_hold(i2c_bus, i2c_addr, _pmbus_spacing)
     return ret
 
 
@@ -129,9 +275,12 @@ def pmbus_read(i2c_bus, i2c_addr, cmd_addr, cmd_len):
     """
     @summary: Read pmbus command.
     """
-    ret = os.popen("i2ctransfer -f -y {0:d} w1@0x{1:02X} 0x{2:02X} r{3:d}"
-                   .format(i2c_bus, i2c_addr, cmd_addr, cmd_len)).read()
-    time.sleep(PMBUS_DELAY)
+    _pmbus_wait(i2c_bus, i2c_addr)
+    ret = I2C_TRANSPORT.read(i2c_bus, i2c_addr, cmd_addr, cmd_len)
+    if ret is None:
+        ret = os.popen("i2ctransfer -f -y {0:d} w1@0x{1:02X} 0x{2:02X} r{3:d}"
+                       .format(i2c_bus, i2c_addr, cmd_addr, cmd_len)).read()
+    pmbus_hold(i2c_bus, i2c_addr, _pmbus_spacing)
     return ret
 
 
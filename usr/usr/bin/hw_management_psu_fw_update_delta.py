@@ -63,6 +63,18 @@ MFR_FWUPLOAD_ACBEL_460 = 0xfb
 MFR_FWUPLOAD_STATUS_ACBEL_460 = 0xfc
 MFR_FW_REVISION_ACBEL_460 = 0xd9
 
+# Minimal interval between PMBus transactions (sec), same as previous delay
+# after each transaction until shorter vendor timing is documented. Block write
+# time from FW header (Delta) is kept by pmbus_hold() before next transaction.
+PMBUS_SPACING = psu_upd_cmn.PMBUS_DELAY
+# Upload mode enter/exit: max time to reach expected status (sec)
+UPLOAD_MODE_ENTER_TIMEOUT = 1
+UPLOAD_MODE_EXIT_TIMEOUT_ACBEL_460 = 10
+# Acbel 460 block write: status polled while "ISP Busy"
+BLOCK_POLL_MIN_ACBEL_460 = PMBUS_SPACING
+BLOCK_POLL_MAX_ACBEL_460 = 0.2
+BLOCK_TIMEOUT_ACBEL_460 = 1
+
 # Delta 550 PSU Model
 MFR_MODEL_500AB = "DPS-550AB"
 
@@ -314,8 +326,8 @@ def delta_fw_file_burn(i2c_bus, i2c_addr, fw_filename):
             data_list = [FW_HEADER["block_size"]]
             data_list.extend(byte_array.tolist())
             write_mfr_fw_upload(i2c_bus, i2c_addr, data_list)
-            # Wait delay
-            time.sleep(FW_HEADER["write_time"] * 0.001)
+            # Wait delay before next block
+            psu_upd_cmn.pmbus_hold(i2c_bus, i2c_addr, FW_HEADER["write_time"] * 0.001)
         print("\nSend FW Done.")
 
 
@@ -341,10 +353,13 @@ def acbel_460_fw_file_burn(i2c_bus, i2c_addr, fw_filename):
             retry_cnt = 0
             while True:
                 write_mfr_fw_upload_acbel_460(i2c_bus, i2c_addr, data_list)
-                # Wait delay
-                time.sleep(50 * 0.001)
 
-                status = read_mfr_fw_upload_status_acbel_460(i2c_bus, i2c_addr)
+                # Poll status while block is written to flash
+                status = psu_upd_cmn.pmbus_poll(lambda: read_mfr_fw_upload_status_acbel_460(i2c_bus, i2c_addr),
+                                                lambda status: status not in (None, "ISP Busy"),
+                                                BLOCK_TIMEOUT_ACBEL_460,
+                                                BLOCK_POLL_MIN_ACBEL_460,
+                                                BLOCK_POLL_MAX_ACBEL_460)
                 if status == "ISP No Error":
                     break
                 if retry_cnt >= 2:
@@ -361,6 +376,7 @@ def update_delta(i2c_bus, i2c_addr, fw_filename):
     """
     @summary: Update Delta PSU FW.
     """
+    psu_upd_cmn.pmbus_set_spacing(PMBUS_SPACING)
     # Validate we need update FW
     current_fw_rev = read_mfr_fw_revision(i2c_bus, i2c_addr)
     print(current_fw_rev)
@@ -370,9 +386,10 @@ def update_delta(i2c_bus, i2c_addr, fw_filename):
         # Put PSU into FW update mode.
         write_mfr_fw_upload_mode(i2c_bus, i2c_addr, 1)
 
-        time.sleep(1)
-
-        if read_mfr_fw_upload_mode(i2c_bus, i2c_addr) != "Enter Firmware upload mode.":
+        upload_mode = psu_upd_cmn.pmbus_poll(lambda: read_mfr_fw_upload_mode(i2c_bus, i2c_addr),
+                                             lambda mode: mode == "Enter Firmware upload mode.",
+                                             UPLOAD_MODE_ENTER_TIMEOUT, PMBUS_SPACING, 0.2)
+        if upload_mode != "Enter Firmware upload mode.":
             if retry_cnt >= 2:
                 print("Fail to enter FW upload mode.")
                 exit(1)
@@ -426,6 +443,7 @@ def update_acbel_460(i2c_bus, i2c_addr, fw_filename):
     """
     @summary: Update Acbel 460 PSU FW.
     """
+    psu_upd_cmn.pmbus_set_spacing(PMBUS_SPACING)
     # Read current FW version
     current_fw_rev = read_mfr_fw_revision(i2c_bus, i2c_addr)
     print(current_fw_rev)
@@ -436,9 +454,10 @@ def update_acbel_460(i2c_bus, i2c_addr, fw_filename):
     while True:
         write_mfr_fw_upload_mode_acbel_460(i2c_bus, i2c_addr, 1)
 
-        time.sleep(1)
-
-        if read_mfr_fw_upload_status_acbel_460(i2c_bus, i2c_addr) == "ISP No Error":
+        status = psu_upd_cmn.pmbus_poll(lambda: read_mfr_fw_upload_status_acbel_460(i2c_bus, i2c_addr),
+                                        lambda status: status == "ISP No Error",
+                                        UPLOAD_MODE_ENTER_TIMEOUT, PMBUS_SPACING, 0.2)
+        if status == "ISP No Error":
             break
         if retry_cnt >= 2:
             print("Failed to enter FW upload mode.")
@@ -454,9 +473,11 @@ def update_acbel_460(i2c_bus, i2c_addr, fw_filename):
     retry_cnt = 0
     while True:
         write_mfr_fw_upload_mode_acbel_460(i2c_bus, i2c_addr, 0)
-        time.sleep(10)
 
-        status = read_mfr_fw_upload_status_acbel_460(i2c_bus, i2c_addr)
+        # "ISP No Error" is accepted after full timeout only, as before
+        status = psu_upd_cmn.pmbus_poll(lambda: read_mfr_fw_upload_status_acbel_460(i2c_bus, i2c_addr),
+                                        lambda status: status == "ISP Mode Disabled",
+                                        UPLOAD_MODE_EXIT_TIMEOUT_ACBEL_460, 0.1, 1)
         if (status == "ISP Mode Disabled") or (status == "ISP No Error"):
             break
         if retry_cnt >= 2:
@@ -58,6 +58,18 @@ UPGRADE_STATUS_ADDR = 0xFA
 BOOTLOADER_STATUS_ADDR = 0xFB
 BOOTLOADER_I2C_ADDR = 0x60
 
+# Minimal interval between PMBus transactions (sec), same as previous delay
+# after each transaction until shorter vendor timing is documented
+PMBUS_SPACING = psu_upd_cmn.PMBUS_DELAY
+# Upgrade data line: status polled while POLL_STATUS_BUSY
+UPGRADE_POLL_MIN = PMBUS_SPACING
+UPGRADE_POLL_MAX = 0.3
+UPGRADE_POLL_TIMEOUT = 1.2
+# Max time to enter bootload mode / to complete checksum test (sec)
+BOOTLOAD_ENTER_TIMEOUT = 1
+BOOTLOAD_ERASE_TIMEOUT = 2
+CHECKSUM_TEST_TIMEOUT = 2
+
 
 def read_murata_fw_revision(i2c_bus, i2c_addr, primary):
     """
@@ -139,15 +151,11 @@ def poll_upgrade_status(i2c_bus, i2c_addr):
 
 def test_poll_upgrade_status(i2c_bus, i2c_addr):
     """
-    @summary: poll upgrade status with 3 reties.
+    @summary: poll upgrade status while busy, up to UPGRADE_POLL_TIMEOUT.
     """
-    retry = 0
-    while True:
-        upgrade_status = poll_upgrade_status(i2c_bus, i2c_addr)
-        if (upgrade_status != "POLL_STATUS_BUSY") or (retry > 3):
-            break
-        time.sleep(0.3)
-        retry += 1
+    upgrade_status = psu_upd_cmn.pmbus_poll(lambda: poll_upgrade_status(i2c_bus, i2c_addr),
+                                            lambda status: status != "POLL_STATUS_BUSY",
+                                            UPGRADE_POLL_TIMEOUT, UPGRADE_POLL_MIN, UPGRADE_POLL_MAX)
 
     if upgrade_status != "POLL_STATUS_SUCCSESS":
         print("PSU FW upgrade failed.")
@@ -250,6 +258,7 @@ def murata_update(i2c_bus, i2c_addr, continue_update, fw_filename, primary):
     """
     @summary: Murata PSU update.
     """
+    psu_upd_cmn.pmbus_set_spacing(PMBUS_SPACING)
     current_fw_rev = ""
     # If coninue_update skip entering to boot_mode.
     if not continue_update:
@@ -274,16 +283,19 @@ def murata_update(i2c_bus, i2c_addr, continue_update, fw_filename, primary):
 
         # 4. Wait typically for 1 second to allow the Power Supply to enter Bootload Mode.
         # fmt: on
-        time.sleep(1)
+        enter_timeout = BOOTLOAD_ENTER_TIMEOUT
     else:
         # Erase, since previous update failed.
         enter_bootload_mode(args.i2c_bus, BOOTLOADER_I2C_ADDR, primary)
-        time.sleep(2)
+        enter_timeout = BOOTLOAD_ERASE_TIMEOUT
 
     # 5. Send the POLL_UPGRADE_STATUS command for successful entry into Bootload Mode.
         # 5a. Send the Host POWER_DOWN, BUSY or SUCCESS.
-
-    if poll_upgrade_status(i2c_bus, BOOTLOADER_I2C_ADDR) != "POLL_STATUS_SUCCSESS":
+    # Polled until SUCCESS, no longer than typical wait.
+    upgrade_status = psu_upd_cmn.pmbus_poll(lambda: poll_upgrade_status(i2c_bus, BOOTLOADER_I2C_ADDR),
+                                            lambda status: status == "POLL_STATUS_SUCCSESS",
+                                            enter_timeout, PMBUS_SPACING, 0.2)
+    if upgrade_status != "POLL_STATUS_SUCCSESS":
         print("failed to enter boot mode")
         exit(1)
 
@@ -297,7 +309,7 @@ def murata_update(i2c_bus, i2c_addr, continue_update, fw_filename, primary):
     end_of_file(i2c_bus, BOOTLOADER_I2C_ADDR)
 
     # 9. Wait typically for 1 second to allow the Power Supply to enter Bootload Mode.
-    time.sleep(2)
+    # Polled in step 10.
 
     # fmt: off
     # 10. Send the POLL_UPGRADE_STATUS command for a successful transaction.
@@ -308,7 +320,11 @@ def murata_update(i2c_bus, i2c_addr, continue_update, fw_filename, primary):
         #     do if IN-SYSTEM PROGRAMMING fails).
     # fmt: on
 
-    if poll_upgrade_status(i2c_bus, BOOTLOADER_I2C_ADDR) == "POLL_STATUS_NOTACTIVE":
+    # SUCCESS (checksum test failed) is accepted after full timeout only.
+    upgrade_status = psu_upd_cmn.pmbus_poll(lambda: poll_upgrade_status(i2c_bus, BOOTLOADER_I2C_ADDR),
+                                            lambda status: status == "POLL_STATUS_NOTACTIVE",
+                                            CHECKSUM_TEST_TIMEOUT, 0.1, 0.5)
+    if upgrade_status == "POLL_STATUS_NOTACTIVE":
         print("checksum test passes, the target microcontroller will leave BOOTLOAD Mode")
     else:
         print("checksum test fails, the target microcontroller remains in BOOTLOAD Mode")
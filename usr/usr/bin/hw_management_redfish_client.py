@@ -39,6 +39,8 @@
 #
 #############################################################################
 
+import asyncio
+import contextlib
 import subprocess
 import json
 import time
@@ -47,13 +49,700 @@ import os
 import sys
 import base64
 import fcntl
+import http.client
+import mmap
+import socket
+import ssl
+import struct
+import threading
+import urllib.parse
 
 # TBD:
-# Support token persistency later on and remove RedfishClient.__password
+# Remove RedfishClient.__password, obtain it by password provider only
+
+
+'''
+Parse curl -K config built by RedfishClient into option dict.
+Repeated options (header, form) are collected to list.
+'''
+
+
+def parse_curl_config(curl_config):
+    opts = {'header': [], 'form': []}
+    for line in curl_config.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        name, sep, val = line.partition('=')
+        name = name.strip()
+        if not sep:
+            opts[name] = True
+            continue
+        val = val.strip()
+        if len(val) >= 2 and val[0] == '"' and val[-1] == '"':
+            val = re.sub(r'\\(.)', r'\1', val[1:-1])
+        if name in ('header', 'form'):
+            opts[name].append(val)
+        else:
+            opts[name] = val
+    return opts
+
+
+'''
+Parse ISO 8601 duration (Redfish Task EstimatedDuration, e.g. 'PT2M30S').
+Return seconds, or None if value is not a duration.
+'''
+
+_ISO8601_DURATION_RE = re.compile(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$')
+
+
+def parse_iso8601_duration(value):
+    if not isinstance(value, str):
+        return None
+    match = _ISO8601_DURATION_RE.match(value)
+    if (not match) or (value in ('P', 'PT')):
+        return None
+    days, hours, minutes, seconds = (float(val) if val else 0 for val in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+'''
+Firmware image upload body for RedfishHttpTransport.
+Image is mmap'd and sent in CHUNK_SIZE reads by http.client; pages already
+sent are dropped from the process (MADV_DONTNEED), so memory use is bounded
+by the chunk size whatever the image size. Optional multipart/form-data
+framing (UpdateService MultipartHttpPushUri).
+progress(sent, total, rate): called per chunk, rate in bytes/sec.
+'''
+
+
+class RedfishUploadBody:
+
+    CHUNK_SIZE = 256 * 1024
+
+    '''
+    fields: [(name, value, content_type)] multipart fields before the image part,
+    None - plain octet-stream body
+    '''
+
+    def __init__(self, path, fields=None, file_field='UpdateFile', progress=None):
+        self.chunk_size = RedfishUploadBody.CHUNK_SIZE
+        self.progress = progress
+        self._file = open(path, 'rb')
+        try:
+            self.image_size = os.fstat(self._file.fileno()).st_size
+            self._map = None
+            if self.image_size:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        head = b''
+        tail = b''
+        self.content_type = 'application/octet-stream'
+        if fields is not None:
+            boundary = 'hw-mgmt-' + os.urandom(12).hex()
+            parts = []
+            for name, value, content_type in fields:
+                parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n'
+                             f'Content-Type: {content_type}\r\n\r\n{value}\r\n')
+            filename = os.path.basename(path).replace('"', '')
+            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+                         f'filename="{filename}"\r\nContent-Type: application/octet-stream\r\n\r\n')
+            head = ''.join(parts).encode('utf-8')
+            tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+            self.content_type = f'multipart/form-data; boundary={boundary}'
+        self._head = head
+        self._tail = tail
+        self.total = len(head) + self.image_size + len(tail)
+        self.seek(0)
+
+    '''
+    Build upload body from curl config options: 'upload-file', or 'form'
+    fields ('name=value;type=...', file part 'name=@path;type=...').
+    '''
+
+    @classmethod
+    def from_curl_opts(cls, opts, progress=None):
+        if not opts['form']:
+            return cls(opts['upload-file'], progress=progress)
+        fields = []
+        file_field = None
+        path = None
+        for form in opts['form']:
+            name, _, value = form.partition('=')
+            content_type = 'text/plain'
+            match = re.search(r';type=([^;]+)$', value)
+            if match:
+                value = value[:match.start()]
+                content_type = match.group(1)
+            if value.startswith('@'):
+                file_field, path = name, value[1:]
+            else:
+                fields.append((name, value, content_type))
+        if path is None:
+            raise OSError('No file part in multipart form')
+        return cls(path, fields, file_field, progress)
+
+    def __len__(self):
+        return self.total
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if (offset, whence) != (0, os.SEEK_SET):
+            raise OSError('Upload body can be rewound only')
+        self.sent = 0
+        self._released = 0
+        self._start = time.monotonic()
+        return 0
+
+    def rate(self):
+        elapsed = time.monotonic() - self._start
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+    def read(self, size=-1):
+        if (size is None) or (size < 0):
+            size = self.chunk_size
+        pos = self.sent
+        head_len = len(self._head)
+        image_end = head_len + self.image_size
+        if pos < head_len:
+            data = self._head[pos:pos + size]
+        elif pos < image_end:
+            offset = pos - head_len
+            data = self._map[offset:offset + min(size, self.image_size - offset)]
+            self.__release(offset + len(data))
+        else:
+            data = self._tail[pos - image_end:pos - image_end + size]
+        self.sent += len(data)
+        if data and self.progress:
+            self.progress(self.sent, self.total, self.rate())
+        return data
+
+    def __release(self, image_offset):
+        # Drop sent image pages: file-backed, re-read from page cache on rewind
+        end = image_offset - (image_offset % mmap.PAGESIZE)
+        if (end <= self._released) or (not hasattr(mmap, 'MADV_DONTNEED')):
+            return
+        self._map.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+        self._released = end
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+'''
+HTTPS connection to BMC, same as curl 'insecure': BMC uses self-signed certificate.
+'''
+
+
+def bmc_https_connection(host, timeout):
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return http.client.HTTPSConnection(host, timeout=timeout, context=context)
+
+
+'''
+Native HTTPS transport for RedfishClient.
+Executes the same curl -K request config in-process over one kept-alive
+connection per BMC: no fork/exec and no TLS handshake per request.
+Result matches curl path: (ret, body, error, http_status, etag), ret is 0
+for any HTTP status and ERR_CODE_CURL_FAILURE on connection/timeout error.
+'''
+
+
+class RedfishHttpTransport:
+
+    name = 'http'
+    REDIRECT_MAX = 5
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+    # Errors on reused kept-alive connection: BMC closed it, reconnect once
+    RECONNECT_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                        ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, connection_factory=None):
+        self._connection_factory = connection_factory or bmc_https_connection
+        self._conn = {}
+        self._lock = threading.Lock()
+        self.stat = {'request': 0, 'connect': 0, 'reconnect': 0, 'error': 0}
+
+    def _get_conn(self, host, timeout):
+        conn = self._conn.get(host)
+        if conn is None:
+            conn = self._connection_factory(host, timeout)
+            self._conn[host] = conn
+            self.stat['connect'] += 1
+            return conn, False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _close_conn(self, host):
+        conn = self._conn.pop(host, None)
+        if conn is not None:
+            conn.close()
+
+    def close(self):
+        with self._lock:
+            for host in list(self._conn.keys()):
+                self._close_conn(host)
+
+    def _request(self, host, method, path, body, headers, timeout):
+        conn, reused = self._get_conn(host, timeout)
+        if hasattr(body, 'chunk_size'):
+            conn.blocksize = body.chunk_size
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+        except RedfishHttpTransport.RECONNECT_ERRORS:
+            self._close_conn(host)
+            if not reused:
+                raise
+            self.stat['reconnect'] += 1
+            if hasattr(body, 'seek'):
+                body.seek(0)
+            conn, _ = self._get_conn(host, timeout)
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+        data = resp.read()
+        if resp.will_close:
+            self._close_conn(host)
+        return resp.status, resp.getheader('Location'), resp.getheader('ETag'), data
+
+    '''
+    Execute curl -K request config.
+    progress: upload progress callback for 'upload-file'/'form' body (RedfishUploadBody)
+    '''
+
+    def exec_config(self, curl_config, progress=None):
+        opts = parse_curl_config(curl_config)
+        method = opts.get('request')
+        url = opts.get('url', '')
+        timeout = None
+        if 'max-time' in opts:
+            timeout = float(opts['max-time'])
+        elif 'speed-time' in opts:
+            # Stalled transfer detection: socket operation timeout
+            timeout = float(opts['speed-time'])
+        headers = {}
+        for hdr in opts['header']:
+            hdr_name, _, hdr_val = hdr.partition(':')
+            headers[hdr_name.strip()] = hdr_val.strip()
+        if 'user' in opts:
+            cred = base64.b64encode(opts['user'].encode('utf-8')).decode('ascii')
+            headers['Authorization'] = f'Basic {cred}'
+
+        upload = None
+        body = None
+        try:
+            if ('upload-file' in opts) or opts['form']:
+                upload = RedfishUploadBody.from_curl_opts(opts, progress)
+                body = upload
+                headers['Content-Length'] = str(len(upload))
+                if opts['form']:
+                    headers['Content-Type'] = upload.content_type
+                method = method or ('POST' if opts['form'] else 'PUT')
+            elif 'data-raw' in opts:
+                body = opts['data-raw'].encode('utf-8')
+                method = method or 'POST'
+            method = method or 'GET'
+
+            with self._lock:
+                self.stat['request'] += 1
+                for _ in range(RedfishHttpTransport.REDIRECT_MAX + 1):
+                    parsed = urllib.parse.urlsplit(url)
+                    path = parsed.path or '/'
+                    if parsed.query:
+                        path = f'{path}?{parsed.query}'
+                    try:
+                        status, location, etag, data = self._request(parsed.netloc, method, path, body, headers, timeout)
+                    except (socket.timeout, OSError, http.client.HTTPException) as e:
+                        self._close_conn(parsed.netloc)
+                        self.stat['error'] += 1
+                        if isinstance(e, socket.timeout):
+                            return (RedfishClient.ERR_CODE_CURL_FAILURE, '',
+                                    f'Operation timed out after {timeout} seconds', None, None)
+                        return (RedfishClient.ERR_CODE_CURL_FAILURE, '', str(e), None, None)
+                    if ('location' in opts) and (status in RedfishHttpTransport.REDIRECT_CODES) and location:
+                        url = urllib.parse.urljoin(url, location)
+                        if status == 303 or (status in (301, 302) and method == 'POST'):
+                            method, body = 'GET', None
+                        continue
+                    break
+        except OSError as e:
+            # upload file open error, same as curl "Failed to open/read local data"
+            return (RedfishClient.ERR_CODE_CURL_FAILURE, '', str(e), None, None)
+        finally:
+            if upload:
+                upload.close()
+
+        return (0, data.decode('utf-8', errors='replace').rstrip('\n'), '', status, etag)
+
+
+'''
+Redfish GET response cache for RedfishClient.
+Entry is fresh for TTL seconds (per URI prefix, longest prefix wins) and
+then revalidated by conditional GET (If-None-Match) if the BMC returned
+ETag (header or @odata.etag). Any PATCH/POST/DELETE invalidates entries
+under the request URI and its parent collections.
+'''
+
+
+class RedfishResponseCache:
+
+    def __init__(self, default_ttl=0, ttl=None):
+        self.default_ttl = default_ttl
+        # {uri_prefix: ttl_sec}
+        self.ttl = dict(ttl) if ttl else {}
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.stat = {'hit': 0, 'revalidated': 0, 'miss': 0, 'invalidated': 0}
+
+    def get_ttl(self, uri):
+        prefix_len = -1
+        ttl = self.default_ttl
+        for prefix, prefix_ttl in self.ttl.items():
+            if uri.startswith(prefix) and len(prefix) > prefix_len:
+                prefix_len = len(prefix)
+                ttl = prefix_ttl
+        return ttl
+
+    '''
+    Return (body, etag): body is set if entry is fresh, etag is set if stale
+    entry can be revalidated.
+    '''
+
+    def lookup(self, uri):
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is None:
+                self.stat['miss'] += 1
+                return (None, None)
+            body, etag, expiry = entry
+            if time.monotonic() < expiry:
+                self.stat['hit'] += 1
+                return (body, None)
+            if not etag:
+                del self._entries[uri]
+                self.stat['miss'] += 1
+            return (None, etag)
+
+    def store(self, uri, body, etag=None):
+        if not etag:
+            try:
+                etag = json.loads(body).get('@odata.etag')
+            except (ValueError, AttributeError):
+                etag = None
+        ttl = self.get_ttl(uri)
+        if ttl <= 0 and not etag:
+            return
+        with self._lock:
+            self._entries[uri] = (body, etag, time.monotonic() + ttl)
+
+    '''
+    Conditional GET returned 304 Not Modified: extend entry and return its body.
+    '''
+
+    def revalidate(self, uri):
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is None:
+                return None
+            body, etag, _ = entry
+            self._entries[uri] = (body, etag, time.monotonic() + self.get_ttl(uri))
+            self.stat['revalidated'] += 1
+            return body
+
+    def invalidate(self, uri):
+        uri = uri.rstrip('/')
+        with self._lock:
+            for key in list(self._entries.keys()):
+                path = key.split('?')[0].rstrip('/')
+                # Same resource, its members or its parents (path segment boundary)
+                if (path == uri) or path.startswith(uri + '/') or uri.startswith(path + '/'):
+                    del self._entries[key]
+                    self.stat['invalidated'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def hit_rate(self):
+        with self._lock:
+            total = self.stat['hit'] + self.stat['revalidated'] + self.stat['miss']
+            if not total:
+                return 0.0
+            return (self.stat['hit'] + self.stat['revalidated']) / total
+
+
+'''
+Cross-process Redfish session token cache.
+Token file is root-only (0600 file in 0700 directory under /run, tmpfs),
+one file per user (token_path.<user>), valid for TTL seconds. Only tokens
+of users listed in "users" are shared (None - any user), so tokens of
+privileged accounts used during provisioning are not handed to other
+consumers. Cached token is not validated: consumer drops token rejected by
+BMC (HTTP 401) and logs in again (RedfishClient.relogin).
+Context manager holds advisory flock on lock_path, so token refresh is
+single-flight across processes. Lock is re-entrant within process. Cache is
+silently disabled if the directory is not accessible (non-root consumer).
+'''
+
+
+class RedfishTokenCache:
+
+    USER_NAME_PATTERN = re.compile(r'[A-Za-z0-9_.-]+')
+
+    def __init__(self, token_path, lock_path, ttl, lock_timeout=10, users=None):
+        self.token_path = token_path
+        self.lock_path = lock_path
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.users = users
+        self._rlock = threading.RLock()
+        self._depth = 0
+        self._lock_fd = None
+
+    def __enter__(self):
+        self._rlock.acquire()
+        self._depth += 1
+        if self._depth == 1:
+            self._lock_fd = self.__flock()
+        return self
+
+    def __exit__(self, *_args):
+        self._depth -= 1
+        if self._depth == 0 and self._lock_fd is not None:
+            try:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            except OSError:
+                pass
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self._rlock.release()
+
+    def __flock(self):
+        try:
+            lock_fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        except OSError:
+            return None
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return lock_fd
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    # Do not block login on stuck lock owner
+                    os.close(lock_fd)
+                    return None
+                time.sleep(0.1)
+            except OSError:
+                os.close(lock_fd)
+                return None
+
+    @staticmethod
+    def __is_private(st):
+        return (st.st_uid == os.geteuid()) and not (st.st_mode & 0o077)
+
+    def user_token_path(self, user):
+        '''
+        Token file of user, None if token of user is not shared
+        '''
+        if (self.users is not None) and (user not in self.users):
+            return None
+        if not (isinstance(user, str) and self.USER_NAME_PATTERN.fullmatch(user)):
+            return None
+        return f'{self.token_path}.{user}'
+
+    def load(self, host, user):
+        token_path = self.user_token_path(user)
+        if token_path is None:
+            return None
+        try:
+            fd = os.open(token_path, os.O_RDONLY | os.O_NOFOLLOW)
+        except OSError:
+            return None
+        try:
+            if not self.__is_private(os.fstat(fd)):
+                return None
+            with os.fdopen(fd, 'r', closefd=False) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+
+        if not isinstance(data, dict):
+            return None
+        if data.get('host') != host or data.get('user') != user:
+            return None
+        if time.monotonic() >= data.get('expiry', 0):
+            return None
+        return data.get('token')
+
+    def store(self, host, user, token):
+        token_path = self.user_token_path(user)
+        if token_path is None:
+            return False
+        token_dir = os.path.dirname(token_path)
+        tmp_path = f'{token_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(token_dir, mode=0o700, exist_ok=True)
+            if not self.__is_private(os.stat(token_dir)):
+                return False
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'host': host, 'user': user, 'token': token,
+                           'expiry': time.monotonic() + self.ttl}, f)
+            os.replace(tmp_path, token_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def invalidate(self, user):
+        token_path = self.user_token_path(user)
+        if token_path is None:
+            return
+        try:
+            os.unlink(token_path)
+        except OSError:
+            pass
+
+
+'''
+Redfish EventService Server-Sent Events (SSE) stream.
+Long-lived GET of ServerSentEventUri; read_event() blocks until next event
+and returns Redfish Event payload as dictionary. Keep-alive comments are
+skipped. Last event id is sent on reconnect (Last-Event-ID), so events
+published while reconnecting are not lost if BMC keeps them.
+'''
+
+
+class RedfishEventStream:
+
+    SSE_URI = '/redfish/v1/EventService/SSE'
+    # BMC sends keep-alive at least every 30-60 sec: silence longer than this is dead stream
+    READ_TIMEOUT = 120
+
+    def __init__(self, client, host, uri=SSE_URI, read_timeout=READ_TIMEOUT, connection_factory=None):
+        self.client = client
+        self.host = host
+        self.uri = uri
+        self.read_timeout = read_timeout
+        self._connection_factory = connection_factory or bmc_https_connection
+        self._conn = None
+        self._resp = None
+        self.last_event_id = None
+        self.stat = {'connect': 0, 'event': 0, 'keepalive': 0}
+
+    '''
+    Open stream, re-login once if token is rejected.
+    Return RedfishClient error code.
+    '''
+
+    def open(self):
+        self.close()
+        for attempt in range(2):
+            token = self.client.get_token()
+            headers = {'Accept': 'text/event-stream', 'X-Auth-Token': token or ''}
+            if self.last_event_id is not None:
+                headers['Last-Event-ID'] = self.last_event_id
+            try:
+                conn = self._connection_factory(self.host, self.read_timeout)
+                conn.request('GET', self.uri, headers=headers)
+                resp = conn.getresponse()
+            except (OSError, http.client.HTTPException):
+                return RedfishClient.ERR_CODE_CURL_FAILURE
+            if resp.status == 200:
+                self._conn = conn
+                self._resp = resp
+                self.stat['connect'] += 1
+                return RedfishClient.ERR_CODE_OK
+            conn.close()
+            if (resp.status != 401) or attempt:
+                return RedfishClient.ERR_CODE_UNEXPECTED_RESPONSE
+            ret = self.client.relogin(token)
+            if ret != RedfishClient.ERR_CODE_OK:
+                return ret
+        return RedfishClient.ERR_CODE_UNEXPECTED_RESPONSE
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._resp = None
+
+    def is_open(self):
+        return self._resp is not None
+
+    '''
+    Block until next event. Return event payload dictionary, or None if
+    stream is closed (BMC closed connection, read timeout, error).
+    '''
+
+    def read_event(self):
+        data_lines = []
+        while self._resp is not None:
+            try:
+                line = self._resp.readline()
+            except (OSError, http.client.HTTPException):
+                line = b''
+            if not line:
+                self.close()
+                break
+            line = line.decode('utf-8', errors='replace').rstrip('\r\n')
+            if not line:
+                # Blank line dispatches event
+                if not data_lines:
+                    continue
+                data = '\n'.join(data_lines)
+                data_lines = []
+                try:
+                    event = json.loads(data)
+                except ValueError:
+                    continue
+                self.stat['event'] += 1
+                return event
+            if line.startswith(':'):
+                self.stat['keepalive'] += 1
+                continue
+            field, _, value = line.partition(':')
+            if value.startswith(' '):
+                value = value[1:]
+            if field == 'data':
+                data_lines.append(value)
+            elif field == 'id':
+                self.last_event_id = value
+        return None
+
+    '''
+    Return list of resource paths (OriginOfCondition) of Redfish Event records.
+    '''
+
+    @staticmethod
+    def event_origins(event):
+        origins = []
+        for record in event.get('Events', []):
+            origin = record.get('OriginOfCondition')
+            if isinstance(origin, dict):
+                origin = origin.get('@odata.id')
+            if origin:
+                origins.append(origin)
+        return origins
 
 
 '''
 cURL wrapper for Redfish client access (curl -K stdin; secrets off argv).
+Optional transport (RedfishHttpTransport) executes the same request config natively.
 '''
 
 
@@ -62,6 +751,9 @@ class RedfishClient:
     DEFAULT_GET_TIMEOUT = 3
     _CFG_LOGIN_PREFIX = '# hw-mgmt-redfish: login\n'
     _CURL_HTTP_TRAILER_RE = re.compile(r'\nHTTP Status Code: (\d+)\Z')
+    # Upload requests: bytes sent by curl, written before HTTP status trailer
+    _CURL_UPLOAD_WRITE_OUT = '\nUpload Size: %{size_upload}'
+    _CURL_UPLOAD_TRAILER_RE = re.compile(r'\nUpload Size: (\d+)\Z')
 
     # Redfish URIs
     REDFISH_URI_FW_INVENTORY = '/redfish/v1/UpdateService/FirmwareInventory'
@@ -80,24 +772,92 @@ class RedfishClient:
     ERR_CODE_IDENTICAL_IMAGE = -7
     ERR_CODE_GENERIC_ERROR = -8
 
+    # Request transports
+    TRANSPORT_CURL = 'curl'
+    TRANSPORT_HTTP = 'http'
+
+    # Firmware update
+    FW_UPLOAD_STALL_SEC = 60
+    FW_UPLOAD_RETRY_MAX = 3
+    FW_UPLOAD_RETRY_DELAY = 5
+    FW_UPDATE_TIMEOUT = 1800
+    # Task monitor poll interval (sec): ~TASK_POLL_STEPS polls over estimated remaining time
+    TASK_POLL_MIN = 1
+    TASK_POLL_MAX = 30
+    TASK_POLL_STEPS = 4
+    TASK_POLL_ERR_MAX = 5
+    TASK_DONE_STATES = ('Completed', 'Exception', 'Killed', 'Cancelled')
+
     '''
     Constructor
+    transport: TRANSPORT_CURL (default, curl process per request), TRANSPORT_HTTP
+    (RedfishHttpTransport) or transport object with exec_config(curl_config)
+    cache: RedfishResponseCache for GET responses, None - no caching (default)
+    token_cache: RedfishTokenCache shared with other processes, None - no sharing (default)
     '''
 
-    def __init__(self, curl_path, ip_addr, user, password):
+    def __init__(self, curl_path, ip_addr, user, password, transport=None, cache=None, token_cache=None):
         self.__curl_path = curl_path
         self.__svr_ip = ip_addr
         self.__user = user
         self.__password = password
         self.__token = None
+        if transport == RedfishClient.TRANSPORT_HTTP:
+            transport = RedfishHttpTransport()
+        elif transport == RedfishClient.TRANSPORT_CURL:
+            transport = None
+        self.__transport = transport
+        self.__cache = cache
+        self.__token_cache = token_cache
+        # Token rejected by BMC: do not take it from token cache again
+        self.__stale_token = None
+        self.__password_provider = None
+        # Serializes token changes and reads of threads sharing the client
+        # (main loop, event listener). Taken after token cache lock.
+        self.__login_lock = threading.RLock()
+
+    def get_transport(self):
+        return self.__transport
+
+    def get_cache(self):
+        return self.__cache
 
     def get_token(self):
         return self.__token
 
+    def get_server_addr(self):
+        return self.__svr_ip
+
     def update_credentials(self, user, password=None):
-        self.__user = user
-        self.__token = None
-        self.__password = password
+        with self.__login_lock:
+            self.__user = user
+            self.__token = None
+            self.__password = password
+
+    '''
+    Set callable which returns password when login is needed and no password
+    is set (password is obtained only if there is no valid token).
+    '''
+
+    def set_password_provider(self, provider):
+        self.__password_provider = provider
+
+    '''
+    Take session token of user from token cache (no BMC access).
+    Return True if valid token is found.
+    '''
+
+    def use_cached_token(self, user):
+        if self.__token_cache is None:
+            return False
+        token = self.__token_cache.load(self.__svr_ip, user)
+        with self.__login_lock:
+            if (not token) or (token == self.__stale_token):
+                return False
+            if user != self.__user:
+                self.update_credentials(user)
+            self.__token = token
+        return True
 
     @staticmethod
     def __curl_config_escape_double_quoted_value(val):
@@ -155,15 +915,18 @@ class RedfishClient:
 
     '''
     Build curl stdin config for firmware upload POST (token off argv).
+    Transfer stalled for FW_UPLOAD_STALL_SEC is aborted (no total time limit).
     '''
 
-    def __build_fw_update_cmd(self, fw_image):
+    def __build_fw_update_cmd(self, fw_image, uri=REDFISH_URI_UPDATE_SERVICE):
         url_esc = self.__curl_config_escape_double_quoted_value(
-            self.__curl_redfish_url(RedfishClient.REDFISH_URI_UPDATE_SERVICE))
+            self.__curl_redfish_url(uri))
         up_esc = self.__curl_config_escape_double_quoted_value(fw_image)
         return '\n'.join([
             '# hw-mgmt-redfish: fw-post-upload',
             'insecure',
+            'speed-limit = 1',
+            f'speed-time = {RedfishClient.FW_UPLOAD_STALL_SEC}',
             self.__curl_config_auth_header_line(),
             'header = "Content-Type: application/octet-stream"',
             'request = POST',
@@ -171,6 +934,28 @@ class RedfishClient:
             f'url = "{url_esc}"',
         ])
 
+    '''
+    Build curl stdin config for multipart firmware upload POST
+    (MultipartHttpPushUri: UpdateParameters JSON + UpdateFile, token off argv).
+    '''
+
+    def __build_fw_multipart_cmd(self, fw_image, uri, update_params):
+        url_esc = self.__curl_config_escape_double_quoted_value(
+            self.__curl_redfish_url(uri))
+        params_esc = self.__curl_config_escape_double_quoted_value(json.dumps(update_params))
+        up_esc = self.__curl_config_escape_double_quoted_value(fw_image)
+        return '\n'.join([
+            '# hw-mgmt-redfish: fw-post-multipart',
+            'insecure',
+            'speed-limit = 1',
+            f'speed-time = {RedfishClient.FW_UPLOAD_STALL_SEC}',
+            self.__curl_config_auth_header_line(),
+            'request = POST',
+            f'form = "UpdateParameters={params_esc};type=application/json"',
+            f'form = "UpdateFile=@{up_esc};type=application/octet-stream"',
+            f'url = "{url_esc}"',
+        ])
+
     '''
     Build curl stdin config for PATCH account password (token off argv).
     '''
@@ -386,16 +1171,27 @@ class RedfishClient:
     Execute cURL command and return the output and error messages
     '''
 
-    def __exec_curl_cmd_internal(self, curl_config):
+    def __exec_curl_cmd_internal(self, curl_config, progress=None):
 
         task_mon = RedfishClient.REDFISH_URI_TASKS in curl_config
+        if self.__transport is not None:
+            if not task_mon:
+                cfg_str = self.__curl_config_for_logging(curl_config)
+                print(f'Execute Redfish request ({self.__transport.name}): {cfg_str}', file=sys.stderr)
+            if progress is not None:
+                return self.__transport.exec_config(curl_config, progress=progress)
+            return self.__transport.exec_config(curl_config)
+
         if not task_mon:
             cmd_str = self.__format_curl_command_for_logging(curl_config)
             print(f'Execute cURL command: {cmd_str}', file=sys.stderr)
 
+        write_out = '\nHTTP Status Code: %{http_code}'
+        if progress is not None:
+            write_out = RedfishClient._CURL_UPLOAD_WRITE_OUT + write_out
         curl_argv = [
             self.__curl_path,
-            '-w', '\nHTTP Status Code: %{http_code}',
+            '-w', write_out,
             '-K', '-',
         ]
         process = subprocess.Popen(
@@ -405,6 +1201,7 @@ class RedfishClient:
             stderr=subprocess.PIPE,
         )
         stdin_bytes = curl_config.encode('utf-8')
+        start = time.monotonic()
         output, error = process.communicate(input=stdin_bytes)
         output_decoded = output.decode('utf-8')
         error_str = error.decode('utf-8')
@@ -413,7 +1210,13 @@ class RedfishClient:
         if ret > 0:
             ret = RedfishClient.ERR_CODE_CURL_FAILURE
 
-        output_str, _http = self.__parse_curl_output(output_decoded)
+        output_str, http_code = self.__parse_curl_output(output_decoded)
+        uploaded = None
+        if progress is not None:
+            match = RedfishClient._CURL_UPLOAD_TRAILER_RE.search(output_str)
+            if match:
+                output_str = output_str[:match.start()]
+                uploaded = int(match.group(1))
         output_str = output_str.rstrip('\n')
 
         if ret != 0:
@@ -421,7 +1224,29 @@ class RedfishClient:
             if match:
                 error_str = match.group(1)
 
-        return (ret, output_str, error_str)
+        http_status = int(http_code) if http_code else None
+        if progress is not None:
+            # curl uploads file itself: report transfer result only,
+            # bytes sent by failed transfer from size_upload
+            size = self.__get_upload_size(curl_config)
+            if size is not None:
+                sent = size if ret == 0 else min(uploaded or 0, size)
+                elapsed = time.monotonic() - start
+                progress(sent, size, sent / elapsed if elapsed > 0 else 0.0)
+        return (ret, output_str, error_str, http_status, None)
+
+    @staticmethod
+    def __get_upload_size(curl_config):
+        opts = parse_curl_config(curl_config)
+        path = opts.get('upload-file')
+        for form in opts['form']:
+            match = re.match(r'[^=]*=@(.*?)(;type=[^;]+)?$', form)
+            if match:
+                path = match.group(1)
+        try:
+            return os.path.getsize(path) if path else None
+        except OSError:
+            return None
 
     def __update_token_in_curl_config(self, curl_config):
         if self.__token is None:
@@ -454,7 +1279,7 @@ class RedfishClient:
     invalid bearer token case.
     '''
 
-    def exec_curl_cmd(self, curl_config):
+    def exec_curl_cmd(self, curl_config, progress=None):
         is_login_cmd = curl_config.startswith(RedfishClient._CFG_LOGIN_PREFIX)
 
         req_type = self.__get_http_request_type(curl_config)
@@ -463,36 +1288,109 @@ class RedfishClient:
         # Not login, return
         if (not self.has_login()) and (not is_login_cmd):
             return (RedfishClient.ERR_CODE_NOT_LOGIN, 'Not login', 'Not login')
-
-        ret, output_str, error_str = self.__exec_curl_cmd_internal(curl_config)
+        # Token may be replaced by other thread after the command was built
+        token = self.__token
+        if not is_login_cmd:
+            curl_config = self.__update_token_in_curl_config(curl_config)
+
+        cache_uri = None
+        is_cached_get = False
+        request_config = curl_config
+        if (self.__cache is not None) and (not is_login_cmd):
+            cache_uri = self.__get_request_uri(curl_config)
+            is_cached_get = req_type in (None, 'GET')
+            if is_cached_get:
+                cached, etag = self.__cache.lookup(cache_uri)
+                if cached is not None:
+                    return (RedfishClient.ERR_CODE_OK, cached, '')
+                if etag:
+                    request_config = self.__add_if_none_match(curl_config, etag)
+
+        ret, output_str, error_str, http_status, etag = self.__exec_curl_cmd_internal(request_config, progress)
+
+        if is_cached_get and (ret == 0) and (http_status == 304):
+            cached = self.__cache.revalidate(cache_uri)
+            if cached is not None:
+                return (RedfishClient.ERR_CODE_OK, cached, '')
+            # Entry invalidated meanwhile, request full body
+            ret, output_str, error_str, http_status, etag = self.__exec_curl_cmd_internal(curl_config)
 
         is_empty_response = ((ret == 0) and (len(output_str) == 0))
+        is_unauthorized = ((ret == 0) and (http_status == 401))
 
         # cURL will return 0 and empty string in case of invalid token for
-        # GET & POST.
+        # GET & POST. HTTP 401 means token expired for any request type.
         # Need to re-generate token
-        if (is_empty_response and (not is_login_cmd) and (not is_patch_req)):
-            self.__token = None
-            ret = self.login()
+        if ((is_empty_response and (not is_patch_req)) or is_unauthorized) and (not is_login_cmd):
+            ret = self.relogin(token)
             if ret == RedfishClient.ERR_CODE_OK:
                 curl_retry = self.__update_token_in_curl_config(curl_config)
-                ret, output_str, error_str = self.__exec_curl_cmd_internal(
-                    curl_retry)
+                ret, output_str, error_str, http_status, etag = self.__exec_curl_cmd_internal(
+                    curl_retry, progress)
             elif ret == RedfishClient.ERR_CODE_BAD_CREDENTIAL:
-                self.__token = None
                 return (ret, 'Bad credential', 'Bad credential')
             else:
-                self.__token = None
                 return (ret, 'Login failure', 'Login failure')
 
+        if cache_uri is not None:
+            if not is_cached_get:
+                # PATCH/POST/DELETE: BMC state changed, even if request failed
+                self.__cache.invalidate(cache_uri)
+            elif (ret == 0) and (http_status == 200):
+                self.__cache.store(cache_uri, output_str, etag)
+
         return (ret, output_str, error_str)
 
+    @staticmethod
+    def __get_request_uri(curl_config):
+        url = urllib.parse.urlsplit(parse_curl_config(curl_config).get('url', ''))
+        if url.query:
+            return f'{url.path}?{url.query}'
+        return url.path
+
+    def __add_if_none_match(self, curl_config, etag):
+        hdr = ('header = "If-None-Match: ' +
+               self.__curl_config_escape_double_quoted_value(etag) + '"')
+        return re.sub(r'^url = ', lambda m: hdr + '\n' + m.group(0), curl_config, count=1, flags=re.MULTILINE)
+
+    '''
+    Drop token rejected by BMC and login again.
+    rejected_token: token used by rejected request, current token if None.
+    Token already replaced by other thread is kept (no second login).
+    '''
+
+    def relogin(self, rejected_token=None):
+        with self.__token_cache or contextlib.nullcontext(), self.__login_lock:
+            if rejected_token is None:
+                rejected_token = self.__token
+            elif (self.__token is not None) and (self.__token != rejected_token):
+                return RedfishClient.ERR_CODE_OK
+            self.__stale_token = rejected_token
+            self.__token = None
+            return self.login()
+
+    '''
+    Open EventService SSE stream (RedfishEventStream) for BMC event notifications.
+    Return (ret, stream), stream is None on failure.
+    '''
+
+    def open_event_stream(self, uri=RedfishEventStream.SSE_URI, read_timeout=RedfishEventStream.READ_TIMEOUT,
+                          connection_factory=None):
+        if not self.has_login():
+            return (RedfishClient.ERR_CODE_NOT_LOGIN, None)
+        stream = RedfishEventStream(self, self.__svr_ip, uri, read_timeout, connection_factory)
+        ret = stream.open()
+        if ret != RedfishClient.ERR_CODE_OK:
+            return (ret, None)
+        return (ret, stream)
+
     '''
     Check if already login
     '''
 
     def has_login(self):
-        return self.__token is not None
+        with self.__login_lock:
+            return self.__token is not None
 
     '''
     Login Redfish server and get bearer token
@@ -502,8 +1400,28 @@ class RedfishClient:
         if self.has_login():
             return RedfishClient.ERR_CODE_OK
 
+        if self.__token_cache is None:
+            with self.__login_lock:
+                if self.__token is not None:
+                    return RedfishClient.ERR_CODE_OK
+                return self.__login(password)
+
+        # Single-flight: other process may have refreshed token meanwhile
+        with self.__token_cache, self.__login_lock:
+            if self.__token is not None:
+                return RedfishClient.ERR_CODE_OK
+            if self.use_cached_token(self.__user):
+                return RedfishClient.ERR_CODE_OK
+            ret = self.__login(password)
+            if ret == RedfishClient.ERR_CODE_OK:
+                self.__token_cache.store(self.__svr_ip, self.__user, self.__token)
+            return ret
+
+    def __login(self, password):
         if not password:
             password = self.__password
+        if (not password) and self.__password_provider:
+            password = self.__password_provider()
 
         curl_cfg = self.__build_login_cmd(password)
         ret, response, error = self.exec_curl_cmd(curl_cfg)
@@ -540,6 +1458,166 @@ class RedfishClient:
 
         return ret
 
+    '''
+    Get firmware push URI from UpdateService.
+    Return (uri, multipart): MultipartHttpPushUri if supported, else HttpPushUri,
+    else UpdateService (legacy BMC).
+    '''
+
+    def __get_fw_push_uri(self):
+        ret, response, _ = self.exec_curl_cmd(self.__build_get_cmd(RedfishClient.REDFISH_URI_UPDATE_SERVICE))
+        if ret == RedfishClient.ERR_CODE_OK:
+            try:
+                service = json.loads(response)
+            except ValueError:
+                service = {}
+            if service.get('MultipartHttpPushUri'):
+                return (service['MultipartHttpPushUri'], True)
+            if service.get('HttpPushUri'):
+                return (service['HttpPushUri'], False)
+        return (RedfishClient.REDFISH_URI_UPDATE_SERVICE, False)
+
+    '''
+    Upload firmware image, retry transfer failed before the whole image was sent.
+    Return (ret, task_uri or None, message).
+    '''
+
+    def __upload_firmware(self, fw_image, targets, force_update, progress_callback):
+        uri, multipart = self.__get_fw_push_uri()
+        if multipart:
+            update_params = {'Targets': list(targets or [])}
+            if force_update is not None:
+                update_params['ForceUpdate'] = bool(force_update)
+            cmd = self.__build_fw_multipart_cmd(fw_image, uri, update_params)
+        else:
+            if force_update is not None:
+                ret, _, error = self.exec_curl_cmd(self.__build_set_force_update_cmd(force_update))
+                if ret != RedfishClient.ERR_CODE_OK:
+                    return (ret, None, f'Failed to set ForceUpdate: {error}')
+            cmd = self.__build_fw_update_cmd(fw_image, uri)
+
+        transfer = {'sent': 0, 'total': None}
+
+        def upload_progress(sent, total, rate):
+            transfer['sent'] = sent
+            transfer['total'] = total
+            if progress_callback:
+                progress_callback(sent, total, rate)
+
+        for attempt in range(RedfishClient.FW_UPLOAD_RETRY_MAX):
+            transfer['sent'] = 0
+            ret, response, error = self.exec_curl_cmd(cmd, progress=upload_progress)
+            # BMC got part of image only: it can not have accepted it, safe to post again
+            incomplete = (transfer['total'] is not None) and (transfer['sent'] < transfer['total'])
+            if (ret != RedfishClient.ERR_CODE_CURL_FAILURE) or (not incomplete):
+                break
+            print(f'Firmware upload failed at {transfer["sent"]}/{transfer["total"]} bytes: {error}',
+                  file=sys.stderr)
+            if attempt + 1 < RedfishClient.FW_UPLOAD_RETRY_MAX:
+                time.sleep(RedfishClient.FW_UPLOAD_RETRY_DELAY * (attempt + 1))
+
+        if ret != RedfishClient.ERR_CODE_OK:
+            return (ret, None, f'Firmware upload failed: {error}')
+        try:
+            result = json.loads(response) if response else {}
+        except ValueError:
+            return (RedfishClient.ERR_CODE_INVALID_JSON_FORMAT, None, 'Invalid json format')
+        if 'error' in result:
+            return (RedfishClient.ERR_CODE_GENERIC_ERROR, None, result['error'].get('message', ''))
+        task_uri = result.get('@odata.id', '')
+        if RedfishClient.REDFISH_URI_TASKS not in task_uri:
+            task_uri = None
+        return (RedfishClient.ERR_CODE_OK, task_uri, '')
+
+    '''
+    Next task monitor poll interval.
+    Remaining time is estimated by task EstimatedDuration, else by PercentComplete
+    progress rate; without estimate the interval is doubled.
+    '''
+
+    @staticmethod
+    def __task_poll_delay(task, elapsed, delay):
+        remaining = None
+        estimated = parse_iso8601_duration(task.get('EstimatedDuration'))
+        if estimated is not None:
+            remaining = estimated - elapsed
+        percent = task.get('PercentComplete')
+        if ((remaining is None) or (remaining <= 0)) and isinstance(percent, (int, float)) and (0 < percent < 100):
+            remaining = elapsed * (100 - percent) / percent
+        if (remaining is not None) and (remaining > 0):
+            delay = remaining / RedfishClient.TASK_POLL_STEPS
+        else:
+            delay = delay * 2
+        return min(max(delay, RedfishClient.TASK_POLL_MIN), RedfishClient.TASK_POLL_MAX)
+
+    '''
+    Wait for Redfish task completion.
+    progress_callback(percent, state) is called per poll.
+    Return (ret, task dictionary).
+    '''
+
+    def __wait_task(self, task_uri, timeout, progress_callback=None):
+        start = time.monotonic()
+        delay = RedfishClient.TASK_POLL_MIN
+        errors = 0
+        task = {}
+        while True:
+            ret, response, _ = self.exec_curl_cmd(self.__build_get_cmd(task_uri))
+            if ret == RedfishClient.ERR_CODE_OK:
+                try:
+                    task = json.loads(response)
+                    errors = 0
+                except ValueError:
+                    ret = RedfishClient.ERR_CODE_INVALID_JSON_FORMAT
+            if ret != RedfishClient.ERR_CODE_OK:
+                # BMC busy with update may drop requests
+                errors += 1
+                if errors >= RedfishClient.TASK_POLL_ERR_MAX:
+                    return (ret, task)
+            else:
+                state = task.get('TaskState')
+                if progress_callback:
+                    progress_callback(task.get('PercentComplete'), state)
+                if state in RedfishClient.TASK_DONE_STATES:
+                    break
+
+            elapsed = time.monotonic() - start
+            if elapsed >= timeout:
+                return (RedfishClient.ERR_CODE_TIMEOUT, task)
+            delay = RedfishClient.__task_poll_delay(task, elapsed, delay)
+            time.sleep(min(delay, timeout - elapsed))
+
+        if (task.get('TaskState') == 'Completed') and (task.get('TaskStatus', 'OK') == 'OK'):
+            return (RedfishClient.ERR_CODE_OK, task)
+        for message in task.get('Messages', []):
+            if 'identical' in message.get('Message', '').lower():
+                return (RedfishClient.ERR_CODE_IDENTICAL_IMAGE, task)
+        return (RedfishClient.ERR_CODE_GENERIC_ERROR, task)
+
+    '''
+    Update firmware: upload image to UpdateService push URI and wait for the
+    update task.
+    targets: FirmwareInventory URIs to update (multipart push only), None - by image
+    force_update: None - BMC default
+    progress_callback(sent, total, rate): upload progress
+    task_callback(percent, state): update task progress
+    Return (ret, message).
+    '''
+
+    def redfish_api_update_firmware(self, fw_image, targets=None, force_update=None, progress_callback=None,
+                                    task_callback=None, timeout=FW_UPDATE_TIMEOUT):
+        ret, task_uri, msg = self.__upload_firmware(fw_image, targets, force_update, progress_callback)
+        if (ret != RedfishClient.ERR_CODE_OK) or (task_uri is None):
+            return (ret, msg)
+
+        ret, task = self.__wait_task(task_uri, timeout, task_callback)
+        if ret == RedfishClient.ERR_CODE_TIMEOUT:
+            return (ret, f'Firmware update task {task_uri} timeout')
+        if ret != RedfishClient.ERR_CODE_OK:
+            messages = [message.get('Message', '') for message in task.get('Messages', [])]
+            return (ret, '; '.join(messages) or f'Firmware update task {task_uri} failed')
+        return (ret, '')
+
     def build_get_cmd(self, uri):
         return self.__build_get_cmd(uri)
 
@@ -547,6 +1625,323 @@ class RedfishClient:
         return self.__build_post_cmd(uri, data_dict)
 
 
+'''
+asyncio Redfish GET client for concurrent multi-resource queries
+(inventory, sensors, accounts). Login, token and relogin are shared with
+the wrapped RedfishClient: on HTTP 401 one coroutine re-logs in by
+RedfishClient.relogin(), others retry with the new token.
+Up to 'concurrency' requests are in flight, each on its own kept-alive
+connection (idle connections are reused). Request timeout does not include
+waiting for a free slot. Results match RedfishClient.exec_curl_cmd():
+(ret, body, error), ret is ERR_CODE_OK for any HTTP status except 401.
+Use in one event loop:
+    async with AsyncRedfishClient(rf_client) as aclient:
+        results = await aclient.gather_many(uris)
+'''
+
+
+class AsyncRedfishClient:
+
+    DEFAULT_CONCURRENCY = 8
+    HTTPS_PORT = 443
+    # Errors on reused kept-alive connection: BMC closed it, reconnect once
+    RECONNECT_ERRORS = (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError)
+
+    '''
+    Constructor
+    rf_client: RedfishClient, login is done by it (login() here or before)
+    connection_factory: coroutine function (host, port) -> (reader, writer),
+    None - TLS without certificate check, same as curl 'insecure'
+    '''
+
+    def __init__(self, rf_client, concurrency=DEFAULT_CONCURRENCY, timeout=RedfishClient.DEFAULT_GET_TIMEOUT,
+                 connection_factory=None):
+        self.__client = rf_client
+        self.__concurrency = concurrency
+        self.__timeout = timeout
+        self.__connection_factory = connection_factory or self.__bmc_https_open_connection
+        host, _, port = rf_client.get_server_addr().rpartition(':')
+        if (not host) or (not port.isdigit()):
+            host, port = rf_client.get_server_addr(), AsyncRedfishClient.HTTPS_PORT
+        self.__host = host
+        self.__port = int(port)
+        self.__loop = None
+        self.__sem = None
+        self.__login_lock = None
+        self.__idle = []
+        self.stat = {'request': 0, 'connect': 0, 'reconnect': 0, 'relogin': 0, 'error': 0}
+
+    @staticmethod
+    async def __bmc_https_open_connection(host, port):
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return await asyncio.open_connection(host, port, ssl=context)
+
+    def __bind_loop(self):
+        # asyncio primitives and connections belong to one event loop
+        loop = asyncio.get_running_loop()
+        if self.__loop is not loop:
+            self.__loop = loop
+            self.__sem = asyncio.Semaphore(self.__concurrency)
+            self.__login_lock = asyncio.Lock()
+            self.__idle = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        await self.close()
+
+    '''
+    Close idle connections.
+    '''
+
+    async def close(self):
+        idle, self.__idle = self.__idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    async def login(self):
+        return await asyncio.get_running_loop().run_in_executor(None, self.__client.login)
+
+    async def __relogin(self, rejected_token):
+        async with self.__login_lock:
+            token = self.__client.get_token()
+            if (token is not None) and (token != rejected_token):
+                # Re-logged in by other request
+                return RedfishClient.ERR_CODE_OK
+            self.stat['relogin'] += 1
+            return await asyncio.get_running_loop().run_in_executor(None, self.__client.relogin, rejected_token)
+
+    async def __acquire(self):
+        while self.__idle:
+            reader, writer = self.__idle.pop()
+            if not reader.at_eof():
+                return (reader, writer), True
+            writer.close()
+        conn = await self.__connection_factory(self.__host, self.__port)
+        self.stat['connect'] += 1
+        return conn, False
+
+    @staticmethod
+    async def __read_response(reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('Connection closed by BMC')
+        status = int(status_line.split(None, 2)[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, val = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = val.strip()
+
+        keep_alive = headers.get('connection', '').lower() != 'close'
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = bytearray()
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    # Trailer section
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                body += await reader.readexactly(size)
+                await reader.readexactly(2)
+            body = bytes(body)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        elif (status in (204, 304)) or (100 <= status < 200):
+            body = b''
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return status, body, keep_alive
+
+    async def __exchange(self, conn, uri, token):
+        reader, writer = conn
+        request = (f'GET {uri} HTTP/1.1\r\n'
+                   f'Host: {self.__host}\r\n'
+                   'Accept: application/json\r\n'
+                   f'X-Auth-Token: {token or ""}\r\n'
+                   '\r\n')
+        writer.write(request.encode('utf-8'))
+        await writer.drain()
+        return await self.__read_response(reader)
+
+    async def __request(self, uri, token):
+        conn, reused = await self.__acquire()
+        try:
+            try:
+                status, body, keep_alive = await self.__exchange(conn, uri, token)
+            except AsyncRedfishClient.RECONNECT_ERRORS:
+                if not reused:
+                    raise
+                conn[1].close()
+                self.stat['reconnect'] += 1
+                conn, _ = await self.__acquire()
+                status, body, keep_alive = await self.__exchange(conn, uri, token)
+        except BaseException:
+            # Error, timeout or cancel: response state unknown, drop connection
+            conn[1].close()
+            raise
+        if keep_alive:
+            self.__idle.append(conn)
+        else:
+            conn[1].close()
+        return status, body
+
+    '''
+    GET Redfish resource. Return (ret, body, error).
+    timeout: per request (sec), None - client default
+    '''
+
+    async def get(self, uri, timeout=None):
+        self.__bind_loop()
+        if not self.__client.has_login():
+            return (RedfishClient.ERR_CODE_NOT_LOGIN, 'Not login', 'Not login')
+        timeout = self.__timeout if timeout is None else timeout
+        async with self.__sem:
+            for attempt in range(2):
+                token = self.__client.get_token()
+                self.stat['request'] += 1
+                try:
+                    status, body = await asyncio.wait_for(self.__request(uri, token), timeout)
+                except asyncio.TimeoutError:
+                    self.stat['error'] += 1
+                    return (RedfishClient.ERR_CODE_CURL_FAILURE, '', f'Operation timed out after {timeout} seconds')
+                except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, ssl.SSLError) as e:
+                    self.stat['error'] += 1
+                    return (RedfishClient.ERR_CODE_CURL_FAILURE, '', str(e) or type(e).__name__)
+                if (status != 401) or attempt:
+                    break
+                ret = await self.__relogin(token)
+                if ret == RedfishClient.ERR_CODE_BAD_CREDENTIAL:
+                    return (ret, 'Bad credential', 'Bad credential')
+                if ret != RedfishClient.ERR_CODE_OK:
+                    return (ret, 'Login failure', 'Login failure')
+        return (RedfishClient.ERR_CODE_OK, body.decode('utf-8', errors='replace').rstrip('\n'), '')
+
+    '''
+    GET resources concurrently. Return list of (ret, body, error) in uris order.
+    '''
+
+    async def gather_many(self, uris, timeout=None):
+        return list(await asyncio.gather(*(self.get(uri, timeout) for uri in uris)))
+
+    '''
+    GET collection and all its Members concurrently.
+    Return (ret, {member_uri: (ret, body, error)}), ret is collection GET result.
+    '''
+
+    async def gather_collection(self, uri, timeout=None):
+        ret, body, _ = await self.get(uri, timeout)
+        if ret != RedfishClient.ERR_CODE_OK:
+            return (ret, {})
+        try:
+            members = [member['@odata.id'] for member in json.loads(body).get('Members', [])]
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return (RedfishClient.ERR_CODE_INVALID_JSON_FORMAT, {})
+        results = await self.gather_many(members, timeout)
+        return (RedfishClient.ERR_CODE_OK, dict(zip(members, results)))
+
+
+'''
+IPv4 address of network interface by SIOCGIFADDR ioctl (no ip/awk processes).
+Addresses are cached until rtnetlink reports link or IPv4 address change
+(RTMGRP_LINK, RTMGRP_IPV4_IFADDR notifications, checked by non-blocking
+read on each lookup). Without netlink socket every lookup is an ioctl.
+'''
+
+
+class NetIfAddrCache:
+
+    SIOCGIFADDR = 0x8915
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+
+    def __init__(self):
+        self._addr = {}
+        self._sock = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __open_watch(self):
+        self.close()
+        self._pid = os.getpid()
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW | socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC,
+                                 socket.NETLINK_ROUTE)
+            sock.bind((0, NetIfAddrCache.RTMGRP_LINK | NetIfAddrCache.RTMGRP_IPV4_IFADDR))
+        except (OSError, AttributeError):
+            return
+        self._sock = sock
+
+    '''
+    Drain pending rtnetlink notifications. Return True if cache is not valid.
+    '''
+
+    def __changed(self):
+        if self._pid != os.getpid():
+            # New process (fork): notification socket is shared with parent
+            self.__open_watch()
+            return True
+        if self._sock is None:
+            return True
+        changed = False
+        while True:
+            try:
+                if not self._sock.recv(65536):
+                    break
+                changed = True
+            except BlockingIOError:
+                break
+            except OSError:
+                # ENOBUFS: notifications lost
+                changed = True
+                break
+        return changed
+
+    @staticmethod
+    def ioctl_addr(ifname):
+        ifreq = struct.pack('256s', ifname[:15].encode('utf-8'))
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                ifreq = fcntl.ioctl(sock.fileno(), NetIfAddrCache.SIOCGIFADDR, ifreq)
+        except OSError:
+            return None
+        # struct ifreq: ifr_name[16], struct sockaddr_in (family, port, addr)
+        return socket.inet_ntoa(ifreq[20:24])
+
+    '''
+    Return IPv4 address of interface, None if interface has no address.
+    '''
+
+    def get(self, ifname):
+        with self._lock:
+            if self.__changed():
+                self._addr.clear()
+            addr = self._addr.get(ifname)
+            if addr is None:
+                addr = self.ioctl_addr(ifname)
+                if addr is not None:
+                    self._addr[ifname] = addr
+            return addr
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._addr.clear()
+
+
 '''
 BMCAccessor encapsulates BMC details such as IP address, credential management.
 It also acts as wrapper of RedfishClient. For each member function
@@ -571,20 +1966,43 @@ class BMCAccessor(object):
     LOCK_FILE = "hw_management_get_login_password.lock"
     FLOCK_TIMEOUT_SEC = 10
     LEGACY_PLATFORM_PATTERN = r'N5\d{3}_LD'
-
-    def __init__(self):
-        # TBD: Token persistency.
-
+    # Session token of BMC_NOS_ACCOUNT shared by Redfish consumers (hw-management.sh,
+    # updaters, FW tools). Admin account tokens of login flow are not shared.
+    TOKEN_CACHE_DIR = "/run/hw-management-redfish"
+    TOKEN_CACHE_FILE = "token"
+    TOKEN_LOCK_FILE = "hw_management_redfish_token.lock"
+    TOKEN_TTL_SEC = 1200
+    # NOS side of NOS-BMC USB network link
+    BMC_NET_IFACE = "usb0"
+    # Shared by BMCAccessor instances of the process
+    ifaddr_cache = NetIfAddrCache()
+
+    def __init__(self, transport=None, cache=None):
+        self.token_cache = RedfishTokenCache(os.path.join(self.TOKEN_CACHE_DIR, self.TOKEN_CACHE_FILE),
+                                             os.path.join(self.LOCK_DIR, self.TOKEN_LOCK_FILE),
+                                             self.TOKEN_TTL_SEC,
+                                             self.FLOCK_TIMEOUT_SEC,
+                                             users=(BMCAccessor.BMC_NOS_ACCOUNT,))
+        # Password (TPM access) is obtained on demand, not if cached token is valid
         self.rf_client = RedfishClient(BMCAccessor.CURL_PATH,
                                        self.get_ip_addr(),
                                        BMCAccessor.BMC_NOS_ACCOUNT,
-                                       self.get_login_password())
+                                       None,
+                                       transport,
+                                       cache,
+                                       self.token_cache)
+        self.rf_client.set_password_provider(self.get_login_password)
 
     def get_ip_addr(self):
         # Return BMC IP address. get usb0 IP address and replace the last
         # byte with '1'.
         # The assumption is that BMC IP address is always X.X.X.1.
-        cmd = "/usr/sbin/ip -o -4 addr list usb0 | awk -F ' *|/' '{print $4}'"
+        addr = BMCAccessor.ifaddr_cache.get(BMCAccessor.BMC_NET_IFACE)
+        if addr is not None:
+            return '.'.join(addr.split('.')[:-1] + ['1'])
+
+        # In-process lookup failed: ip utility
+        cmd = f"/usr/sbin/ip -o -4 addr list {BMCAccessor.BMC_NET_IFACE} | awk -F ' *|/' '{{print $4}}'"
         result = subprocess.run(cmd,
                                 stdout=subprocess.PIPE,
                                 stderr=subprocess.PIPE,
@@ -816,6 +2234,14 @@ class BMCAccessor(object):
 
     def login(self, password=None):
         print("Login to BMC")
+        # Single-flight across processes: wait for login in progress, then reuse its token
+        with self.token_cache:
+            if self.rf_client.use_cached_token(BMCAccessor.BMC_NOS_ACCOUNT):
+                print("-- BMC Login Pass, cached token")
+                return RedfishClient.ERR_CODE_OK
+            return self._login_flow()
+
+    def _login_flow(self):
         cp = []
         try:
             cp.append("A")  # try with BMC_NOS_ACCOUNT and TPM password")
@@ -56,11 +56,14 @@ import subprocess
 import signal
 from hw_management_lib import HW_Mgmt_Logger as Logger
 from hw_management_lib import current_milli_time as current_milli_time
-from hw_management_lib import RepeatedTimer as RepeatedTimer
+from hw_management_lib import JobScheduler
+from hw_management_lib import FileHandleCache
 from hw_management_lib import ObjectSnapshot, compare_snapshots, print_comparison, read_dmi_data, exit_wait, run_shell_cmd
 import json
 import re
 import threading
+import heapq
+import time
 import psutil
 
 #############################
@@ -86,6 +89,7 @@ class CONST:
     LOG_USE_SYSLOG = "use_syslog"
     LOG_FILE = "log_filename"
     HW_MGMT_ROOT = "root_folder"
+    FILE_CACHE_SIZE = "file_cache_size"
     GLOBAL_CONFIG = "global_config"
     SYSTEM_CONFIG = "system_config"
 
@@ -244,6 +248,9 @@ class CONST:
     # so we need to wait for SDK load timeout to avoid false error handling
     SDK_LOAD_TIMEOUT_SEC = 60
 
+    # Main loop scheduler: re-check period for disabled devices (msec)
+    SCHED_DISABLED_RECHECK_TIME = 1000
+
     # subclass with CPLD reg definition
     class CPLD_REG:
         BASE_ADDR = "0x2500"
@@ -498,6 +505,8 @@ ASIC_CONF_DEFAULT = {"1": {"pwm_control": False, "fan_control": False}}
 # Memory usage debugging variables
 gmemory_snapshot = None
 gmemory_snapshot_profiler = ObjectSnapshot(max_depth=16)
+# Shared cache of open attribute descriptors used by hw_management_file_op (None - disabled)
+gfile_handle_cache = None
 
 _sig_condition_name = ""
 
@@ -664,7 +673,11 @@ class hw_management_file_op:
         """
         content = None
         filename = os.path.join(self.root_folder, filename)
-        if os.path.isfile(filename):
+        if gfile_handle_cache:
+            content = gfile_handle_cache.read(filename)
+            if content is not None:
+                content = content.rstrip("\n")
+        elif os.path.isfile(filename):
             with open(filename, "r") as content_file:
                 content = content_file.read().rstrip("\n")
 
@@ -778,6 +791,8 @@ class hw_management_file_op:
         if not filename:
             return False
         filename = os.path.join(self.root_folder, filename)
+        if gfile_handle_cache:
+            return gfile_handle_cache.is_file(filename)
         return os.path.isfile(filename)
 
     # ----------------------------------------------------------------------
@@ -789,6 +804,8 @@ class hw_management_file_op:
         @param data: data to write
         """
         filename = os.path.join(self.root_folder, filename)
+        if gfile_handle_cache:
+            gfile_handle_cache.invalidate(filename)
         if os.path.isfile(filename):
             os.remove(filename)
 
@@ -1288,6 +1305,10 @@ class system_device(hw_management_file_op):
         self.fault_list_dynamic_filtered = []
         self.dynamic_filter_ena = False
 
+        # error exclusion (redundancy) rules which are applied to this device.
+        # Filled by ThermalManagement on device add
+        self.err_exclusion_conf_list = []
+
     # ----------------------------------------------------------------------
     def __del__(self):
         """
@@ -3561,6 +3582,7 @@ class ThermalManagement(hw_management_file_op):
                           r'dpu\d*_cx_amb': "add_DPU_cx_amb_sensor",
                           r'dpu\d*_module': "add_DPU_module"
                           }
+    ADD_SENSOR_HANDLER_RE = [(re.compile(mask), fn_name) for mask, fn_name in ADD_SENSOR_HANDLER.items()]
 
     def __init__(self, cmd_arg, tc_logger):
         """
@@ -3571,10 +3593,17 @@ class ThermalManagement(hw_management_file_op):
         hw_management_file_op.__init__(self, cmd_arg)
         self.log = tc_logger
         self.log.notice("Preinit Nvidia thermal control v.{}".format(VERSION), repeat=1)
+        file_cache_size = cmd_arg.get(CONST.FILE_CACHE_SIZE, 0)
+        if file_cache_size:
+            global gfile_handle_cache
+            gfile_handle_cache = FileHandleCache(max_size=file_cache_size)
+            self.log.info("file handle cache enabled, max open files {}".format(file_cache_size))
         try:
             self.write_file(CONST.LOG_LEVEL_FILENAME, cmd_arg["verbosity"])
         except (OSError, IOError):
             pass
+        # PWM worker and periodic report jobs run from single scheduler thread
+        self.job_scheduler = JobScheduler("tc_job_scheduler")
         self.periodic_report_worker_timer = None
         self.cmd_arg = cmd_arg
 
@@ -3591,7 +3620,25 @@ class ThermalManagement(hw_management_file_op):
         self.log.info("periodic report {} sec".format(self.periodic_report_time))
 
         self.dev_obj_list = []
+        # device name -> device object index
+        self.dev_obj_dict = {}
+        self.dev_child_obj_dict = {}
         self.sys_config = {}
+        # precompiled name_mask patterns of sensor configuration sections
+        self.conf_rule_index = {}
+
+        # Main loop scheduler state.
+        # dev_sched_heap: min-heap of (service timestamp, seq, dev_obj), one entry per device in dev_obj_dict
+        # dev_pwm_dict/dev_pwm_max: last PWM reported by each enabled device and cached max of it
+        # dev_fault_dict: running devices which have faults (static filtered)
+        self.dev_sched_heap = []
+        self.dev_sched_seq = 0
+        self.dev_pwm_dict = {}
+        self.dev_pwm_max = (0, "")
+        self.dev_pwm_max_dirty = True
+        self.dev_fault_dict = {}
+        self.loop_stat = {}
+        self._loop_stat_reset()
 
         self.pwm_max_reduction = CONST.PWM_MAX_REDUCTION
         self.pwm_worker_timer = None
@@ -3863,7 +3910,11 @@ class ThermalManagement(hw_management_file_op):
     def _get_dev_obj(self, name_mask):
         """
         @summary: Get device object by it's name
+        @param name_mask: device name or regex mask of device name
         """
+        dev_obj = self.dev_obj_dict.get(name_mask)
+        if dev_obj:
+            return dev_obj
         for dev_obj in list(self.dev_obj_list):
             if re.match(name_mask, dev_obj.name):
                 return dev_obj
@@ -3892,6 +3943,9 @@ class ThermalManagement(hw_management_file_op):
             return None
 
         self.dev_obj_list.append(dev_obj)
+        self.dev_obj_dict[dev_obj.name] = dev_obj
+        self._dev_rule_index_update(dev_obj)
+        self._sched_push(dev_obj)
         child_list = dev_obj.get_child_list()
         if child_list:
             self.add_sensors(child_list)
@@ -3907,6 +3961,60 @@ class ThermalManagement(hw_management_file_op):
         if dev_obj:
             self.log.info("Rm dev {}".format(dev_obj.name))
             self.dev_obj_list.remove(dev_obj)
+            # Heap entry is dropped lazily on pop
+            if self.dev_obj_dict.get(dev_obj.name) is dev_obj:
+                del self.dev_obj_dict[dev_obj.name]
+            dev_obj.err_exclusion_conf_list = []
+            self.dev_fault_dict.pop(dev_obj.name, None)
+            self._pwm_dict_rm(dev_obj.name)
+
+    # ----------------------------------------------------------------------
+    def _dev_rule_index_update(self, dev_obj):
+        """
+        @summary: Attach to device error exclusion rules which name_mask matches device name
+        """
+        dev_obj.err_exclusion_conf_list = [conf for conf in self.dev_err_exclusion_conf.values() if conf["name_re"].match(dev_obj.name)]
+
+    # ----------------------------------------------------------------------
+    def _add_err_exclusion_conf(self, err_name, name_mask, min_err_cnt):
+        """
+        @summary: Add error exclusion (redundancy) rule and attach it to already created devices
+        @param err_name: error type name (CONST.PSU_ERR, CONST.FAN_ERR)
+        @param name_mask: regex mask of device names rule is applied to
+        @param min_err_cnt: minimal number of failed devices to count the error
+        """
+        self.dev_err_exclusion_conf[err_name] = {"name_mask": name_mask,
+                                                 "name_re": re.compile(name_mask),
+                                                 "min_err_cnt": min_err_cnt,
+                                                 "curr_err_cnt": 0,
+                                                 "skip_err": False}
+        for dev_obj in self.dev_obj_list:
+            self._dev_rule_index_update(dev_obj)
+
+    # ----------------------------------------------------------------------
+    def _conf_rule_match(self, rule_name, conf_dict, name, full_match=True):
+        """
+        @summary: Find first entry of conf_dict which key (regex name_mask) matches name.
+        Compiled patterns are cached per rule_name.
+        @param rule_name: name of configuration section (cache key)
+        @param conf_dict: dict {name_mask: value}
+        @param name: sensor name
+        @param full_match: mask should match whole name ('$' appended to mask)
+        @return: tuple (True, value) if matched, (False, None) otherwise
+        """
+        rule_list = self.conf_rule_index.get(rule_name)
+        if rule_list is None:
+            rule_list = []
+            for name_mask, val in conf_dict.items():
+                if full_match and not name_mask.endswith("$"):
+                    name_mask = name_mask + "$"
+                rule_list.append((re.compile(name_mask), val))
+            self.conf_rule_index[rule_name] = rule_list
+
+        for name_re, val in rule_list:
+            if name_re.match(name):
+                return True, val
+        return False, None
 
     # ----------------------------------------------------------------------
     def _init_child_obj(self):
@@ -3919,6 +4027,167 @@ class ThermalManagement(hw_management_file_op):
                 child_obj = self._get_dev_obj(child_name)
                 if child_obj:
                     dev_obj.add_child_obj(child_obj)
+                    self.dev_child_obj_dict.setdefault(dev_obj.name, []).append(child_obj)
+
+    # ----------------------------------------------------------------------
+    def _sched_push(self, dev_obj, timestamp=None):
+        """
+        @summary: Add device to the main loop scheduler heap
+        @param dev_obj: device object
+        @param timestamp: time (msec) when device should be serviced. Default - device timestamp
+        """
+        if timestamp is None:
+            timestamp = dev_obj.get_timestamp()
+        self.dev_sched_seq += 1
+        heapq.heappush(self.dev_sched_heap, (timestamp, self.dev_sched_seq, dev_obj))
+
+    # ----------------------------------------------------------------------
+    def _sched_rebuild(self):
+        """
+        @summary: Rebuild scheduler heap, PWM and fault caches from dev_obj_list.
+        Should be called when devices were started/stopped outside of the main loop.
+        """
+        self.dev_sched_heap = []
+        self.dev_obj_dict = {}
+        self.dev_pwm_dict = {}
+        self.dev_pwm_max_dirty = True
+        self.dev_fault_dict = {}
+        for dev_obj in self.dev_obj_list:
+            self.dev_obj_dict[dev_obj.name] = dev_obj
+            self._sched_push(dev_obj)
+            self._sched_sync_fault(dev_obj)
+            self._sched_sync_pwm(dev_obj)
+
+    # ----------------------------------------------------------------------
+    def _sched_pop_due(self, curr_timestamp):
+        """
+        @summary: Pop from scheduler heap all devices which should be serviced now.
+        Removed devices and devices which timestamp was moved forward are skipped.
+        Disabled devices are re-checked every SCHED_DISABLED_RECHECK_TIME.
+        @param curr_timestamp: current time in msec
+        @return: list of device objects
+        """
+        due_list = []
+        heap = self.dev_sched_heap
+        while heap and heap[0][0] <= curr_timestamp:
+            _, _, dev_obj = heapq.heappop(heap)
+            if self.dev_obj_dict.get(dev_obj.name) is not dev_obj:
+                continue
+
+            dev_timestamp = dev_obj.get_timestamp()
+            if dev_timestamp > curr_timestamp:
+                self._sched_push(dev_obj, dev_timestamp)
+            elif not dev_obj.enable:
+                self._sched_sync_fault(dev_obj)
+                self._sched_sync_pwm(dev_obj)
+                self._sched_push(dev_obj, curr_timestamp + CONST.SCHED_DISABLED_RECHECK_TIME)
+            else:
+                due_list.append(dev_obj)
+        return due_list
+
+    # ----------------------------------------------------------------------
+    def _sched_get_next_timestamp(self, default_timestamp):
+        """
+        @summary: Get time when next device should be serviced
+        @param default_timestamp: maximum value to return
+        """
+        if self.dev_sched_heap:
+            return min(self.dev_sched_heap[0][0], default_timestamp)
+        return default_timestamp
+
+    # ----------------------------------------------------------------------
+    def _sched_sync_fault(self, dev_obj):
+        """
+        @summary: Update fault cache with device state. Should be called after device was processed
+        """
+        if dev_obj.enable and dev_obj.state == CONST.RUNNING and dev_obj.get_fault_list_static_filtered():
+            self.dev_fault_dict[dev_obj.name] = dev_obj
+        else:
+            self.dev_fault_dict.pop(dev_obj.name, None)
+
+    # ----------------------------------------------------------------------
+    def _sched_sync_pwm(self, dev_obj):
+        """
+        @summary: Update PWM cache and cached max PWM with device PWM.
+        Max PWM is fully recalculated only when the current max source decreases or removed.
+        """
+        name = dev_obj.name
+        if not dev_obj.enable:
+            self._pwm_dict_rm(name)
+            return
+
+        pwm = dev_obj.get_pwm()
+        self.log.debug("{0:25}: PWM {1}".format(name, pwm))
+        self.dev_pwm_dict[name] = pwm
+        if self.dev_pwm_max_dirty:
+            return
+
+        pwm_max, pwm_max_name = self.dev_pwm_max
+        try:
+            if pwm > pwm_max:
+                self.dev_pwm_max = (pwm, name)
+            elif name == pwm_max_name and pwm < pwm_max:
+                self.dev_pwm_max_dirty = True
+        except (ValueError, TypeError):
+            self.dev_pwm_max_dirty = True
+
+    # ----------------------------------------------------------------------
+    def _pwm_dict_rm(self, name):
+        """
+        @summary: Remove device from PWM cache
+        """
+        if name in self.dev_pwm_dict:
+            del self.dev_pwm_dict[name]
+            if name == self.dev_pwm_max[1]:
+                self.dev_pwm_max_dirty = True
+
+    # ----------------------------------------------------------------------
+    def _pwm_get_cached_max(self):
+        """
+        @summary: Get max PWM over all enabled devices
+        @return: Max PWM value, name of device which set it
+        """
+        if self.dev_pwm_max_dirty:
+            self.dev_pwm_max = self._pwm_get_max(self.dev_pwm_dict)
+            self.dev_pwm_max_dirty = False
+        return self.dev_pwm_max
+
+    # ----------------------------------------------------------------------
+    def _loop_stat_reset(self):
+        """
+        @summary: Reset main loop cost statistic
+        """
+        self.loop_stat = {"iter_cnt": 0, "due_cnt": 0, "due_max": 0, "time_ms": 0.0, "time_max_ms": 0.0}
+
+    # ----------------------------------------------------------------------
+    def _loop_stat_update(self, due_cnt, time_ms):
+        """
+        @summary: Add main loop iteration to the statistic
+        @param due_cnt: number of devices serviced in iteration
+        @param time_ms: iteration processing time in msec
+        """
+        stat = self.loop_stat
+        stat["iter_cnt"] += 1
+        stat["due_cnt"] += due_cnt
+        stat["due_max"] = max(stat["due_max"], due_cnt)
+        stat["time_ms"] += time_ms
+        stat["time_max_ms"] = max(stat["time_max_ms"], time_ms)
+
+    # ----------------------------------------------------------------------
+    def _loop_stat_str(self):
+        """
+        @summary: Get main loop statistic string for periodic report
+        """
+        stat = self.loop_stat
+        iter_cnt = stat["iter_cnt"]
+        if not iter_cnt:
+            return "Main loop: no iterations"
+        return "Main loop: iterations:{} dev serviced avg/max:{}/{} of {}, time avg/max:{}/{} ms".format(iter_cnt,
+                                                                                                       round(stat["due_cnt"] / iter_cnt, 1),
+                                                                                                       stat["due_max"],
+                                                                                                       len(self.dev_obj_list),
+                                                                                                       round(stat["time_ms"] / iter_cnt, 2),
+                                                                                                       round(stat["time_max_ms"], 2))
 
     # ---------------------------------------------------------------------
     def _get_chassis_fan_dir(self):
@@ -4041,7 +4310,7 @@ class ThermalManagement(hw_management_file_op):
         self.pwm_timestamp_array[0] = current_milli_time()
 
         for drwr_idx in range(1, self.fan_drwr_num + 1):
-            fan_obj = self._get_dev_obj("drwr{}.*".format(drwr_idx))
+            fan_obj = self._get_dev_obj("drwr{}".format(drwr_idx))
             if fan_obj:
                 fan_obj.set_pwm(pwm_val, force)
 
@@ -4240,38 +4509,27 @@ class ThermalManagement(hw_management_file_op):
             # 3.2 Apply missing keys from user_config->sensors_config to sensor_conf
             if CONST.SYS_CONF_DEV_PARAM in user_config:
                 dev_param = user_config[CONST.SYS_CONF_DEV_PARAM]
-                for name_mask, val in dev_param.items():
-                    if re.match(name_mask, sensor_name):
-                        add_missing_to_dict(sensors_config[sensor_name], val)
-                        break
+                match, val = self._conf_rule_match("user_dev_param", dev_param, sensor_name, full_match=False)
+                if match:
+                    add_missing_to_dict(sensors_config[sensor_name], val)
 
         # 4. Apply config from dev_tune as extra_param
         if CONST.SYS_CONF_DEV_TUNE in self.sys_config:
             dev_tune = self.sys_config[CONST.SYS_CONF_DEV_TUNE]
-            for name_mask, dev_tune_val in dev_tune.items():
-                if not name_mask.endswith("$"):
-                    name_mask = name_mask + "$"
-                if re.match(name_mask, sensor_name):
-                    add_missing_to_dict(sensors_config[sensor_name], {CONST.DEV_CONF_EXTRA_PARAM: dev_tune_val})
-                    break
+            match, dev_tune_val = self._conf_rule_match("dev_tune", dev_tune, sensor_name)
+            if match:
+                add_missing_to_dict(sensors_config[sensor_name], {CONST.DEV_CONF_EXTRA_PARAM: dev_tune_val})
 
         # 5. Apply missing keys from dev_parameters to sensor_conf
         dev_param = self.sys_config[CONST.SYS_CONF_DEV_PARAM]
-        for name_mask, val in dev_param.items():
-            if not name_mask.endswith("$"):
-                name_mask = name_mask + "$"
-            if re.match(name_mask, sensor_name):
-                add_missing_to_dict(sensors_config[sensor_name], val)
-                break
+        match, val = self._conf_rule_match("dev_param", dev_param, sensor_name)
+        if match:
+            add_missing_to_dict(sensors_config[sensor_name], val)
 
         # 6. Apply missing keys from def config to sensor_conf
-        dev_param = SENSOR_DEF_CONFIG
-        for name_mask, val in dev_param.items():
-            if not name_mask.endswith("$"):
-                name_mask = name_mask + "$"
-            if re.match(name_mask, sensor_name):
-                add_missing_to_dict(sensors_config[sensor_name], val)
-                break
+        match, val = self._conf_rule_match("def_config", SENSOR_DEF_CONFIG, sensor_name)
+        if match:
+            add_missing_to_dict(sensors_config[sensor_name], val)
 
     # ----------------------------------------------------------------------
     def _pwm_get_max(self, pwm_list):
@@ -4530,7 +4788,7 @@ class ThermalManagement(hw_management_file_op):
         err_mask = None
         if exclusion_conf:
             min_err_cnt = int(exclusion_conf.get("min_err_cnt", 2))
-            self.dev_err_exclusion_conf[CONST.PSU_ERR] = {"name_mask": r"psu\d+_fan", "min_err_cnt": min_err_cnt, "curr_err_cnt": 0}
+            self._add_err_exclusion_conf(CONST.PSU_ERR, r"psu\d+_fan", min_err_cnt)
             err_mask = exclusion_conf.get("err_mask", None)
             if not err_mask:
                 err_mask = CONST.PSU_ERR_LIST
@@ -4548,7 +4806,7 @@ class ThermalManagement(hw_management_file_op):
         err_mask = None
         if exclusion_conf:
             min_err_cnt = int(exclusion_conf.get("min_err_cnt", 2))
-            self.dev_err_exclusion_conf[CONST.FAN_ERR] = {"name_mask": r"drwr\d+", "min_err_cnt": min_err_cnt, "curr_err_cnt": 0}
+            self._add_err_exclusion_conf(CONST.FAN_ERR, r"drwr\d+", min_err_cnt)
             err_mask = exclusion_conf.get("err_mask", None)
             if not err_mask:
                 err_mask = CONST.DRWR_ERR_LIST
@@ -4697,9 +4955,8 @@ class ThermalManagement(hw_management_file_op):
         @summary: Add sensor configuration based on sensor list
         """
         for sensor_name in sensor_list:
-            for config_handler_mask in self.ADD_SENSOR_HANDLER:
-                if re.match(config_handler_mask, sensor_name):
-                    fn_name = self.ADD_SENSOR_HANDLER[config_handler_mask]
+            for config_handler_re, fn_name in self.ADD_SENSOR_HANDLER_RE:
+                if config_handler_re.match(sensor_name):
                     init_fn = getattr(self, fn_name)
                     init_fn(sensor_name)
 
@@ -4765,17 +5022,18 @@ class ThermalManagement(hw_management_file_op):
             if fan_obj:
                 self.pwm_max_reduction = fan_obj.get_max_reduction()
 
-            # Stop old timers before creating new ones
+            # Remove old jobs before creating new ones
             if self.periodic_report_worker_timer:
-                self.periodic_report_worker_timer.stop()
-            self.periodic_report_worker_timer = RepeatedTimer(
-                self.periodic_report_time, self.print_periodic_info, auto_start=True)
+                self.job_scheduler.remove_job(self.periodic_report_worker_timer)
+            self.periodic_report_worker_timer = self.job_scheduler.add_job(
+                self.print_periodic_info, self.periodic_report_time, auto_start=True, name="periodic_report")
 
-            # PWM worker timer - stop old one and START the new one!
+            # PWM worker job is started on PWM target change. Runs before report if both are due.
             if self.pwm_worker_timer:
-                self.pwm_worker_timer.stop()
-            self.pwm_worker_timer = RepeatedTimer(
-                self.pwm_worker_poll_time, self._pwm_worker, auto_start=False)
+                self.job_scheduler.remove_job(self.pwm_worker_timer)
+            self.pwm_worker_timer = self.job_scheduler.add_job(
+                self._pwm_worker, self.pwm_worker_poll_time, priority=1, auto_start=False, name="pwm_worker")
+            self.job_scheduler.start()
 
             fan_dir = self._get_chassis_fan_dir()
             self._update_system_flow_dir(fan_dir)
@@ -4787,6 +5045,8 @@ class ThermalManagement(hw_management_file_op):
                 ambient_sensor = self._get_dev_obj("sensor_amb")
                 self.amb_tmp = ambient_sensor.get_value()
 
+            # devices were restarted - reschedule all of them
+            self._sched_rebuild()
             self.write_file("config/thermal_enforced_full_speed", "0\n")
 
     # ----------------------------------------------------------------------
@@ -4798,12 +5058,13 @@ class ThermalManagement(hw_management_file_op):
         """
         if self.state != CONST.STOPPED:
             if self.pwm_worker_timer:
-                self.pwm_worker_timer.stop()
+                self.job_scheduler.remove_job(self.pwm_worker_timer)
                 self.pwm_worker_timer = None
 
             if self.periodic_report_worker_timer:
-                self.periodic_report_worker_timer.stop()
+                self.job_scheduler.remove_job(self.periodic_report_worker_timer)
                 self.periodic_report_worker_timer = None
+            self.job_scheduler.stop()
 
             # Stop all devices gracefully
             for dev_obj in self.dev_obj_list:
@@ -4882,91 +5143,89 @@ class ThermalManagement(hw_management_file_op):
                 self.module_scan()
                 module_scan_timeout = current_milli_time() + 30 * 1000
 
-            pwm_list = {}
             # set maximum next poll timestamp = 60 sec
             timestamp_next = current_milli_time() + 60 * 1000
 
-            # collect errors
+            loop_start = time.perf_counter()
             curr_timestamp = current_milli_time()
+            # only devices which poll time expired are serviced
+            due_list = self._sched_pop_due(curr_timestamp)
 
-            for dev_obj in self.dev_obj_list:
+            for dev_obj in due_list:
                 if self.exit.is_set():
                     return
                 if dev_obj.enable:
-                    if curr_timestamp >= dev_obj.get_timestamp():
-                        # process sensors
-                        dev_obj.process(self.sys_config[CONST.SYS_CONF_DMIN], self.system_flow_dir, self.amb_tmp)
-                        if dev_obj.name == "sensor_amb":
-                            self.amb_tmp = dev_obj.get_value()
+                    # process sensors
+                    dev_obj.process(self.sys_config[CONST.SYS_CONF_DMIN], self.system_flow_dir, self.amb_tmp)
+                    if dev_obj.name == "sensor_amb":
+                        self.amb_tmp = dev_obj.get_value()
+                self._sched_sync_fault(dev_obj)
+                for child_obj in self.dev_child_obj_dict.get(dev_obj.name, []):
+                    self._sched_sync_fault(child_obj)
 
+            # collect errors
             total_err_count = 0
             for name, conf in self.dev_err_exclusion_conf.items():
                 conf["curr_err_cnt"] = 0
                 conf["skip_err"] = False
 
-            for dev_obj in self.dev_obj_list:
+            for dev_obj in list(self.dev_fault_dict.values()):
                 if self.exit.is_set():
                     return
-                if dev_obj.enable:
-                    if dev_obj.state != CONST.RUNNING:
-                        continue
-                    fault_list = dev_obj.get_fault_list_static_filtered()
-                    if not fault_list:
-                        continue
-                    else:
-                        if CONST.EMERGENCY in fault_list:
-                            self.emergency = True
-                            break
-                        fault_cnt = dev_obj.get_fault_cnt()
-                        total_err_count += fault_cnt
-
-                    dynamic_fault_list = dev_obj.get_fault_list_dynamic()
-                    if not dynamic_fault_list:
-                        continue
+                fault_list = dev_obj.get_fault_list_static_filtered()
+                if not fault_list:
+                    continue
+                else:
+                    if CONST.EMERGENCY in fault_list:
+                        self.emergency = True
+                        break
+                    fault_cnt = dev_obj.get_fault_cnt()
+                    total_err_count += fault_cnt
 
-                    for name, conf in self.dev_err_exclusion_conf.items():
-                        # don't need to check if min error not set
-                        min_num = conf.get("min_err_cnt", 0)
-                        if not min_num:
-                            continue
-                        name_mask = conf["name_mask"]
-
-                        # matched with dev name
-                        if re.match(name_mask, dev_obj.name):
-                            # optional mask for specific error
-                            conf["curr_err_cnt"] += 1
-                            # if current err count >= than set in min config
-                            conf["skip_err"] = (conf["curr_err_cnt"] < min_num)
-                            if conf["skip_err"]:
-                                total_err_count -= fault_cnt
+                dynamic_fault_list = dev_obj.get_fault_list_dynamic()
+                if not dynamic_fault_list:
+                    continue
+
+                # rules matched with dev name
+                for conf in dev_obj.err_exclusion_conf_list:
+                    # don't need to check if min error not set
+                    min_num = conf.get("min_err_cnt", 0)
+                    if not min_num:
+                        continue
+                    # optional mask for specific error
+                    conf["curr_err_cnt"] += 1
+                    # if current err count >= than set in min config
+                    conf["skip_err"] = (conf["curr_err_cnt"] < min_num)
+                    if conf["skip_err"]:
+                        total_err_count -= fault_cnt
 
             if self.emergency:
+                for due_obj in due_list:
+                    self._sched_push(due_obj)
                 self.stop("Emergency stop {}".format(dev_obj.name))
                 self.write_file("config/thermal_enforced_full_speed", "1\n")
                 continue
 
-            for dev_obj in self.dev_obj_list:
+            for dev_obj in due_list:
                 if self.exit.is_set():
                     return
                 if dev_obj.enable:
                     if curr_timestamp >= dev_obj.get_timestamp():
                         if dev_obj.state == CONST.RUNNING:
                             # process sensors
-                            for name, conf in self.dev_err_exclusion_conf.items():
-                                name_mask = conf["name_mask"]
-                                # if exists min err rule for current device
-                                if re.match(name_mask, dev_obj.name):
-                                    dev_obj.set_dynamic_filter_ena(conf["skip_err"])
+                            # if exists min err rule for current device
+                            for conf in dev_obj.err_exclusion_conf_list:
+                                dev_obj.set_dynamic_filter_ena(conf["skip_err"])
                             dev_obj.handle_err(self.sys_config[CONST.SYS_CONF_DMIN], self.system_flow_dir, self.amb_tmp)
                         dev_obj.update_timestamp()
 
-                    pwm = dev_obj.get_pwm()
-                    self.log.debug("{0:25}: PWM {1}".format(dev_obj.name, pwm))
-                    pwm_list[dev_obj.name] = pwm
-
-                    obj_timestamp = dev_obj.get_timestamp()
-                    timestamp_next = min(obj_timestamp, timestamp_next)
+                self._sched_sync_pwm(dev_obj)
+                for child_obj in self.dev_child_obj_dict.get(dev_obj.name, []):
+                    self._sched_sync_pwm(child_obj)
+                self._sched_push(dev_obj)
 
+            pwm_max, pwm_max_name = self._pwm_get_cached_max()
+            pwm_list = {pwm_max_name: pwm_max}
             if total_err_count >= CONST.TOTAL_MAX_ERR_COUNT:
                 pwm_list["total_err_cnt({})>={}".format(total_err_count, CONST.TOTAL_MAX_ERR_COUNT)] = CONST.PWM_MAX
                 force_reason = True
@@ -4981,6 +5240,11 @@ class ThermalManagement(hw_management_file_op):
             self.log.debug("Result PWM {}".format(pwm))
             self._set_pwm(pwm, reason=name, force_reason=force_reason)
 
+            loop_time_ms = (time.perf_counter() - loop_start) * 1000
+            self._loop_stat_update(len(due_list), loop_time_ms)
+            self.log.debug("Serviced {} of {} dev in {} ms".format(len(due_list), len(self.dev_obj_list), round(loop_time_ms, 2)))
+
+            timestamp_next = self._sched_get_next_timestamp(timestamp_next)
             sleep_ms = int(timestamp_next - current_milli_time())
 
             # Poll time should not be smaller than 1 sec to reduce system load
@@ -5089,6 +5353,16 @@ class ThermalManagement(hw_management_file_op):
         self.log.info("Temperature(C):{} amb:{}".format(asic_info, amb_tmp))
         self.log.info("Cooling(%):{} (max pwm source:{}), avg:{}".format(self.pwm_target, self.pwm_change_reason, round(self._get_pwm_avg(), 1)))
         self.log.info("dir:{}".format(flow_dir))
+        self.log.info(self._loop_stat_str())
+        self._loop_stat_reset()
+        if gfile_handle_cache:
+            file_cache_stat = gfile_handle_cache.get_stat()
+            gfile_handle_cache.reset_stat()
+            self.log.info("File cache: hit:{hit} miss:{miss} reopen:{reopen} evict:{evict} open:{open}".format(**file_cache_stat))
+        for job_name, job_stat in self.job_scheduler.get_stat().items():
+            self.log.info("Job {}: run:{} skip:{} err:{} runtime avg/max:{:.2f}/{:.2f}ms late avg/max:{:.1f}/{}ms".format(
+                job_name, job_stat["run_cnt"], job_stat["skip_cnt"], job_stat["err_cnt"],
+                job_stat["runtime_avg_ms"], job_stat["runtime_max_ms"], job_stat["late_avg_ms"], job_stat["late_max_ms"]))
         self.log.info("=" * 40)
 
         dev_obj_sorted = sorted(self.dev_obj_list, key=natural_key)
@@ -5150,6 +5424,14 @@ if __name__ == '__main__':
                             dest=CONST.HW_MGMT_ROOT,
                             help="Define custom hw-management root folder",
                             default=CONST.HW_MGMT_FOLDER_DEF)
+    CMD_PARSER.add_argument("--file_cache_size",
+                            dest=CONST.FILE_CACHE_SIZE,
+                            help="Keep up to N sensor attribute files open and re-read them with pread. 0 - disabled",
+                            type=int, default=0)
+    CMD_PARSER.add_argument("--log_async_queue",
+                            dest="log_async_queue",
+                            help="Write log from separate thread with queue of N messages. 0 - synchronous log",
+                            type=int, default=0)
     args = vars(CMD_PARSER.parse_args())
     if args[CONST.LOG_USE_SYSLOG]:
         syslog_level = Logger.NOTICE
@@ -5160,6 +5442,8 @@ if __name__ == '__main__':
                     log_repeat=Logger.LOG_REPEAT_UNLIMITED, syslog_repeat=0,
                     syslog_level=syslog_level,
                     ident=CONST.SYSLOG_IDENTIFIER)
+    if args["log_async_queue"]:
+        logger.set_async_mode(args["log_async_queue"])
     thermal_management = None
     try:
         thermal_management = ThermalManagement(args, logger)
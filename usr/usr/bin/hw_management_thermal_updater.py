@@ -59,8 +59,9 @@ try:
         atomic_file_write,
         exit_wait,
         current_milli_time,
+        JobScheduler,
     )
-    from collections import Counter
+    from collections import Counter, deque
     from hw_management_platform_config import (
         PLATFORM_CONFIG,
         get_module_count
@@ -94,6 +95,12 @@ class CONST(object):
     # Error retry configuration
     ASIC_READ_ERR_RETRY_COUNT = 3
 
+    # Forced rewrite interval of unchanged thermal attributes (sec)
+    ATTR_WRITE_REFRESH_TIME = 60
+
+    # Parallel SDK sysfs read: max single ASIC/module read time (ms)
+    READ_DEADLINE_DEF = 2000
+
     # Temperature conversion constants
     SDK_TEMP_MULTIPLIER = 125  # SDK to millidegrees conversion
     SDK_TEMP_MASK = 0xffff      # Mask for negative temperature values
@@ -107,11 +114,17 @@ class CONST(object):
     LOG_ROTATION_SIZE = 1 * 1024 * 1024  # 1MB
     LOG_ROTATION_COUNT = 3
 
+    # Log repeat-collapse hash: min size, message ids per module/ASIC
+    LOG_HASH_SIZE_MIN = 256
+    LOG_HASH_IDS_PER_MODULE = 4
+
     # Memory usage debugging
     DBG_MEMORY_INFO = True
     DBG_MEMORY_USAGE_ALERT = 30000    # KB
     DBG_MEMORY_USAGE_ALERT_STEP = 5000  # KB
     PERIODIC_MEMORY_REPORT_TIME = 5 * 60  # 5 min
+    # Attribute entry run longer than this (ms) is reported
+    ATTR_SLOW_RUN_MS = 1000
 
 
 # ----------------------------------------------------------------------
@@ -173,6 +186,17 @@ _memory_alert_threshold = CONST.DBG_MEMORY_USAGE_ALERT
 EXIT = threading.Event()
 _sig_condition_name = ""
 
+# Last written values of thermal attributes {f_name: [value, refresh_ts]}.
+# None - cache disabled, every attribute is written on each poll.
+_attr_write_cache = None
+_attr_write_refresh_ms = 0
+_attr_write_stat = Counter()
+
+# Parallel SDK sysfs reader (ThermalReadPool). None - sequential reads from main loop
+READ_POOL = None
+# Due time scheduler of thermal_attr entries (JobScheduler of AttrEntry jobs)
+SCHEDULER = None
+
 
 class ShutdownRequested(BaseException):
     """
@@ -201,6 +225,77 @@ def sdk_temp2degree(val):
 # ----------------------------------------------------------------------
 
 
+def attr_write_cache_init(refresh_time):
+    """
+    @summary: Enable cache of last written thermal attribute values
+    @param refresh_time: Interval (sec) of forced rewrite of unchanged values. 0 - disable cache
+    """
+    global _attr_write_cache, _attr_write_refresh_ms
+    if refresh_time > 0:
+        _attr_write_cache = {}
+        _attr_write_refresh_ms = refresh_time * 1000
+    else:
+        _attr_write_cache = None
+        _attr_write_refresh_ms = 0
+
+# ----------------------------------------------------------------------
+
+
+def attr_write_cache_drop(f_name_prefix):
+    """
+    @summary: Drop cached values of attributes with names starting with f_name_prefix.
+        Next write of these attributes is done unconditionally.
+    @param f_name_prefix: Attribute file name prefix (e.g. /var/run/hw-management/thermal/module1_)
+    """
+    if _attr_write_cache:
+        # list() - cache can be updated by reader threads
+        for f_name in list(_attr_write_cache):
+            if f_name.startswith(f_name_prefix):
+                _attr_write_cache.pop(f_name, None)
+
+# ----------------------------------------------------------------------
+
+
+def _attr_file_ino(f_name):
+    """
+    @summary: Inode of attribute file, None if it doesn't exist
+    """
+    try:
+        return os.stat(f_name).st_ino
+    except OSError:
+        return None
+
+# ----------------------------------------------------------------------
+
+
+def attr_write(f_name, value):
+    """
+    @summary: Write thermal attribute if value changed since last write,
+        refresh interval expired or file was removed/replaced by other writer
+        (e.g. module files removed by hw-management-thermal-events.sh)
+    @param f_name: Attribute file name
+    @param value: Value (str) to write
+    """
+    if _attr_write_cache is not None:
+        now = current_milli_time()
+        cached = _attr_write_cache.get(f_name)
+        if cached and cached[0] == value and now < cached[1] and _attr_file_ino(f_name) == cached[2]:
+            _attr_write_stat["skipped"] += 1
+            return
+        # Drop entry until write is done: failed write must be retried on next poll
+        _attr_write_cache.pop(f_name, None)
+
+    atomic_file_write(f_name, value)
+    _attr_write_stat["written"] += 1
+    if _attr_write_cache is not None:
+        # atomic_file_write replaces file: new inode on each write
+        ino = _attr_file_ino(f_name)
+        if ino is not None:
+            _attr_write_cache[f_name] = [value, now + _attr_write_refresh_ms, ino]
+
+# ----------------------------------------------------------------------
+
+
 def is_module_host_management_mode(f_module_path):
     """
     @summary: Check if ASIC in independent mode
@@ -266,7 +361,7 @@ def asic_temp_reset(asic_name, f_asic_src_path):
     }
     for suffix, value in file_paths.items():
         f_name = "/var/run/hw-management/thermal/{}{}".format(asic_name, suffix)
-        atomic_file_write(f_name, str(value) + "\n")
+        attr_write(f_name, str(value) + "\n")
 
 
 # ----------------------------------------------------------------------
@@ -314,6 +409,7 @@ def asic_temp_populate(arg_list, arg):
         f_dst_name = "/var/run/hw-management/thermal/{}".format(asic_name)
         if os.path.islink(f_dst_name):
             LOGGER.notice("{} link exists".format(asic_name), id="{} asic_link_exists".format(asic_name))
+            attr_write_cache_drop(f_dst_name)
             continue
         else:
             LOGGER.notice(None, id="{} asic_link_exists".format(asic_name))
@@ -354,7 +450,7 @@ def asic_temp_populate(arg_list, arg):
         for suffix, value in file_paths.items():
             f_name = "/var/run/hw-management/thermal/{}{}".format(asic_name, suffix)
             try:
-                atomic_file_write(f_name, str(value) + "\n")
+                attr_write(f_name, str(value) + "\n")
             except Exception as e:
                 LOGGER.error(f"Error writing {f_name}: {e}")
                 continue
@@ -383,152 +479,343 @@ def module_temp_populate(arg_list, _dummy):
     for idx in range(module_count):
         if EXIT.is_set():
             break
-        module_name = "module{}".format(idx + offset)
-        f_dst_name = "/var/run/hw-management/thermal/{}_temp_input".format(module_name)
-        if os.path.islink(f_dst_name):
-            LOGGER.notice("skip link: {}".format(module_name), id="{} link_exists".format(module_name))
-            continue
-        else:
-            LOGGER.notice(None, id="{} link_exists".format(module_name))
+        module_temp_update("module{}".format(idx + offset), fin.format(idx))
+
+# ----------------------------------------------------------------------
 
-        f_src_path = fin.format(idx)
-        # If control mode is SW - skip temperature reading (independent mode)
-        if is_module_host_management_mode(f_src_path):
-            LOGGER.notice("{} independent mode".format(module_name), id="{} independent_mode".format(module_name))
-            continue
-        else:
-            LOGGER.notice(None, id="{} independent_mode".format(module_name))
 
-        # Check if module is present
-        module_present = 0
-        f_src_present = os.path.join(f_src_path, "present")
+def module_temp_update(module_name, f_src_path):
+    """
+    @summary: Populate temperature attributes of single module from SDK sysfs
+    @param module_name: Module name in hw-management thermal sysfs (e.g. "module1")
+    @param f_src_path: Path to SDK sysfs module directory
+    """
+    f_dst_name = "/var/run/hw-management/thermal/{}_temp_input".format(module_name)
+    if os.path.islink(f_dst_name):
+        LOGGER.notice("skip link: {}".format(module_name), id="{} link_exists".format(module_name))
+        attr_write_cache_drop("/var/run/hw-management/thermal/{}_".format(module_name))
+        return
+    else:
+        LOGGER.notice(None, id="{} link_exists".format(module_name))
+
+    # If control mode is SW - skip temperature reading (independent mode)
+    if is_module_host_management_mode(f_src_path):
+        LOGGER.notice("{} independent mode".format(module_name), id="{} independent_mode".format(module_name))
+        return
+    else:
+        LOGGER.notice(None, id="{} independent_mode".format(module_name))
+
+    # Check if module is present
+    module_present = 0
+    f_src_present = os.path.join(f_src_path, "present")
+    try:
+        with open(f_src_present, 'r') as f:
+            module_present = int(f.read().strip())
+    except (OSError, ValueError) as e:
+        error_message = str(e)
+        LOGGER.warning("{} read failed: {}".format(f_src_present, error_message), id="{} present_read_fail".format(module_name))
+    else:
+        LOGGER.notice(None, id="{} present_read_fail".format(module_name))
+
+    # Default temperature values
+    temperature = "0"
+    temperature_emergency = "0"
+    temperature_fault = "0"
+    temperature_trip_crit = "0"
+    temperature_crit = "0"
+    cooling_level_input = None
+    cooling_level_warning = None
+
+    if module_present:
+        f_src_input = os.path.join(f_src_path, "temperature/input")
+        f_src_crit = os.path.join(f_src_path, "temperature/threshold_hi")
+        f_src_hcrit = os.path.join(f_src_path, "temperature/threshold_critical_hi")
+        f_src_cooling_level_input = os.path.join(f_src_path, "temperature/tec/cooling_level")
+        f_src_cooling_level_warning = os.path.join(f_src_path, "temperature/tec/warning_cooling_level")
+
+        if os.path.isfile(f_src_cooling_level_input):
+            try:
+                with open(f_src_cooling_level_input, 'r') as f:
+                    cooling_level_input = f.read()
+            except OSError as e:
+                LOGGER.warning("{} read failed: {}".format(f_src_cooling_level_input, e),
+                               id="{} read_fail".format(f_src_cooling_level_input))
+            else:
+                LOGGER.notice(None, id="{} read_fail".format(f_src_cooling_level_input))
+
+        if os.path.isfile(f_src_cooling_level_warning):
+            try:
+                with open(f_src_cooling_level_warning, 'r') as f:
+                    cooling_level_warning = f.read()
+            except OSError as e:
+                LOGGER.warning("{} read failed: {}".format(f_src_cooling_level_warning, e),
+                               id="{} read_fail".format(f_src_cooling_level_warning))
+            else:
+                LOGGER.notice(None, id="{} read_fail".format(f_src_cooling_level_warning))
+
         try:
-            with open(f_src_present, 'r') as f:
-                module_present = int(f.read().strip())
+            with open(f_src_input, 'r') as f:
+                val = f.read()
+            temperature = sdk_temp2degree(int(val))
+
+            if os.path.isfile(f_src_crit):
+                with open(f_src_crit, 'r') as f:
+                    val = f.read()
+                temperature_crit = sdk_temp2degree(int(val))
+            else:
+                temperature_crit = CONST.MODULE_TEMP_MAX_DEF
+
+            if os.path.isfile(f_src_hcrit):
+                with open(f_src_hcrit, 'r') as f:
+                    val = f.read()
+                    temperature_emergency = sdk_temp2degree(int(val))
+            else:
+                temperature_emergency = temperature_crit + CONST.MODULE_TEMP_EMERGENCY_OFFSET
+
+            temperature_trip_crit = CONST.MODULE_TEMP_CRIT_DEF
+
         except (OSError, ValueError) as e:
             error_message = str(e)
-            LOGGER.warning("{} read failed: {}".format(f_src_present, error_message), id="{} present_read_fail".format(module_name))
+            LOGGER.warning("{} {}".format(f_src_input, error_message),
+                           id="{} read_fail".format(module_name))
         else:
-            LOGGER.notice(None, id="{} present_read_fail".format(module_name))
-
-        # Default temperature values
-        temperature = "0"
-        temperature_emergency = "0"
-        temperature_fault = "0"
-        temperature_trip_crit = "0"
-        temperature_crit = "0"
-        cooling_level_input = None
-        cooling_level_warning = None
-
-        if module_present:
-            f_src_input = os.path.join(f_src_path, "temperature/input")
-            f_src_crit = os.path.join(f_src_path, "temperature/threshold_hi")
-            f_src_hcrit = os.path.join(f_src_path, "temperature/threshold_critical_hi")
-            f_src_cooling_level_input = os.path.join(f_src_path, "temperature/tec/cooling_level")
-            f_src_cooling_level_warning = os.path.join(f_src_path, "temperature/tec/warning_cooling_level")
-
-            if os.path.isfile(f_src_cooling_level_input):
-                try:
-                    with open(f_src_cooling_level_input, 'r') as f:
-                        cooling_level_input = f.read()
-                except OSError as e:
-                    LOGGER.warning("{} read failed: {}".format(f_src_cooling_level_input, e),
-                                   id="{} read_fail".format(f_src_cooling_level_input))
-                else:
-                    LOGGER.notice(None, id="{} read_fail".format(f_src_cooling_level_input))
-
-            if os.path.isfile(f_src_cooling_level_warning):
-                try:
-                    with open(f_src_cooling_level_warning, 'r') as f:
-                        cooling_level_warning = f.read()
-                except OSError as e:
-                    LOGGER.warning("{} read failed: {}".format(f_src_cooling_level_warning, e),
-                                   id="{} read_fail".format(f_src_cooling_level_warning))
-                else:
-                    LOGGER.notice(None, id="{} read_fail".format(f_src_cooling_level_warning))
+            LOGGER.info(None, id="{} read_fail".format(module_name))
+    else:
+        LOGGER.info(None, id="{} read_fail".format(module_name))
+
+    # Write the temperature data to files
+    file_paths = {
+        "_temp_input": temperature,  # SDK sysfs temperature/input
+        "_temp_crit": temperature_crit,  # SDK sysfs temperature/threshold_hi, CMIS bytes 132-133 TempMonHighWarningTreshold
+        "_temp_emergency": temperature_emergency,  # SDK sysfs temperature/threshold_critical_hi, CMIS bytes 128-129 TempMonHighAlarmTreshold
+        "_temp_fault": temperature_fault,
+        "_temp_trip_crit": temperature_trip_crit,
+        "_cooling_level_input": cooling_level_input,
+        "_cooling_level_warning": cooling_level_warning,
+        "_status": module_present  # SDK sysfs moduleX/present
+    }
 
+    for suffix, value in file_paths.items():
+        f_name = "/var/run/hw-management/thermal/{}{}".format(module_name, suffix)
+        if value is not None:
             try:
-                with open(f_src_input, 'r') as f:
-                    val = f.read()
-                temperature = sdk_temp2degree(int(val))
-
-                if os.path.isfile(f_src_crit):
-                    with open(f_src_crit, 'r') as f:
-                        val = f.read()
-                    temperature_crit = sdk_temp2degree(int(val))
-                else:
-                    temperature_crit = CONST.MODULE_TEMP_MAX_DEF
-
-                if os.path.isfile(f_src_hcrit):
-                    with open(f_src_hcrit, 'r') as f:
-                        val = f.read()
-                        temperature_emergency = sdk_temp2degree(int(val))
-                else:
-                    temperature_emergency = temperature_crit + CONST.MODULE_TEMP_EMERGENCY_OFFSET
-
-                temperature_trip_crit = CONST.MODULE_TEMP_CRIT_DEF
-
-            except (OSError, ValueError) as e:
-                error_message = str(e)
-                LOGGER.warning("{} {}".format(f_src_input, error_message),
-                               id="{} read_fail".format(module_name))
+                attr_write(f_name, str(value) + "\n")
+            except Exception as e:
+                LOGGER.error(f"Error writing {f_name}: {e}")
+                continue
+
+# ----------------------------------------------------------------------
+
+
+class ThermalReadWorker(threading.Thread):
+    """
+    @summary: Worker thread which serializes SDK sysfs reads of single ASIC root
+    """
+
+    def __init__(self, pool, root):
+        threading.Thread.__init__(self, name="thermal_read[{}]".format(root), daemon=True)
+        self.pool = pool
+        self.root = root
+        self.retired = False
+        self.job_name = None
+        self.job_ts = 0
+
+    def run(self):
+        pool = self.pool
+        job_queue = pool.queues[self.root]
+        while True:
+            with pool.cond:
+                while not self.retired and not EXIT.is_set() and not job_queue:
+                    pool.cond.wait(0.2)
+                if self.retired or EXIT.is_set():
+                    return
+                name, fn, args = job_queue.popleft()
+                self.job_name = name
+                self.job_ts = current_milli_time()
+            try:
+                fn(*args)
+            except InterruptedError:
+                pass
+            except Exception as e:
+                LOGGER.error("{} read job failed: {}".format(name, e), id="{} read_job_fail".format(name))
             else:
-                LOGGER.info(None, id="{} read_fail".format(module_name))
-        else:
-            LOGGER.info(None, id="{} read_fail".format(module_name))
+                LOGGER.notice(None, id="{} read_job_fail".format(name))
+            with pool.cond:
+                pool.pending.discard(name)
+                pool.stat["done"] += 1
+                self.job_name = None
+                if name in pool.stuck:
+                    del pool.stuck[name]
+                    LOGGER.notice("{} read job finished after {} ms".format(name, current_milli_time() - self.job_ts))
 
-        # Write the temperature data to files
-        file_paths = {
-            "_temp_input": temperature,  # SDK sysfs temperature/input
-            "_temp_crit": temperature_crit,  # SDK sysfs temperature/threshold_hi, CMIS bytes 132-133 TempMonHighWarningTreshold
-            "_temp_emergency": temperature_emergency,  # SDK sysfs temperature/threshold_critical_hi, CMIS bytes 128-129 TempMonHighAlarmTreshold
-            "_temp_fault": temperature_fault,
-            "_temp_trip_crit": temperature_trip_crit,
-            "_cooling_level_input": cooling_level_input,
-            "_cooling_level_warning": cooling_level_warning,
-            "_status": module_present  # SDK sysfs moduleX/present
-        }
+# ----------------------------------------------------------------------
 
-        for suffix, value in file_paths.items():
-            f_name = "/var/run/hw-management/thermal/{}{}".format(module_name, suffix)
-            if value is not None:
-                try:
-                    atomic_file_write(f_name, str(value) + "\n")
-                except Exception as e:
-                    LOGGER.error(f"Error writing {f_name}: {e}")
+
+class ThermalReadPool:
+    """
+    @summary: Bounded pool of SDK sysfs readers, one worker per ASIC sysfs root.
+        Modules and ASICs of the same root are read sequentially by its worker,
+        different roots are read in parallel.
+        Worker which runs single job (ASIC or module read) longer than read deadline
+        is left to finish it and replaced by new worker for the rest of the root queue.
+        Job is not queued again while its previous run is pending - it is skipped and counted.
+    """
+
+    def __init__(self, max_workers, read_deadline_ms):
+        """
+        @param max_workers: Max number of reader threads including stuck ones
+        @param read_deadline_ms: Max time (ms) of single job run
+        """
+        self.max_workers = max_workers
+        self.read_deadline_ms = read_deadline_ms
+        self.cond = threading.Condition()
+        self.queues = {}
+        self.workers = {}
+        self.retired = []
+        self.pending = set()
+        self.stuck = {}
+        self.stat = Counter({"done": 0, "timeout": 0, "skipped": 0})
+
+    def _get_worker(self, root):
+        worker = self.workers.get(root)
+        if worker:
+            return worker
+        self.retired = [worker for worker in self.retired if worker.is_alive()]
+        if len(self.workers) + len(self.retired) >= self.max_workers:
+            return None
+        self.queues.setdefault(root, deque())
+        worker = ThermalReadWorker(self, root)
+        self.workers[root] = worker
+        worker.start()
+        return worker
+
+    def check_deadline(self):
+        """
+        @summary: Retire workers which run job longer than read deadline.
+            Start workers for queued jobs left without worker.
+        """
+        now = current_milli_time()
+        with self.cond:
+            for root, worker in list(self.workers.items()):
+                if worker.job_name is None or now - worker.job_ts < self.read_deadline_ms:
                     continue
+                LOGGER.warning("{} read takes more than {} ms, skipped".format(worker.job_name, self.read_deadline_ms),
+                               id="{} read_timeout".format(worker.job_name))
+                self.stat["timeout"] += 1
+                self.stuck[worker.job_name] = worker
+                worker.retired = True
+                self.retired.append(worker)
+                del self.workers[root]
+            for root, job_queue in self.queues.items():
+                if job_queue:
+                    self._get_worker(root)
+            self.cond.notify_all()
+
+    def submit(self, root, name, fn, *args):
+        """
+        @summary: Queue read job to the worker of ASIC root
+        @param root: ASIC SDK sysfs root (e.g. /sys/module/sx_core/asic0)
+        @param name: Job name (ASIC or module name), unique across pool
+        @param fn: Function to run
+        @param args: Function arguments
+        @return: True if job queued, False if skipped
+        """
+        with self.cond:
+            if name in self.pending:
+                self.stat["skipped"] += 1
+                return False
+            worker = self._get_worker(root)
+            if worker is None:
+                self.stat["skipped"] += 1
+                return False
+            self.pending.add(name)
+            self.queues[root].append((name, fn, args))
+            self.cond.notify_all()
+        return True
+
+    def get_stat(self):
+        """
+        @summary: Get pool counters
+        @return: dict done/timeout/skipped, number of workers and stuck jobs
+        """
+        with self.cond:
+            stat = dict(self.stat)
+            stat["workers"] = len(self.workers)
+            stat["stuck"] = len(self.stuck)
+        return stat
+
+    def stop(self):
+        """
+        @summary: Stop all workers. Workers blocked in sysfs read are not waited.
+        """
+        with self.cond:
+            for worker in self.workers.values():
+                worker.retired = True
+            self.cond.notify_all()
+            workers = list(self.workers.values())
+        for worker in workers:
+            worker.join(0.2)
+
+# ----------------------------------------------------------------------
+
+
+def thermal_read_root(fin):
+    """
+    @summary: Get ASIC SDK sysfs root of module/ASIC sysfs path
+    @param fin: ASIC path (/sys/module/sx_core/asic0/) or module path (/sys/module/sx_core/asic0/module1/)
+    @return: ASIC root (/sys/module/sx_core/asic0)
+    """
+    path = os.path.normpath(fin)
+    if os.path.basename(path).startswith("module"):
+        path = os.path.dirname(path)
+    return path
+
+# ----------------------------------------------------------------------
 
-    return
+
+def thermal_read_submit(fn_name, argv):
+    """
+    @summary: Split thermal entry to per ASIC/module jobs and queue them to read pool
+    @param fn_name: asic_temp_populate or module_temp_populate
+    @param argv: Entry arguments
+    """
+    if fn_name == "asic_temp_populate":
+        for asic_name, asic_attr in argv.items():
+            READ_POOL.submit(thermal_read_root(asic_attr["fin"]), asic_name, asic_temp_populate, {asic_name: asic_attr}, None)
+    elif fn_name == "module_temp_populate":
+        fin = argv["fin"]
+        offset = argv["fout_idx_offset"]
+        for idx in range(argv["module_count"]):
+            f_src_path = fin.format(idx)
+            READ_POOL.submit(thermal_read_root(f_src_path), "module{}".format(idx + offset), module_temp_update,
+                             "module{}".format(idx + offset), f_src_path)
 
 # ----------------------------------------------------------------------
 
 
-def update_thermal_attr(attr_prop):
+def update_thermal_attr(entry):
     """
-    @summary: Update thermal attributes and invoke temperature monitoring functions per poll interval
+    @summary: Run thermal attribute entry: invoke temperature monitoring function
 
-    This function is called for each thermal monitoring entry (ASIC temps, module temps)
+    Called by scheduler for each thermal monitoring entry (ASIC temps, module temps)
     at the configured polling interval. It invokes the appropriate thermal function
     (e.g., asic_temp_populate, module_temp_populate) to read and update temperature data.
+    @param entry: AttrEntry
     """
-    ts = current_milli_time() // 1000
-    if ts >= attr_prop["ts"]:
-        # update timestamp
-        attr_prop["ts"] = ts + attr_prop["poll"]
-        fn_name = attr_prop["fn"]
-        argv = attr_prop["arg"]
-
-        try:
-            globals()[fn_name](argv, None)
-        except ShutdownRequested:
-            raise
-        except InterruptedError:
-            # SIGTERM during sysfs I/O: do not treat as a normal read error
-            raise ShutdownRequested()
-        except (OSError, ValueError, KeyError, TypeError):
-            # Catch common errors from dynamically called functions
-            # to prevent daemon crash
-            pass
+    try:
+        if READ_POOL and entry.fn_name in ("asic_temp_populate", "module_temp_populate"):
+            thermal_read_submit(entry.fn_name, entry.arg)
+        else:
+            entry.fn(entry.arg, None)
+    except ShutdownRequested:
+        raise
+    except InterruptedError:
+        # SIGTERM during sysfs I/O: do not treat as a normal read error
+        raise ShutdownRequested()
+    except (OSError, ValueError, KeyError, TypeError):
+        # Catch common errors from dynamically called functions
+        # to prevent daemon crash
+        pass
 
 # ----------------------------------------------------------------------
 
@@ -599,6 +886,25 @@ def print_memory_info():
         _memory_alert_threshold = memory_usage_rss + CONST.DBG_MEMORY_USAGE_ALERT_STEP
 
 
+def log_hash_size(thermal_attr):
+    """
+    @summary: Size of logger repeat-collapse hash for configured modules and ASICs.
+        System can have 512 modules, each of them can report several messages at once:
+        hash must keep all of them to collapse repeats.
+    @param thermal_attr: List of thermal attribute entries
+    @return: Hash size
+    """
+    count = 0
+    for attr in thermal_attr:
+        if attr["fn"] == "module_temp_populate":
+            count += attr["arg"]["module_count"]
+        elif attr["fn"] == "asic_temp_populate":
+            count += len(attr["arg"])
+    return max(CONST.LOG_HASH_SIZE_MIN, count * CONST.LOG_HASH_IDS_PER_MODULE)
+
+# ----------------------------------------------------------------------
+
+
 def print_periodic_info(_argv, _val):
     """
     @summary: Print periodic memory statistic info
@@ -607,6 +913,17 @@ def print_periodic_info(_argv, _val):
     LOGGER.info("=" * 40)
     if CONST.DBG_MEMORY_INFO:
         print_memory_info()
+    if READ_POOL:
+        LOGGER.info("Read pool: workers {workers} done {done} timeout {timeout} skipped {skipped} stuck {stuck}".format(
+            **READ_POOL.get_stat()))
+    LOGGER.info("Attribute writes: performed {} skipped {}".format(_attr_write_stat["written"],
+                                                                  _attr_write_stat["skipped"]))
+    _attr_write_stat.clear()
+    LOGGER.info("Log hash: log {log_hash_size} syslog {syslog_hash_size} evict {evict} expire {expire}".format(
+        **LOGGER.get_hash_stat()))
+    if SCHEDULER:
+        for line in SCHEDULER.report():
+            LOGGER.info(line)
     LOGGER.info("=" * 40)
 
 
@@ -633,14 +950,12 @@ def handle_shutdown(sig, _frame):
 # ----------------------------------------------------------------------
 
 
-def main():
+def parse_args(argv=None):
     """
-    @summary: Hardware Management Thermal Updater Main Loop
-
-    Monitors ASIC and optical module temperatures from SDK sysfs and
-    updates hw-management thermal sysfs.
+    @summary: Parse thermal updater command line
+    @param argv: Arguments list, sys.argv if None
+    @return: Arguments dictionary
     """
-
     CMD_PARSER = argparse.ArgumentParser(description="HW Management Thermal Updater")
     CMD_PARSER.add_argument("--version", action="version", version="%(prog)s ver:{}".format(VERSION))
     CMD_PARSER.add_argument("-l", "--log_file",
@@ -660,15 +975,34 @@ def main():
                         """,
                             type=int, default=20)
     CMD_PARSER.add_argument("-s", "--system_type", nargs='?', help="System type (optional) for custom system emulation.")
-
-    args = vars(CMD_PARSER.parse_args())
-    global LOGGER, PROCESS
+    CMD_PARSER.add_argument("--write_refresh_interval",
+                            dest="write_refresh_interval",
+                            help="Rewrite unchanged thermal attributes at least every N sec. 0 - write on each poll",
+                            type=int, default=CONST.ATTR_WRITE_REFRESH_TIME)
+    CMD_PARSER.add_argument("--read_workers",
+                            dest="read_workers",
+                            help="Read ASICs/modules by pool of up to N threads, one per ASIC. 0 - sequential read",
+                            type=int, default=0)
+    CMD_PARSER.add_argument("--read_deadline",
+                            dest="read_deadline",
+                            help="Max time (ms) of single ASIC/module read in pool mode, slower reads are skipped",
+                            type=int, default=CONST.READ_DEADLINE_DEF)
+
+    return vars(CMD_PARSER.parse_args(argv))
+
+
+def updater_init(args, ident=None):
+    """
+    @summary: Init logger, load platform thermal config and schedule its entries
+    @param args: Arguments dictionary (parse_args)
+    @param ident: Log identifier, script name if None
+    """
+    global LOGGER, PROCESS, READ_POOL, SCHEDULER
 
     try:
-        LOGGER = Logger(log_file=args["log_file"], log_level=args["verbosity"], log_repeat=2)
-        # System can have >100 ports. It means we can have potential >100 warnings in the logger
-        # We need enough space to store all warnings for all ports.
-        LOGGER.set_log_hash_max_size(256)
+        LOGGER = Logger(ident=ident, log_file=args["log_file"], log_level=args["verbosity"], log_repeat=2)
+        # Sized for number of modules when config is loaded
+        LOGGER.set_log_hash_max_size(CONST.LOG_HASH_SIZE_MIN)
         LOGGER.set_log_rotation_size(file_size=CONST.LOG_ROTATION_SIZE, file_count=CONST.LOG_ROTATION_COUNT)
     except Exception as e:
         print("Failed to initialize logger: {}. Stopping service.".format(e))
@@ -685,19 +1019,101 @@ def main():
     product_sku = product_sku.strip()
 
     LOGGER.notice("hw-management-thermal-updater: load config ({})".format(product_sku))
-    thermal_attr = thermal_config["def"]
+    thermal_attr = list(thermal_config["def"])
     for key, val in thermal_config.items():
         if re.match(key, product_sku):
             thermal_attr.extend(val)
             break
+    LOGGER.set_log_hash_max_size(log_hash_size(thermal_attr))
 
     EXIT.clear()
+    attr_write_cache_init(args["write_refresh_interval"])
+    if args["read_workers"] > 0:
+        READ_POOL = ThermalReadPool(args["read_workers"], args["read_deadline"])
+        read_roots = set()
+        for attr in thermal_attr:
+            if attr["fn"] == "asic_temp_populate":
+                read_roots.update(thermal_read_root(asic_attr["fin"]) for asic_attr in attr["arg"].values())
+            elif attr["fn"] == "module_temp_populate":
+                read_roots.add(thermal_read_root(attr["arg"]["fin"].format(0)))
+        LOGGER.notice("hw-management-thermal-updater: parallel read, {} workers for {} ASICs".format(args["read_workers"], len(read_roots)))
+        if args["read_workers"] < len(read_roots):
+            LOGGER.warning("read_workers {} less than number of ASICs {}, reads of some ASICs will be skipped".format(
+                args["read_workers"], len(read_roots)))
 
     PROCESS = psutil.Process(os.getpid())
     LOGGER.info("periodic memory report {} sec".format(CONST.PERIODIC_MEMORY_REPORT_TIME))
     if CONST.DBG_MEMORY_INFO:
         thermal_attr.append({'fin': None, 'fn': 'print_periodic_info', 'arg': [], 'poll': CONST.PERIODIC_MEMORY_REPORT_TIME, 'ts': 0})
 
+    SCHEDULER = JobScheduler("thermal_attr", logger=LOGGER, slow_ms=CONST.ATTR_SLOW_RUN_MS)
+    for attr in thermal_attr:
+        try:
+            SCHEDULER.add_entry(attr, globals(), update_thermal_attr)
+        except KeyError:
+            LOGGER.error("Unknown function {}, entry skipped".format(attr["fn"]))
+
+
+def updater_loop(stop=None, heartbeat=None):
+    """
+    @summary: Run due thermal entries until EXIT is set
+    @param stop: Function returning True to leave the loop
+    @param heartbeat: Function called on each loop iteration (watchdog)
+    """
+    def stopped():
+        return EXIT.is_set() or (stop is not None and stop())
+
+    while not stopped():
+        if heartbeat:
+            heartbeat()
+        try:
+            if READ_POOL:
+                READ_POOL.check_deadline()
+            SCHEDULER.run_pending(stop=stopped)
+            try:
+                log_level_filename = os.path.join(CONST.HW_MGMT_FOLDER_DEF, CONST.LOG_LEVEL_FILENAME)
+                if os.path.isfile(log_level_filename):
+                    with open(log_level_filename, 'r', encoding="utf-8") as f:
+                        log_level = f.read().rstrip('\n')
+                        log_level = int(log_level)
+                        LOGGER.set_loglevel(log_level)
+            except InterruptedError:
+                raise ShutdownRequested()
+            except (OSError, ValueError):
+                # Expected errors when reading/parsing log level file
+                # These are non-critical, just skip and continue
+                pass
+        except ShutdownRequested:
+            raise
+        except Exception as e:
+            # Safety net: catch any unexpected exceptions to keep daemon alive
+            LOGGER.error("Unexpected error in main loop: {}".format(e))
+            LOGGER.notice(traceback.format_exc())
+            # Continue running despite error
+
+        # read pool deadline and log level are checked at least once per second
+        exit_wait(EXIT, SCHEDULER.get_next_timeout(1))
+
+
+def updater_stop():
+    """
+    @summary: Stop read pool. Workers blocked in sysfs read are not waited.
+    """
+    global READ_POOL
+    if READ_POOL:
+        READ_POOL.stop()
+        READ_POOL = None
+
+
+def main():
+    """
+    @summary: Hardware Management Thermal Updater Main Loop
+
+    Monitors ASIC and optical module temperatures from SDK sysfs and
+    updates hw-management thermal sysfs.
+    """
+    updater_init(parse_args())
+
     try:
         for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
             signal.signal(sig, handle_shutdown)
@@ -705,38 +1121,12 @@ def main():
             signal.siginterrupt(sig, True)
 
         LOGGER.notice("hw-management-thermal-updater: start main loop")
-        while not EXIT.is_set():
-            try:
-                for attr in thermal_attr:
-                    if EXIT.is_set():
-                        break
-                    update_thermal_attr(attr)
-                try:
-                    log_level_filename = os.path.join(CONST.HW_MGMT_FOLDER_DEF, CONST.LOG_LEVEL_FILENAME)
-                    if os.path.isfile(log_level_filename):
-                        with open(log_level_filename, 'r', encoding="utf-8") as f:
-                            log_level = f.read().rstrip('\n')
-                            log_level = int(log_level)
-                            LOGGER.set_loglevel(log_level)
-                except InterruptedError:
-                    raise ShutdownRequested()
-                except (OSError, ValueError):
-                    # Expected errors when reading/parsing log level file
-                    # These are non-critical, just skip and continue
-                    pass
-            except ShutdownRequested:
-                raise
-            except Exception as e:
-                # Safety net: catch any unexpected exceptions to keep daemon alive
-                LOGGER.error("Unexpected error in main loop: {}".format(e))
-                LOGGER.notice(traceback.format_exc())
-                # Continue running despite error
-
-            exit_wait(EXIT, 1)
+        updater_loop()
     except ShutdownRequested:
         pass
 
     try:
+        updater_stop()
         LOGGER.notice("hw-management-thermal-updater: stopped main loop ({})".format(_sig_condition_name))
     except ShutdownRequested:
         pass
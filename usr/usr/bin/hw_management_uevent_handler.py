@@ -0,0 +1,1125 @@
+#!/usr/bin/python
+# pylint: disable=line-too-long
+# pylint: disable=C0103
+# pylint: disable=W0718
+# pylint: disable=R0913:
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the names of the copyright holders nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# Alternatively, this software may be distributed under the terms of the
+# GNU General Public License ("GPL") version 2 as published by the Free
+# Software Foundation.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""
+Hardware Management Uevent Handler Service
+
+Optional replacement of udev RUN+= hooks of hw-management rules. Kernel
+uevents are read from NETLINK_KOBJECT_UEVENT socket and matched against rule
+table compiled from the installed hw-management udev rules files. Matched
+handler commands run in persistent bash workers instead of fork/exec of new
+bash process per RUN+= hook:
+    - event scripts (hw-management-chassis-events.sh,
+      hw-management-thermal-events.sh) are loaded by worker once and run as
+      shell functions in forked subshell
+    - hw-management-helpers.sh is sourced by worker once instead of once per
+      command, and again when it or hw-management udev ready flag (touched by
+      hw-management start after platform config is set) is changed
+    - commands of one device (device and its hwmon) run by the same worker in
+      event order, commands of parent or child device wait until commands of
+      the device in flight are done (like udev), commands of other devices run
+      by workers in parallel
+    - commands queued to busy worker are run as one batch, repeated identical
+      "change" commands of one device in the batch are merged
+
+Rules files which can be handled completely are masked for udev in
+/run/udev/rules.d, files with rules which can't be compiled are left to udev.
+Handled kernel uevent sequence number is published for "--settle" which
+waits for handling of all uevents emitted by kernel (like "udevadm settle").
+"""
+
+try:
+    import argparse
+    import errno
+    import fnmatch
+    import glob
+    import os
+    import queue
+    import re
+    import select
+    import shlex
+    import signal
+    import socket
+    import subprocess
+    import sys
+    import threading
+    import time
+    import zlib
+    from collections import deque
+    from hw_management_lib import HW_Mgmt_Logger as Logger
+except ImportError as e:
+    raise ImportError(str(e) + "- required module not found")
+
+VERSION = "1.0.0"
+
+
+class CONST(object):
+    LOG_FILE = "/var/log/hw-management-uevent-handler.log"
+    LOG_ROTATION_SIZE = 1 * 1024 * 1024  # 1MB
+    LOG_ROTATION_COUNT = 3
+    # hw-management udev rules files handled by service
+    RULES_FILES = "/lib/udev/rules.d/*hw-management*events*.rules"
+    # Runtime udev rules directory used to mask handled rules files
+    UDEV_RULES_RUN_DIR = "/run/udev/rules.d"
+    # Handled kernel uevent sequence number, exists while service is running
+    SEQNUM_FILE = "/run/hw-management-uevent-handler.seqnum"
+    KERNEL_SEQNUM_FILE = "/sys/kernel/uevent_seqnum"
+    SYSFS = "/sys"
+    # Event scripts loaded by worker once and run as shell functions
+    PRELOAD = ["/usr/bin/hw-management-chassis-events.sh", "/usr/bin/hw-management-thermal-events.sh"]
+    HELPERS = "/usr/bin/hw-management-helpers.sh"
+    # Touched by hw-management start, helpers are sourced again
+    UDEV_READY = "/var/run/hw-management/.udev_ready"
+    WORKERS = 4
+    # Max time (sec) of handler command, same as udev event timeout
+    HANDLER_TIMEOUT = 180
+    NETLINK_KOBJECT_UEVENT = 15
+    NETLINK_RCVBUF = 16 * 1024 * 1024
+    # Max time (sec) of socket wait, main loop checks exit and report interval
+    POLL_TIMEOUT = 1
+    # Min number of events of burst (e.g. boot, line card insertion) reported in log
+    BURST_MIN = 20
+    REPORT_INTERVAL = 600
+    LATENCY_SAMPLES = 2048
+    SETTLE_TIMEOUT = 120
+    SETTLE_POLL = 0.05
+
+
+LOGGER = None
+EXIT = threading.Event()
+
+# Bash worker: $1 - helpers, $2.. - event scripts to preload.
+# Reads one handler command per line ("#reload" line sources helpers), writes
+# exit code of each command.
+WORKER_SCRIPT = r'''
+helpers=$1
+shift
+preload=("$@")
+for i in "${!preload[@]}"; do
+	eval "__hw_uevent_preload_${i}()
+{
+$(< "${preload[$i]}")
+}" || exit 1
+done
+
+source()
+{
+	if [ "$1" == hw-management-helpers.sh ] && [ -n "$__hw_uevent_helpers" ]; then
+		return 0
+	fi
+	builtin source "$@"
+}
+
+__hw_uevent_run()
+{
+	local i
+	BASH_ARGV0=$1
+	for i in "${!preload[@]}"; do
+		if [ "$1" == "${preload[$i]}" ]; then
+			shift
+			"__hw_uevent_preload_${i}" "$@"
+			return
+		fi
+	done
+	exec "$@"
+}
+
+while IFS= read -r line; do
+	if [ "$line" == "#reload" ]; then
+		__hw_uevent_helpers=
+		if [ -f "$helpers" ] && builtin source "$helpers" > /dev/null; then
+			__hw_uevent_helpers=1
+		fi
+		continue
+	fi
+	( eval "$line" ) < /dev/null > /dev/null
+	echo "$?"
+done
+'''
+
+
+def compile_glob(pattern):
+    """
+    @summary: Compile udev match pattern ("*", "?", "[...]", "|" alternatives)
+    @return: Compiled regex
+    """
+    return re.compile("|".join(fnmatch.translate(alt) for alt in pattern.split("|")))
+
+
+# udev format substitutions: {token: kind}
+FORMAT_TOKENS = {
+    "%k": "kernel", "$kernel": "kernel",
+    "%n": "number", "$number": "number",
+    "%p": "devpath", "$devpath": "devpath",
+    "%S": "sys", "$sys": "sys",
+    "%s": "attr", "$attr": "attr",
+    "%E": "env", "$env": "env",
+}
+FORMAT_RE = re.compile(r"%%|\$\$|%[a-zA-Z]|\$[a-z]+|[%$]")
+FORMAT_ATTR_RE = re.compile(r"\{([^}]*)\}")
+
+
+def compile_format(text):
+    """
+    @summary: Compile udev format string (RUN, ATTR assignment value)
+    @return: List of literal strings and (kind, attr) substitutions
+    @raise ValueError: Unsupported substitution
+    """
+    parts = []
+    pos = 0
+    for token in FORMAT_RE.finditer(text):
+        parts.append(text[pos:token.start()])
+        pos = token.end()
+        tok = token.group(0)
+        if tok in ("%%", "$$"):
+            parts.append(tok[0])
+            continue
+        kind = FORMAT_TOKENS.get(tok)
+        if not kind:
+            raise ValueError("unsupported substitution {}".format(tok))
+        attr = None
+        if kind in ("attr", "env"):
+            attr_match = FORMAT_ATTR_RE.match(text, pos)
+            if not attr_match:
+                raise ValueError("{} without attribute".format(tok))
+            attr = attr_match.group(1)
+            pos = attr_match.end()
+        parts.append((kind, attr))
+    parts.append(text[pos:])
+    return [part for part in parts if part != ""]
+
+
+def compile_run(text):
+    """
+    @summary: Compile udev RUN value. Value without quotes is split to
+        arguments once, value with quotes is split after substitution.
+    @return: (split, format): split - list of argument formats or None,
+        format - compiled format of quoted value
+    """
+    if "'" in text or '"' in text:
+        return None, compile_format(text)
+    return [compile_format(arg) for arg in text.split()], None
+
+
+class Uevent(object):
+    """
+    @summary: Kernel uevent and sysfs values read while its rules are matched
+    """
+
+    __slots__ = ("action", "devpath", "env", "seqnum", "ts", "sysfs", "cache")
+
+    def __init__(self, action, devpath, env, sysfs=CONST.SYSFS, ts=None):
+        self.action = action
+        self.devpath = devpath
+        self.env = env
+        self.sysfs = sysfs
+        self.ts = time.monotonic() if ts is None else ts
+        try:
+            self.seqnum = int(env.get("SEQNUM", 0))
+        except ValueError:
+            self.seqnum = 0
+        # {matcher: result}, rules share matchers; "DRIVERS": drivers
+        self.cache = {}
+
+    @classmethod
+    def parse(cls, data, sysfs=CONST.SYSFS):
+        """
+        @summary: Parse kernel uevent netlink message "action@devpath\\0KEY=VAL\\0..."
+        @return: Uevent or None for other messages
+        """
+        fields = data.decode("utf-8", "replace").split("\0")
+        if "@" not in fields[0]:
+            return None
+        env = {}
+        for field in fields[1:]:
+            key, sep, val = field.partition("=")
+            if sep:
+                env[key] = val
+        if "ACTION" not in env or "DEVPATH" not in env:
+            return None
+        return cls(env["ACTION"], env["DEVPATH"], env, sysfs=sysfs)
+
+    @property
+    def kernel(self):
+        return self.devpath.rsplit("/", 1)[-1]
+
+    @property
+    def number(self):
+        kernel = self.kernel
+        digits = len(kernel) - len(kernel.rstrip("0123456789"))
+        return kernel[-digits:] if digits else ""
+
+    @property
+    def key(self):
+        """
+        @summary: Ordering key, physical device of the event (device and its hwmon)
+        """
+        return self.devpath.split("/hwmon/", 1)[0]
+
+    def attr(self, name):
+        """
+        @summary: Read sysfs attribute of event device
+        @return: Value without trailing whitespace or None
+        """
+        path = "{}{}/{}".format(self.sysfs, self.devpath, name)
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                return f.read().rstrip()
+        except (OSError, IOError):
+            return None
+
+    def drivers(self):
+        """
+        @summary: Driver names of event device and its parents (read once per event)
+        """
+        drivers = self.cache.get("DRIVERS")
+        if drivers is None:
+            drivers = [self.env["DRIVER"]] if self.env.get("DRIVER") else []
+            path = self.devpath
+            while path.startswith("/devices/"):
+                try:
+                    drivers.append(os.path.basename(os.readlink("{}{}/driver".format(self.sysfs, path))))
+                except OSError:
+                    pass
+                path = os.path.dirname(path)
+            self.cache["DRIVERS"] = drivers
+        return drivers
+
+    def format(self, parts):
+        """
+        @summary: Substitute compiled udev format
+        """
+        out = []
+        for part in parts:
+            if isinstance(part, str):
+                out.append(part)
+                continue
+            kind, attr = part
+            if kind == "sys":
+                out.append(self.sysfs)
+            elif kind == "env":
+                out.append(self.env.get(attr, ""))
+            elif kind == "attr":
+                out.append(self.attr(attr) or "")
+            else:
+                out.append(getattr(self, kind))
+        return "".join(out)
+
+
+class Matcher(object):
+    """
+    @summary: Compiled rule match key. Equal keys of different rules are the
+        same Matcher, result is computed once per event.
+    """
+
+    # Evaluation order of keys in rule: cheap first, sysfs access last
+    COST = {"ACTION": 0, "SUBSYSTEM": 0, "ENV": 1, "DRIVER": 1, "KERNEL": 2, "DEVPATH": 2, "ATTR": 3, "DRIVERS": 4}
+
+    __slots__ = ("key", "attr", "pattern", "values", "prefix", "regex", "cost")
+
+    def __init__(self, key, attr, pattern):
+        self.key = key
+        self.attr = attr
+        self.pattern = pattern
+        # Pattern without wildcards is matched by set lookup, pattern with
+        # wildcards is checked for literal prefix before regex match
+        self.values = None
+        self.prefix = ""
+        self.regex = None
+        if any(c in pattern for c in "*?["):
+            self.regex = compile_glob(pattern)
+            if "|" not in pattern:
+                self.prefix = re.split(r"[*?\[]", pattern, 1)[0]
+        else:
+            self.values = frozenset(pattern.split("|"))
+        self.cost = self.COST[key]
+
+    def value_match(self, value):
+        if self.values is not None:
+            return value in self.values
+        return value.startswith(self.prefix) and self.regex.match(value) is not None
+
+    def match(self, event):
+        """
+        @summary: Match event (cached per event)
+        @return: True/False or None if device attribute can't be read
+        """
+        # Event itself is "not cached" marker, result can be None
+        ret = event.cache.get(self, event)
+        if ret is not event:
+            return ret
+        if self.key == "DRIVERS":
+            ret = any(self.value_match(driver) for driver in event.drivers())
+        elif self.key == "ATTR":
+            value = event.attr(self.attr)
+            ret = None if value is None else self.value_match(value)
+        elif self.key == "ENV":
+            ret = self.value_match(event.env.get(self.attr, ""))
+        elif self.key == "KERNEL":
+            ret = self.value_match(event.kernel)
+        elif self.key == "DEVPATH":
+            ret = self.value_match(event.devpath)
+        else:
+            ret = self.value_match(event.env.get(self.key, ""))
+        event.cache[self] = ret
+        return ret
+
+
+class UeventRule(object):
+    """
+    @summary: Compiled udev rule: match keys, RUN commands, ATTR assignments
+    """
+
+    __slots__ = ("src", "order", "subsystem", "action", "env_key", "match", "run", "assign")
+
+    def __init__(self, src, order):
+        self.src = src
+        self.order = order
+        self.subsystem = None
+        self.action = None
+        # ENV property which must be present in matched event
+        self.env_key = None
+        # [(Matcher, negate)]
+        self.match = []
+        # [compiled RUN]
+        self.run = []
+        # [(attr, compiled format)]
+        self.assign = []
+
+    def matches(self, event):
+        for matcher, negate in self.match:
+            # Unreadable ATTR doesn't match regardless of operator
+            ret = matcher.match(event)
+            if ret is None or ret == negate:
+                return False
+        return True
+
+
+# udev rule key: KEY{attr}<op>"value"
+RULE_KEY_RE = re.compile(r'\s*([A-Z_]+)(?:\{([^}]*)\})?\s*(==|!=|\+=|:=|=)\s*"((?:[^"\\]|\\.)*)"\s*(,|$)')
+MATCH_KEYS = ("ACTION", "SUBSYSTEM", "DEVPATH", "KERNEL", "DRIVER", "DRIVERS", "ATTR", "ENV")
+ATTR_KEYS = ("ATTR", "ENV")
+
+
+class RuleTable(object):
+    """
+    @summary: Rules compiled from udev rules files, indexed by SUBSYSTEM and ACTION
+    """
+
+    def __init__(self, sysfs=CONST.SYSFS, logger=None):
+        self.sysfs = sysfs
+        self.logger = logger
+        self.files = []
+        self.rules = []
+        # {(subsystem, action): [rules in udev order]}, rules without
+        # SUBSYSTEM/ACTION are in each bucket, None - other values
+        self.index = {}
+        self._matchers = {}
+
+    def _matcher(self, key, attr, pattern):
+        matcher = self._matchers.get((key, attr, pattern))
+        if matcher is None:
+            matcher = Matcher(key, attr, pattern)
+            self._matchers[(key, attr, pattern)] = matcher
+        return matcher
+
+    def compile_rule(self, line, src, order):
+        """
+        @summary: Compile udev rule line
+        @return: UeventRule or None for rule without RUN/ATTR assignment
+        @raise ValueError: Rule syntax or key not supported
+        """
+        rule = UeventRule(src, order)
+        pos = 0
+        while pos < len(line):
+            key_match = RULE_KEY_RE.match(line, pos)
+            if not key_match:
+                raise ValueError("syntax error at: {}".format(line[pos:]))
+            pos = key_match.end()
+            key, attr, op, value = key_match.groups()[:4]
+            value = value.replace('\\"', '"')
+            if (attr is None) == (key in ATTR_KEYS):
+                raise ValueError("unsupported key {}".format(key))
+            if op in ("==", "!=") and key in MATCH_KEYS:
+                if key == "DRIVERS" and op == "!=":
+                    raise ValueError("unsupported DRIVERS!=")
+                # Plain ACTION/SUBSYSTEM values are used for rule lookup
+                plain = op == "==" and not any(c in value for c in "*?[|")
+                if key == "ACTION" and plain and rule.action is None:
+                    rule.action = value
+                elif key == "SUBSYSTEM" and plain and rule.subsystem is None:
+                    rule.subsystem = value
+                else:
+                    rule.match.append((self._matcher(key, attr, value), op == "!="))
+            elif key == "RUN" and op in ("+=", "=", ":="):
+                if op != "+=":
+                    rule.run = []
+                rule.run.append(compile_run(value))
+            elif key == "ATTR" and op == "=":
+                rule.assign.append((attr, compile_format(value)))
+            else:
+                raise ValueError("unsupported key {}{}".format(key, op))
+        if not rule.run and not rule.assign:
+            return None
+        rule.match.sort(key=lambda item: item[0].cost)
+        for matcher, negate in rule.match:
+            if matcher.key == "ENV" and not negate and matcher.values is not None and "" not in matcher.values:
+                rule.env_key = matcher.attr
+                break
+        return rule
+
+    def load(self, path):
+        """
+        @summary: Compile udev rules file. File with rules which can't be
+            compiled is not loaded (left to udev).
+        @return: True if file is loaded
+        """
+        rules = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().replace("\\\n", "").splitlines()
+        except (OSError, IOError) as err:
+            if self.logger:
+                self.logger.error("Can't read rules file {}: {}".format(path, err))
+            return False
+        for num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            src = "{}:{}".format(os.path.basename(path), num)
+            try:
+                rule = self.compile_rule(line, src, (os.path.basename(path), num))
+            except ValueError as err:
+                if self.logger:
+                    self.logger.warning("{}: {}, rules file is left to udev".format(src, err))
+                return False
+            if rule:
+                rules.append(rule)
+        self.files.append(path)
+        self.rules.extend(rules)
+        self.rules.sort(key=lambda rule: rule.order)
+        self.index = {}
+        subsystems = set(rule.subsystem for rule in self.rules) | {None}
+        actions = set(rule.action for rule in self.rules) | {None}
+        for subsystem in subsystems:
+            for action in actions:
+                self.index[(subsystem, action)] = [rule for rule in self.rules
+                                                   if rule.subsystem in (subsystem, None) and
+                                                   rule.action in (action, None)]
+        return True
+
+    def apply(self, event):
+        """
+        @summary: Match event: write ATTR assignments of matched rules
+        @return: Handler commands (argv) of matched rules in udev order
+        """
+        subsystem = event.env.get("SUBSYSTEM")
+        if (subsystem, None) not in self.index:
+            subsystem = None
+        rules = self.index.get((subsystem, event.action))
+        if rules is None:
+            rules = self.index.get((subsystem, None), [])
+        commands = []
+        env = event.env
+        for rule in rules:
+            if rule.env_key is not None and rule.env_key not in env:
+                continue
+            if not rule.matches(event):
+                continue
+            for attr, value in rule.assign:
+                path = "{}{}/{}".format(event.sysfs, event.devpath, attr)
+                try:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(event.format(value))
+                except (OSError, IOError) as err:
+                    if self.logger:
+                        self.logger.warning("{}: write {}: {}".format(rule.src, path, err))
+            for split, fmt in rule.run:
+                if fmt is None:
+                    # Substituted values are split like udev does (empty value - no argument)
+                    argv = [word for arg in split for word in event.format(arg).split()]
+                else:
+                    argv = shlex.split(event.format(fmt))
+                if argv:
+                    commands.append(argv)
+        return commands
+
+
+class HandlerCmd(object):
+    """
+    @summary: Handler command of uevent, line passed to worker
+    """
+
+    __slots__ = ("event", "argv", "line")
+
+    # Event properties exported to handler environment, like udev does
+    ENV_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+    def __init__(self, event, argv):
+        self.event = event
+        self.argv = argv
+        env = " ".join("{}={}".format(key, shlex.quote(val.replace("\n", " ")))
+                       for key, val in sorted(event.env.items()) if self.ENV_NAME_RE.match(key))
+        cmd = " ".join(shlex.quote(arg.replace("\n", " ")) for arg in argv)
+        self.line = "{}__hw_uevent_run {}".format("export {}; ".format(env) if env else "", cmd)
+
+    def __str__(self):
+        return " ".join(self.argv)
+
+
+class LatencyStat(object):
+    """
+    @summary: Latency (ms) statistics, percentiles from last samples
+    """
+
+    def __init__(self, samples=CONST.LATENCY_SAMPLES):
+        self.cnt = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=samples)
+
+    def add(self, val):
+        self.cnt += 1
+        self.sum += val
+        self.max = max(self.max, val)
+        self.samples.append(val)
+
+    def percentile(self, pct):
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+    def __str__(self):
+        return "n={} avg={:.1f} p50={:.1f} p95={:.1f} max={:.1f}".format(
+            self.cnt, self.sum / self.cnt if self.cnt else 0.0,
+            self.percentile(50), self.percentile(95), self.max)
+
+
+class ShellWorker(object):
+    """
+    @summary: Persistent bash running handler commands in forked subshells
+    """
+
+    def __init__(self, name, preload=None, helpers=CONST.HELPERS, timeout=CONST.HANDLER_TIMEOUT,
+                 stderr=None, logger=None):
+        """
+        @param preload: Event scripts loaded once and run as shell functions
+        @param helpers: Helpers sourced by worker, again when helpers or udev ready flag is changed
+        @param timeout: Max time (sec) of handler command, worker is restarted on timeout
+        @param stderr: Stderr of handlers (default: inherited)
+        """
+        self.name = name
+        self.preload = [path for path in (CONST.PRELOAD if preload is None else preload) if os.path.isfile(path)]
+        self.helpers = helpers
+        self.timeout = timeout
+        self.stderr = stderr
+        self.logger = logger
+        self.proc = None
+        self._buf = b""
+        self._helpers_stamp = None
+
+    def _stamp(self):
+        stamp = []
+        for path in (self.helpers, CONST.UDEV_READY):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return stamp
+
+    def start(self):
+        self._buf = b""
+        self._helpers_stamp = None
+        self.proc = subprocess.Popen(["bash", "-c", WORKER_SCRIPT, self.name, self.helpers] + self.preload,
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=self.stderr,
+                                     start_new_session=True)
+
+    def stop(self):
+        if not self.proc:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self._kill()
+        self.proc.stdout.close()
+        self.proc = None
+
+    def _kill(self):
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        self.proc.wait()
+
+    def _read_rc(self, deadline):
+        """
+        @return: Exit code of next command or None on timeout/worker exit
+        """
+        fd = self.proc.stdout.fileno()
+        while b"\n" not in self._buf:
+            wait = deadline - time.monotonic()
+            if wait <= 0 or not select.select([fd], [], [], wait)[0]:
+                return None
+            data = os.read(fd, 4096)
+            if not data:
+                return None
+            self._buf += data
+        line, self._buf = self._buf.split(b"\n", 1)
+        try:
+            return int(line)
+        except ValueError:
+            return None
+
+    def run_batch(self, cmds):
+        """
+        @summary: Run handler commands in order
+        @return: Exit codes, None for command not completed (timeout, worker failure)
+        """
+        if not self.proc or self.proc.poll() is not None:
+            self.start()
+        lines = [cmd.line for cmd in cmds]
+        stamp = self._stamp()
+        if stamp != self._helpers_stamp:
+            self._helpers_stamp = stamp
+            lines.insert(0, "#reload")
+        try:
+            self.proc.stdin.write(("\n".join(lines) + "\n").encode("utf-8", "replace"))
+            self.proc.stdin.flush()
+        except OSError as err:
+            if self.logger:
+                self.logger.error("{}: write failed: {}".format(self.name, err))
+            self._kill()
+            self.proc = None
+            return [None] * len(cmds)
+        rcs = []
+        for cmd in cmds:
+            rc = self._read_rc(time.monotonic() + self.timeout)
+            if rc is None:
+                if self.logger:
+                    self.logger.error("{}: handler not completed, restart worker: {}".format(self.name, cmd))
+                self._kill()
+                self.proc = None
+                rcs.extend([None] * (len(cmds) - len(rcs)))
+                break
+            rcs.append(rc)
+        return rcs
+
+
+class Dispatcher(object):
+    """
+    @summary: Worker threads running handler commands. Commands of the same
+        device go to the same worker in event order. Commands of parent or
+        child device (e.g. i2c adapter and its clients) are held until commands
+        of the device in flight are done, like udev serializes events of related
+        devpaths. Commands queued to busy worker are run as one batch.
+    """
+
+    def __init__(self, workers=CONST.WORKERS, logger=None, **worker_args):
+        self.logger = logger
+        self.workers = [ShellWorker("hw-management-uevent-worker{}".format(idx), logger=logger, **worker_args)
+                        for idx in range(workers)]
+        self.queues = [queue.Queue() for _ in self.workers]
+        self.threads = []
+        self.lock = threading.Lock()
+        self.inflight = 0
+        # {ordering key: commands queued to worker or running}
+        self.active = {}
+        # Commands held in event order: [(ordering key, command)]
+        self.held = []
+        self.idle = threading.Event()
+        self.idle.set()
+        self.stat = {"run": 0, "merged": 0, "failed": 0, "timeout": 0, "batch": 0, "held": 0}
+        # Event receive to handler done
+        self.latency = LatencyStat()
+        # Handler command run time (batch run time / commands)
+        self.run_time = LatencyStat()
+
+    def start(self):
+        for idx, worker in enumerate(self.workers):
+            thread = threading.Thread(target=self._run, args=(worker, self.queues[idx]),
+                                      name=worker.name, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self, timeout=5):
+        for work_q in self.queues:
+            work_q.put(None)
+        for thread in self.threads:
+            thread.join(timeout)
+        for worker in self.workers:
+            worker.stop()
+
+    @staticmethod
+    def _related(key, other):
+        """
+        @summary: Ancestor or descendant device
+        """
+        return other.startswith(key + "/") or key.startswith(other + "/")
+
+    def _blocked(self, key):
+        for other in self.active:
+            if self._related(key, other):
+                return True
+        # Keep event order behind held commands of the same or related device
+        for other, _cmd in self.held:
+            if other == key or self._related(key, other):
+                return True
+        return False
+
+    def _dispatch(self, key, cmd):
+        self.active[key] = self.active.get(key, 0) + 1
+        self.queues[zlib.crc32(key.encode()) % len(self.workers)].put(cmd)
+
+    def submit(self, cmds):
+        if not cmds:
+            return
+        with self.lock:
+            self.inflight += len(cmds)
+            self.idle.clear()
+            for cmd in cmds:
+                key = cmd.event.key
+                if self._blocked(key):
+                    self.stat["held"] += 1
+                    self.held.append((key, cmd))
+                else:
+                    self._dispatch(key, cmd)
+
+    def _done(self, cmds, merged):
+        with self.lock:
+            self.stat["merged"] += merged
+            self.inflight -= len(cmds)
+            released = False
+            for cmd in cmds:
+                key = cmd.event.key
+                self.active[key] -= 1
+                if not self.active[key]:
+                    del self.active[key]
+                    released = True
+            if released and self.held:
+                held, self.held = self.held, []
+                for key, cmd in held:
+                    if self._blocked(key):
+                        self.held.append((key, cmd))
+                    else:
+                        self._dispatch(key, cmd)
+            if not self.inflight:
+                self.idle.set()
+
+    def _run(self, worker, work_q):
+        while True:
+            cmds = [work_q.get()]
+            while True:
+                try:
+                    cmds.append(work_q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in cmds
+            cmds = [cmd for cmd in cmds if cmd is not None]
+            batch = []
+            for cmd in cmds:
+                prev = batch[-1] if batch else None
+                if prev and cmd.event.action == "change" and prev.event.action == "change" and \
+                        cmd.line == prev.line:
+                    continue
+                batch.append(cmd)
+            if batch:
+                start = time.monotonic()
+                try:
+                    rcs = worker.run_batch(batch)
+                except Exception as err:
+                    if self.logger:
+                        self.logger.error("{}: batch failed: {}".format(worker.name, err))
+                    rcs = [None] * len(batch)
+                done = time.monotonic()
+                with self.lock:
+                    self.stat["batch"] += 1
+                    self.stat["run"] += len(batch)
+                    for cmd, rc in zip(batch, rcs):
+                        if rc is None:
+                            self.stat["timeout"] += 1
+                        elif rc:
+                            self.stat["failed"] += 1
+                        self.latency.add((done - cmd.event.ts) * 1000)
+                    self.run_time.add((done - start) * 1000 / len(batch))
+            self._done(cmds, len(cmds) - len(batch))
+            if stop:
+                return
+
+
+def open_uevent_socket():
+    """
+    @summary: Open netlink socket subscribed to kernel uevents
+    """
+    sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, CONST.NETLINK_KOBJECT_UEVENT)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, 33, CONST.NETLINK_RCVBUF)  # SO_RCVBUFFORCE
+    except OSError:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CONST.NETLINK_RCVBUF)
+    sock.bind((0, 1))
+    sock.setblocking(False)
+    return sock
+
+
+def mask_udev_rules(files, rules_dir=CONST.UDEV_RULES_RUN_DIR, mask=True):
+    """
+    @summary: Mask (or unmask) rules files for udev by /dev/null link in runtime rules directory
+    """
+    if mask:
+        os.makedirs(rules_dir, exist_ok=True)
+    for path in files:
+        link = os.path.join(rules_dir, os.path.basename(path))
+        try:
+            if mask:
+                if not os.path.lexists(link):
+                    os.symlink("/dev/null", link)
+            elif os.path.islink(link) and os.readlink(link) == "/dev/null":
+                os.unlink(link)
+        except OSError as err:
+            LOGGER.warning("Can't {} udev rules {}: {}".format("mask" if mask else "unmask", link, err))
+    try:
+        subprocess.run(["udevadm", "control", "--reload"], check=False, timeout=10)
+    except (OSError, subprocess.TimeoutExpired) as err:
+        LOGGER.warning("udevadm control --reload: {}".format(err))
+
+
+def cleanup(rules=CONST.RULES_FILES, rules_dir=CONST.UDEV_RULES_RUN_DIR, seqnum_file=CONST.SEQNUM_FILE):
+    """
+    @summary: Remove udev rules masks and handled seqnum file left by service
+        which exited without cleanup (killed, start limit hit)
+    """
+    masked = [path for path in glob.glob(rules)
+              if os.path.islink(os.path.join(rules_dir, os.path.basename(path)))]
+    if masked:
+        mask_udev_rules(masked, rules_dir, mask=False)
+    try:
+        os.unlink(seqnum_file)
+    except OSError:
+        pass
+
+
+def write_seqnum(seqnum, path=CONST.SEQNUM_FILE):
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write("{}\n".format(seqnum))
+        os.rename(path + ".tmp", path)
+    except OSError as err:
+        LOGGER.warning("Can't write {}: {}".format(path, err))
+
+
+def read_seqnum(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def settle(timeout=CONST.SETTLE_TIMEOUT, seqnum_file=CONST.SEQNUM_FILE, kernel_seqnum_file=CONST.KERNEL_SEQNUM_FILE):
+    """
+    @summary: Wait until uevents emitted by kernel so far are handled by service
+    @return: True if handled (or service isn't running), False on timeout
+    """
+    target = read_seqnum(kernel_seqnum_file)
+    deadline = time.monotonic() + timeout
+    while True:
+        handled = read_seqnum(seqnum_file)
+        if handled is None or target is None or handled >= target:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(CONST.SETTLE_POLL)
+
+
+def sd_notify(state):
+    """
+    @summary: Send service state (e.g. "READY=1") to systemd, Type=notify unit
+    @return: True if sent, False if not run by systemd or on error
+    """
+    addr = os.environ.get("NOTIFY_SOCKET")
+    if not addr:
+        return False
+    if addr.startswith("@"):
+        # Abstract namespace socket
+        addr = "\0" + addr[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(addr)
+            sock.sendall(state.encode("utf-8"))
+    except OSError as err:
+        LOGGER.warning("Can't notify systemd {}: {}".format(state, err))
+        return False
+    return True
+
+
+def handle_shutdown(sig, _frame):
+    """
+    @summary: Signal handler: stop main loop
+    """
+    EXIT.set()
+
+
+def log_stat(dispatcher, stat):
+    LOGGER.info("events {recv} matched {matched} lost {lost}, handlers {run} merged {merged} "
+                "batches {batch} held {held} failed {failed} not completed {timeout}".format(**dict(stat, **dispatcher.stat)))
+    LOGGER.info("event to handler done latency ms: {}".format(dispatcher.latency))
+    LOGGER.info("handler run time ms: {}".format(dispatcher.run_time))
+
+
+def main():
+    """
+    @summary: Read kernel uevents and run handlers of hw-management udev rules
+    """
+    CMD_PARSER = argparse.ArgumentParser(description="HW Management Uevent Handler")
+    CMD_PARSER.add_argument("--version", action="version", version="%(prog)s ver:{}".format(VERSION))
+    CMD_PARSER.add_argument("-l", "--log_file", dest="log_file", help="Log file", default=CONST.LOG_FILE)
+    CMD_PARSER.add_argument("-v", "--verbosity", dest="verbosity", help="Set log verbosity level",
+                            type=int, default=20)
+    CMD_PARSER.add_argument("--rules", dest="rules", help="Udev rules files (glob)", default=CONST.RULES_FILES)
+    CMD_PARSER.add_argument("--workers", dest="workers", help="Number of handler workers",
+                            type=int, default=CONST.WORKERS)
+    CMD_PARSER.add_argument("--no_mask", dest="mask", action="store_false",
+                            help="Don't mask handled rules files for udev (handlers run twice)")
+    CMD_PARSER.add_argument("--settle", dest="settle", action="store_true",
+                            help="Wait for handling of uevents emitted so far and exit")
+    CMD_PARSER.add_argument("--timeout", dest="timeout", help="Settle timeout (sec)",
+                            type=int, default=CONST.SETTLE_TIMEOUT)
+    CMD_PARSER.add_argument("--cleanup", dest="cleanup", action="store_true",
+                            help="Unmask rules files for udev and remove seqnum file after service exit and exit")
+    args = vars(CMD_PARSER.parse_args())
+
+    if args["settle"]:
+        return 0 if settle(args["timeout"]) else 1
+
+    global LOGGER
+    LOGGER = Logger(log_file=args["log_file"], log_level=args["verbosity"], log_repeat=2)
+    LOGGER.set_log_rotation_size(file_size=CONST.LOG_ROTATION_SIZE, file_count=CONST.LOG_ROTATION_COUNT)
+
+    if args["cleanup"]:
+        cleanup(args["rules"])
+        return 0
+
+    table = RuleTable(logger=LOGGER)
+    for path in sorted(glob.glob(args["rules"]), key=os.path.basename):
+        table.load(path)
+    if not table.files:
+        LOGGER.error("No rules files loaded: {}".format(args["rules"]))
+        return 1
+    LOGGER.notice("hw-management-uevent-handler: {} rules from {}".format(
+        len(table.rules), ", ".join(os.path.basename(path) for path in table.files)))
+
+    # Socket is bound before masking udev rules: uevents are not missed
+    sock = open_uevent_socket()
+    if args["mask"]:
+        mask_udev_rules(table.files)
+
+    EXIT.clear()
+    for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(sig, handle_shutdown)
+
+    dispatcher = Dispatcher(args["workers"], logger=LOGGER)
+    dispatcher.start()
+    stat = {"recv": 0, "matched": 0, "lost": 0}
+    burst = None
+    max_seqnum = handled_seqnum = read_seqnum(CONST.KERNEL_SEQNUM_FILE) or 0
+    write_seqnum(handled_seqnum)
+    # Started: udev rules are masked and settle is possible. Units ordered
+    # after the service (hw-management "udevadm trigger") start from now.
+    sd_notify("READY=1")
+    report_ts = time.monotonic()
+    try:
+        while not EXIT.is_set():
+            wait = CONST.POLL_TIMEOUT if dispatcher.idle.is_set() else 0.01
+            if select.select([sock], [], [], wait)[0]:
+                while True:
+                    try:
+                        data = sock.recv(65536)
+                    except BlockingIOError:
+                        break
+                    except OSError as err:
+                        if err.errno != errno.ENOBUFS:
+                            raise
+                        stat["lost"] += 1
+                        LOGGER.warning("uevents lost: socket receive buffer overrun")
+                        continue
+                    event = Uevent.parse(data)
+                    if not event:
+                        continue
+                    stat["recv"] += 1
+                    max_seqnum = max(max_seqnum, event.seqnum)
+                    if burst is None:
+                        burst = {"ts": event.ts, "events": 0, "run": dispatcher.stat["run"]}
+                    burst["events"] += 1
+                    commands = [HandlerCmd(event, argv) for argv in table.apply(event)]
+                    if commands:
+                        stat["matched"] += 1
+                        dispatcher.submit(commands)
+
+            if dispatcher.idle.is_set():
+                if max_seqnum != handled_seqnum:
+                    handled_seqnum = max_seqnum
+                    write_seqnum(handled_seqnum)
+                if burst:
+                    if burst["events"] >= CONST.BURST_MIN:
+                        LOGGER.info("burst: {} events, {} handlers in {:.0f} ms".format(
+                            burst["events"], dispatcher.stat["run"] - burst["run"],
+                            (time.monotonic() - burst["ts"]) * 1000))
+                    burst = None
+
+            if time.monotonic() - report_ts >= CONST.REPORT_INTERVAL:
+                report_ts = time.monotonic()
+                if stat["recv"]:
+                    log_stat(dispatcher, stat)
+    finally:
+        sd_notify("STOPPING=1")
+        if args["mask"]:
+            mask_udev_rules(table.files, mask=False)
+        sock.close()
+        dispatcher.stop()
+        try:
+            os.unlink(CONST.SEQNUM_FILE)
+        except OSError:
+            pass
+        log_stat(dispatcher, stat)
+        LOGGER.notice("hw-management-uevent-handler: stopped")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/python
+# pylint: disable=line-too-long
+# pylint: disable=C0103
+# pylint: disable=W0718
+# pylint: disable=R0913:
+########################################################################
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the names of the copyright holders nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# Alternatively, this software may be distributed under the terms of the
+# GNU General Public License ("GPL") version 2 as published by the Free
+# Software Foundation.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""
+Hardware Management Combined Updater Service
+
+Optional runner which hosts thermal and peripheral updater job groups in one
+process instead of two hw-management-*-updater daemons, sharing interpreter,
+imported modules and memory report machinery.
+
+Each group runs its own main loop thread with its own configuration, logger
+(log file and syslog identifier) and EXIT event. Runner watchdog:
+    - group main loop thread which died (unexpected exception) is stopped and
+      initialized again after restart delay (exponential backoff)
+    - group main loop which did not complete iteration for watchdog timeout
+      (hung handler) is retired and replaced by new main loop thread; retired
+      thread leaves the loop when its handler returns. If too many retired
+      threads are still hung, runner exits with error to be restarted by systemd.
+"""
+
+try:
+    import argparse
+    import shlex
+    import signal
+    import sys
+    import threading
+    import time
+    import traceback
+    from hw_management_lib import (
+        HW_Mgmt_Logger as Logger,
+        exit_wait,
+    )
+    import hw_management_thermal_updater as thermal_updater
+    import hw_management_peripheral_updater as peripheral_updater
+except ImportError as e:
+    raise ImportError(str(e) + "- required module not found")
+
+VERSION = "1.0.0"
+
+
+class CONST(object):
+    LOG_FILE = "/var/log/hw-management-updater.log"
+    LOG_ROTATION_SIZE = 1 * 1024 * 1024  # 1MB
+    LOG_ROTATION_COUNT = 3
+
+    # Max time (sec) of single main loop iteration of group
+    WATCHDOG_TIMEOUT = 120
+    # Watchdog check interval (sec)
+    WATCHDOG_POLL = 1
+    # Restart delay (sec) of failed group, doubled on each failure
+    RESTART_DELAY_MIN = 10
+    RESTART_DELAY_MAX = 300
+    # Max number of retired hung main loop threads per group
+    HUNG_MAX = 2
+    # Max time (sec) to wait for group main loop on stop
+    STOP_TIMEOUT = 5
+
+
+# Job groups: {name: updater module}
+GROUPS = {
+    "thermal": thermal_updater,
+    "peripheral": peripheral_updater,
+}
+
+LOGGER = None
+EXIT = threading.Event()
+
+
+class UpdaterGroup(object):
+    """
+    @summary: Job group hosted by combined updater: updater module
+        (parse_args/updater_init/updater_loop/updater_stop) and its main loop thread
+    """
+
+    def __init__(self, name, module, argv, watchdog_timeout=CONST.WATCHDOG_TIMEOUT):
+        """
+        @param name: Group name
+        @param module: Updater module
+        @param argv: Command line arguments of the updater
+        @param watchdog_timeout: Max time (sec) of single main loop iteration
+        """
+        self.name = name
+        self.module = module
+        self.args = module.parse_args(argv)
+        self.watchdog_timeout = watchdog_timeout
+        self.thread = None
+        self.loop_id = 0
+        self.beat_ts = 0
+        self.start_ts = 0
+        self.initialized = False
+        self.restart_ts = None
+        self.restart_delay = CONST.RESTART_DELAY_MIN
+        self.hung = []
+        self.stat = {"start": 0, "fail": 0, "hung": 0}
+
+    def _beat(self):
+        self.beat_ts = time.monotonic()
+
+    def _run(self, loop_id):
+        try:
+            if not self.initialized:
+                self.module.updater_init(self.args, ident="hw_management_{}_updater".format(self.name))
+                self.initialized = True
+            self.module.LOGGER.notice("hw-management-{}-updater: start main loop".format(self.name))
+            self.module.updater_loop(stop=lambda: self.loop_id != loop_id, heartbeat=self._beat)
+        except self.module.ShutdownRequested:
+            pass
+        except Exception as e:
+            LOGGER.error("{} updater failed: {}".format(self.name, e))
+            LOGGER.notice(traceback.format_exc())
+        except SystemExit as e:
+            LOGGER.error("{} updater exit: {}".format(self.name, e.code))
+
+    def start(self):
+        """
+        @summary: Start new main loop thread of the group
+        """
+        self.loop_id += 1
+        self.stat["start"] += 1
+        self.start_ts = self.beat_ts = time.monotonic()
+        self.thread = threading.Thread(target=self._run, args=(self.loop_id,),
+                                       name="{}_updater".format(self.name), daemon=True)
+        self.thread.start()
+
+    def check(self, now):
+        """
+        @summary: Watchdog: restart failed group, replace hung main loop
+        @param now: time.monotonic()
+        @return: False if group can not be recovered
+        """
+        if EXIT.is_set() or self.module.EXIT.is_set():
+            return True
+        if not self.thread.is_alive():
+            if self.restart_ts is None:
+                self.stat["fail"] += 1
+                LOGGER.error("{} updater stopped, restart in {} sec".format(self.name, self.restart_delay))
+                self._stop_module()
+                self.restart_ts = now + self.restart_delay
+                self.restart_delay = min(self.restart_delay * 2, CONST.RESTART_DELAY_MAX)
+            elif now >= self.restart_ts:
+                self.restart_ts = None
+                self.start()
+            return True
+
+        if now - self.beat_ts > self.watchdog_timeout:
+            self.hung = [thread for thread in self.hung if thread.is_alive()]
+            if len(self.hung) >= CONST.HUNG_MAX:
+                LOGGER.error("{} updater: {} main loops hung".format(self.name, len(self.hung) + 1))
+                return False
+            self.stat["hung"] += 1
+            LOGGER.error("{} updater main loop hung for {} sec, restart main loop".format(self.name, int(now - self.beat_ts)))
+            self.hung.append(self.thread)
+            self.start()
+        elif now - self.start_ts > CONST.RESTART_DELAY_MAX:
+            self.restart_delay = CONST.RESTART_DELAY_MIN
+        return True
+
+    def _stop_module(self):
+        if not self.initialized:
+            return
+        self.initialized = False
+        try:
+            self.module.updater_stop()
+        except Exception as e:
+            LOGGER.error("{} updater stop failed: {}".format(self.name, e))
+
+    def wake(self):
+        """
+        @summary: Set group EXIT, interrupt main loop wait which does not watch EXIT
+        """
+        self.module.EXIT.set()
+        wake = getattr(self.module, "updater_wake", None)
+        if wake:
+            wake()
+
+    def stop(self, timeout=CONST.STOP_TIMEOUT):
+        """
+        @summary: Stop main loop, wait for it up to timeout and stop updater
+        """
+        self.wake()
+        if self.thread:
+            self.thread.join(timeout)
+            if self.thread.is_alive():
+                LOGGER.warning("{} updater main loop did not stop in {} sec".format(self.name, timeout))
+        self._stop_module()
+
+
+def handle_shutdown(sig, _frame):
+    """
+    @summary: Stop runner on SIGTERM/SIGINT/SIGHUP. Groups are stopped by main loop.
+    """
+    EXIT.set()
+
+
+def main():
+    """
+    @summary: Run updater job groups in one process
+    """
+    CMD_PARSER = argparse.ArgumentParser(description="HW Management Combined Updater")
+    CMD_PARSER.add_argument("--version", action="version", version="%(prog)s ver:{}".format(VERSION))
+    CMD_PARSER.add_argument("-l", "--log_file",
+                            dest="log_file",
+                            help="Runner log file. Groups log to their own log files",
+                            default=CONST.LOG_FILE)
+    CMD_PARSER.add_argument("-v", "--verbosity",
+                            dest="verbosity",
+                            help="Set log verbosity level",
+                            type=int, default=20)
+    CMD_PARSER.add_argument("--groups",
+                            dest="groups",
+                            help="Comma separated job groups: {}".format(",".join(GROUPS)),
+                            default=",".join(GROUPS))
+    for name in GROUPS:
+        CMD_PARSER.add_argument("--{}_args".format(name),
+                                dest="{}_args".format(name),
+                                help="Command line arguments of {0} updater, e.g. --{0}_args=\"-v 10\"".format(name),
+                                default="")
+    CMD_PARSER.add_argument("--watchdog_timeout",
+                            dest="watchdog_timeout",
+                            help="Max time (sec) of group main loop iteration, hung main loop is restarted",
+                            type=int, default=CONST.WATCHDOG_TIMEOUT)
+    args = vars(CMD_PARSER.parse_args())
+
+    global LOGGER
+    # Groups and runner log to syslog in one process: keep identifier of each logger
+    Logger.SYSLOG_OWN_IDENT = True
+    LOGGER = Logger(log_file=args["log_file"], log_level=args["verbosity"], log_repeat=2)
+    LOGGER.set_log_rotation_size(file_size=CONST.LOG_ROTATION_SIZE, file_count=CONST.LOG_ROTATION_COUNT)
+
+    groups = []
+    for name in args["groups"].split(","):
+        if name not in GROUPS:
+            LOGGER.error("Unknown job group: {}".format(name))
+            return 1
+        groups.append(UpdaterGroup(name, GROUPS[name], shlex.split(args["{}_args".format(name)]),
+                                   args["watchdog_timeout"]))
+
+    EXIT.clear()
+    for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(sig, handle_shutdown)
+
+    LOGGER.notice("hw-management-updater: start groups {}".format(args["groups"]))
+    for group in groups:
+        group.start()
+
+    ret = 0
+    while not EXIT.is_set():
+        now = time.monotonic()
+        for group in groups:
+            if not group.check(now):
+                ret = 1
+                EXIT.set()
+        exit_wait(EXIT, CONST.WATCHDOG_POLL)
+
+    for group in groups:
+        group.wake()
+    for group in groups:
+        group.stop()
+        LOGGER.notice("hw-management-updater: {} stopped, starts {start} failures {fail} hangs {hung}".format(
+            group.name, **group.stat))
+    return ret
+
+
+if __name__ == '__main__':
+    sys.exit(main())